@@ -0,0 +1,100 @@
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt6.QtCore import QObject, Qt, pyqtSignal
+from PyQt6.QtGui import QImage, QImageReader
+
+from ..persistence.config import constants
+
+
+def _cache_key(path):
+    """Path plus modification time and size, so an overwritten capture is reloaded."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return os.path.abspath(path), stat.st_mtime_ns, stat.st_size
+
+
+class AsyncImageLoader(QObject):
+    """
+    Decodes image files on a worker thread.
+
+    Each load() supersedes the previous one: a request that is still queued
+    is skipped and a finished decode for an older request is discarded.
+    Decoded images are kept in a small LRU cache so reopened captures are
+    shown immediately.
+    """
+
+    image_loaded = pyqtSignal(str, QImage)
+    load_failed = pyqtSignal(str)
+
+    _decoded = pyqtSignal(int, str, object, QImage)
+
+    def __init__(self, parent=None, cache_size=None):
+        super().__init__(parent)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="image-loader")
+        self._generation = 0
+        self._cache = OrderedDict()
+        self._cache_size = constants.IMAGE_CACHE_SIZE if cache_size is None else cache_size
+        self._decoded.connect(self._on_decoded, Qt.ConnectionType.QueuedConnection)
+
+    def load(self, path):
+        """
+        Start loading path. Returns the cached image when it is available
+        (image_loaded is emitted as well), otherwise None.
+        """
+        self._generation += 1
+        key = _cache_key(path)
+        cached = self._cache_get(key)
+        if cached is not None:
+            self.image_loaded.emit(path, cached)
+            return cached
+        self._executor.submit(self._decode, self._generation, path, key)
+        return None
+
+    def cancel(self):
+        """Discard every pending load."""
+        self._generation += 1
+
+    @staticmethod
+    def image_size(path):
+        """Read only the image header; cheap enough for the GUI thread."""
+        return QImageReader(path).size()
+
+    def _decode(self, generation, path, key):
+        # Runs on the worker thread
+        if generation != self._generation:
+            return
+        reader = QImageReader(path)
+        reader.setAutoTransform(True)
+        image = reader.read()
+        self._decoded.emit(generation, path, key, image)
+
+    def _on_decoded(self, generation, path, key, image):
+        if image.isNull():
+            if generation == self._generation:
+                self.load_failed.emit(path)
+            return
+        self._cache_put(key, image)
+        if generation == self._generation:
+            self.image_loaded.emit(path, image)
+
+    def _cache_get(self, key):
+        if key is None or key not in self._cache:
+            return None
+        self._cache.move_to_end(key)
+        return self._cache[key]
+
+    def _cache_put(self, key, image):
+        if key is None or self._cache_size <= 0:
+            return
+        self._cache[key] = image
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+    def shutdown(self):
+        self.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,128 @@
+import threading
+import zlib
+
+import numpy as np
+from PyQt6.QtCore import QObject, QThread, Qt, pyqtSignal
+
+
+def frame_fingerprint(frame):
+    """
+    Identity check for a frame: shape, dtype and the CRC of the whole pixel
+    buffer, so changes as small as a single pixel are not taken for repeats.
+    """
+    return frame.shape, frame.dtype.str, zlib.crc32(np.ascontiguousarray(frame).data)
+
+
+class LatestFrameSlot:
+    """
+    Thread-safe single-slot buffer. A producer on any thread overwrites the
+    pending frame (latest frame wins); the GUI thread takes it when it is
+    ready to draw, so stale frames are dropped instead of queued.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = None
+        self._last_key = None
+        self.dropped_frames = 0
+        self.skipped_frames = 0
+
+    def put(self, frame, frame_id=None, bgr=False):
+        """Store a frame. Returns False when it repeats the last accepted frame."""
+        key = ("id", frame_id) if frame_id is not None else frame_fingerprint(frame)
+        with self._lock:
+            if key == self._last_key:
+                self.skipped_frames += 1
+                return False
+            if self._pending is not None:
+                self.dropped_frames += 1
+            self._pending = (frame, bgr)
+            self._last_key = key
+            return True
+
+    def take(self):
+        """Remove and return the pending (frame, bgr) pair, or None."""
+        with self._lock:
+            pending, self._pending = self._pending, None
+            return pending
+
+    def reset(self):
+        with self._lock:
+            self._pending = None
+            self._last_key = None
+
+
+class CameraFeedManager(QObject):
+    """
+    Feeds camera frames into the editor.
+
+    Frames may be submitted from any thread; the newest one is shown on the
+    GUI thread and identical or superseded frames are skipped. The pull-style
+    update_camera_feed_requested poll is paused while the editor is hidden or
+    the user is zooming, panning or dragging.
+    """
+
+    _frame_available = pyqtSignal()
+
+    def __init__(self, editor):
+        super().__init__(editor)
+        self.editor = editor
+        self.slot = LatestFrameSlot()
+        self._resume_on_show = False
+        self._frame_available.connect(self._deliver, Qt.ConnectionType.QueuedConnection)
+
+    def submit(self, frame, frame_id=None, bgr=False):
+        """
+        Queue a NumPy frame for display. frame_id, when the camera provides
+        one, replaces the content fingerprint for duplicate detection.
+
+        A frame that owns its memory is displayed without copying, so the
+        producer hands it over and must not write to it afterwards. Frames
+        that are views of someone else's buffer (np.frombuffer, slices of a
+        reused capture buffer) are copied first.
+
+        None clears the shown frame and resets duplicate detection, so the
+        next frame is shown even if it repeats the last one.
+        """
+        if frame is None:
+            self.slot.reset()
+            self.editor.viewport_controller.clear_image()
+            return
+        if not frame.flags.owndata:
+            frame = frame.copy()
+        if not self.slot.put(frame, frame_id, bgr):
+            return
+        if QThread.currentThread() is self.thread():
+            self._deliver()
+        else:
+            self._frame_available.emit()
+
+    def _deliver(self):
+        pending = self.slot.take()
+        if pending is None:
+            return
+        frame, bgr = pending
+        self.editor.viewport_controller.set_image(frame, bgr=bgr)
+
+    def poll(self):
+        """Camera timer tick: request a new frame unless polling is paused."""
+        if not self.editor.isVisible() or self.is_editing():
+            return
+        self.editor.update_camera_feed_requested.emit()
+
+    def is_editing(self):
+        """True while an interaction that should not be disturbed by new frames is running."""
+        if self.editor.interaction_quality.active:
+            return True
+        return self.editor.mode_manager.drag_mode.dragging_point is not None
+
+    def pause_for_hide(self):
+        timer = self.editor.camera_feed_update_timer
+        # A second hide finds the timer already stopped; keep the pending resume
+        self._resume_on_show = self._resume_on_show or timer.isActive()
+        timer.stop()
+
+    def resume_after_show(self):
+        if self._resume_on_show:
+            self.editor.camera_feed_update_timer.start()
+        self._resume_on_show = False
@@ -3,6 +3,7 @@ from PyQt6.QtCore import QEvent
 from ...input.mouse_handler import MouseHandler
 from ...input.gesture_handler import GestureHandler
 from ...input.zoom_handler import ZoomHandler
+from ...input.event_coalescer import InputCoalescer
 from ...core.editor_context import EditorContext
 
 
@@ -19,21 +20,26 @@ class EventManager:
         self._mouse_handler = MouseHandler(self._context)
         self._gesture_handler = GestureHandler(self._context)
         self._zoom_handler = ZoomHandler(self._context)
+        # One move / wheel dispatch per frame; presses and releases flush it first
+        self._input_coalescer = InputCoalescer(self._mouse_handler.handle_move, self._zoom_handler.zoom_by_wheel)
 
     def handle_mouse_press(self, event):
+        self._input_coalescer.flush()
         self._mouse_handler.handle_press(event)
 
     def handle_mouse_double_click(self, event):
+        self._input_coalescer.flush()
         self._mouse_handler.handle_double_click(event)
 
     def handle_mouse_move(self, event):
-        self._mouse_handler.handle_move(event)
+        self._input_coalescer.move(event)
 
     def handle_mouse_release(self, event):
+        self._input_coalescer.flush()
         self._mouse_handler.handle_release(event)
 
     def handle_wheel(self, event):
-        self._zoom_handler.handle_wheel_event(event)
+        self._input_coalescer.wheel(event)
 
     def handle_general_event(self, event):
         if event.type() == QEvent.Type.Gesture:
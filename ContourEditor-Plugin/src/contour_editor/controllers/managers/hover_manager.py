@@ -0,0 +1,113 @@
+import numpy as np
+from PyQt6.QtGui import QRegion
+
+from ...models.spatial_index import closest_on_pieces
+from ...persistence.config import constants
+from ...persistence.utils.coordinate_utils import map_to_image_space
+from ...rendering.dirty_regions import DirtyRegionTracker
+
+# Most spans a hover query looks at; denser geometry narrows the radius (SpanGrid.spans_near)
+MAX_HOVER_SPANS = 2048
+
+
+class HoverManager:
+    """
+    Tracks the point or span under the cursor so it can be highlighted before
+    it is clicked.
+
+    The hovered element is a (role, seg_index, index) tuple like a drag
+    target, with role "anchor", "control" or "span" (index is then the span
+    index). Lookups go through the spatial index's SpanGrid, so a query only
+    touches the spans under the hit radius, and the first query after an edit
+    only re-indexes the edited segments. A change of target repaints just the
+    old and new highlight.
+    """
+
+    def __init__(self, editor):
+        self.editor = editor
+        self.hovered = None
+
+    def update(self, screen_pos):
+        """Highlight the element under a screen position (called once per coalesced move)."""
+        target = None
+        if constants.HOVER_HIGHLIGHT_ENABLED:
+            scale = self.editor.scale_factor
+            target = self.find_target(map_to_image_space(screen_pos, self.editor.translation, scale), scale)
+        self._set_hovered(target)
+
+    def clear(self):
+        self._set_hovered(None)
+
+    def find_target(self, pos, scale):
+        """
+        Nearest anchor or control within POINT_HIT_RADIUS_PX screen pixels of
+        the image-space pos, else the nearest span within that radius, else None.
+        """
+        segments = self.editor.manager.get_segments()
+        grid = self.editor.spatial_index.grid_for(segments)
+        x, y = pos.x(), pos.y()
+        spans, radius = grid.spans_near(x, y, constants.POINT_HIT_RADIUS_PX / scale, MAX_HOVER_SPANS)
+        if not len(spans):
+            return None
+        seg_ids = grid.seg_ids[spans]
+        visible_ids = [seg_index for seg_index in np.unique(seg_ids).tolist() if segments[seg_index].visible]
+        spans = spans[np.isin(seg_ids, visible_ids)]
+        if not len(spans):
+            return None
+        cursor = np.array((x, y))
+
+        seg_ids, span_ids, controls = grid.seg_ids[spans], grid.span_ids[spans], grid.controls[spans]
+        has_control = ~np.isnan(controls[:, 0])
+        points = np.vstack((grid.starts[spans], grid.ends[spans], controls[has_control]))
+        roles = ["anchor"] * (2 * len(spans)) + ["control"] * int(has_control.sum())
+        point_segs = np.concatenate((seg_ids, seg_ids, seg_ids[has_control]))
+        point_ids = np.concatenate((span_ids, span_ids + 1, span_ids[has_control]))
+        distances = np.hypot(*(points - cursor).T)
+        best = int(np.argmin(distances))
+        if distances[best] <= radius:
+            return roles[best], int(point_segs[best]), int(point_ids[best])
+
+        a, b, owner = grid.pieces(spans)
+        distances = np.hypot(*(closest_on_pieces(a, b, cursor) - cursor).T)
+        best = int(np.argmin(distances))
+        if distances[best] <= radius:
+            span = owner[best]
+            return "span", int(seg_ids[span]), int(span_ids[span])
+        return None
+
+    def highlight_points(self):
+        """
+        Image-space geometry of the hovered element: [point] for a point or
+        [start, control or None, end] for a span; None if nothing valid is hovered.
+        """
+        if self.hovered is None:
+            return None
+        role, seg_index, index = self.hovered
+        segments = self.editor.manager.get_segments()
+        if not 0 <= seg_index < len(segments):
+            return None
+        segment = segments[seg_index]
+        points, controls = segment.points, segment.controls
+        if role == "anchor":
+            return [points[index]] if index < len(points) else None
+        if role == "control":
+            return [controls[index]] if index < len(controls) and controls[index] is not None else None
+        if index + 1 >= len(points):
+            return None
+        return [points[index], controls[index] if index < len(controls) else None, points[index + 1]]
+
+    def _set_hovered(self, target):
+        if target == self.hovered:
+            return
+        region = self._highlight_region()
+        self.hovered = target
+        region = region.united(self._highlight_region())
+        if not region.isEmpty():
+            self.editor.request_repaint(region, "hover")
+
+    def _highlight_region(self):
+        points = self.highlight_points()
+        if not points:
+            return QRegion()
+        padding = DirtyRegionTracker.HANDLE_PADDING_PX + constants.HOVER_HIGHLIGHT_WIDTH
+        return QRegion(self.editor.dirty_regions.image_points_rect(points, padding))
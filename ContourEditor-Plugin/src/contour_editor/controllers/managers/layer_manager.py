@@ -16,7 +16,7 @@ class LayerManager:
             if hasattr(segment, 'layer') and segment.layer.name == layer.name:
                 self.editor.manager.set_segment_visibility(idx, visible)
 
-        self.editor.update()  # Redraw after visibility change
+        self.editor.request_repaint(reason="layer")  # Redraw after visibility change
 
     def set_layer_locked(self, layer_name, locked):
         """Set lock state of a specific layer"""
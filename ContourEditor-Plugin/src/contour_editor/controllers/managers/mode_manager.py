@@ -1,6 +1,6 @@
 from PyQt6.QtCore import Qt
 
-from ...persistence.config.constants import EDIT_MODE, RECTANGLE_SELECT_MODE, DRAG_MODE, PICKUP_POINT_MODE, MULTI_SELECT_MODE
+from ...persistence.config.constants import EDIT_MODE, RECTANGLE_SELECT_MODE, DRAG_MODE, PICKUP_POINT_MODE, MULTI_SELECT_MODE, TRANSFORM_MODE
 from ..state.mode_handlers.multi_select_mode import MultiPointSelectMode
 from ..state.mode_handlers.pan_mode import PanMode
 from ..state.mode_handlers.point_drag_mode import PointDragMode
@@ -39,6 +39,8 @@ class ModeManager:
             self.editor.setCursor(Qt.CursorShape.PointingHandCursor)
         elif mode == RECTANGLE_SELECT_MODE:
             self.editor.setCursor(Qt.CursorShape.CrossCursor)
+        elif mode == TRANSFORM_MODE:
+            self.editor.setCursor(Qt.CursorShape.SizeAllCursor)
 
     def toggle_multi_select_mode(self):
         """Toggle multi-selection mode on/off"""
@@ -54,7 +56,7 @@ class ModeManager:
             self.set_cursor_mode(MULTI_SELECT_MODE)
             print("Multi-selection mode activated")
 
-        self.editor.update()
+        self.editor.request_repaint(reason="mode")
         return self.multi_select_mode_active
 
     def _should_draw_all_points(self):
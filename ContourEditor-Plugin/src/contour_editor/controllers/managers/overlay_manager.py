@@ -67,7 +67,7 @@ class OverlayManager:
                 print(f"Control point already exists at line {line_index}, adding anchor point instead")
                 result = self.editor.manager.insert_anchor_point(seg_index, pos)
                 if result:
-                    self.editor.update()
+                    self.editor.request_repaint(reason="overlay")
                     self.editor.pointsUpdated.emit()
                 return True
             else:
@@ -1,7 +1,10 @@
 from PyQt6.QtCore import QEventLoop, QPointF
 from PyQt6.QtWidgets import QDialog
 import math
+from ...core.event_bus import EventBus
+from ...core.scene_changes import changed_indices
 from ...persistence.config import constants
+from ...models.segment import touch_geometry
 from ...persistence.utils import coordinate_utils
 from ...ui.new_widgets.PointInfoOverlay import PointInfoOverlay
 from ...ui.new_widgets.SetLengthAndAngleDialog import SetLengthAndAngleDialog
@@ -60,54 +63,60 @@ def remove_selected_points(editor):
             # Save state once for the entire operation
             editor.manager.save_state()
 
-            # Process each segment independently
-            for seg_index in sorted_segments:
-                segment_points = points_by_segment[seg_index]
+            # Process each segment independently; the edits are published as one change set
+            bus = EventBus.get_instance()
+            with bus.transaction():
+                for seg_index in sorted_segments:
+                    segment_points = points_by_segment[seg_index]
 
-                # Sort points within segment by index in reverse order
-                sorted_points = sorted(segment_points, key=lambda x: x['point_index'], reverse=True)
+                    # Sort points within segment by index in reverse order
+                    sorted_points = sorted(segment_points, key=lambda x: x['point_index'], reverse=True)
 
-                segments = editor.manager.get_segments()
-                if seg_index < 0 or seg_index >= len(segments):
-                    print(f"Warning: Skipping invalid segment index: {seg_index}")
-                    continue
-
-                segment = segments[seg_index]
-
-                # Check if layer is locked
-                if segment.layer and segment.layer.locked:
-                    print(f"Warning: Cannot delete points from locked layer '{segment.layer.name}'")
-                    continue
+                    segments = editor.manager.get_segments()
+                    if seg_index < 0 or seg_index >= len(segments):
+                        print(f"Warning: Skipping invalid segment index: {seg_index}")
+                        continue
 
-                # Delete points in reverse order
-                for point_info in sorted_points:
-                    role = point_info['role']
-                    point_index = point_info['point_index']
+                    segment = segments[seg_index]
+                    before = list(segment.points), list(segment.controls)
 
-                    if role not in ['anchor', 'control']:
-                        print(f"Warning: Skipping unknown point type: {role}")
+                    # Check if layer is locked
+                    if segment.layer and segment.layer.locked:
+                        print(f"Warning: Cannot delete points from locked layer '{segment.layer.name}'")
                         continue
 
-                    try:
-                        if role == 'anchor':
-                            if 0 <= point_index < len(segment.points):
-                                del segment.points[point_index]
-                                # Also remove corresponding control point
-                                if point_index < len(segment.controls):
-                                    del segment.controls[point_index]
-                                print(f"Deleted anchor point at segment {seg_index}, index {point_index}")
-                            else:
-                                print(f"Warning: Anchor index {point_index} out of bounds")
-
-                        elif role == 'control':
-                            if 0 <= point_index < len(segment.controls):
-                                segment.controls[point_index] = None
-                                print(f"Cleared control point at segment {seg_index}, index {point_index}")
-                            else:
-                                print(f"Warning: Control index {point_index} out of bounds")
-
-                    except Exception as e:
-                        print(f"Error deleting point at seg {seg_index}, idx {point_index}: {e}")
+                    # Delete points in reverse order
+                    for point_info in sorted_points:
+                        role = point_info['role']
+                        point_index = point_info['point_index']
+
+                        if role not in ['anchor', 'control']:
+                            print(f"Warning: Skipping unknown point type: {role}")
+                            continue
+
+                        try:
+                            if role == 'anchor':
+                                if 0 <= point_index < len(segment.points):
+                                    del segment.points[point_index]
+                                    # Also remove corresponding control point
+                                    if point_index < len(segment.controls):
+                                        del segment.controls[point_index]
+                                    print(f"Deleted anchor point at segment {seg_index}, index {point_index}")
+                                else:
+                                    print(f"Warning: Anchor index {point_index} out of bounds")
+
+                            elif role == 'control':
+                                if 0 <= point_index < len(segment.controls):
+                                    segment.controls[point_index] = None
+                                    print(f"Cleared control point at segment {seg_index}, index {point_index}")
+                                else:
+                                    print(f"Warning: Control index {point_index} out of bounds")
+
+                        except Exception as e:
+                            print(f"Error deleting point at seg {seg_index}, idx {point_index}: {e}")
+
+                    touch_geometry(segment)
+                    _publish_point_changes(bus, seg_index, before, segment)
 
             # Clear selections
             editor.selection_manager.clear_all_selections()
@@ -123,7 +132,12 @@ def remove_selected_points(editor):
                     return
 
                 # Use manager's remove_point method (handles undo/redo)
-                editor.manager.remove_point(role, seg_index, point_index)
+                segment = editor.manager.get_segments()[seg_index]
+                before = list(segment.points), list(segment.controls)
+                bus = EventBus.get_instance()
+                with bus.transaction():
+                    editor.manager.remove_point(role, seg_index, point_index)
+                    _publish_point_changes(bus, seg_index, before, segment)
                 editor.selection_manager.clear_all_selections()
                 print(f"Deleted {role} point {point_index} from segment {seg_index}")
 
@@ -132,10 +146,17 @@ def remove_selected_points(editor):
                 print(f"Error in remove_selected_points: {e}")
 
         # Refresh UI
-        editor.update()
+        editor.request_repaint(reason="overlay")
         if hasattr(editor, 'point_manager_widget') and editor.point_manager_widget:
             editor.point_manager_widget.refresh_points()
 
+def _publish_point_changes(bus, seg_index, before, segment):
+    """Publish a geometry change with the anchor and control indices of segment that differ from before."""
+    anchors = changed_indices(before[0], segment.points)
+    controls = changed_indices(before[1], segment.controls)
+    if anchors or controls:
+        bus.publish("geometry", seg_index, anchors=anchors, controls=controls)
+
 def on_line_segment_clicked(editor, seg_index, line_index):
     """Handle line segment button click in point info overlay"""
     if line_index == -1:
@@ -146,7 +167,7 @@ def on_line_segment_clicked(editor, seg_index, line_index):
         editor.highlighted_line_segment = (seg_index, line_index)
 
     # Redraw to show/hide the highlighted line
-    editor.update()
+    editor.request_repaint(reason="overlay")
 
 def on_set_length_requested(editor, seg_index, line_index):
         """Handle set length and angle request for a line segment"""
@@ -228,9 +249,10 @@ def on_set_length_requested(editor, seg_index, line_index):
 
         # Move the point
         points[line_index + 1] = new_p2
+        touch_geometry(segment)
 
         # Update and redraw
-        editor.update()
+        editor.request_repaint(reason="overlay")
         editor.pointsUpdated.emit()
 
         print(f"Moved point from ({p2.x():.2f}, {p2.y():.2f}) to ({new_p2.x():.2f}, {new_p2.y():.2f})")
@@ -26,7 +26,7 @@ def on_disconnect_line_requested(editor):
 
     if result:
         # Update and emit signals only if successful
-        editor.update()
+        editor.request_repaint(reason="overlay")
         editor.pointsUpdated.emit()
     else:
         print(f"Failed to disconnect line segment in segment {editor.pending_segment_click_index}")
@@ -47,7 +47,7 @@ def on_add_control_point_requested(editor):
     # If the result is False, that means adding the control point was prevented (e.g., due to layer being locked)
     if result:
         # Update and emit signals if control point is successfully added
-        editor.update()
+        editor.request_repaint(reason="overlay")
         editor.pointsUpdated.emit()
 
     # Clear pending data
@@ -64,7 +64,7 @@ def on_delete_segment_requested(editor):
     # Delete the segment
     editor.segment_action_controller.on_delete_segment_requested(seg_index)
     # Update and emit signals
-    editor.update()
+    editor.request_repaint(reason="overlay")
     editor.pointsUpdated.emit()
 
     # Clear pending data
@@ -83,7 +83,7 @@ def on_add_anchor_point_requested(editor):
     result = editor.segment_action_controller.on_add_anchor_point_requested(pos, seg_index)
     if result:
         # Update and emit signals if anchor point is successfully added
-        editor.update()
+        editor.request_repaint(reason="overlay")
         editor.pointsUpdated.emit()
 
     # Clear pending data
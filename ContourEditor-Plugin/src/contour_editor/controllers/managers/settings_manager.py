@@ -83,15 +83,15 @@ class SettingsManager:
         self.editor.cluster_distance_px = self.cluster_distance_px
 
         # Update timer intervals
-        if hasattr(self.editor, 'drag_timer'):
-            self.editor.drag_timer.setInterval(constants.DRAG_UPDATE_INTERVAL_MS)
+        if hasattr(self.editor, 'frame_scheduler'):
+            self.editor.frame_scheduler.set_interval(constants.DRAG_UPDATE_INTERVAL_MS)
         if hasattr(self.editor.overlay_manager, 'point_info_timer'):
             self.editor.overlay_manager.point_info_timer.setInterval(constants.POINT_INFO_HOLD_DURATION_MS)
 
         print("Reloaded cached constants in editor")
 
         # Trigger a repaint to show the changes
-        self.editor.update()
+        self.editor.request_repaint(reason="settings")
     
     def show_global_settings(self):
         """Show the global settings dialog (Ctrl+G)"""
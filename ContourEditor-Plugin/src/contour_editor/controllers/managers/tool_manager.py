@@ -1,12 +1,14 @@
 from PyQt6.QtCore import Qt, QPointF
 from PyQt6.QtGui import QCursor
 
-from ...persistence.config.constants import EDIT_MODE, RECTANGLE_SELECT_MODE
+from ...persistence.config import constants
+from ...persistence.config.constants import EDIT_MODE, RECTANGLE_SELECT_MODE, TRANSFORM_MODE
 from ...persistence.utils.coordinate_utils import map_to_image_space
 from ...ui.new_widgets.ToolsPopup import ToolsPopup
 from ...ui.new_widgets.MagnifierWidget import MagnifierWidget
 from ..state.mode_handlers.ruler_mode import RulerMode
 from ..state.mode_handlers.rectangle_select_mode import RectangleSelectMode
+from ..state.mode_handlers.transform_mode import TransformMode
 
 class ToolManager:
     def __init__(self, editor):
@@ -16,10 +18,12 @@ class ToolManager:
         self.ruler_mode_active = False
         self.magnifier_active = False
         self.rectangle_select_mode_active = False
+        self.transform_mode_active = False
         
         # Tool mode objects
         self.ruler_mode = RulerMode()
         self.rectangle_select_mode = RectangleSelectMode()
+        self.transform_mode = TransformMode()
         
         # Magnifier widget
         self.magnifier = MagnifierWidget(editor)
@@ -31,7 +35,9 @@ class ToolManager:
         active_states = {
             "ruler": self.ruler_mode_active,
             "magnifier": self.magnifier_active,
-            "rectangle_select": self.rectangle_select_mode_active
+            "rectangle_select": self.rectangle_select_mode_active,
+            "transform": self.transform_mode_active,
+            "snap": constants.SNAP_ENABLED
         }
 
         print(f"Current active states: {active_states}")
@@ -60,9 +66,46 @@ class ToolManager:
             self.toggle_magnifier()
         elif tool_name == "Rectangle Select":
             self.enable_rectangle_select_mode()
+        elif tool_name == "Transform":
+            self.toggle_transform_mode()
+        elif tool_name == "Snap":
+            self.toggle_snapping()
         else:
             print(f"Unknown tool: {tool_name}")
 
+    def toggle_transform_mode(self):
+        """Toggle the transform tool; it acts on the current point selection, or the active segment"""
+        if self.transform_mode_active:
+            self.transform_mode_active = False
+            self.transform_mode.clear()
+            self.editor.set_cursor_mode(EDIT_MODE)
+            print("Transform mode deactivated")
+        else:
+            # Keep the selection made with rectangle select - it is what gets transformed
+            self.rectangle_select_mode_active = False
+            self.rectangle_select_mode.clear()
+            self.transform_mode_active = True
+            self.transform_mode.refresh(self.editor)
+            self.editor.set_cursor_mode(TRANSFORM_MODE)
+            print("Transform mode activated")
+
+        self.editor.request_repaint(reason="mode")
+        return self.transform_mode_active
+
+    def toggle_snapping(self):
+        """Toggle snapping of added and dragged points; targets are chosen in the settings dialog"""
+        constants.SNAP_ENABLED = not constants.SNAP_ENABLED
+        print(f"Snapping {'enabled' if constants.SNAP_ENABLED else 'disabled'}.")
+        return constants.SNAP_ENABLED
+
+    def show_transform_dialog(self):
+        """Numeric entry for the transform tool."""
+        from ...ui.new_widgets.TransformDialog import TransformDialog
+        dialog = TransformDialog(self.editor)
+        if dialog.exec() == TransformDialog.DialogCode.Accepted:
+            moved = self.transform_mode.apply_numeric(self.editor, **dialog.get_transform())
+            print(f"Transformed {moved} points")
+
     def enable_rectangle_select_mode(self):
         """Toggle rectangle selection mode on/off"""
         if self.rectangle_select_mode_active:
@@ -74,11 +117,13 @@ class ToolManager:
             print("Rectangle selection mode deactivated")
         else:
             # Enter rectangle select mode
+            self.transform_mode_active = False
+            self.transform_mode.clear()
             self.rectangle_select_mode_active = True
             self.editor.set_cursor_mode(RECTANGLE_SELECT_MODE)
             print("Rectangle selection mode activated")
 
-        self.editor.update()
+        self.editor.request_repaint(reason="mode")
         return self.rectangle_select_mode_active
 
     def toggle_ruler_mode(self):
@@ -88,7 +133,7 @@ class ToolManager:
         self.ruler_mode.ruler_end = None
         self.editor.setCursor(Qt.CursorShape.CrossCursor if self.ruler_mode_active else Qt.CursorShape.ArrowCursor)
         print(f"Ruler mode {'enabled' if self.ruler_mode_active else 'disabled'}.")
-        self.editor.update()
+        self.editor.request_repaint(reason="mode")
 
     def toggle_magnifier(self):
         """Toggle the magnifier window on/off"""
@@ -143,7 +188,7 @@ def enable_rectangle_select_mode(editor):
         editor.set_cursor_mode(RECTANGLE_SELECT_MODE)
         print("Rectangle selection mode activated")
 
-    editor.update()
+    editor.request_repaint(reason="mode")
     return editor.rectangle_select_mode_active
 
 def toggle_ruler_mode(editor):
@@ -153,7 +198,7 @@ def toggle_ruler_mode(editor):
     editor.ruler_mode.ruler_end = None
     editor.setCursor(Qt.CursorShape.CrossCursor if editor.ruler_mode_active else Qt.CursorShape.ArrowCursor)
     print(f"Ruler mode {'enabled' if editor.ruler_mode_active else 'disabled'}.")
-    editor.update()
+    editor.request_repaint(reason="mode")
 
 def toggle_magnifier(editor):
     """Toggle the magnifier window on/off"""
@@ -1,5 +1,6 @@
 # pl_ui/contour_editor/EditorStateMachine/Modes/PanMode.py
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QPointF
+from PyQt6.QtGui import QRegion
 from .base_mode import BaseMode
 
 class PanMode(BaseMode):
@@ -9,20 +10,49 @@ class PanMode(BaseMode):
         super().__init__()
         # Pan state variables (moved from ContourEditor)
         self.last_drag_pos = None  # QPointF - last mouse position during panning
+        self.scroll_remainder = QPointF(0, 0)  # Sub-pixel pan not yet applied to the on-screen frame
 
     def mousePress(self, editor, event):
         if event.button() == Qt.MouseButton.LeftButton:
             self.last_drag_pos = event.position()
+            self.scroll_remainder = QPointF(0, 0)
             editor.setCursor(Qt.CursorShape.ClosedHandCursor)
 
     def mouseMove(self, editor, event):
         if self.last_drag_pos is None:
             return
         delta = event.position() - self.last_drag_pos
+        entering_interaction = not editor.interaction_quality.active
+        editor.interaction_quality.begin()
         editor.translation += delta
         self.last_drag_pos = event.position()
-        editor.update()
+        if entering_interaction:
+            # The last frame was drawn at full quality; repaint it once so
+            # scrolled pixels and exposed strips match
+            self.scroll_remainder = QPointF(0, 0)
+            editor.request_repaint(reason="pan")
+        else:
+            self._scroll_frame(editor, delta)
+
+    def _scroll_frame(self, editor, delta):
+        """
+        Shift the last painted frame by whole pixels with QWidget.scroll(); Qt
+        repaints only the exposed strips. Screen-anchored overlays are repainted
+        at both their old and shifted position. The sub-pixel remainder is
+        carried over and resolved by the full repaint on release.
+        """
+        self.scroll_remainder += delta
+        dx, dy = int(self.scroll_remainder.x()), int(self.scroll_remainder.y())
+        if not dx and not dy:
+            return
+        self.scroll_remainder -= QPointF(dx, dy)
+        editor.scroll(dx, dy, editor.rect())
+        editor.frame_scheduler.scrolled(dx, dy)
+        overlay = editor.renderer.screen_overlay_rect.toAlignedRect()
+        if not overlay.isEmpty():
+            editor.request_repaint(QRegion(overlay).united(overlay.translated(dx, dy)), "pan")
 
     def mouseRelease(self):
         """Clear pan state"""
         self.last_drag_pos = None
+        self.scroll_remainder = QPointF(0, 0)
@@ -1,7 +1,12 @@
-from PyQt6.QtCore import QPointF
+from PyQt6.QtCore import QPointF, QRect, QTimer
+from PyQt6.QtGui import QRegion
 
 from .base_mode import BaseMode
+from ....core.event_bus import EventBus
+from ....persistence.config import constants
 from ....persistence.utils.coordinate_utils import map_to_image_space
+from ....input.motion_predictor import MotionPredictor
+from ....models.group_move import GroupMove
 
 class PointDragMode(BaseMode):
     name = "drag_point"
@@ -14,9 +19,20 @@ class PointDragMode(BaseMode):
         self.initial_drag_point_pos = None  # QPointF - original point position
         self.initial_drag_mouse_pos = None  # QPointF - original mouse position
         self.drag_threshold = 10  # pixels - minimum movement to trigger drag
-        self.pending_drag_update = False  # flag for throttled updates
         self.point_to_crosshair_offset = None  # Offset from crosshair to point
         self.is_actually_dragging = False  # True only when mouse has moved significantly
+        self._last_painted_rect = QRect()  # Screen area the drag overlays covered in the last frame
+        self.group_move = None  # GroupMove - set when the pressed point is part of a multi-selection
+
+        # Input prediction: the dragged point is drawn where the finger will be
+        # about one frame from now; the committed position stays exact
+        self.predictor = MotionPredictor()
+        self.predicted_point = None  # QPointF - drawn (image-space) position of the dragged point
+        self.predicted_cursor_pos = None  # QPointF - drawn (screen-space) cursor position
+        self._last_cursor_pos = None
+        self._prediction_expiry = QTimer()
+        self._prediction_expiry.setSingleShot(True)
+        self._prediction_expiry.timeout.connect(self._expire_prediction)
 
     def mousePress(self, editor, event, drag_target=None):
         """
@@ -30,9 +46,17 @@ class PointDragMode(BaseMode):
         self.is_actually_dragging = False  # Not dragging yet, just pressed
         role, seg_index, idx = drag_target
 
-        # Set this point as selected (for deletion via remove button)
-        editor.selection_manager.set_single_selection(drag_target)
-        print(f"Point selected: {drag_target}")
+        # Pressing a point of a multi-selection drags the whole selection;
+        # otherwise this point becomes the selection (for deletion via remove button)
+        selection = editor.selection_manager.selected_points_list
+        if len(selection) > 1 and editor.selection_manager.is_point_selected(role, seg_index, idx):
+            self.group_move = GroupMove(editor.manager.get_segments(), list(selection))
+        else:
+            self.group_move = None
+            editor.selection_manager.set_single_selection(drag_target)
+            print(f"Point selected: {drag_target}")
+            # Index the scene once for snapping; only the dragged point's spans change during the drag
+            editor.snapping.begin(editor.manager.get_segments(), drag_target)
 
         # Hide point info overlay when dragging starts
         if hasattr(editor, 'point_info_overlay'):
@@ -61,7 +85,10 @@ class PointDragMode(BaseMode):
             return
 
         # Mark that we're actually dragging (mouse has moved)
+        # Handle sizes change for every segment on the first move, so repaint everything once
+        full_repaint = not self.is_actually_dragging or not editor.interaction_quality.active
         self.is_actually_dragging = True
+        editor.interaction_quality.begin()
 
         # Calculate current crosshair position in image space (50 pixels above cursor)
         crosshair_offset_y = -50
@@ -73,13 +100,21 @@ class PointDragMode(BaseMode):
         # Convert current crosshair position to image space
         current_crosshair_pos = map_to_image_space(crosshair_screen_pos, editor.translation, editor.scale_factor)
 
-        # Place the point directly at the crosshair position
-        # This ensures the point is exactly where the crosshair shows
-        role, seg_index, idx = self.dragging_point
-        new_pos = current_crosshair_pos
+        if self.group_move is not None:
+            # Every selected point moves by the crosshair offset since the press
+            self.group_move.apply(current_crosshair_pos - self.initial_drag_mouse_pos)
+            full_repaint = True
+        else:
+            # Place the point directly at the crosshair position
+            # This ensures the point is exactly where the crosshair shows
+            role, seg_index, idx = self.dragging_point
+            new_pos = current_crosshair_pos
+            editor.snap_indicator = editor.snapping.snap(new_pos, editor.scale_factor)
+            if editor.snap_indicator is not None:
+                new_pos = editor.snap_indicator.point
 
-        editor.manager.move_point(role, seg_index, idx, new_pos, suppress_save=True)
-        self.pending_drag_update = True
+            editor.manager.move_point(role, seg_index, idx, new_pos, suppress_save=True)
+            self._update_prediction(editor, event, crosshair_offset_y)
 
         # Autoscroll if near edges
         margin = 50
@@ -96,21 +131,121 @@ class PointDragMode(BaseMode):
         elif y > editor.height() - margin:
             editor.translation -= QPointF(0, scroll_speed)
 
-        if not self.editor.drag_timer.isActive():
-            self.editor.drag_timer.start()
+        if x < margin or x > editor.width() - margin or y < margin or y > editor.height() - margin:
+            full_repaint = True
+        # The frame scheduler merges these regions and throttles to one paint per frame
+        editor.request_repaint(self._dirty_region(editor, event.position(), full_repaint), "drag")
 
     def mouseRelease(self):
-        """Clear drag state"""
+        """Publish the moved points and clear drag state"""
+        if self.dragging_point and self.is_actually_dragging:
+            self._publish_moved_points()
         self.dragging_point = None
         self.initial_drag_point_pos = None
         self.initial_drag_mouse_pos = None
         self.point_to_crosshair_offset = None
         self.is_actually_dragging = False
+        self.group_move = None
+        self._last_painted_rect = QRect()
+        self._clear_prediction()
+        self.editor.snapping.end()
+        self.editor.snap_indicator = None
+
+    def _publish_moved_points(self):
+        """Publish the points the drag moved as one geometry change per segment."""
+        bus = EventBus.get_instance()
+        with bus.transaction():
+            if self.group_move is not None:
+                for seg_index, anchors, controls in self.group_move.changed_points():
+                    bus.publish("geometry", seg_index, anchors=anchors, controls=controls)
+                return
+            role, seg_index, idx = self.dragging_point
+            segments = self.editor.manager.get_segments()
+            if not 0 <= seg_index < len(segments) or segments[seg_index].layer.locked:
+                return
+            if role == "anchor":
+                # move_point keeps on-line controls of both adjacent spans at their midpoint
+                anchors = [idx]
+                controls = [i for i in (idx - 1, idx) if 0 <= i < len(segments[seg_index].controls)]
+            else:
+                anchors, controls = [], [idx]
+            bus.publish("geometry", seg_index, anchors=anchors, controls=controls)
+
+    def _update_prediction(self, editor, event, crosshair_offset_y):
+        """
+        Extrapolate the cursor DRAG_PREDICTION_MS ahead and derive the drawn
+        point from it. The prediction expires if no further move arrives, so a
+        finger that stops does not leave the point drawn ahead of it.
+        """
+        cursor_pos = event.position()
+        self._last_cursor_pos = QPointF(cursor_pos)
+        # Moves are dispatched on the coalescer's frame timer, so sample at the
+        # input time; events without a timestamp fall back to the predictor's clock
+        timestamp = event.timestamp() if hasattr(event, "timestamp") else 0
+        self.predictor.add_sample(cursor_pos, timestamp / 1000.0 if timestamp else None)
+        # A snapped point is drawn where it snapped, not ahead of the finger
+        if constants.DRAG_PREDICTION_MS <= 0 or editor.snap_indicator is not None:
+            self.predicted_point = self.predicted_cursor_pos = None
+            return
+        predicted = self.predictor.predict(constants.DRAG_PREDICTION_MS)
+        self.predicted_cursor_pos = predicted
+        self.predicted_point = map_to_image_space(
+            QPointF(predicted.x(), predicted.y() + crosshair_offset_y), editor.translation, editor.scale_factor
+        )
+        self._prediction_expiry.start(max(constants.DRAG_PREDICTION_WINDOW_MS, constants.DRAG_UPDATE_INTERVAL_MS * 2))
+
+    def _clear_prediction(self):
+        self._prediction_expiry.stop()
+        self.predictor.reset()
+        self.predicted_point = None
+        self.predicted_cursor_pos = None
+        self._last_cursor_pos = None
 
-    # def perform_drag_update(self):
-    #     if self.pending_drag_update:
-    #         self.editor.update()
-    #         print(f"Dragged point to new position.")
-    #         self.pending_drag_update = False
-    #     else:
-    #         self.drag_timer.stop()
+    def _expire_prediction(self):
+        if not self.dragging_point or self.predicted_point is None:
+            return
+        self.predicted_point = None
+        self.predicted_cursor_pos = None
+        self.predictor.reset()
+        self.editor.request_repaint(self._dirty_region(self.editor, self._last_cursor_pos), "drag")
+
+    def _dirty_region(self, editor, cursor_pos, full_repaint=False):
+        """
+        Screen area touched by this move (None = whole widget): the spans
+        adjacent to the dragged point with their length/axis overlays, and the
+        crosshair, together with the area they covered in the previous move.
+        """
+        tracker = editor.dirty_regions
+        points = self._affected_points(editor)
+        current_rect = self._crosshair_rect(tracker, cursor_pos)
+        if self.predicted_point is not None:
+            points.append(self.predicted_point)
+            current_rect = current_rect.united(self._crosshair_rect(tracker, self.predicted_cursor_pos))
+        current_rect = tracker.image_points_rect(points, tracker.OVERLAY_PADDING_PX).united(current_rect)
+        previous_rect = self._last_painted_rect
+        self._last_painted_rect = current_rect
+        if full_repaint:
+            return None
+        return QRegion(previous_rect).united(current_rect)
+
+    def _affected_points(self, editor):
+        """Anchors and controls whose drawing depends on the dragged point."""
+        role, seg_index, idx = self.dragging_point
+        segments = editor.manager.get_segments()
+        if not 0 <= seg_index < len(segments):
+            return []
+        points = segments[seg_index].points
+        controls = segments[seg_index].controls
+        if role == "anchor":
+            anchor_range, control_range = range(idx - 1, idx + 2), range(idx - 1, idx + 1)
+        else:
+            anchor_range, control_range = range(idx, idx + 2), range(idx, idx + 1)
+        affected = [points[i] for i in anchor_range if 0 <= i < len(points)]
+        affected += [controls[i] for i in control_range if 0 <= i < len(controls) and controls[i] is not None]
+        return affected
+
+    @staticmethod
+    def _crosshair_rect(tracker, cursor_pos):
+        crosshair_pos = QPointF(cursor_pos.x(), cursor_pos.y() + constants.CROSSHAIR_OFFSET_Y)
+        padding = max(constants.CROSSHAIR_SIZE, constants.CROSSHAIR_CIRCLE_RADIUS) + constants.CROSSHAIR_LINE_THICKNESS
+        return tracker.screen_points_rect([cursor_pos, crosshair_pos], padding)
@@ -1,10 +1,12 @@
 # pl_ui/contour_editor/EditorStateMachine/Modes/RectangleSelectMode.py
 from PyQt6.QtCore import Qt, QRectF
+from PyQt6.QtGui import QRegion
 from .base_mode import BaseMode
 from ....persistence.utils.coordinate_utils import map_to_image_space
 
 class RectangleSelectMode(BaseMode):
     name = "rectangle_select"
+    REPAINT_PADDING_PX = 4  # Border pen width plus antialiasing
 
     def __init__(self):
         super().__init__()
@@ -24,7 +26,7 @@ class RectangleSelectMode(BaseMode):
             self.is_selecting = True
 
             print(f"Rectangle selection started at: {pos_img}")
-            editor.update()
+            editor.request_repaint(reason="rectangle_select")
 
     def mouseMove(self, editor, event):
         """Update rectangle as user drags"""
@@ -32,8 +34,14 @@ class RectangleSelectMode(BaseMode):
             # Convert screen position to image space
             pos_img = map_to_image_space(event.position(), editor.translation, editor.scale_factor)
 
+            old_rect = self.get_selection_rect()
             self.selection_end = pos_img
-            editor.update()  # Redraw to show selection rectangle
+            # Redraw only where the selection rectangle was and now is
+            region = QRegion()
+            for rect in (old_rect, self.get_selection_rect()):
+                if rect is not None:
+                    region = region.united(editor.dirty_regions.image_rect_to_screen(rect, self.REPAINT_PADDING_PX))
+            editor.request_repaint(region, "rectangle_select")
 
     def mouseRelease(self, editor, event):
         """Finalize selection and select all points within rectangle"""
@@ -56,7 +64,7 @@ class RectangleSelectMode(BaseMode):
             self.selection_start = None
             self.selection_end = None
 
-            editor.update()
+            editor.request_repaint(reason="rectangle_select")
 
     def _select_points_in_rectangle(self, editor, rect):
         """Select all points (anchors and controls) that fall within the rectangle"""
@@ -23,7 +23,7 @@ class RulerMode(BaseMode):
 
     def exit(self, editor):
         self.dragging_ruler_point = None
-        editor.update()
+        editor.request_repaint(reason="ruler")
 
     def mousePress(self, editor, event):
 
@@ -52,7 +52,7 @@ class RulerMode(BaseMode):
             self.ruler_start = pos_img
             self.ruler_end = None
 
-        editor.update()
+        editor.request_repaint(reason="ruler")
 
     def mouseMove(self, editor, event):
         if not self.dragging_ruler_point:
@@ -62,7 +62,7 @@ class RulerMode(BaseMode):
             self.ruler_start = pos_img
         elif self.dragging_ruler_point == "end":
             self.ruler_end = pos_img
-        editor.update()
+        editor.request_repaint(reason="ruler")
 
     def mouseRelease(self):
         """Clear dragging state"""
@@ -0,0 +1,175 @@
+import math
+
+import numpy as np
+from PyQt6.QtCore import Qt, QPointF
+from PyQt6.QtGui import QPolygonF
+
+from .base_mode import BaseMode
+from ....persistence.config import constants
+from ....persistence.utils.coordinate_utils import map_to_image_space
+from ....models.affine_transform import (
+    AffinePreview, targets_from_selection, targets_for_segments, targets_bounds,
+    translation_matrix, rotation_matrix, scale_matrix, mirror_matrix
+)
+
+# Corner handle -> the opposite corner it scales around
+_OPPOSITE_CORNER = {
+    "top_left": "bottom_right", "top_right": "bottom_left",
+    "bottom_left": "top_right", "bottom_right": "top_left",
+}
+
+
+def _corner(rect, name):
+    return {
+        "top_left": rect.topLeft(), "top_right": rect.topRight(),
+        "bottom_left": rect.bottomLeft(), "bottom_right": rect.bottomRight(),
+    }[name]
+
+
+class TransformMode(BaseMode):
+    """
+    Move, rotate and scale the selected points (or the active segment when
+    nothing is selected) with on-canvas handles. The drag is previewed on the
+    points themselves and committed as one AffineTransformCommand on release.
+    """
+
+    name = "transform"
+    MIN_SCALE = 1e-3  # Keeps the matrix invertible when a corner is dragged onto its opposite
+
+    def __init__(self):
+        super().__init__()
+        self.targets = ()
+        self.bounds = None        # QRectF - image-space box around the targets
+        self.active_handle = None  # "move", "rotate" or a corner name while dragging
+        self.press_pos = None     # QPointF - image-space press position
+        self.matrix = None        # np.ndarray - transform of the drag in progress
+        self._preview = None
+
+    def refresh(self, editor):
+        """Recompute the targets and their box from the current selection."""
+        segments = editor.manager.get_segments()
+        selection = editor.selection_manager.selected_points_list
+        if selection:
+            self.targets = targets_from_selection(selection, segments)
+        elif 0 <= editor.manager.active_segment_index < len(segments):
+            self.targets = targets_for_segments([editor.manager.active_segment_index])
+        else:
+            self.targets = ()
+        self.bounds = targets_bounds(segments, self.targets) if self.targets else None
+
+    def handle_positions(self, editor):
+        """Screen-space centers of the rotate and corner handles."""
+        if self.bounds is None:
+            return {}
+        to_screen = lambda p: p * editor.scale_factor + editor.translation
+        positions = {name: to_screen(_corner(self.bounds, name)) for name in _OPPOSITE_CORNER}
+        top_center = to_screen(QPointF(self.bounds.center().x(), self.bounds.top()))
+        positions["rotate"] = top_center - QPointF(0, constants.TRANSFORM_ROTATE_HANDLE_OFFSET_PX)
+        return positions
+
+    def hit_test(self, editor, screen_pos):
+        """Handle under screen_pos: "rotate", a corner name, "move" inside the box, or None."""
+        # Twice the drawn half-size, so the handles are easy to hit on a touchscreen
+        reach = constants.TRANSFORM_HANDLE_SIZE_PX
+        for name, center in self.handle_positions(editor).items():
+            if abs(center.x() - screen_pos.x()) <= reach and abs(center.y() - screen_pos.y()) <= reach:
+                return name
+        if self.bounds is not None:
+            pos = map_to_image_space(screen_pos, editor.translation, editor.scale_factor)
+            margin = reach / editor.scale_factor
+            if self.bounds.adjusted(-margin, -margin, margin, margin).contains(pos):
+                return "move"
+        return None
+
+    def mousePress(self, editor, event):
+        if event.button() != Qt.MouseButton.LeftButton:
+            return
+        self.refresh(editor)
+        self.active_handle = self.hit_test(editor, event.position())
+        if self.active_handle is None:
+            return
+        self.press_pos = map_to_image_space(event.position(), editor.translation, editor.scale_factor)
+        self.matrix = np.identity(3)
+        self._preview = AffinePreview(editor.manager.get_segments(), self.targets)
+
+    def mouseMove(self, editor, event):
+        if self.active_handle is None:
+            return
+        pos = map_to_image_space(event.position(), editor.translation, editor.scale_factor)
+        self.matrix = self._drag_matrix(pos)
+        self._preview.show(self.matrix)
+        editor.request_repaint(reason="transform")
+
+    def mouseRelease(self, editor, event):
+        if self.active_handle is None:
+            return
+        handle, matrix = self.active_handle, self.matrix
+        self._preview.restore()
+        self._preview = None
+        self.active_handle = None
+        self.press_pos = None
+        self.matrix = None
+        if not np.allclose(matrix, np.identity(3)):
+            description = "Move" if handle == "move" else "Rotate" if handle == "rotate" else "Scale"
+            editor.segment_service.transform(self.targets, matrix, description)
+            editor.pointsUpdated.emit()
+        self.refresh(editor)
+        editor.request_repaint(reason="transform")
+
+    def apply_numeric(self, editor, dx=0.0, dy=0.0, angle=0.0, sx=1.0, sy=1.0,
+                      mirror_horizontal=False, mirror_vertical=False):
+        """Mirror, scale and rotate around the box center, then move by (dx, dy), as one command."""
+        self.refresh(editor)
+        if self.bounds is None:
+            return 0
+        center = self.bounds.center()
+        matrix = (translation_matrix(dx, dy) @ rotation_matrix(angle, center) @
+                  scale_matrix(sx, sy, center) @ mirror_matrix(mirror_horizontal, mirror_vertical, center))
+        if np.allclose(matrix, np.identity(3)):
+            return 0
+        moved = editor.segment_service.transform(self.targets, matrix)
+        editor.pointsUpdated.emit()
+        self.refresh(editor)
+        editor.request_repaint(reason="transform")
+        return moved
+
+    def _drag_matrix(self, pos):
+        if self.active_handle == "move":
+            delta = pos - self.press_pos
+            return translation_matrix(delta.x(), delta.y())
+        center = self.bounds.center()
+        if self.active_handle == "rotate":
+            start = math.atan2(self.press_pos.y() - center.y(), self.press_pos.x() - center.x())
+            current = math.atan2(pos.y() - center.y(), pos.x() - center.x())
+            return rotation_matrix(math.degrees(current - start), center)
+        fixed = _corner(self.bounds, _OPPOSITE_CORNER[self.active_handle])
+        dragged = _corner(self.bounds, self.active_handle)
+        return scale_matrix(self._ratio(pos.x(), dragged.x(), fixed.x()),
+                            self._ratio(pos.y(), dragged.y(), fixed.y()), fixed)
+
+    def _ratio(self, current, start, fixed):
+        span = start - fixed
+        if abs(span) < 1e-9:
+            # A flat box (e.g. a horizontal line) cannot be scaled along its zero side
+            return 1.0
+        ratio = (current - fixed) / span
+        return math.copysign(max(abs(ratio), self.MIN_SCALE), ratio)
+
+    def box_polygon(self):
+        """Image-space outline of the box, following the drag in progress; None when there is nothing to transform."""
+        if self.bounds is None:
+            return None
+        corners = np.array([(p.x(), p.y()) for p in (
+            self.bounds.topLeft(), self.bounds.topRight(), self.bounds.bottomRight(), self.bounds.bottomLeft()
+        )])
+        if self.matrix is not None:
+            corners = corners @ self.matrix[:2, :2].T + self.matrix[:2, 2]
+        return QPolygonF([QPointF(x, y) for x, y in corners.tolist()])
+
+    def clear(self):
+        self.targets = ()
+        self.bounds = None
+        self.active_handle = None
+        self.press_pos = None
+        self.matrix = None
+        self._preview = None
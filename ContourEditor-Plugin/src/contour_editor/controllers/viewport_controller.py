@@ -1,6 +1,11 @@
+import sys
+
+import numpy as np
 from PyQt6.QtCore import Qt, QPointF
 from PyQt6.QtGui import QImage
 from ..persistence.utils.coordinate_utils import map_to_image_space
+from ..rendering.image_pyramid import ImagePyramid
+from .image_loader import AsyncImageLoader
 
 
 class ViewportController:
@@ -13,15 +18,36 @@ class ViewportController:
         self.is_zooming = False
         
         # Image state - now owned by controller
-        self.image = None
+        self.image_pyramid = ImagePyramid()
+        self._image = None
+        self._image_buffer = None  # NumPy array backing a zero-copy QImage
+        self._image_loader = None  # Created on first async load
+
+    @property
+    def image(self):
+        return self._image
+
+    @image.setter
+    def image(self, value):
+        self._set_background(value)
+
+    def _set_background(self, image, buffer=None):
+        """
+        Replacing the image invalidates the scaled background cache and the
+        edge map used for snapping. buffer is the array a zero-copy image wraps.
+        """
+        self._image = image
+        self._image_buffer = buffer
+        self.image_pyramid.set_image(image)
+        self.editor.snapping.set_background(image, buffer)
 
     def zoom_in(self):
         self._apply_centered_zoom(1.25)
-        self.editor.update()
+        self.editor.request_repaint(reason="zoom")
 
     def zoom_out(self):
         self._apply_centered_zoom(0.8)
-        self.editor.update()
+        self.editor.request_repaint(reason="zoom")
 
     def _apply_centered_zoom(self, factor):
         """Apply zoom centered on the widget center"""
@@ -57,7 +83,7 @@ class ViewportController:
         else:
             self.translation = QPointF(0, 0)
 
-        self.editor.update()
+        self.editor.request_repaint(reason="zoom")
 
     def handle_zoom(self, event):
         """Handle mouse wheel zoom towards cursor position"""
@@ -72,7 +98,7 @@ class ViewportController:
         # Update translation to zoom towards cursor
         new_cursor_screen_pos = cursor_img_pos * self.scale_factor + self.translation
         self.translation += cursor_pos - new_cursor_screen_pos
-        self.editor.update()
+        self.editor.request_repaint(reason="zoom")
 
     def reset_zoom_flag(self):
         self.is_zooming = False
@@ -99,24 +125,88 @@ class ViewportController:
         self.image = image
         return image
 
-    def set_image(self, image):
-        """Set image from numpy array"""
+    def load_image_async(self, path):
+        """
+        Load an image file on a worker thread. A placeholder of the same size
+        is shown until decoding finishes; a newer load supersedes this one.
+        """
+        loader = self._get_image_loader()
+        if loader.load(path) is not None:
+            return  # Served from the cache, image_loaded already applied it
+        size = loader.image_size(path)
+        if size.isValid() and (self.image is None or self.image.size() != size):
+            placeholder = QImage(size, QImage.Format.Format_RGB32)
+            placeholder.fill(Qt.GlobalColor.lightGray)
+            self.update_image(placeholder)
+
+    def _get_image_loader(self):
+        if self._image_loader is None:
+            self._image_loader = AsyncImageLoader()
+            self._image_loader.image_loaded.connect(self._on_image_loaded)
+            self._image_loader.load_failed.connect(lambda path: print(f"Failed to load image from path: {path}"))
+        return self._image_loader
+
+    def shutdown(self):
+        """Stop the background image loader's worker thread."""
+        if self._image_loader is not None:
+            self._image_loader.shutdown()
+            self._image_loader = None
+
+    def _on_image_loaded(self, path, image):
+        self.update_image(image)
+
+    def set_image(self, image, bgr=False):
+        """
+        Set image from numpy array without copying the pixels.
+
+        The QImage wraps the array memory, so the array is kept alive for as
+        long as the image is shown. bgr=True selects OpenCV channel order.
+        None clears the background (see clear_image).
+        """
         if image is None:
+            self.clear_image()
             return
-        height, width, channels = image.shape
-        bytes_per_line = channels * width
-        fmt = QImage.Format.Format_RGB888 if channels == 3 else QImage.Format.Format_RGBA8888
-        qimage = QImage(image.data, width, height, bytes_per_line, fmt)
-        self.update_image(qimage)
+        if self._image_loader is not None:
+            self._image_loader.cancel()  # A live frame supersedes a pending file load
+        if image.dtype != np.uint8:
+            image = image.astype(np.uint8)
+        if image.ndim == 2:
+            fmt = QImage.Format.Format_Grayscale8
+            channels = 1
+        else:
+            channels = image.shape[2]
+            if channels == 3:
+                fmt = QImage.Format.Format_BGR888 if bgr else QImage.Format.Format_RGB888
+            elif bgr and sys.byteorder == "little":
+                fmt = QImage.Format.Format_ARGB32  # BGRA bytes are ARGB32 on little-endian hosts
+            else:
+                if bgr:
+                    image = image[..., [2, 1, 0, 3]]
+                fmt = QImage.Format.Format_RGBA8888
+        if image.strides[-1] != image.itemsize or (image.ndim == 3 and image.strides[1] != channels * image.itemsize):
+            image = np.ascontiguousarray(image)
+        height, width = image.shape[:2]
+        qimage = QImage(image.data, width, height, image.strides[0], fmt)
+        self._set_background(qimage, image)
+        self.editor.request_repaint(reason="image")
+
+    def clear_image(self):
+        """Remove the background image together with its pyramid levels and edge map."""
+        if self._image_loader is not None:
+            self._image_loader.cancel()  # A pending file load must not bring an image back
+        self._set_background(None)
+        self.editor.request_repaint(reason="image")
 
     def is_within_image(self, pos: QPointF) -> bool:
+        if self.image is None:
+            return True  # Without a background there are no bounds to leave
         image_width = self.image.width()
         image_height = self.image.height()
         img_pos = map_to_image_space(pos, self.translation, self.scale_factor)
         return 0 <= img_pos.x() < image_width and 0 <= img_pos.y() < image_height
 
     def update_image(self, image_input):
-        """Update the current image"""
+        """Update the current image (paths are decoded synchronously; see load_image_async)"""
         if isinstance(image_input, str):
             image = QImage(image_input)
             if image.isNull():
@@ -128,4 +218,4 @@ class ViewportController:
         else:
             print("Unsupported image input type.")
             return
-        self.editor.update()
\ No newline at end of file
+        self.editor.request_repaint(reason="image")
\ No newline at end of file
@@ -1,3 +1,5 @@
+from functools import partial
+
 from PyQt6.QtCore import pyqtSignal, Qt, QTimer, QPointF
 from PyQt6.QtGui import QPainter
 from PyQt6.QtWidgets import QFrame
@@ -14,12 +16,27 @@ from ..controllers.managers.settings_manager import SettingsManager
 from ..controllers.managers.data_export_manager import DataExportManager
 from ..controllers.managers.event_manager import EventManager
 from ..controllers.managers.layer_manager import LayerManager
+from ..controllers.managers.camera_feed_manager import CameraFeedManager
+from ..controllers.managers.hover_manager import HoverManager
 from ..rendering.editor_renderer import EditorRenderer
+from ..rendering.dirty_regions import DirtyRegionTracker
+from ..rendering.interaction_quality import InteractionQuality
+from ..rendering.frame_scheduler import FrameScheduler
 from ..models.segment import Segment, Layer
+from ..models.spatial_index import SpatialIndex
 from ..persistence.data.segment_provider import SegmentManagerProvider
 from ..core.event_bus import EventBus
 from ..services.commands.command_history import CommandHistory
 from ..services.segment_service import SegmentService
+from ..services.snapping_service import SnappingService
+
+# Beyond this many changed segments one full repaint is cheaper than a region per segment
+MAX_SEGMENT_REPAINTS = 32
+
+
+def _shutdown_workers(viewport_controller, snapping, *_):
+    viewport_controller.shutdown()
+    snapping.shutdown()
 
 
 class ContourEditor(QFrame):
@@ -43,6 +60,13 @@ class ContourEditor(QFrame):
         self.settings_manager = SettingsManager(self,self.glue_type_names)
         self.event_manager = EventManager(self)  # Initialize early for event handling
         self.renderer = EditorRenderer(self)
+        self.frame_scheduler = FrameScheduler(self)
+        self.dirty_regions = DirtyRegionTracker(self)
+        self.interaction_quality = InteractionQuality(self)
+        self.spatial_index = SpatialIndex()
+        self.snapping = SnappingService(self.spatial_index)
+        self.snap_indicator = None  # SnapResult shown while a snapped point is dragged
+        self.hover_manager = HoverManager(self)
         self.mode_manager = ModeManager(self)
         self.overlay_manager = OverlayManager(self)
         self.data_export_manager = DataExportManager(self)
@@ -56,6 +80,7 @@ class ContourEditor(QFrame):
         self.setWindowTitle("Editable Bezier Curves")
         self.setGeometry(100, 100, 640, 360)
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+        self.setMouseTracking(True)  # Moves without a pressed button drive the hover highlight
         self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
         self.setAttribute(Qt.WidgetAttribute.WA_AcceptTouchEvents)
         self.setAutoFillBackground(False)
@@ -67,9 +92,13 @@ class ContourEditor(QFrame):
         self.segment_service = SegmentService(self.manager, self._command_history, self._event_bus)
         self.segment_action_controller = SegmentActionController(self.manager, self.segment_service)
 
+        self.camera_feed_manager = CameraFeedManager(self)
         self.setup_timers()
         # Viewport controller - owns zoom, translation, and image state
         self.viewport_controller = ViewportController(self)
+        # An embedded editor gets no closeEvent when its window closes; stop the
+        # worker threads on destruction as well (the slot must not capture self)
+        self.destroyed.connect(partial(_shutdown_workers, self.viewport_controller, self.snapping))
 
         # Tool manager - owns tool state and tool mode objects
         self.tool_manager = ToolManager(self)
@@ -111,13 +140,44 @@ class ContourEditor(QFrame):
 
     def _connect_event_bus(self):
         """Subscribe to EventBus events that require canvas repaint"""
-        self._event_bus.segment_visibility_changed.connect(lambda *_: self.update())
-        self._event_bus.segment_deleted.connect(lambda *_: self.update())
-        self._event_bus.segment_added.connect(lambda *_: self.update())
-        self._event_bus.segment_layer_changed.connect(lambda *_: self.update())
-        self._event_bus.points_changed.connect(self.update)
-        self._event_bus.undo_executed.connect(self.update)
-        self._event_bus.redo_executed.connect(self.update)
+        self._event_bus.scene_changed.connect(self._on_scene_changed)
+        self._event_bus.points_changed.connect(self._on_points_changed)
+        self._event_bus.undo_executed.connect(lambda *_: self.request_repaint(reason="undo"))
+        self._event_bus.redo_executed.connect(lambda *_: self.request_repaint(reason="redo"))
+
+    def _on_points_changed(self, *_):
+        # Emitted next to published changes, scene_changed repaints just the touched segments
+        if self._event_bus.has_pending_changes():
+            return
+        self.request_repaint(reason="points_changed")
+
+    def _on_scene_changed(self, changes):
+        """Repaint only the segments a ChangeSet touched."""
+        seg_indexes = changes.seg_indexes()
+        # Added or removed segments shift the indices of the others
+        if changes.structural or len(seg_indexes) > MAX_SEGMENT_REPAINTS:
+            self.request_repaint(reason="scene_changed")
+            return
+        for seg_index in seg_indexes:
+            self.update_segment(seg_index)
+
+    def request_repaint(self, region=None, reason="update"):
+        """
+        Ask for a repaint of region (None = whole widget). Requests are merged
+        by the frame scheduler into at most one paint per frame interval.
+        """
+        scheduler = getattr(self, "frame_scheduler", None)
+        if scheduler is None:
+            if region is None:
+                self.update()
+            else:
+                self.update(region)
+            return
+        scheduler.request(region, reason)
+
+    def update_segment(self, seg_index):
+        """Repaint only the area covered by a segment before and after its change."""
+        self.request_repaint(self.dirty_regions.segment_region(seg_index), "segment")
 
     # Property accessors for backward compatibility
     @property
@@ -169,6 +229,14 @@ class ContourEditor(QFrame):
     def rectangle_select_mode_active(self, value):
         self.tool_manager.rectangle_select_mode_active = value
 
+    @property
+    def transform_mode_active(self):
+        return self.tool_manager.transform_mode_active
+
+    @transform_mode_active.setter
+    def transform_mode_active(self, value):
+        self.tool_manager.transform_mode_active = value
+
     @property
     def ruler_mode(self):
         return self.tool_manager.ruler_mode
@@ -177,6 +245,10 @@ class ContourEditor(QFrame):
     def rectangle_select_mode(self):
         return self.tool_manager.rectangle_select_mode
 
+    @property
+    def transform_mode(self):
+        return self.tool_manager.transform_mode
+
     @property
     def magnifier(self):
         return self.tool_manager.magnifier
@@ -309,15 +381,10 @@ class ContourEditor(QFrame):
         self.tool_manager.show_tools_menu()
 
     def setup_timers(self):
-        # Drag update throttling (used by PointDragMode)
-        self.drag_timer = QTimer(self)
-        self.drag_timer.setInterval(constants.DRAG_UPDATE_INTERVAL_MS)  # Limit updates to ~60 FPS
-        self.drag_timer.timeout.connect(self.perform_drag_update)
-
         # Camera feed update timer
         self.camera_feed_update_timer = QTimer(self)
         self.camera_feed_update_timer.setInterval(constants.CAMERA_FEED_UPDATE_INTERVAL_MS)
-        self.camera_feed_update_timer.timeout.connect(self.update_camera_feed_requested.emit)
+        self.camera_feed_update_timer.timeout.connect(self.camera_feed_manager.poll)
         self.camera_feed_update_timer.start()
 
     """ OVERLAYS """
@@ -351,16 +418,27 @@ class ContourEditor(QFrame):
     def load_image(self, path):
         return self.viewport_controller.load_image(path)
 
-    def set_image(self, image):
-        self.viewport_controller.set_image(image)
+    def load_image_async(self, path):
+        """Decode an image file in the background; see ViewportController.load_image_async."""
+        self.viewport_controller.load_image_async(path)
+
+    def set_image(self, image, frame_id=None, bgr=False):
+        """
+        Show a NumPy camera frame. Safe to call from any thread; only the newest
+        pending frame is drawn and repeated frames are skipped. Pass bgr=True
+        for OpenCV channel order.
+        """
+        self.camera_feed_manager.submit(image, frame_id, bgr)
 
     def set_verification_contours(self, contours):
         self.verification_contours = list(contours or [])
-        self.update()
+        self.renderer.set_verification_contours(self.verification_contours)
+        self.request_repaint(reason="verification")
 
     def clear_verification_contours(self):
         self.verification_contours = []
-        self.update()
+        self.renderer.set_verification_contours(self.verification_contours)
+        self.request_repaint(reason="verification")
 
     def update_image(self, image_input):
         self.viewport_controller.update_image(image_input)
@@ -370,7 +448,7 @@ class ContourEditor(QFrame):
     def delete_segment(self, seg_index):
         """Delete a segment - delegates to external manager"""
         self.segment_action_controller.delete_segment(seg_index)
-        self.update()
+        self.request_repaint(reason="scene_changed")
         self.pointsUpdated.emit()
 
     def _handle_add_control_point(self, pos):
@@ -411,6 +489,10 @@ class ContourEditor(QFrame):
     def mouseReleaseEvent(self, event):
         self.event_manager.handle_mouse_release(event)
 
+    def leaveEvent(self, event):
+        self.hover_manager.clear()
+        super().leaveEvent(event)
+
     def wheelEvent(self, event):
         self.event_manager.handle_wheel(event)
         event.accept()  # Accept the event so Qt knows we handled it
@@ -430,21 +512,29 @@ class ContourEditor(QFrame):
 
     """ KEYBOARD EVENTS"""
 
-    def perform_drag_update(self):
-        """Throttled update callback for drag operations"""
-        if self.mode_manager.drag_mode.pending_drag_update:
-            self.update()
-            self.mode_manager.drag_mode.pending_drag_update = False
-        else:
-            self.drag_timer.stop()
-
     def addNewSegment(self, layer_name=None):
         """Add new segment - delegates to external manager"""
         new_segment = self.segment_action_controller.add_new_segment(layer_name)
-        self.update()
+        self.request_repaint(reason="scene_changed")
         self.pointsUpdated.emit()
         return  new_segment
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.camera_feed_manager.resume_after_show()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.camera_feed_manager.pause_for_hide()
+
+    def closeEvent(self, event):
+        self.shutdown_workers()
+        super().closeEvent(event)
+
+    def shutdown_workers(self):
+        """Stop the image decoding and edge map worker threads."""
+        _shutdown_workers(self.viewport_controller, self.snapping)
+
     def paintEvent(self, event):
         painter = QPainter(self)
         self.renderer.render(painter, event)
@@ -488,5 +578,5 @@ class ContourEditor(QFrame):
 
         # Clear selection and update UI
         self.selection_manager.clear_all_selections()
-        self.update()
+        self.request_repaint(reason="scene_changed")
         self.pointsUpdated.emit()
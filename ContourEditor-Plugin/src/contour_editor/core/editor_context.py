@@ -75,6 +75,9 @@ class ModeAPI:
     def is_rectangle_select_active(self) -> bool:
         return getattr(self._editor, 'rectangle_select_mode_active', False)
     @property
+    def is_transform_active(self) -> bool:
+        return getattr(self._editor, 'transform_mode_active', False)
+    @property
     def is_multi_select_active(self) -> bool:
         return self._editor.multi_select_mode_active
     @property
@@ -87,6 +90,9 @@ class ModeAPI:
     def rectangle_select(self):
         return self._editor.rectangle_select_mode
     @property
+    def transform(self):
+        return self._editor.transform_mode
+    @property
     def multi_select(self):
         return self._editor.multi_select_mode
     @property
@@ -141,7 +147,7 @@ class EditorContext:
     @property
     def widget(self):
         return self._editor
-    def update(self):
-        self._editor.update()
+    def update(self, region=None, reason="update"):
+        self._editor.request_repaint(region, reason)
     def is_within_image(self, pos: QPointF) -> bool:
         return self._editor.is_within_image(pos)
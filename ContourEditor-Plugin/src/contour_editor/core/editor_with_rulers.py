@@ -1,4 +1,4 @@
-from PyQt6.QtCore import Qt, QEvent, pyqtSignal
+from PyQt6.QtCore import Qt, QEvent, QTimer, pyqtSignal
 from PyQt6.QtWidgets import QWidget, QGridLayout
 
 from .ruler import Ruler
@@ -28,11 +28,16 @@ class ContourEditorWithRulers(QWidget):
         layout.addWidget(self.editor, 1, 1)       # editor viewport
         self.setLayout(layout)
 
-        # Keep rulers in sync after the editor repaints or updates
+        # Keep rulers in sync after the editor repaints or updates,
+        # at most once per event loop pass
+        self._ruler_sync_timer = QTimer(self)
+        self._ruler_sync_timer.setSingleShot(True)
+        self._ruler_sync_timer.setInterval(0)
+        self._ruler_sync_timer.timeout.connect(self._update_rulers)
         self.editor.installEventFilter(self)
         try:
             # also update when points change (signal provided by editor)
-            self.editor.pointsUpdated.connect(self._update_rulers)
+            self.editor.pointsUpdated.connect(self._schedule_ruler_update)
         except Exception:
             pass
 
@@ -41,10 +46,14 @@ class ContourEditorWithRulers(QWidget):
         self.h_ruler.update_view(self.editor.scale_factor, self.editor.translation)
         self.v_ruler.update_view(self.editor.scale_factor, self.editor.translation)
 
+    def _schedule_ruler_update(self):
+        if not self._ruler_sync_timer.isActive():
+            self._ruler_sync_timer.start()
+
     def eventFilter(self, obj, event):
         # After editor paint, refresh rulers
         if obj is self.editor and event.type() == QEvent.Type.Paint:
-            self._update_rulers()
+            self._schedule_ruler_update()
         return super().eventFilter(obj, event)
 
     def __getattr__(self, name):
@@ -48,7 +48,7 @@ class ContourEditorWithBottomToolBar(QWidget):
         constants.SHOW_ANCHOR_POINTS = True
         constants.SHOW_CONTROL_POINTS = True
         # Trigger repaint to update the display
-        self.editor_with_rulers.editor.update()
+        self.editor_with_rulers.editor.request_repaint(reason="settings")
 
     def hide_points(self):
         """Hide anchor and control points"""
@@ -56,7 +56,7 @@ class ContourEditorWithBottomToolBar(QWidget):
         constants.SHOW_ANCHOR_POINTS = False
         constants.SHOW_CONTROL_POINTS = False
         # Trigger repaint to update the display
-        self.editor_with_rulers.editor.update()
+        self.editor_with_rulers.editor.request_repaint(reason="settings")
 
     def set_zoom_controls_visible(self, visible):
         """Toggle visibility of zoom controls"""
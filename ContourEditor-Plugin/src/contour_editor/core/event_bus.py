@@ -4,7 +4,9 @@ This provides a decoupled communication mechanism between components.
 All state changes are broadcast as signals, allowing widgets to react
 without direct coupling.
 """
+from contextlib import contextmanager
 from PyQt6.QtCore import QObject, pyqtSignal
+from .scene_changes import ChangeSet, SceneChange
 class EventBus(QObject):
     """
     Singleton event bus for application-wide event distribution.
@@ -15,6 +17,10 @@ class EventBus(QObject):
         bus.segment_visibility_changed.emit(seg_index, visible)
         # Subscribe to events
         bus.segment_visibility_changed.connect(self._on_visibility_changed)
+        # Publish structured changes; a transaction delivers them as one ChangeSet
+        with bus.transaction():
+            bus.publish("geometry", seg_index, anchors=[2, 3])
+        bus.scene_changed.connect(self._on_scene_changed)
     """
     # Segment events
     segment_added = pyqtSignal(int)  # seg_index
@@ -22,8 +28,10 @@ class EventBus(QObject):
     segment_visibility_changed = pyqtSignal(int, bool)  # seg_index, visible
     segment_layer_changed = pyqtSignal(int, str)  # seg_index, layer_name
     active_segment_changed = pyqtSignal(int)  # seg_index
+    # Structured change events
+    scene_changed = pyqtSignal(object)  # ChangeSet of one transaction
     # Point events
-    points_changed = pyqtSignal()  # General points modification
+    points_changed = pyqtSignal()  # General points modification, no details
     point_added = pyqtSignal(int, int)  # seg_index, point_index
     point_deleted = pyqtSignal(int, int)  # seg_index, point_index
     point_moved = pyqtSignal(int, int)  # seg_index, point_index
@@ -43,6 +51,8 @@ class EventBus(QObject):
         if EventBus._instance is not None:
             raise RuntimeError("EventBus is a singleton. Use EventBus.get_instance()")
         super().__init__()
+        self._transaction_depth = 0
+        self._pending_changes = None
     @classmethod
     def get_instance(cls):
         """Get the singleton instance of EventBus"""
@@ -53,3 +63,31 @@ class EventBus(QObject):
     def reset_instance(cls):
         """Reset the singleton (useful for testing)"""
         cls._instance = None
+    def publish(self, kind, seg_index, anchors=None, controls=None):
+        """
+        Record a SceneChange. Inside a transaction it is delivered with the
+        rest of the transaction; outside one it is emitted on its own.
+        """
+        with self.transaction() as changes:
+            changes.append(SceneChange(kind, seg_index, anchors, controls))
+    def has_pending_changes(self):
+        """Whether the open transaction has changes that scene_changed is yet to deliver."""
+        return bool(self._pending_changes)
+
+    @contextmanager
+    def transaction(self):
+        """
+        Collect the changes published inside the block into one ChangeSet,
+        emitted by scene_changed when the outermost transaction ends.
+        """
+        if self._transaction_depth == 0:
+            self._pending_changes = ChangeSet()
+        self._transaction_depth += 1
+        try:
+            yield self._pending_changes
+        finally:
+            self._transaction_depth -= 1
+            if self._transaction_depth == 0:
+                changes, self._pending_changes = self._pending_changes, None
+                if changes:
+                    self.scene_changed.emit(changes)
@@ -133,24 +133,31 @@ class MainApplicationFrame(QFrame):
             return
 
         from contour_editor.services.commands import CommandHistory
+        from contour_editor.services.commands.undo_order import publish_snapshot_changes, redo_source
         from contour_editor.core.event_bus import EventBus
 
+        # Segment operations live in CommandHistory, point edits in the manager's
+        # snapshots; redo_source picks whichever edit is next in time
         history = CommandHistory.get_instance()
-
-        if history.can_redo():
-            # Use CommandHistory for segment-level operations
+        source = redo_source(history, self.contourEditor.manager)
+        if source == "command":
             history.redo()
             EventBus.get_instance().redo_executed.emit()
-        else:
+        elif source == "snapshot":
             # Fall back to manager's snapshot redo for point-level operations
+            manager = self.contourEditor.manager
+            before = list(manager.get_segments())
             try:
-                self.contourEditor.manager.redo()
-                self.pointManagerWidget.refresh_points()
+                manager.redo()
             except Exception:
                 return
+            publish_snapshot_changes(EventBus.get_instance(), before, manager.get_segments())
+            self.pointManagerWidget.refresh_points()
+        else:
+            return
 
-        # Qt's standard update mechanism - no forced repaints
-        self.contourEditor.editor.update()
+        # Repaint through the frame scheduler - no forced repaints
+        self.contourEditor.editor.request_repaint(reason="redo")
         self.contourEditor.update()
 
     def on_undo(self):
@@ -158,24 +165,31 @@ class MainApplicationFrame(QFrame):
             return
 
         from contour_editor.services.commands import CommandHistory
+        from contour_editor.services.commands.undo_order import publish_snapshot_changes, undo_source
         from contour_editor.core.event_bus import EventBus
 
+        # Segment operations live in CommandHistory, point edits in the manager's
+        # snapshots; undo_source picks whichever edit is next in time
         history = CommandHistory.get_instance()
-
-        if history.can_undo():
-            # Use CommandHistory for segment-level operations
+        source = undo_source(history, self.contourEditor.manager)
+        if source == "command":
             history.undo()
             EventBus.get_instance().undo_executed.emit()
-        else:
+        elif source == "snapshot":
             # Fall back to manager's snapshot undo for point-level operations
+            manager = self.contourEditor.manager
+            before = list(manager.get_segments())
             try:
-                self.contourEditor.manager.undo()
-                self.pointManagerWidget.refresh_points()
+                manager.undo()
             except Exception:
                 return
+            publish_snapshot_changes(EventBus.get_instance(), before, manager.get_segments())
+            self.pointManagerWidget.refresh_points()
+        else:
+            return
 
-        # Qt's standard update mechanism - no forced repaints
-        self.contourEditor.editor.update()
+        # Repaint through the frame scheduler - no forced repaints
+        self.contourEditor.editor.request_repaint(reason="undo")
         self.contourEditor.update()
 
     def on_multi_select_mode_requested(self):
@@ -517,8 +531,8 @@ class MainApplicationFrame(QFrame):
             traceback.print_exc()
             QMessageBox.critical(self, "Error", f"Failed to prepare data: {e}")
 
-    def set_image(self, image):
-        self.contourEditor.set_image(image)
+    def set_image(self, image, frame_id=None, bgr=False):
+        self.contourEditor.set_image(image, frame_id, bgr)
 
     def init_contours(self, contours):
         """
@@ -1,6 +1,6 @@
 
 from PyQt6.QtWidgets import QWidget
-from PyQt6.QtGui import QPainter, QPen, QColor, QFont
+from PyQt6.QtGui import QPainter, QPen, QColor, QFont, QPixmap
 from PyQt6.QtCore import Qt, QPointF
 
 class Ruler(QWidget):
@@ -13,21 +13,22 @@ class Ruler(QWidget):
         self.text_color = QColor(40, 40, 40)
         self.tick_color = QColor(100, 100, 100)
         self.font = QFont("Arial", 8)
+        self._strip = None  # Cached tick/label pixmap for the current scale
         if orientation == Qt.Orientation.Horizontal:
             self.setFixedHeight(20)
         else:
             self.setFixedWidth(30)
 
     def update_view(self, scale_factor, translation):
+        if scale_factor == self.scale_factor and translation == self.translation:
+            return
         self.scale_factor = scale_factor
-        self.translation = translation
+        self.translation = QPointF(translation)
         self.update()
 
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.fillRect(self.rect(), self.ruler_color)
-        painter.setPen(QPen(self.tick_color, 1))
-        painter.setFont(self.font)
 
         step = 50  # base logical unit (in image pixels)
         step_screen = step * self.scale_factor
@@ -38,33 +39,78 @@ class Ruler(QWidget):
             step /= 2
             step_screen = step * self.scale_factor
 
+        # Image coordinate at the ruler origin and the visible image-space length
+        if self.orientation == Qt.Orientation.Horizontal:
+            offset, length = self.translation.x(), self.width()
+        else:
+            offset, length = self.translation.y(), self.height()
+        first_value = -offset / self.scale_factor
+        last_value = first_value + length / self.scale_factor
+
+        strip = self._strip
+        if (strip is None or strip["scale"] != self.scale_factor or strip["step"] != step
+                or strip["thickness"] != self._thickness() or first_value < strip["start"]
+                or last_value > strip["end"]):
+            strip = self._strip = self._build_strip(step, first_value, length)
+
+        # Panning only moves the cached strip
+        shift = round(strip["start"] * self.scale_factor + offset)
+        if self.orientation == Qt.Orientation.Horizontal:
+            painter.drawPixmap(shift, 0, strip["pixmap"])
+        else:
+            painter.drawPixmap(0, shift, strip["pixmap"])
+        painter.end()
+
+    def _thickness(self):
+        return self.height() if self.orientation == Qt.Orientation.Horizontal else self.width()
+
+    def _build_strip(self, step, first_value, length):
+        """
+        Render ticks and labels for three ruler lengths around the visible
+        range into a pixmap, so pans within that range are plain blits.
+        """
+        start = (first_value - length / self.scale_factor) // step * step
+        strip_length = int(3 * length + 2 * step * self.scale_factor) + 1
+        thickness = self._thickness()
+        ratio = self.devicePixelRatioF()
+        if self.orientation == Qt.Orientation.Horizontal:
+            pixmap = QPixmap(int(strip_length * ratio), int(thickness * ratio))
+        else:
+            pixmap = QPixmap(int(thickness * ratio), int(strip_length * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(self.ruler_color)
+
+        painter = QPainter(pixmap)
+        painter.setPen(QPen(self.tick_color, 1))
+        painter.setFont(self.font)
         if self.orientation == Qt.Orientation.Horizontal:
-            self.draw_horizontal(painter, step)
+            self.draw_horizontal(painter, step, start, strip_length, thickness)
         else:
-            self.draw_vertical(painter, step)
+            self.draw_vertical(painter, step, start, strip_length, thickness)
+        painter.end()
+        return {
+            "pixmap": pixmap,
+            "scale": self.scale_factor,
+            "step": step,
+            "thickness": thickness,
+            "start": start,
+            "end": start + strip_length / self.scale_factor,
+        }
 
-    def draw_horizontal(self, painter, step):
-        height = self.height()
-        width = self.width()
-        start_x = -self.translation.x() % (step * self.scale_factor)
-        base_value = int(-self.translation.x() / self.scale_factor // step * step)
-        for i in range(int(width / (step * self.scale_factor)) + 3):
-            x = start_x + i * step * self.scale_factor
-            value = base_value + i * step
+    def draw_horizontal(self, painter, step, start_value, length, height):
+        for i in range(int(length / (step * self.scale_factor)) + 1):
+            x = i * step * self.scale_factor
+            value = start_value + i * step
             painter.drawLine(int(x), height, int(x), height - 8)
             painter.drawText(int(x) + 2, height - 2, f"{int(value)}")
 
-    def draw_vertical(self, painter, step):
-        height = self.height()
-        width = self.width()
-        start_y = -self.translation.y() % (step * self.scale_factor)
-        base_value = int(-self.translation.y() / self.scale_factor // step * step)
-        for i in range(int(height / (step * self.scale_factor)) + 3):
-            y = start_y + i * step * self.scale_factor
-            value = base_value + i * step
+    def draw_vertical(self, painter, step, start_value, length, width):
+        for i in range(int(length / (step * self.scale_factor)) + 1):
+            y = i * step * self.scale_factor
+            value = start_value + i * step
             painter.drawLine(width, int(y), width - 8, int(y))
             painter.save()
             painter.translate(width - 2, int(y) - 2)
             painter.rotate(-90)
             painter.drawText(0, 0, f"{int(value)}")
-            painter.restore()
\ No newline at end of file
+            painter.restore()
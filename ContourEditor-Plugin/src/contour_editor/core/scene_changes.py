@@ -0,0 +1,92 @@
+"""
+Scene Changes - Structured payloads of EventBus.scene_changed
+Each SceneChange says which segment changed and how; a ChangeSet collects
+the changes of one EventBus transaction so consumers can update only what
+was touched instead of assuming the whole scene changed.
+"""
+
+
+def index_ranges(indices):
+    """Collapse point indices into a tuple of ranges of consecutive indices."""
+    ranges = []
+    for index in sorted(set(indices)):
+        if ranges and ranges[-1].stop == index:
+            ranges[-1] = range(ranges[-1].start, index + 1)
+        else:
+            ranges.append(range(index, index + 1))
+    return tuple(ranges)
+
+
+def changed_indices(before, after):
+    """
+    Range of the indices of after that hold a different point than before.
+    Points are compared by identity: edits replace points rather than
+    mutating them. Once the lengths differ every later index has shifted.
+    """
+    start = 0
+    common = min(len(before), len(after))
+    while start < common and before[start] is after[start]:
+        start += 1
+    stop = len(after)
+    if len(before) == len(after):
+        while stop > start and before[stop - 1] is after[stop - 1]:
+            stop -= 1
+    return range(start, stop)
+
+
+class SceneChange:
+    """
+    One change to one segment.
+
+    kind is one of KINDS. For "geometry" changes anchors and controls are
+    the changed point indices as a tuple of ranges, or None when any point
+    of the segment may have changed.
+    """
+
+    KINDS = ("added", "removed", "geometry", "visibility", "layer", "settings")
+
+    def __init__(self, kind, seg_index, anchors=None, controls=None):
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown scene change kind: {kind!r}")
+        self.kind = kind
+        self.seg_index = seg_index
+        self.anchors = None if anchors is None else index_ranges(anchors)
+        self.controls = None if controls is None else index_ranges(controls)
+
+    def __repr__(self):
+        return f"SceneChange({self.kind!r}, {self.seg_index}, anchors={self.anchors}, controls={self.controls})"
+
+
+class ChangeSet:
+    """The changes of one EventBus transaction, in the order they were published."""
+
+    # Kinds after which segment indices no longer line up with the previous scene
+    STRUCTURAL_KINDS = frozenset(("added", "removed"))
+
+    def __init__(self, changes=()):
+        self.changes = list(changes)
+
+    def append(self, change):
+        self.changes.append(change)
+
+    def __iter__(self):
+        return iter(self.changes)
+
+    def __len__(self):
+        return len(self.changes)
+
+    def __repr__(self):
+        return f"ChangeSet({self.changes!r})"
+
+    @property
+    def kinds(self):
+        return {change.kind for change in self.changes}
+
+    @property
+    def structural(self):
+        """Whether segments were added or removed, shifting the indices of later segments."""
+        return not self.kinds.isdisjoint(self.STRUCTURAL_KINDS)
+
+    def seg_indexes(self, *kinds):
+        """Indices of the segments changed in any of kinds (all kinds if none are given)."""
+        return {change.seg_index for change in self.changes if not kinds or change.kind in kinds}
@@ -0,0 +1,67 @@
+from PyQt6.QtCore import QPointF, QTimer
+from ..persistence.config import constants
+class InputCoalescer:
+    """
+    Merges bursts of mouse-move and wheel events to one dispatch per frame.
+    The first event of a burst is handled at once; events arriving within the
+    next frame interval are folded (moves to the latest event, wheel deltas
+    summed) and dispatched when the interval ends.
+    """
+    def __init__(self, dispatch_move, dispatch_wheel, interval_ms=None):
+        self._dispatch_move = dispatch_move
+        self._dispatch_wheel = dispatch_wheel
+        self._interval_ms = constants.DRAG_UPDATE_INTERVAL_MS if interval_ms is None else interval_ms
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._on_frame)
+        self._pending_move = None
+        self._wheel_delta = 0
+        self._wheel_pos = None
+        self.received_events = 0
+        self.dispatched_events = 0
+    def move(self, event):
+        self.received_events += 1
+        if self._timer.isActive():
+            # Qt reuses event objects after the handler returns; the clone keeps the input timestamp
+            self._pending_move = event.clone() if hasattr(event, "clone") else event
+            return
+        self._start_frame()
+        self._send_move(event)
+    def wheel(self, event):
+        angle = event.angleDelta().y()
+        if angle == 0:
+            return
+        self.received_events += 1
+        if self._timer.isActive():
+            self._wheel_delta += angle
+            self._wheel_pos = QPointF(event.position())
+            return
+        self._start_frame()
+        self._send_wheel(angle, event.position())
+    def flush(self):
+        """Dispatch pending input now, e.g. before a press or release is handled."""
+        self._timer.stop()
+        self._dispatch_pending()
+    def _on_frame(self):
+        if self._has_pending():
+            # Keep the frame window open while the burst continues
+            self._start_frame()
+            self._dispatch_pending()
+    def _has_pending(self):
+        return self._pending_move is not None or self._wheel_delta != 0
+    def _dispatch_pending(self):
+        move, self._pending_move = self._pending_move, None
+        delta, pos = self._wheel_delta, self._wheel_pos
+        self._wheel_delta, self._wheel_pos = 0, None
+        if move is not None:
+            self._send_move(move)
+        if delta:
+            self._send_wheel(delta, pos)
+    def _send_move(self, event):
+        self.dispatched_events += 1
+        self._dispatch_move(event)
+    def _send_wheel(self, angle, pos):
+        self.dispatched_events += 1
+        self._dispatch_wheel(angle, pos)
+    def _start_frame(self):
+        self._timer.start(self._interval_ms)
@@ -10,6 +10,7 @@ class GestureHandler:
         if pinch.state() == Qt.GestureState.GestureStarted:
             self._initial_scale = self.ctx.viewport.scale
         elif pinch.state() == Qt.GestureState.GestureUpdated:
+            self.ctx.widget.interaction_quality.begin()
             total_scale_factor = pinch.totalScaleFactor()
             center = pinch.centerPoint()
             old_scale = self.ctx.viewport.scale
@@ -20,4 +21,4 @@ class GestureHandler:
             self.ctx.viewport.translation = center - image_point_under_fingers * new_scale
             self.ctx.update()
         elif pinch.state() == Qt.GestureState.GestureFinished:
-            pass
+            self.ctx.widget.interaction_quality.end()
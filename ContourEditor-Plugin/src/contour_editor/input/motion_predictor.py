@@ -0,0 +1,51 @@
+import time
+from collections import deque
+from PyQt6.QtCore import QPointF
+from ..persistence.config import constants
+class MotionPredictor:
+    """
+    Extrapolates a pointer position a short time ahead from its recent
+    velocity. Velocity is a least-squares fit over the samples of the last
+    window_ms, so single jittery samples do not throw the estimate off.
+    """
+    def __init__(self, window_ms=None, max_lead_px=None, clock=time.perf_counter):
+        self.window_ms = constants.DRAG_PREDICTION_WINDOW_MS if window_ms is None else window_ms
+        self.max_lead_px = constants.DRAG_PREDICTION_MAX_LEAD_PX if max_lead_px is None else max_lead_px
+        self._clock = clock
+        self._samples = deque(maxlen=16)
+    def add_sample(self, pos, t=None):
+        t = self._clock() if t is None else t
+        self._samples.append((t, pos.x(), pos.y()))
+        cutoff = t - self.window_ms / 1000.0
+        while self._samples and self._samples[0][0] < cutoff:
+            self._samples.popleft()
+    def velocity(self):
+        """Pixels per second as (vx, vy), or None with fewer than two samples."""
+        if len(self._samples) < 2:
+            return None
+        n = len(self._samples)
+        mean_t = sum(s[0] for s in self._samples) / n
+        mean_x = sum(s[1] for s in self._samples) / n
+        mean_y = sum(s[2] for s in self._samples) / n
+        var_t = sum((s[0] - mean_t) ** 2 for s in self._samples)
+        if var_t <= 0:
+            return None
+        vx = sum((s[0] - mean_t) * (s[1] - mean_x) for s in self._samples) / var_t
+        vy = sum((s[0] - mean_t) * (s[2] - mean_y) for s in self._samples) / var_t
+        return vx, vy
+    def predict(self, horizon_ms):
+        """Latest position moved horizon_ms along the current velocity, lead clamped to max_lead_px."""
+        if not self._samples:
+            return None
+        _, x, y = self._samples[-1]
+        velocity = self.velocity() if horizon_ms > 0 else None
+        if velocity is None:
+            return QPointF(x, y)
+        dx = velocity[0] * horizon_ms / 1000.0
+        dy = velocity[1] * horizon_ms / 1000.0
+        lead = (dx * dx + dy * dy) ** 0.5
+        if lead > self.max_lead_px:
+            dx, dy = dx * self.max_lead_px / lead, dy * self.max_lead_px / lead
+        return QPointF(x + dx, y + dy)
+    def reset(self):
+        self._samples.clear()
@@ -4,6 +4,7 @@ class MouseHandler:
         self.ctx = context
     def handle_press(self, event):
         editor = self.ctx.widget
+        editor.hover_manager.clear()
         if self.ctx.overlay.is_point_info_visible():
             self.ctx.selection.clear()
             self.ctx.overlay.hide_point_info()
@@ -33,6 +34,9 @@ class MouseHandler:
                 editor.handle_right_mouse_click(editor)
                 return
         elif event.button() == Qt.MouseButton.LeftButton:
+            if self.ctx.mode.is_transform_active:
+                self.ctx.mode.transform.mousePress(editor, event)
+                return
             if self.ctx.mode.is_rectangle_select_active:
                 self.ctx.mode.rectangle_select.mousePress(editor, event)
                 return
@@ -66,6 +70,10 @@ class MouseHandler:
             if result:
                 print(f"_handle_add_control_point return result: {result}")
                 return
+            snapped = editor.snapping.snap(pos, self.ctx.viewport.scale, self.ctx.segments.all())
+            if snapped is not None:
+                print(f"Snapped new point to {snapped.kind} at {snapped.point}")
+                pos = snapped.point
             editor.manager.add_point(pos)
             self.ctx.update()
             editor.pointsUpdated.emit()
@@ -92,6 +100,16 @@ class MouseHandler:
                 screen_pos = event.position()
                 image_pos = self.ctx.viewport.screen_to_image(screen_pos)
                 editor.magnifier.update_position(screen_pos, image_pos)
+        mode = self.ctx.mode
+        if (event.buttons() == Qt.MouseButton.NoButton and not self.ctx.viewport.is_zooming and
+                not (mode.is_transform_active or mode.is_rectangle_select_active or mode.is_ruler_active or
+                     mode.is_pan_active)):
+            editor.hover_manager.update(event.position())
+        else:
+            editor.hover_manager.clear()
+        if self.ctx.mode.is_transform_active:
+            self.ctx.mode.transform.mouseMove(editor, event)
+            return
         if self.ctx.mode.is_rectangle_select_active:
             self.ctx.mode.rectangle_select.mouseMove(editor, event)
             return
@@ -107,6 +125,10 @@ class MouseHandler:
     def handle_double_click(self, event):
         editor = self.ctx.widget
         pos = event.position()
+        if self.ctx.mode.is_transform_active:
+            if self.ctx.mode.transform.hit_test(editor, pos) is not None:
+                editor.tool_manager.show_transform_dialog()
+            return
         target = editor.manager.find_drag_target(pos)
         if target and target[0] == 'control':
             role, seg_index, ctrl_idx = target
@@ -118,12 +140,16 @@ class MouseHandler:
         if editor.point_info_timer.isActive():
             editor.point_info_timer.stop()
         editor.press_hold_start_pos = None
+        if self.ctx.mode.is_transform_active:
+            self.ctx.mode.transform.mouseRelease(editor, event)
+            return
         if self.ctx.mode.is_rectangle_select_active:
             self.ctx.mode.rectangle_select.mouseRelease(editor, event)
             return
         if self.ctx.mode.is_ruler_active:
             self.ctx.mode.ruler.mouseRelease()
         self.ctx.mode.drag.mouseRelease()
+        editor.interaction_quality.end()
         if self.ctx.viewport.is_zooming:
             editor.last_drag_pos = None
             self.ctx.update()
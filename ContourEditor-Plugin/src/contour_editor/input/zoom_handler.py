@@ -1,4 +1,6 @@
 from PyQt6.QtCore import QPointF
+WHEEL_NOTCH_DELTA = 120
+WHEEL_NOTCH_FACTOR = 1.25
 class ZoomHandler:
     def __init__(self, context):
         self.ctx = context
@@ -20,10 +22,12 @@ class ZoomHandler:
             self.ctx.widget.height()
         )
     def handle_wheel_event(self, event):
-        angle = event.angleDelta().y()
+        self.zoom_by_wheel(event.angleDelta().y(), event.position())
+    def zoom_by_wheel(self, angle, cursor_pos):
         if angle == 0:  # No vertical scroll
             return
-        factor = 1.25 if angle > 0 else 0.8
-        cursor_pos = event.position()
+        # 1.25x per 120-unit notch; partial deltas (trackpads, coalesced bursts) zoom proportionally
+        factor = WHEEL_NOTCH_FACTOR ** (angle / WHEEL_NOTCH_DELTA)
+        self.ctx.widget.interaction_quality.begin()
         self.ctx.viewport.zoom_at_point(cursor_pos, factor)
-        self.ctx.widget.update()  # Trigger repaint
+        self.ctx.widget.request_repaint(reason="zoom")
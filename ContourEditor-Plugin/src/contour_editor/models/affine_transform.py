@@ -0,0 +1,229 @@
+import math
+from collections import defaultdict
+
+import numpy as np
+from PyQt6.QtCore import QPointF, QRectF
+
+from .group_move import recentred_controls
+from .segment import touch_geometry
+from ..persistence.utils.point_visibility import segment_to_arrays
+
+
+def translation_matrix(dx, dy):
+    return np.array([[1.0, 0.0, dx], [0.0, 1.0, dy], [0.0, 0.0, 1.0]])
+
+
+def about_center(matrix, center):
+    """Conjugate a linear matrix so it acts around center instead of the origin."""
+    cx, cy = center.x(), center.y()
+    return translation_matrix(cx, cy) @ matrix @ translation_matrix(-cx, -cy)
+
+
+def rotation_matrix(degrees, center=QPointF(0, 0)):
+    angle = math.radians(degrees)
+    cos_a, sin_a = math.cos(angle), math.sin(angle)
+    return about_center(np.array([[cos_a, -sin_a, 0.0], [sin_a, cos_a, 0.0], [0.0, 0.0, 1.0]]), center)
+
+
+def scale_matrix(sx, sy, center=QPointF(0, 0)):
+    return about_center(np.diag([float(sx), float(sy), 1.0]), center)
+
+
+def mirror_matrix(horizontal=True, vertical=False, center=QPointF(0, 0)):
+    """Mirror left-right (horizontal) and/or top-bottom (vertical) around center."""
+    return scale_matrix(-1.0 if horizontal else 1.0, -1.0 if vertical else 1.0, center)
+
+
+def targets_for_segments(seg_indices):
+    """Transform targets covering every anchor and control of whole segments."""
+    return tuple((seg_index, None, None) for seg_index in sorted(set(seg_indices)))
+
+
+def targets_from_selection(selection, segments):
+    """
+    Transform targets for a point selection (SelectionManager dicts) as
+    (seg_index, anchor_indices, control_indices) tuples. Controls between
+    two selected anchors are included so selected spans keep their shape.
+    """
+    by_segment = defaultdict(lambda: (set(), set()))
+    for item in selection:
+        anchors, controls = by_segment[item['seg_index']]
+        (anchors if item['role'] == 'anchor' else controls).add(item['point_index'])
+    targets = []
+    for seg_index, (anchors, controls) in sorted(by_segment.items()):
+        if not 0 <= seg_index < len(segments):
+            continue
+        segment_controls = segments[seg_index].controls
+        anchors = {i for i in anchors if 0 <= i < len(segments[seg_index].points)}
+        controls |= {i for i in anchors if i + 1 in anchors}
+        controls = {i for i in controls if 0 <= i < len(segment_controls) and segment_controls[i] is not None}
+        targets.append((seg_index, tuple(sorted(anchors)), tuple(sorted(controls))))
+    return tuple(targets)
+
+
+def _target_indices(segment, anchors, controls):
+    # Stored targets (an undo's) can outlive the points they named; indices that no longer exist are skipped
+    point_count, segment_controls = len(segment.points), segment.controls
+    if anchors is None:
+        anchors = range(point_count)
+    if controls is None:
+        controls = [i for i, c in enumerate(segment_controls) if c is not None]
+    else:
+        controls = [i for i in controls if 0 <= i < len(segment_controls) and segment_controls[i] is not None]
+    anchor_idx = np.fromiter(anchors, dtype=np.intp)
+    anchor_idx = anchor_idx[(anchor_idx >= 0) & (anchor_idx < point_count)]
+    return anchor_idx, np.fromiter(controls, dtype=np.intp)
+
+
+def _is_locked(segment):
+    layer = getattr(segment, 'layer', None)
+    return layer is not None and layer.locked
+
+
+def unlocked_targets(segments, targets):
+    """The targets whose segment exists and is not on a locked layer."""
+    return tuple(
+        target for target in targets
+        if 0 <= target[0] < len(segments) and not _is_locked(segments[target[0]])
+    )
+
+
+class _TargetGeometry:
+    """
+    Start positions of one segment's transform targets. Unselected controls
+    next to a transformed anchor follow the move_point rule: if they sat on
+    the straight line between their anchors they are placed at its midpoint,
+    as a group drag of the same selection does.
+    """
+
+    def __init__(self, seg_index, segment, anchors, controls):
+        self.seg_index = seg_index
+        self.segment = segment
+        self.anchors, self.controls = segment_to_arrays(segment)
+        self.anchor_idx, control_idx = _target_indices(segment, anchors, controls)
+        # Only span controls are transformed; a control left past the last span is not drawn
+        self.control_idx = control_idx[control_idx < len(self.controls)]
+        self.recentred_idx = recentred_controls(self.anchors, self.controls, self.anchor_idx, self.control_idx)
+
+    @property
+    def anchor_xy(self):
+        return self.anchors[self.anchor_idx]
+
+    @property
+    def control_xy(self):
+        return self.controls[self.control_idx]
+
+    @property
+    def moved_count(self):
+        return len(self.anchor_idx) + len(self.control_idx)
+
+    def write(self, matrix, recentre=True):
+        """Place the targets at matrix @ start; recentre=False leaves the on-line neighbours alone."""
+        points, controls = self.segment.points, self.segment.controls
+        anchors = self.anchors.copy()
+        anchors[self.anchor_idx] = _transform(matrix, self.anchor_xy)
+        for i, (x, y) in zip(self.anchor_idx.tolist(), anchors[self.anchor_idx].tolist()):
+            points[i] = QPointF(x, y)
+        for i, (x, y) in zip(self.control_idx.tolist(), _transform(matrix, self.control_xy).tolist()):
+            controls[i] = QPointF(x, y)
+        if recentre:
+            recentred = self.recentred_idx
+            midpoints = (anchors[recentred] + anchors[recentred + 1]) / 2
+            for i, (x, y) in zip(recentred.tolist(), midpoints.tolist()):
+                controls[i] = QPointF(x, y)
+        touch_geometry(self.segment)
+
+    def restore(self):
+        """Put the targets and their recentred neighbours back at their start positions."""
+        controls = self.segment.controls
+        for i, (x, y) in zip(self.recentred_idx.tolist(), self.controls[self.recentred_idx].tolist()):
+            controls[i] = QPointF(x, y)
+        self.write(np.identity(3), recentre=False)
+
+    def recentred_controls(self):
+        """(index, (x, y)) start positions of the controls write() recentres."""
+        return tuple(zip(self.recentred_idx.tolist(), map(tuple, self.controls[self.recentred_idx].tolist())))
+
+
+def _target_geometry(segments, targets, include_locked=False):
+    """Yield the _TargetGeometry of each target, skipping locked segments unless include_locked is set."""
+    for seg_index, anchors, controls in targets:
+        if not 0 <= seg_index < len(segments):
+            continue
+        segment = segments[seg_index]
+        if not include_locked and _is_locked(segment):
+            continue
+        yield _TargetGeometry(seg_index, segment, anchors, controls)
+
+
+def _transform(matrix, xy):
+    return xy @ matrix[:2, :2].T + matrix[:2, 2]
+
+
+def apply_affine(segments, targets, matrix, include_locked=False, recentre=True):
+    """
+    Apply a 3x3 affine matrix to the target points, one array operation per
+    segment. Segments on locked layers are skipped unless include_locked is
+    set. Unselected controls on the line next to a transformed anchor move to
+    the new midpoint unless recentre is False. Returns the number of points
+    moved.
+    """
+    moved = 0
+    for geometry in _target_geometry(segments, targets, include_locked):
+        geometry.write(matrix, recentre)
+        moved += geometry.moved_count
+    return moved
+
+
+def recentred_controls_of(segments, targets, include_locked=False):
+    """
+    Start positions of the controls apply_affine would recentre, as
+    (seg_index, ((control_index, (x, y)), ...)) tuples for restore_controls().
+    """
+    return tuple(
+        (geometry.seg_index, geometry.recentred_controls())
+        for geometry in _target_geometry(segments, targets, include_locked)
+        if len(geometry.recentred_idx)
+    )
+
+
+def restore_controls(segments, saved):
+    """Write control positions saved by recentred_controls_of() back; indices that no longer exist are skipped."""
+    for seg_index, controls in saved:
+        if not 0 <= seg_index < len(segments):
+            continue
+        segment = segments[seg_index]
+        for i, (x, y) in controls:
+            if 0 <= i < len(segment.controls):
+                segment.controls[i] = QPointF(x, y)
+        touch_geometry(segment)
+
+
+def targets_bounds(segments, targets):
+    """Image-space bounding rect of the target points, or None if there are none."""
+    arrays = [xy for g in _target_geometry(segments, targets) for xy in (g.anchor_xy, g.control_xy) if len(xy)]
+    if not arrays:
+        return None
+    xy = np.vstack(arrays)
+    (min_x, min_y), (max_x, max_y) = xy.min(axis=0).tolist(), xy.max(axis=0).tolist()
+    return QRectF(min_x, min_y, max_x - min_x, max_y - min_y)
+
+
+class AffinePreview:
+    """
+    Live preview of a transform: start positions are captured once and each
+    show() writes matrix @ start, so an interactive drag never accumulates
+    error. restore() puts the start positions back before the final command
+    is executed.
+    """
+
+    def __init__(self, segments, targets):
+        self._entries = list(_target_geometry(segments, targets))
+
+    def show(self, matrix):
+        for geometry in self._entries:
+            geometry.write(matrix)
+
+    def restore(self):
+        for geometry in self._entries:
+            geometry.restore()
@@ -6,7 +6,9 @@ import copy
 import numpy as np
 from PyQt6.QtCore import QPointF
 
-from .segment import Segment, Layer
+from .segment import Segment, Layer, touch_geometry
+from .group_move import GroupMove
+from .edit_sequence import latest_edit_sequence, next_edit_sequence
 from ..persistence.data.layer_config_registry import LayerConfigRegistry
 
 
@@ -14,8 +16,8 @@ class BezierSegmentManager:
     def __init__(self):
         self.layer_config = LayerConfigRegistry.get_instance().get_config()
         self.active_segment_index = 0
-        self.undo_stack = []
-        self.redo_stack = []
+        self.undo_stack = []  # [(edit sequence, segments before the edit)]
+        self.redo_stack = []  # [(edit sequence, segments after the edit, latest edit sequence when undone)]
         self.external_layer = self._make_layer("workpiece")
         self.contour_layer = self._make_layer("contour")
         self.fill_layer = self._make_layer("fill")
@@ -60,21 +62,37 @@ class BezierSegmentManager:
     def undo(self):
         if not self.undo_stack:
             raise Exception("Nothing to undo.")
-        self.redo_stack.append(copy.deepcopy(self.segments))
-        self.segments = self.undo_stack.pop()
+        sequence, segments = self.undo_stack.pop()
+        self.redo_stack.append((sequence, copy.deepcopy(self.segments), latest_edit_sequence()))
+        self.segments = segments
 
     def redo(self):
-        if not self.redo_stack:
+        if self.redo_sequence() is None:
             raise Exception("Nothing to redo.")
-        self.undo_stack.append(copy.deepcopy(self.segments))
-        self.segments = self.redo_stack.pop()
+        sequence, segments, _ = self.redo_stack.pop()
+        self.undo_stack.append((sequence, copy.deepcopy(self.segments)))
+        self.segments = segments
 
     def save_state(self, max_stack_size=100):
-        self.undo_stack.append(copy.deepcopy(self.segments))
+        self.undo_stack.append((next_edit_sequence(), copy.deepcopy(self.segments)))
         if len(self.undo_stack) > max_stack_size:
             self.undo_stack.pop(0)
         self.redo_stack.clear()
 
+    def undo_sequence(self):
+        """Edit sequence of the snapshot undo() would restore, or None."""
+        return self.undo_stack[-1][0] if self.undo_stack else None
+
+    def redo_sequence(self):
+        """
+        Edit sequence of the snapshot redo() would restore, or None. Snapshots
+        undone before a newer edit, made here or through CommandHistory, are
+        dropped: they no longer follow from the current segments.
+        """
+        if self.redo_stack and self.redo_stack[-1][2] != latest_edit_sequence():
+            self.redo_stack.clear()
+        return self.redo_stack[-1][0] if self.redo_stack else None
+
     def set_active_segment(self, seg_index):
         if 0 <= seg_index < len(self.segments):
             segment = self.segments[seg_index]
@@ -371,6 +389,7 @@ class BezierSegmentManager:
 
         if 0 <= ctrl_idx < len(segment.controls) and ctrl_idx < len(segment.points):
             segment.controls[ctrl_idx] = QPointF(segment.points[ctrl_idx])
+            touch_geometry(segment)
 
     def move_point(self, role, seg_index, idx, new_pos, suppress_save=False):
         if not suppress_save:
@@ -406,6 +425,14 @@ class BezierSegmentManager:
         elif role == 'control':
             controls[idx] = new_pos
 
+        touch_geometry(segment)
+
+    def move_points(self, selection, delta, suppress_save=False):
+        """Move every selected anchor and control (selection dicts) by delta in one step."""
+        if not suppress_save:
+            self.save_state()
+        GroupMove(self.segments, selection).apply(delta)
+
     def remove_control_point_at(self, pos, threshold=10):
         self.save_state()
         for seg in self.segments:
@@ -423,6 +450,7 @@ class BezierSegmentManager:
                     seg.remove_point(i)
                     if i + 1 < len(seg.points):
                         del seg.points[i + 1]
+                    touch_geometry(seg)
                     return True
         return False
 
@@ -441,6 +469,7 @@ class BezierSegmentManager:
             del segment.controls[idx]
         else:
             raise ValueError("Role must be 'anchor' or 'control'")
+        touch_geometry(segment)
 
     @staticmethod
     def is_on_line(p0, cp, p1, threshold=1.0):
@@ -493,6 +522,7 @@ class BezierSegmentManager:
                 segment.controls.append(None)
             segment.controls.append(midpoint)
 
+        touch_geometry(segment)
         return True
 
     def insert_anchor_point(self, segment_index, pos):
@@ -554,6 +584,7 @@ class BezierSegmentManager:
         else:
             segment.controls.insert(line_index + 1, None)
 
+        touch_geometry(segment)
         return True
 
     def find_segment_at(self, pos, threshold=10):
@@ -0,0 +1,22 @@
+"""
+Edit Sequence - Orders edits across the two undo histories
+Point edits are undone from BezierSegmentManager's snapshots and segment
+operations from CommandHistory. Both number their entries from this shared
+counter so undo and redo can always take the most recent edit of either.
+"""
+import itertools
+
+_counter = itertools.count(1)
+_latest = 0
+
+
+def next_edit_sequence():
+    """Number a new edit. Undo and redo keep the number of the edit they replay."""
+    global _latest
+    _latest = next(_counter)
+    return _latest
+
+
+def latest_edit_sequence():
+    """Number of the most recent new edit, 0 before the first one."""
+    return _latest
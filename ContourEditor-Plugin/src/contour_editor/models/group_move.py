@@ -0,0 +1,119 @@
+from collections import defaultdict
+
+import numpy as np
+from PyQt6.QtCore import QPointF
+
+from .segment import touch_geometry
+from ..persistence.utils.point_visibility import segment_to_arrays
+
+
+def controls_on_line(starts, controls, ends, threshold=1.0):
+    """
+    Vectorized BezierSegmentManager.is_on_line over rows of (N, 2) arrays.
+    Missing controls are NaN rows and never count as on the line.
+    """
+    direction = ends - starts
+    offset = controls - starts
+    len_sq = np.einsum("ij,ij->i", direction, direction)
+    dot = np.einsum("ij,ij->i", offset, direction)
+    cross = np.abs(direction[:, 0] * offset[:, 1] - direction[:, 1] * offset[:, 0])
+    with np.errstate(invalid="ignore", divide="ignore"):
+        distance = cross / np.sqrt(len_sq)
+        return (len_sq > 0) & (dot >= 0) & (dot <= len_sq) & (distance < threshold)
+
+
+def recentred_controls(anchors, controls, anchor_indices, control_indices):
+    """
+    Indices of the controls that follow the move_point rule when the given
+    anchors move: unselected controls next to a moved anchor that sit on the
+    straight line between their anchors stay at its midpoint. anchors and
+    controls are the start geometry as returned by segment_to_arrays().
+    """
+    if not len(controls):
+        return np.empty(0, dtype=np.intp)
+    moved = np.zeros(len(anchors), dtype=bool)
+    moved[anchor_indices] = True
+    neighbours = moved[:-1] | moved[1:]
+    neighbours[control_indices] = False
+    on_line = controls_on_line(anchors[:-1], controls, anchors[1:])
+    return np.flatnonzero(neighbours & on_line)
+
+
+class _SegmentMove:
+    """Start positions and masks of one segment's part of a group move."""
+
+    def __init__(self, seg_index, segment, anchor_indices, control_indices):
+        points = segment.points
+        span_count = max(0, len(points) - 1)
+        self.seg_index = seg_index
+        self.segment = segment
+        self.anchors, self.controls = segment_to_arrays(segment)
+
+        self.anchor_indices = np.array(sorted(i for i in anchor_indices if 0 <= i < len(points)), dtype=np.intp)
+        self.control_indices = np.array(
+            sorted(i for i in control_indices if 0 <= i < span_count and segment.controls[i] is not None),
+            dtype=np.intp,
+        )
+
+        self.recentred_indices = recentred_controls(
+            self.anchors, self.controls, self.anchor_indices, self.control_indices
+        )
+
+    def apply(self, delta):
+        points = self.segment.points
+        controls = self.segment.controls
+        anchors = self.anchors.copy()
+        anchors[self.anchor_indices] += delta
+        for i, (x, y) in zip(self.anchor_indices.tolist(), anchors[self.anchor_indices].tolist()):
+            points[i] = QPointF(x, y)
+        moved_controls = self.controls[self.control_indices] + delta
+        for i, (x, y) in zip(self.control_indices.tolist(), moved_controls.tolist()):
+            controls[i] = QPointF(x, y)
+        recentred = self.recentred_indices
+        midpoints = (anchors[recentred] + anchors[recentred + 1]) / 2
+        for i, (x, y) in zip(recentred.tolist(), midpoints.tolist()):
+            controls[i] = QPointF(x, y)
+        touch_geometry(self.segment)
+
+
+class GroupMove:
+    """
+    Moves a selection of anchors and controls by a common offset.
+
+    Start positions are captured once, so each apply() places every point at
+    start + delta: repeated drag updates do not accumulate rounding error and
+    the on-line test for neighbouring controls uses the pre-drag geometry.
+    Segments on locked layers are left out.
+    """
+
+    def __init__(self, segments, selection):
+        by_segment = defaultdict(lambda: (set(), set()))
+        for item in selection:
+            anchors, controls = by_segment[item['seg_index']]
+            (anchors if item['role'] == 'anchor' else controls).add(item['point_index'])
+        self._moves = []
+        for seg_index, (anchors, controls) in sorted(by_segment.items()):
+            if not 0 <= seg_index < len(segments):
+                continue
+            segment = segments[seg_index]
+            layer = getattr(segment, 'layer', None)
+            if layer is not None and layer.locked:
+                continue
+            self._moves.append(_SegmentMove(seg_index, segment, anchors, controls))
+
+    @property
+    def point_count(self):
+        return sum(len(m.anchor_indices) + len(m.control_indices) for m in self._moves)
+
+    def changed_points(self):
+        """(seg_index, anchor indices, control indices) of every point apply() moves, recentred controls included."""
+        return [
+            (move.seg_index, move.anchor_indices.tolist(),
+             sorted(move.control_indices.tolist() + move.recentred_indices.tolist()))
+            for move in self._moves
+        ]
+
+    def apply(self, delta):
+        offset = np.array((delta.x(), delta.y()), dtype=np.float64)
+        for move in self._moves:
+            move.apply(offset)
@@ -3,11 +3,19 @@ from typing import Optional
 
 
 class Segment:
+    # Bumped on every geometry change of any Segment, so scene-wide caches can
+    # revalidate without visiting each segment's geometry_version
+    geometry_epoch = 0
+
     def __init__(self, layer=None, settings=None):
         self.points: list[QPointF] = []
         self.controls: list[QPointF | None] = []
         self.visible = True
         self.layer = layer
+        # Set to a new geometry_epoch whenever points or controls change so geometry
+        # caches can revalidate; deep copies (undo snapshots) keep the version of
+        # the geometry they copied, so equal non-zero versions mean equal geometry
+        self.geometry_version = 0
         if settings is None:
             self.settings = {}
         else:
@@ -16,22 +24,29 @@ class Segment:
     def set_settings(self, settings: dict):
         self.settings = settings
 
+    def mark_geometry_changed(self):
+        Segment.geometry_epoch += 1
+        self.geometry_version = Segment.geometry_epoch
+
     def add_point(self, point: QPointF):
         self.points.append(point)
         if len(self.points) > 1:
             self.controls.append(None)
+        self.mark_geometry_changed()
 
     def remove_point(self, index: int):
         if 0 <= index < len(self.points):
             del self.points[index]
             if index < len(self.controls):
                 del self.controls[index]
+            self.mark_geometry_changed()
 
     def add_control_point(self, index: int, point: QPointF):
         if 0 <= index < len(self.controls):
             self.controls[index] = point
         else:
             self.controls.append(point)
+        self.mark_geometry_changed()
 
     def set_layer(self, layer):
         self.layer = layer
@@ -49,6 +64,13 @@ class Segment:
         return f"Segment(points={len(self.points)}, controls={len(self.controls)}, visible={self.visible}, layer={self.layer.name if self.layer else None})"
 
 
+def touch_geometry(segment):
+    """Bump the geometry version of segments that track one (custom ISegment types may not)."""
+    mark_changed = getattr(segment, "mark_geometry_changed", None)
+    if mark_changed is not None:
+        mark_changed()
+
+
 class Layer:
     def __init__(self, name, locked=False, visible=True):
         self.name = name
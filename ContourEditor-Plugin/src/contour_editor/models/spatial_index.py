@@ -0,0 +1,421 @@
+import weakref
+from operator import attrgetter, eq
+
+import numpy as np
+from PyQt6.QtCore import QRectF
+
+from .segment import Segment
+from ..persistence.utils.point_visibility import segment_to_arrays
+
+# Curved spans are approximated by this many straight pieces for nearest-point and intersection queries
+CURVE_PIECES = 8
+
+
+def closest_on_pieces(starts, ends, point):
+    """Closest position to point on each straight piece starts[i] -> ends[i]."""
+    d = ends - starts
+    length_sq = np.einsum("ij,ij->i", d, d)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.clip(np.einsum("ij,ij->i", point - starts, d) / length_sq, 0.0, 1.0)
+    t = np.where(length_sq > 0, t, 0.0)
+    return starts + t[:, None] * d
+
+
+class SegmentSpans:
+    """
+    Flattened geometry of one segment for spatial queries.
+
+    Span i runs from anchor i to anchor i + 1 through control i (if any);
+    its bounds cover all three points, which contain the quadratic curve.
+    """
+
+    def __init__(self, segment):
+        self.anchors, self.controls = segment_to_arrays(segment)
+        if len(self.controls):
+            starts, ends = self.anchors[:-1], self.anchors[1:]
+            ctrl = np.where(np.isnan(self.controls), starts, self.controls)
+            self.span_min = np.minimum(np.minimum(starts, ends), ctrl)
+            self.span_max = np.maximum(np.maximum(starts, ends), ctrl)
+        else:
+            self.span_min = self.span_max = np.empty((0, 2))
+        if len(self.anchors):
+            all_points = np.vstack((self.anchors, self.controls[~np.isnan(self.controls[:, 0])]))
+            self.bounds = (*all_points.min(axis=0).tolist(), *all_points.max(axis=0).tolist())
+        else:
+            self.bounds = None
+
+    def intersects(self, min_x, min_y, max_x, max_y):
+        if self.bounds is None:
+            return False
+        return not (self.bounds[2] < min_x or self.bounds[0] > max_x or
+                    self.bounds[3] < min_y or self.bounds[1] > max_y)
+
+    def spans_in(self, min_x, min_y, max_x, max_y):
+        """Indices of spans whose bounds overlap the rect."""
+        mask = ((self.span_max[:, 0] >= min_x) & (self.span_min[:, 0] <= max_x) &
+                (self.span_max[:, 1] >= min_y) & (self.span_min[:, 1] <= max_y))
+        return np.flatnonzero(mask)
+
+
+def _filled(parts, capacity, dtype=np.float64):
+    """Concatenate parts into the start of a new array with room for capacity rows."""
+    out = np.empty((capacity,) + parts[0].shape[1:], dtype=dtype)
+    np.concatenate(parts, out=out[:sum(map(len, parts))])
+    return out
+
+
+class SpanGrid:
+    """
+    Every span of a scene in one uniform grid, for rect queries whose cost
+    does not grow with the number of segments or points.
+
+    Spans are bucketed by the cell of their min corner and sorted by cell
+    key; the cell size is at least the extent of nearly all spans, so a
+    query only visits the cells under the rect and one ring before it.
+    The few longer spans are kept aside and tested directly.
+
+    update() swaps the spans of edited segments in place: their old rows are
+    emptied and the new ones appended to the row arrays and inserted into
+    the sorted cell keys, so an edit costs the edited spans rather than a
+    rebuild. Emptied rows are dropped once they outnumber the live ones.
+    """
+
+    _ROW_ARRAYS = ("seg_ids", "span_ids", "starts", "ends", "controls", "span_min", "span_max")
+
+    def __init__(self, span_sets, seg_count=None):
+        span_sets = list(span_sets)
+        if seg_count is None:
+            seg_count = max((seg_index + 1 for seg_index, _ in span_sets), default=0)
+        span_sets = [(seg_index, spans) for seg_index, spans in span_sets if len(spans.span_min)]
+        self._seg_start = np.zeros(seg_count, dtype=np.intp)
+        self._seg_stop = np.zeros(seg_count, dtype=np.intp)
+        if span_sets:
+            counts = [len(spans.span_min) for _, spans in span_sets]
+            stops = np.cumsum(counts)
+            # Room for edits before update() has to grow the arrays
+            capacity = int(stops[-1]) * 5 // 4 + 1024
+            self.seg_ids = _filled([np.repeat([seg_index for seg_index, _ in span_sets], counts)], capacity, np.intp)
+            self.span_ids = _filled([np.arange(count) for count in counts], capacity, np.intp)
+            self.starts = _filled([spans.anchors[:-1] for _, spans in span_sets], capacity)
+            self.ends = _filled([spans.anchors[1:] for _, spans in span_sets], capacity)
+            self.controls = _filled([spans.controls for _, spans in span_sets], capacity)
+            self.span_min = _filled([spans.span_min for _, spans in span_sets], capacity)
+            self.span_max = _filled([spans.span_max for _, spans in span_sets], capacity)
+            seg_indexes = [seg_index for seg_index, _ in span_sets]
+            self._seg_start[seg_indexes] = stops - counts
+            self._seg_stop[seg_indexes] = stops
+        else:
+            self.seg_ids = self.span_ids = np.empty(0, dtype=np.intp)
+            self.starts = self.ends = self.controls = self.span_min = self.span_max = np.empty((0, 2))
+        self._size = int(self._seg_stop.max(initial=0))  # Rows in use; the arrays have spare capacity beyond
+        self._dead = 0  # Emptied rows, seg_ids -1
+        self._build_cells()
+
+    def __len__(self):
+        return self._size - self._dead
+
+    def _build_cells(self):
+        count = self._size
+        if not count:
+            self.cell_size = 1.0
+            self._origin = np.zeros(2)
+            self._rows = 1
+            self._keys = self._order = self._large = np.empty(0, dtype=np.intp)
+            return
+        span_min, span_max = self.span_min[:count], self.span_max[:count]
+        extent = (span_max - span_min).max(axis=1)
+        scene_min, scene_max = span_min.min(axis=0), span_max.max(axis=0)
+        area = max(float(np.prod(scene_max - scene_min)), 1.0)
+        self.cell_size = max(float(np.percentile(extent, 95)), (area / count) ** 0.5, 1e-6)
+        self._origin = scene_min
+        small = extent <= self.cell_size
+        self._large = np.flatnonzero(~small)
+        cells = np.floor((span_min - self._origin) / self.cell_size).astype(np.int64)
+        self._rows = int(cells[:, 1].max()) + 2
+        keys = cells[:, 0] * self._rows + cells[:, 1]
+        small_ids = np.flatnonzero(small)
+        order = np.argsort(keys[small_ids], kind="stable")
+        self._order = small_ids[order]
+        self._keys = keys[self._order]
+
+    def _cell_keys(self, span_min):
+        # Spans outside the grid built at construction share its border cells; queries clamp the same way
+        cells = np.floor((span_min - self._origin) / self.cell_size).astype(np.int64)
+        return np.maximum(cells[:, 0], 0) * self._rows + np.clip(cells[:, 1], 0, self._rows - 1)
+
+    def update(self, seg_map, span_sets, seg_count):
+        """
+        Apply an edit to the grid. seg_map gives, for every segment index the
+        grid holds, its index in the edited scene, or -1 to drop its spans (a
+        removed or changed segment); span_sets are the (seg_index, spans) of
+        the changed and added segments; seg_count is the new segment count.
+        """
+        seg_map = np.asarray(seg_map, dtype=np.intp)
+        for seg_index in np.flatnonzero(seg_map < 0).tolist():
+            start, stop = int(self._seg_start[seg_index]), int(self._seg_stop[seg_index])
+            self.seg_ids[start:stop] = -1
+            self.span_min[start:stop] = np.inf
+            self.span_max[start:stop] = -np.inf
+            self._dead += stop - start
+        kept = np.flatnonzero(seg_map >= 0)
+        seg_start, seg_stop = np.zeros(seg_count, dtype=np.intp), np.zeros(seg_count, dtype=np.intp)
+        seg_start[seg_map[kept]] = self._seg_start[kept]
+        seg_stop[seg_map[kept]] = self._seg_stop[kept]
+        self._seg_start, self._seg_stop = seg_start, seg_stop
+        if (seg_map[kept] != kept).any():
+            ids = self.seg_ids[:self._size]
+            live = ids >= 0
+            ids[live] = seg_map[ids[live]]
+
+        live_before = len(self)
+        span_sets = [(seg_index, spans) for seg_index, spans in span_sets if len(spans.span_min)]
+        added = sum(len(spans.span_min) for _, spans in span_sets)
+        self._reserve(added)
+        first = row = self._size
+        for seg_index, spans in span_sets:
+            stop = row + len(spans.span_min)
+            self.seg_ids[row:stop] = seg_index
+            self.span_ids[row:stop] = np.arange(stop - row)
+            self.starts[row:stop] = spans.anchors[:-1]
+            self.ends[row:stop] = spans.anchors[1:]
+            self.controls[row:stop] = spans.controls
+            self.span_min[row:stop] = spans.span_min
+            self.span_max[row:stop] = spans.span_max
+            self._seg_start[seg_index], self._seg_stop[seg_index] = row, stop
+            row = stop
+        self._size = row
+
+        if added > live_before:
+            # Mostly new geometry: re-derive the cell size and origin from it
+            self._compact()
+            self._build_cells()
+            return
+        rows = np.arange(first, row)
+        extent = (self.span_max[rows] - self.span_min[rows]).max(axis=1)
+        small = extent <= self.cell_size
+        self._large = np.concatenate((self._large[self.seg_ids[self._large] >= 0], rows[~small]))
+        keys = self._cell_keys(self.span_min[rows[small]])
+        order = np.argsort(keys, kind="stable")
+        at = np.searchsorted(self._keys, keys[order], side="right")
+        self._keys = np.insert(self._keys, at, keys[order])
+        self._order = np.insert(self._order, at, rows[small][order])
+        if self._dead > len(self):
+            self._compact()
+
+    def _reserve(self, extra):
+        capacity = len(self.seg_ids)
+        if self._size + extra <= capacity:
+            return
+        capacity = max(2 * capacity, self._size + extra)
+        for name in self._ROW_ARRAYS:
+            old = getattr(self, name)
+            new = np.empty((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, name, new)
+
+    def _compact(self):
+        """Drop emptied rows, renumbering the rows the cell index and segments refer to."""
+        alive = self.seg_ids[:self._size] >= 0
+        new_row = np.cumsum(alive) - 1
+        live = int(alive.sum())
+        for name in self._ROW_ARRAYS:
+            rows = getattr(self, name)
+            setattr(self, name, _filled([rows[:self._size][alive]], live * 5 // 4 + 1024, rows.dtype))
+        keep = alive[self._order]
+        self._order, self._keys = new_row[self._order[keep]], self._keys[keep]
+        self._large = new_row[self._large[alive[self._large]]]
+        counts = self._seg_stop - self._seg_start
+        has_rows = counts > 0
+        self._seg_start = np.zeros_like(self._seg_start)
+        self._seg_start[has_rows] = new_row[self._seg_stop[has_rows] - counts[has_rows]]
+        self._seg_stop = self._seg_start + counts
+        self._size = live
+        self._dead = 0
+
+    def spans_in(self, min_x, min_y, max_x, max_y):
+        """Indices (into the grid arrays) of spans whose bounds overlap the rect."""
+        if not len(self):
+            return np.empty(0, dtype=np.intp)
+        (x0, y0), (x1, y1) = np.floor((np.array([[min_x, min_y], [max_x, max_y]]) - self._origin) / self.cell_size)
+        # A small span starting one cell before the rect can still reach into it
+        last_row = self._rows - 1
+        x0, x1 = max(int(x0) - 1, 0), max(int(x1), 0)
+        y0, y1 = min(max(int(y0) - 1, 0), last_row), min(max(int(y1), 0), last_row)
+        found = [self._large]
+        if x1 >= x0 and y1 >= y0:
+            columns = np.arange(x0, x1 + 1, dtype=np.int64) * self._rows
+            lo = np.searchsorted(self._keys, columns + y0, side="left")
+            hi = np.searchsorted(self._keys, columns + y1, side="right")
+            found += [self._order[a:b] for a, b in zip(lo.tolist(), hi.tolist()) if b > a]
+        candidates = np.concatenate(found)
+        mask = ((self.span_max[candidates, 0] >= min_x) & (self.span_min[candidates, 0] <= max_x) &
+                (self.span_max[candidates, 1] >= min_y) & (self.span_min[candidates, 1] <= max_y))
+        return candidates[mask]
+
+    def spans_near(self, x, y, radius, limit):
+        """
+        Spans within radius of (x, y) and the radius used. More than limit spans
+        means the geometry is denser than the screen can show; the radius is
+        then narrowed until the spans fit.
+        """
+        spans = self.spans_in(x - radius, y - radius, x + radius, y + radius)
+        while len(spans) > limit:
+            radius *= max((limit / len(spans)) ** 0.5, 0.1)
+            spans = self.spans_in(x - radius, y - radius, x + radius, y + radius)
+        return spans, radius
+
+    def pieces(self, spans):
+        """
+        Straight pieces approximating the spans as (starts, ends, owner), owner
+        being the position in spans. Straight spans are one piece, curved
+        spans CURVE_PIECES.
+        """
+        starts, ends, controls = self.starts[spans], self.ends[spans], self.controls[spans]
+        curved = np.flatnonzero(~np.isnan(controls[:, 0]))
+        straight = np.flatnonzero(np.isnan(controls[:, 0]))
+        t = np.linspace(0.0, 1.0, CURVE_PIECES + 1)[None, :, None]
+        curve = ((1 - t) ** 2 * starts[curved, None] + 2 * (1 - t) * t * controls[curved, None] +
+                 t ** 2 * ends[curved, None])
+        a = np.concatenate((starts[straight], curve[:, :-1].reshape(-1, 2)))
+        b = np.concatenate((ends[straight], curve[:, 1:].reshape(-1, 2)))
+        owner = np.concatenate((straight, np.repeat(curved, CURVE_PIECES)))
+        return a, b, owner
+
+
+class SpatialIndex:
+    """
+    Per-segment span bounds used to find the geometry under a small image
+    area without walking every point of every segment.
+
+    Entries are keyed on the segment object and revalidated against its
+    geometry_version, like CurvatureRankCache; segments that do not track a
+    version are rebuilt on every query.
+    """
+
+    def __init__(self):
+        self._entries = weakref.WeakKeyDictionary()
+        self._grid = None
+        self._grid_segments = None  # Weak references, so replaced segments are not freed by the next query
+        self._grid_by_epoch = False
+        self._grid_epoch = None
+        self._grid_versions = None
+
+    def spans_for(self, segment):
+        version = getattr(segment, "geometry_version", None)
+        if version is None:
+            return SegmentSpans(segment)
+        key = (version, len(segment.points), len(segment.controls))
+        try:
+            cached_key, spans = self._entries[segment]
+        except (KeyError, TypeError):
+            cached_key, spans = None, None
+        if cached_key != key:
+            spans = SegmentSpans(segment)
+            try:
+                self._entries[segment] = (key, spans)
+            except TypeError:
+                pass
+        return spans
+
+    def query_rect(self, segments, rect: QRectF):
+        """
+        Return [(seg_index, segment, spans, span_indices)] for the segments
+        with at least one span overlapping rect, in segment order. Spans are
+        found through the scene's SpanGrid, so the cost follows what is under
+        rect rather than the size of the scene. Visibility is not checked.
+        """
+        segments = tuple(segments)
+        grid = self.grid_for(segments)
+        found = grid.spans_in(rect.left(), rect.top(), rect.right(), rect.bottom())
+        if not len(found):
+            return []
+        found = found[np.lexsort((grid.span_ids[found], grid.seg_ids[found]))]
+        seg_ids = grid.seg_ids[found]
+        breaks = np.flatnonzero(np.diff(seg_ids)) + 1
+        hits = []
+        for start, stop in zip(np.r_[0, breaks].tolist(), np.r_[breaks, len(found)].tolist()):
+            segment = segments[int(seg_ids[start])]
+            hits.append((int(seg_ids[start]), segment, self.spans_for(segment), grid.span_ids[found[start:stop]]))
+        return hits
+
+    def grid_for(self, segments):
+        """
+        SpanGrid of the whole scene, kept up to date with edits. A scene of
+        Segment objects is validated on Segment.geometry_epoch without visiting
+        every segment. After an edit only segments that were added or whose
+        geometry_version changed are re-read, and the grid swaps their spans in
+        place (SpanGrid.update); an undo's copy of a segment carries the version
+        of the geometry it copied and keeps its rows. A scene with segments
+        that track no version is rebuilt on every call.
+        """
+        segments = tuple(segments)
+        refs = self._refs(segments)
+        grid = self._grid
+        same = grid is not None and refs == self._grid_segments
+        if same and self._grid_by_epoch and Segment.geometry_epoch == self._grid_epoch:
+            return grid
+        versions = self._versions(segments)
+        if versions is not None and versions == self._grid_versions and same:
+            changed = None
+        elif grid is None or versions is None or self._grid_versions is None:
+            grid = SpanGrid(((seg_index, self.spans_for(segment)) for seg_index, segment in enumerate(segments)),
+                            len(segments))
+            changed = None
+        else:
+            seg_map, changed = self._match(segments, versions, same)
+        if changed is not None:
+            grid.update(seg_map, [(seg_index, self.spans_for(segments[seg_index])) for seg_index in changed],
+                        len(segments))
+        self._grid = grid
+        self._grid_segments = refs
+        self._grid_versions = versions
+        self._grid_by_epoch = all(isinstance(segment, Segment) for segment in segments)
+        self._grid_epoch = Segment.geometry_epoch
+        return grid
+
+    def _match(self, segments, versions, same):
+        """
+        Map the grid's segments onto segments. Returns seg_map (old index to new
+        index, -1 if the old spans are stale) and the new indices to re-read.
+        """
+        old_versions = self._grid_versions
+        if same:
+            unchanged = np.fromiter(map(eq, versions, old_versions), dtype=bool, count=len(versions))
+            seg_map = np.where(unchanged, np.arange(len(segments)), -1)
+            return seg_map, np.flatnonzero(~unchanged).tolist()
+        old_segments = [ref() if isinstance(ref, weakref.ref) else ref for ref in self._grid_segments]
+        by_id = {id(segment): seg_index for seg_index, segment in enumerate(old_segments) if segment is not None}
+        # Equal non-zero versions of two Segments mean one is a copy of the other's geometry
+        by_version = {version: seg_index for seg_index, version in enumerate(old_versions)
+                      if version} if self._grid_by_epoch else {}
+        seg_map = np.full(len(old_segments), -1, dtype=np.intp)
+        changed = []
+        for seg_index, (segment, version) in enumerate(zip(segments, versions)):
+            old_index = by_id.get(id(segment))
+            if old_index is None or old_versions[old_index] != version:
+                old_index = by_version.get(version) if isinstance(segment, Segment) else None
+            if old_index is None or seg_map[old_index] >= 0:
+                changed.append(seg_index)
+            else:
+                seg_map[old_index] = seg_index
+        return seg_map, changed
+
+    @staticmethod
+    def _refs(segments):
+        try:
+            return tuple(map(weakref.ref, segments))
+        except TypeError:
+            return segments  # Segment types without weak reference support are held
+
+    @staticmethod
+    def _versions(segments):
+        try:
+            return tuple(map(attrgetter("geometry_version"), segments))
+        except AttributeError:
+            return None
+
+    def clear(self):
+        self._entries.clear()
+        self._grid = None
+        self._grid_segments = None
+        self._grid_versions = None
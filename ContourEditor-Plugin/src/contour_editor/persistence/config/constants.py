@@ -4,6 +4,7 @@ from PyQt6.QtGui import QColor
 # CAMERA FEED CONSTANTS
 # ============================================================================
 CAMERA_FEED_UPDATE_INTERVAL_MS = 100  # Update camera feed every 100 ms
+IMAGE_CACHE_SIZE = 4  # Decoded image files kept for reopening
 
 # ============================================================================
 # MODE CONSTANTS
@@ -13,6 +14,7 @@ EDIT_MODE = "edit"
 PICKUP_POINT_MODE = "pickup_point"
 MULTI_SELECT_MODE = "multi_select"
 RECTANGLE_SELECT_MODE = "rectangle_select"
+TRANSFORM_MODE = "transform"
 MEASURE_MODE = "measure"
 
 # ============================================================================
@@ -125,12 +127,38 @@ PIXELS_PER_MM = 0.985  # Calibration factor for mm conversion
 DRAG_THRESHOLD_PX = 10  # Minimum movement to trigger drag
 POINT_HIT_RADIUS_PX = 10  # Screen-space hit radius for point selection
 CLUSTER_DISTANCE_PX = 6  # Merge nearby points in screen-space
+TRANSFORM_HANDLE_SIZE_PX = 12  # Side of the scale handles on the transform box
+TRANSFORM_ROTATE_HANDLE_OFFSET_PX = 30  # Distance of the rotate handle above the transform box
+HOVER_HIGHLIGHT_ENABLED = True  # Outline the point or span under the cursor (within POINT_HIT_RADIUS_PX)
+HOVER_HIGHLIGHT_COLOR = QColor(0, 150, 255, 200)  # Blue outline of the hovered element
+HOVER_HIGHLIGHT_WIDTH = 3  # Outline pen width in pixels
+
+# ============================================================================
+# SNAPPING
+# ============================================================================
+SNAP_ENABLED = False  # Snap added and dragged points to the targets below
+SNAP_RADIUS_PX = 10  # Screen-space distance within which a target captures the point
+SNAP_TO_ANCHORS = True  # Existing anchor points
+SNAP_TO_INTERSECTIONS = True  # Crossings of two spans
+SNAP_TO_MIDPOINTS = True  # Middle of a span
+SNAP_TO_SPANS = False  # Nearest point on a span
+SNAP_TO_EDGES = False  # Strong edges of the background camera image
+SNAP_TO_GRID = False  # Nodes of a square grid
+SNAP_GRID_MM = 5.0  # Grid spacing in mm
+SNAP_INDICATOR_COLOR = QColor(255, 140, 0, 255)  # Orange marker at the snapped position
+SNAP_INDICATOR_SIZE = 7  # Half-size of the snap marker in pixels
 
 # ============================================================================
 # TIMING
 # ============================================================================
 DRAG_UPDATE_INTERVAL_MS = 16  # ~60 FPS for drag updates
+DRAG_PREDICTION_MS = 16  # How far ahead the dragged point is drawn (0 disables prediction)
+DRAG_PREDICTION_WINDOW_MS = 60  # Recent move samples used to estimate drag velocity
+DRAG_PREDICTION_MAX_LEAD_PX = 40  # Upper bound on the drawn lead, in screen pixels
 POINT_INFO_HOLD_DURATION_MS = 500  # Hold time to show point info overlay
+INTERACTION_SETTLE_MS = 150  # Idle time after zoom/pan/drag before a full-quality frame
+FRAME_TIME_BUDGET_MS = 12  # Segment painting time per frame before the rest is deferred
+PROGRESSIVE_RENDER_MIN_SEGMENTS = 2000  # Scenes at least this large are painted progressively
 PRESS_HOLD_MOVEMENT_THRESHOLD_PX = 5  # Max movement allowed during hold
 
 # ============================================================================
@@ -244,9 +244,23 @@ class ConstantsManager:
             "DRAG_THRESHOLD_PX",
             "POINT_HIT_RADIUS_PX",
             "CLUSTER_DISTANCE_PX",
+            "HOVER_HIGHLIGHT_ENABLED",
+            "HOVER_HIGHLIGHT_COLOR",
+            "HOVER_HIGHLIGHT_WIDTH",
             "DRAG_UPDATE_INTERVAL_MS",
             "POINT_INFO_HOLD_DURATION_MS",
             "PRESS_HOLD_MOVEMENT_THRESHOLD_PX",
+
+            # Snapping
+            "SNAP_ENABLED",
+            "SNAP_RADIUS_PX",
+            "SNAP_TO_ANCHORS",
+            "SNAP_TO_INTERSECTIONS",
+            "SNAP_TO_MIDPOINTS",
+            "SNAP_TO_SPANS",
+            "SNAP_TO_EDGES",
+            "SNAP_TO_GRID",
+            "SNAP_GRID_MM",
         ]
 
         result = {}
@@ -1,4 +1,6 @@
+import numpy as np
 from PyQt6.QtCore import QPointF
+from PyQt6.QtGui import QPolygonF
 
 
 def map_to_image_space(pos,translation,scale_factor):
@@ -11,3 +13,23 @@ def calculate_distance(p1: QPointF, p2: QPointF) -> float:
     dy = p2.y() - p1.y()
     return (dx ** 2 + dy ** 2) ** 0.5
 
+
+def map_points_to_screen(coords, transform):
+    """Vectorized QTransform.map for an (N, 2) array of image-space points."""
+    x = coords[:, 0]
+    y = coords[:, 1]
+    sx = transform.m11() * x + transform.m21() * y + transform.dx()
+    sy = transform.m12() * x + transform.m22() * y + transform.dy()
+    return np.column_stack((sx, sy))
+
+
+def array_to_polygon(coords):
+    """Build a QPolygonF from an (N, 2) array by writing straight into its buffer."""
+    coords = np.ascontiguousarray(coords, dtype=np.float64).reshape(-1, 2)
+    polygon = QPolygonF()
+    polygon.resize(len(coords))
+    if len(coords):
+        buffer = polygon.data()
+        buffer.setsize(coords.nbytes)
+        np.frombuffer(buffer, dtype=np.float64).reshape(-1, 2)[:] = coords
+    return polygon
@@ -1,6 +1,10 @@
+import weakref
+
 import numpy as np
 from PyQt6.QtCore import QPointF
 
+from .coordinate_utils import map_points_to_screen
+
 
 def get_significant_points(points, num_points=None):
     """
@@ -19,8 +23,13 @@ def curvature_scores(points):
     if len(points) < 3:
         # Not enough points for curvature, return zeros
         return np.zeros(len(points))
+    return curvature_scores_array(points_to_array(points))
+
+def curvature_scores_array(pts):
+    """Curvature score per row of an (N, 2) array, padded to N entries."""
+    if len(pts) < 3:
+        return np.zeros(len(pts))
 
-    pts = np.array([[p.x(), p.y()] for p in points], dtype=np.float64)
     diff1 = np.diff(pts, axis=0)  # shape (N-1, 2)
     diff2 = np.diff(diff1, axis=0)  # shape (N-2, 2)
 
@@ -32,42 +41,142 @@ def curvature_scores(points):
     scores = np.pad(curvature, (1, 1), mode='edge')
     return scores
 
-def get_visible_points(points,scale_factor):
+def points_to_array(points):
+    """Convert a list of QPointF to an (N, 2) float64 array."""
+    if not points:
+        return np.empty((0, 2), dtype=np.float64)
+    return np.array([(p.x(), p.y()) for p in points], dtype=np.float64)
+
+def segment_to_arrays(segment):
     """
-    Determine how many points to show based on current zoom level.
+    Anchors of a segment as an (N, 2) array and the controls of its N - 1
+    spans as an (N - 1, 2) array whose rows are NaN where a span has none.
     """
+    anchors = points_to_array(segment.points)
+    span_count = max(0, len(anchors) - 1)
+    controls = np.full((span_count, 2), np.nan)
+    present = [i for i, c in enumerate(segment.controls[:span_count]) if c is not None]
+    if present:
+        controls[present] = points_to_array([segment.controls[i] for i in present])
+    return anchors, controls
+
+def visible_point_count(num_points, scale_factor):
+    """Number of handles to show for a segment of num_points at this zoom level."""
     min_points = 5
-    max_points = len(points)
     # linear scaling: fraction of points to show
     fraction = min(1.0, scale_factor / 5.0)  # adjust denominator for zoom sensitivity
-    num_points = int(min_points + fraction * (max_points - min_points))
+    return int(min_points + fraction * (num_points - min_points))
+
+def get_visible_points(points,scale_factor):
+    """
+    Determine how many points to show based on current zoom level.
+    """
+    num_points = visible_point_count(len(points), scale_factor)
     return get_significant_points(points, num_points)
 
+def get_visible_point_mask(points, scale_factor):
+    """
+    Boolean mask over points marking the ones get_visible_points would keep.
+    Lets callers test visibility by index in O(1) instead of searching the
+    returned list with QPointF equality.
+    """
+    return _mask_from_ranking(len(points), _ranking(points_to_array(points)), scale_factor)
+
+def _ranking(coords):
+    """Point indices ordered by descending curvature."""
+    if len(coords) <= 2:
+        return np.arange(len(coords))
+    return np.argsort(-curvature_scores_array(coords))
+
+def _mask_from_ranking(count, ranking, scale_factor):
+    num_points = visible_point_count(count, scale_factor)
+    if count <= 2 or num_points >= count:
+        return np.ones(count, dtype=bool)
+    mask = np.zeros(count, dtype=bool)
+    mask[ranking[:max(num_points, 0)]] = True
+    return mask
+
+
+class SegmentHandleGeometry:
+    """Handle coordinates and curvature rankings for one segment geometry version."""
+
+    def __init__(self, points, controls):
+        self.anchors = points_to_array(points)
+        self.control_indices = np.array([i for i, c in enumerate(controls) if c is not None], dtype=np.intp)
+        self.controls = points_to_array([controls[i] for i in self.control_indices])
+        self.anchor_ranking = _ranking(self.anchors)
+        self.control_ranking = _ranking(self.controls)
+        # Image-space (min_x, min_y, max_x, max_y); quadratic spans stay inside their control hull
+        all_coords = np.vstack((self.anchors, self.controls))
+        if len(all_coords):
+            self.bounds = (*all_coords.min(axis=0).tolist(), *all_coords.max(axis=0).tolist())
+        else:
+            self.bounds = None
+
+    def anchor_mask(self, scale_factor):
+        return _mask_from_ranking(len(self.anchors), self.anchor_ranking, scale_factor)
+
+    def control_mask(self, scale_factor):
+        return _mask_from_ranking(len(self.controls), self.control_ranking, scale_factor)
+
+
+class CurvatureRankCache:
+    """
+    Caches SegmentHandleGeometry per segment so picking the top-k handles for
+    the current zoom is a slice of a precomputed ranking. Entries are keyed on
+    the segment object and revalidated against its geometry_version; segments
+    that do not track a version are recomputed every call.
+    """
+
+    def __init__(self):
+        self._entries = weakref.WeakKeyDictionary()
+
+    def get(self, segment):
+        points = segment.points
+        controls = segment.controls
+        version = getattr(segment, "geometry_version", None)
+        if version is None:
+            return SegmentHandleGeometry(points, controls)
+        key = (version, len(points), len(controls))
+        try:
+            cached_key, geometry = self._entries[segment]
+        except (KeyError, TypeError):
+            cached_key, geometry = None, None
+        if cached_key != key:
+            geometry = SegmentHandleGeometry(points, controls)
+            try:
+                self._entries[segment] = (key, geometry)
+            except TypeError:
+                pass
+        return geometry
+
+    def peek(self, segment):
+        """Return the last cached geometry without revalidating it, or None."""
+        try:
+            return self._entries[segment][1]
+        except (KeyError, TypeError):
+            return None
+
+    def clear(self):
+        self._entries.clear()
+
+
 def _declutter_points_screen_space(painter, points,width,height):
-    transform = painter.transform()
-    screen_pts = np.array([[transform.map(pt).x(), transform.map(pt).y()] for pt in points])
-    if len(screen_pts) == 0:
+    """Keep the first point falling into each min_dist x min_dist screen cell."""
+    if len(points) == 0:
         return []
+    screen_pts = map_points_to_screen(points_to_array(points), painter.transform())
 
     min_dist = 20  # pixels between visible points
     w_cells = int(width // min_dist) + 2
     h_cells = int(height // min_dist) + 2
-    occupied = np.zeros((w_cells, h_cells), dtype=bool)
-
-    visible = []
-    for x, y in screen_pts:
-        gx = int(x // min_dist)
-        gy = int(y // min_dist)
 
-        # Clamp to valid range
-        gx = max(0, min(gx, w_cells - 1))
-        gy = max(0, min(gy, h_cells - 1))
+    # Clamp to valid range
+    gx = np.clip(np.floor_divide(screen_pts[:, 0], min_dist), 0, w_cells - 1).astype(np.int64)
+    gy = np.clip(np.floor_divide(screen_pts[:, 1], min_dist), 0, h_cells - 1).astype(np.int64)
 
-        if not occupied[gx, gy]:
-            visible.append(QPointF(x, y))
-            occupied[gx, gy] = True
-
-    return visible
+    _, first = np.unique(gx * h_cells + gy, return_index=True)
+    return [QPointF(x, y) for x, y in screen_pts[np.sort(first)].tolist()]
 
 def _cluster_screen_points(painter, points,cluster_distance_px):
     """
@@ -77,18 +186,16 @@ def _cluster_screen_points(painter, points,cluster_distance_px):
     if not points:
         return []
 
-    transform = painter.transform()
-    screen_pts = np.array([[transform.map(pt).x(), transform.map(pt).y()] for pt in points])
-    if len(screen_pts) == 0:
-        return []
+    screen_pts = map_points_to_screen(points_to_array(points), painter.transform())
 
     # Grid-based clustering in screen space
-    grid_size = cluster_distance_px
-    grid = {}
-    for x, y in screen_pts:
-        gx, gy = int(x // grid_size), int(y // grid_size)
-        grid.setdefault((gx, gy), []).append((x, y))
-
-    # Centroids (in screen space)
-    clustered = [QPointF(np.mean(xs), np.mean(ys)) for xs, ys in [list(zip(*pts)) for pts in grid.values()]]
-    return clustered
\ No newline at end of file
+    cells = np.floor_divide(screen_pts, cluster_distance_px).astype(np.int64)
+    _, first, inverse = np.unique(cells, axis=0, return_index=True, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    counts = np.bincount(inverse)
+    cx = np.bincount(inverse, weights=screen_pts[:, 0]) / counts
+    cy = np.bincount(inverse, weights=screen_pts[:, 1]) / counts
+
+    # Centroids (in screen space), in order of first appearance
+    order = np.argsort(first)
+    return [QPointF(x, y) for x, y in zip(cx[order].tolist(), cy[order].tolist())]
@@ -0,0 +1,68 @@
+import math
+
+from PyQt6.QtCore import QRect, QRectF, QPointF
+from PyQt6.QtGui import QRegion
+
+
+class DirtyRegionTracker:
+    """
+    Computes the screen-space area a geometry change touches, so the editor can
+    call update(QRegion) instead of repainting the whole widget.
+
+    Segment bounds come from the renderer's geometry cache: the cached entry is
+    the geometry that was last painted (old bounds) and a refreshed entry is the
+    current geometry (new bounds).
+    """
+
+    HANDLE_PADDING_PX = 24  # Largest handle radius plus pen width
+    OVERLAY_PADDING_PX = 80  # Length labels, axis labels and angle arc around a dragged point
+
+    def __init__(self, editor):
+        self.editor = editor
+
+    def image_rect_to_screen(self, rect: QRectF, padding=0) -> QRect:
+        """Map an image-space rect to an integer screen rect grown by padding pixels."""
+        scale = self.editor.scale_factor
+        offset = self.editor.translation
+        left = rect.left() * scale + offset.x() - padding
+        top = rect.top() * scale + offset.y() - padding
+        right = rect.right() * scale + offset.x() + padding
+        bottom = rect.bottom() * scale + offset.y() + padding
+        return QRect(math.floor(left), math.floor(top),
+                     math.ceil(right) - math.floor(left) + 1, math.ceil(bottom) - math.floor(top) + 1)
+
+    def screen_points_rect(self, screen_points, padding=0) -> QRect:
+        """Bounding screen rect of screen-space points grown by padding pixels."""
+        points = [p for p in screen_points if p is not None]
+        if not points:
+            return QRect()
+        xs = [p.x() for p in points]
+        ys = [p.y() for p in points]
+        left, top = min(xs) - padding, min(ys) - padding
+        right, bottom = max(xs) + padding, max(ys) + padding
+        return QRect(math.floor(left), math.floor(top),
+                     math.ceil(right) - math.floor(left) + 1, math.ceil(bottom) - math.floor(top) + 1)
+
+    def image_points_rect(self, image_points, padding=HANDLE_PADDING_PX) -> QRect:
+        """Bounding screen rect of image-space points grown by padding pixels."""
+        scale = self.editor.scale_factor
+        offset = self.editor.translation
+        return self.screen_points_rect(
+            [QPointF(p.x() * scale + offset.x(), p.y() * scale + offset.y()) for p in image_points if p is not None],
+            padding
+        )
+
+    def segment_region(self, seg_index, padding=HANDLE_PADDING_PX) -> QRegion:
+        """Union of the last painted and the current screen bounds of a segment."""
+        segments = self.editor.manager.get_segments()
+        if not 0 <= seg_index < len(segments):
+            return QRegion(self.editor.rect())
+        segment = segments[seg_index]
+        renderer = self.editor.renderer
+        region = QRegion()
+        for geometry in (renderer.cached_segment_geometry(segment), renderer.segment_geometry(segment)):
+            if geometry is not None and geometry.bounds is not None:
+                min_x, min_y, max_x, max_y = geometry.bounds
+                rect = QRectF(min_x, min_y, max_x - min_x, max_y - min_y)
+                region = region.united(self.image_rect_to_screen(rect, padding))
+        return region.intersected(self.editor.rect())
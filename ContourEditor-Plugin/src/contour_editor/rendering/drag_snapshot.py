@@ -0,0 +1,76 @@
+from collections import namedtuple
+
+from PyQt6.QtCore import Qt, QPointF
+from PyQt6.QtGui import QPixmap, QPainter
+
+# Part of the dragged segment a drag frame draws live: spans is a range of
+# span indices, anchors and controls are tuples of handle indices
+HeldOut = namedtuple("HeldOut", "seg_index spans anchors controls")
+
+
+def affected_span_range(role, point_index, point_count):
+    """
+    Spans [start, stop) of a segment whose curve depends on the dragged point:
+    the two spans meeting at an anchor, or the single span a control bends.
+    """
+    span_count = max(0, point_count - 1)
+    if role == "anchor":
+        start, stop = point_index - 1, point_index + 1
+    else:
+        start, stop = point_index, point_index + 1
+    return max(0, start), min(span_count, stop)
+
+
+def held_out_for(role, seg_index, point_index, point_count):
+    """
+    The spans and handles a drag of one point changes. Dragging an anchor
+    also moves the on-line controls of its spans (move_point recentres
+    them), so those controls are live as well.
+    """
+    spans = range(*affected_span_range(role, point_index, point_count))
+    if role == "anchor":
+        return HeldOut(seg_index, spans, (point_index,), tuple(spans))
+    return HeldOut(seg_index, spans, (), (point_index,))
+
+
+class DragSceneSnapshot:
+    """
+    Pixmap of the scene as it looks during a point drag, minus the geometry
+    the drag changes (the affected spans and handles of the dragged segment;
+    see held_out_for). The other handles of the dragged segment stay in it.
+
+    It is built once when the drag starts and reused for every drag frame,
+    so a frame only blits the pixmap and draws the live spans on top. The
+    snapshot is rebuilt whenever its key changes (view transform, widget
+    size, dragged point, background image or verification contours).
+    """
+
+    def __init__(self):
+        self._pixmap = None
+        self._key = None
+
+    def pixmap_for(self, key, size, ratio, draw_scene):
+        """Return the snapshot for key, rendering it with draw_scene(painter) if stale."""
+        if self._pixmap is None or key != self._key:
+            pixmap = QPixmap(int(size.width() * ratio), int(size.height() * ratio))
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.GlobalColor.white)
+            painter = QPainter(pixmap)
+            try:
+                draw_scene(painter)
+            finally:
+                painter.end()
+            self._pixmap = pixmap
+            self._key = key
+        return self._pixmap
+
+    def draw(self, painter):
+        painter.drawPixmap(QPointF(0, 0), self._pixmap)
+
+    def invalidate(self):
+        self._pixmap = None
+        self._key = None
+
+    @property
+    def is_valid(self):
+        return self._pixmap is not None
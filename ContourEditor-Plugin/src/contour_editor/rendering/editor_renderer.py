@@ -1,74 +1,315 @@
-from PyQt6.QtCore import Qt, QPointF
-from PyQt6.QtGui import QColor, QPainter, QPainterPath, QPen
+from operator import attrgetter
+
+from PyQt6.QtCore import Qt, QRectF, QTimer
+from PyQt6.QtGui import QPainter
 
 from ..core.editor_context import EditorContext
+from ..persistence.config import constants
+from .dirty_regions import DirtyRegionTracker
+from .drag_snapshot import DragSceneSnapshot, held_out_for
+from .progressive_buffer import ProgressiveSceneBuffer
+from .render_resources import get_render_resources
 from .segment_renderer import SegmentRenderer
+from .verification_overlay import VerificationOverlay
 from .renderer import (
-    draw_ruler, draw_rectangle_selection, draw_pickup_point,
-    draw_selection_status, draw_drag_crosshair,
+    draw_ruler, draw_rectangle_selection, draw_transform_box, draw_pickup_point,
+    draw_selection_status, draw_drag_crosshair, draw_snap_indicator, draw_hover_highlight,
     draw_highlighted_line_segment
 )
 
 
+def _scene_signature(segments):
+    """
+    Hash of segment identity, geometry version, visibility and layer. Built
+    with map() so it stays cheap for very large scenes.
+    """
+    try:
+        state = tuple(map(attrgetter("geometry_version", "visible", "layer"), segments))
+    except AttributeError:
+        state = tuple((getattr(segment, "geometry_version", None), segment.visible, segment.layer)
+                      for segment in segments)
+    return hash((tuple(segments), state))
+
+
 class EditorRenderer:
     def __init__(self, editor):
         self.editor = editor
         self._context = EditorContext(editor)
-        self._segment_renderer = SegmentRenderer(self._context)
+        self.resources = get_render_resources()
+        self._segment_renderer = SegmentRenderer(self._context, self.resources)
+        self._verification_overlay = VerificationOverlay()
+        self._drag_snapshot = DragSceneSnapshot()
+        # Large scenes are painted into a persistent buffer a time slice per frame
+        self._progressive = ProgressiveSceneBuffer()
+        self._progressive_selected = {}
+        self._progressive_timer = QTimer()
+        self._progressive_timer.setSingleShot(True)
+        self._progressive_timer.setInterval(0)
+        self._progressive_timer.timeout.connect(self._resume_progressive)
+        # Screen-anchored overlays (e.g. selection status) from the last frame;
+        # these do not move with the view, so a scrolled frame must repaint them
+        self.screen_overlay_rect = QRectF()
 
     def render(self, painter, event):
         if not painter.isActive():
             return
 
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.fillRect(self.editor.rect(), Qt.GlobalColor.white)
+        # Interaction quality: cheaper frames while zooming, panning or dragging
+        draft = self.editor.interaction_quality.active
+        self.resources.sync(self.editor.scale_factor)
+
+        drag = self._active_drag() if draft else None
+        if drag is not None:
+            self._render_drag_frame(painter, drag)
+            return
+        self._drag_snapshot.invalidate()
+
+        progressive = (not draft and
+                       len(self._context.segments.all()) >= constants.PROGRESSIVE_RENDER_MIN_SEGMENTS)
+        if not progressive:
+            self._progressive.invalidate()
+
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, not draft)
+        if progressive:
+            self._render_progressive(painter)
+        else:
+            painter.fillRect(self.editor.rect(), Qt.GlobalColor.white)
         
         painter.translate(self.editor.translation)
         painter.scale(self.editor.scale_factor, self.editor.scale_factor)
-        painter.drawImage(0, 0, self.editor.image)
-        self._draw_verification_contours(painter)
+        visible_bounds = self._visible_image_bounds(event)
+        if not progressive:
+            self._draw_background(painter, visible_bounds)
 
         draw_ruler(self.editor, painter)
-        self._segment_renderer.render_all(painter)
+        if not progressive:
+            self._segment_renderer.render_all(painter, visible_bounds, draft)
         draw_rectangle_selection(self.editor, painter)
+        draw_transform_box(self.editor, painter)
         draw_pickup_point(self.editor, painter)
-        draw_selection_status(self.editor, painter)
+        status_rect = None if draft else draw_selection_status(self.editor, painter)
+        if status_rect is not None:
+            self.screen_overlay_rect = status_rect
+        elif event is None or not hasattr(event, "rect") or event.rect().contains(self.editor.rect()):
+            self.screen_overlay_rect = QRectF()
 
-        if self.editor.highlighted_line_segment:
+        if self.editor.highlighted_line_segment and not draft:
             draw_highlighted_line_segment(self.editor, painter)
 
         painter.resetTransform()
+        draw_hover_highlight(self.editor, painter)
+        self._draw_drag_overlay(painter)
+
+    def _draw_background(self, painter, visible_bounds):
+        min_x, min_y, max_x, max_y = visible_bounds
+        visible_rect = QRectF(min_x, min_y, max_x - min_x, max_y - min_y)
+        self.editor.viewport_controller.image_pyramid.draw(painter, visible_rect, self.editor.scale_factor)
+        self._verification_overlay.draw(painter, getattr(self.editor, "verification_contours", None), visible_rect)
+
+    def _render_progressive(self, painter):
+        """
+        Paint the segments of a large scene from the progressive buffer. A
+        changed scene or view starts a new pass; each frame and each idle tick
+        after it paints one time budget worth of segments, so input keeps being
+        handled while the picture converges.
+        """
+        segments = self._context.segments.all()
+        selected = self._segment_renderer.selected_indices_by_segment()
+        key = self._progressive_key(segments, selected)
+        started = self._progressive.ensure(
+            key, self.editor.size(), self.editor.devicePixelRatioF(),
+            lambda: self._progressive_items(segments, selected), self._draw_progressive_base
+        )
+        if started:
+            self._progressive_selected = selected
+            self._paint_progressive_chunk()
+        self._progressive.draw(painter)
+        if not self._progressive.is_complete:
+            self._progressive_timer.start()
+
+    def _draw_progressive_base(self, painter):
+        painter.translate(self.editor.translation)
+        painter.scale(self.editor.scale_factor, self.editor.scale_factor)
+        self._draw_background(painter, self._visible_image_bounds(None))
+
+    def _resume_progressive(self):
+        if self._progressive.is_complete:
+            return
+        self._paint_progressive_chunk()
+        self.editor.request_repaint(reason="progressive")
+
+    def _paint_progressive_chunk(self):
+        editor = self.editor
+        segments = self._context.segments.all()
+        selected = self._progressive_selected
+        visible_bounds = self._visible_image_bounds(None)
 
+        def setup(buffer_painter):
+            buffer_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            buffer_painter.translate(editor.translation)
+            buffer_painter.scale(editor.scale_factor, editor.scale_factor)
+
+        def paint_item(buffer_painter, seg_index):
+            if seg_index is not None and seg_index < len(segments):
+                self._segment_renderer.render_one(
+                    buffer_painter, seg_index, segments[seg_index], selected.get(seg_index), visible_bounds
+                )
+
+        self._progressive.paint_chunk(setup, paint_item, constants.FRAME_TIME_BUDGET_MS)
+
+    def _progressive_items(self, segments, selected):
+        """
+        Segment indices in paint priority order: the active segment, segments
+        with selected points, segments near the cursor, then the rest. The
+        near-cursor scan yields None for misses so it stays within the budget.
+        """
+        painted = set()
+        first = [self.editor.manager.active_segment_index, *sorted(selected)]
+        for seg_index in first:
+            if seg_index is not None and 0 <= seg_index < len(segments) and seg_index not in painted:
+                painted.add(seg_index)
+                yield seg_index
+        cursor_bounds = self._cursor_image_bounds()
+        if cursor_bounds is not None:
+            for seg_index, segment in enumerate(segments):
+                if (seg_index not in painted and segment.visible and
+                        self._segment_renderer.intersects(segment, cursor_bounds)):
+                    painted.add(seg_index)
+                    yield seg_index
+                else:
+                    yield None
+        for seg_index in range(len(segments)):
+            if seg_index not in painted:
+                yield seg_index
+
+    def _cursor_image_bounds(self):
+        cursor = self.editor.current_cursor_pos
+        if cursor is None:
+            return None
+        scale = self.editor.scale_factor
+        offset = self.editor.translation
+        radius = DirtyRegionTracker.OVERLAY_PADDING_PX * 2 / scale
+        x = (cursor.x() - offset.x()) / scale
+        y = (cursor.y() - offset.y()) / scale
+        return x - radius, y - radius, x + radius, y + radius
+
+    def _progressive_key(self, segments, selected):
+        """Everything a full-quality frame of a large scene depends on."""
+        editor = self.editor
+        image = editor.viewport_controller.image
+        selection = tuple(sorted(
+            (seg_index, role, tuple(sorted(indices)))
+            for seg_index, roles in selected.items() for role, indices in roles.items()
+        ))
+        return (
+            editor.translation.x(), editor.translation.y(), editor.scale_factor,
+            editor.width(), editor.height(), editor.devicePixelRatioF(),
+            image.cacheKey() if image is not None else None,
+            id(getattr(editor, "verification_contours", None)),
+            _scene_signature(segments),
+            selection, editor.manager.active_segment_index, self.resources.layer_signature,
+            editor.show_handles_only_on_selection, editor.handle_radius,
+            editor.handle_color.rgba(), editor.handle_selected_color.rgba(),
+            editor.drag_mode.dragging_point is not None,
+            constants.SHOW_ANCHOR_POINTS, constants.SHOW_CONTROL_POINTS,
+        )
+
+    def _draw_drag_overlay(self, painter):
         if (hasattr(self.editor.mode_manager, 'drag_mode') and
             self.editor.mode_manager.drag_mode.is_actually_dragging and 
             self.editor.current_cursor_pos is not None):
-            draw_drag_crosshair(self.editor, painter, self.editor.current_cursor_pos)
+            cursor_pos = getattr(self.editor.mode_manager.drag_mode, 'predicted_cursor_pos', None)
+            if cursor_pos is None:
+                cursor_pos = self.editor.current_cursor_pos
+            draw_drag_crosshair(self.editor, painter, cursor_pos)
+            draw_snap_indicator(self.editor, painter)
 
-    def _draw_verification_contours(self, painter):
-        contours = getattr(self.editor, "verification_contours", None) or []
-        if not contours:
-            return
+    def _active_drag(self):
+        """(role, seg_index, point_index, segment) of a point drag in progress, or None."""
+        drag_mode = getattr(self.editor.mode_manager, 'drag_mode', None)
+        if drag_mode is None or not drag_mode.is_actually_dragging or drag_mode.dragging_point is None:
+            return None
+        if getattr(drag_mode, 'group_move', None) is not None:
+            # The snapshot holds out one point's spans; group drags repaint the scene
+            return None
+        role, seg_index, point_index = drag_mode.dragging_point
+        segments = self._context.segments.all()
+        if not 0 <= seg_index < len(segments) or not segments[seg_index].visible:
+            return None
+        return role, seg_index, point_index, segments[seg_index]
+
+    def _render_drag_frame(self, painter, drag):
+        """
+        Drag fast path: blit the snapshot of everything the drag leaves
+        untouched, then draw the affected spans with their handles, the
+        dragged handle and the drag overlays on top. The snapshot is built
+        once per drag, so it is drawn at full quality with every other handle
+        of the dragged segment. Qt clips the blit to the repainted region.
+        """
+        role, seg_index, point_index, segment = drag
+        held_out = held_out_for(role, seg_index, point_index, len(segment.points))
+        editor = self.editor
+        image = editor.viewport_controller.image
+        key = (
+            editor.translation.x(), editor.translation.y(), editor.scale_factor,
+            editor.width(), editor.height(), editor.devicePixelRatioF(),
+            held_out, editor.manager.active_segment_index, len(self._context.segments.all()),
+            image.cacheKey() if image is not None else None,
+            id(getattr(editor, "verification_contours", None)),
+        )
+
+        def draw_static_scene(scene_painter):
+            scene_painter.translate(editor.translation)
+            scene_painter.scale(editor.scale_factor, editor.scale_factor)
+            visible_bounds = self._visible_image_bounds(None)
+            self._draw_background(scene_painter, visible_bounds)
+            self._segment_renderer.render_all(scene_painter, visible_bounds, False, held_out)
+
+        self._drag_snapshot.pixmap_for(key, editor.size(), editor.devicePixelRatioF(), draw_static_scene)
+        self._drag_snapshot.draw(painter)
+
+        painter.translate(editor.translation)
+        painter.scale(editor.scale_factor, editor.scale_factor)
+        # Draw the dragged point where input prediction expects it, the committed geometry is untouched
+        points = segment.points if role == "anchor" else segment.controls
+        drawn_point = editor.mode_manager.drag_mode.predicted_point
+        override = None
+        if drawn_point is not None and 0 <= point_index < len(points):
+            override = (role, point_index, drawn_point)
+        elif 0 <= point_index < len(points):
+            drawn_point = points[point_index]
+        self._segment_renderer.render_spans(
+            painter, segment, seg_index, held_out.spans.start, held_out.spans.stop, override
+        )
+        self._segment_renderer.render_held_out(painter, segment, seg_index, held_out, override)
+        show = constants.SHOW_ANCHOR_POINTS if role == "anchor" else constants.SHOW_CONTROL_POINTS
+        if show and drawn_point is not None:
+            self._segment_renderer.render_drag_handle(painter, drawn_point, editor.handle_selected_color)
+        draw_pickup_point(editor, painter)
+        painter.resetTransform()
+        self._draw_drag_overlay(painter)
+
+    def set_verification_contours(self, contours):
+        """Prebuild the verification contour paths so paints only draw them."""
+        self._verification_overlay.set_contours(contours)
+
+    def segment_geometry(self, segment):
+        """Current cached geometry (handle arrays, rankings, bounds) of a segment."""
+        return self._segment_renderer.geometry_for(segment)
+
+    def cached_segment_geometry(self, segment):
+        """Geometry of a segment as it was last painted, or None."""
+        return self._segment_renderer.cached_geometry_for(segment)
 
-        pen = QPen(QColor(0, 180, 255, 220))
-        pen.setWidthF(2.0)
-        pen.setCosmetic(True)
-
-        painter.save()
-        painter.setPen(pen)
-        painter.setBrush(Qt.BrushStyle.NoBrush)
-
-        for contour in contours:
-            if contour is None or len(contour) < 2:
-                continue
-            points = [(float(point[0]), float(point[1])) for point in contour]
-            path = QPainterPath(QPointF(points[0][0], points[0][1]))
-            for x, y in points[1:]:
-                path.lineTo(x, y)
-            if len(points) > 2:
-                first_x, first_y = points[0]
-                last_x, last_y = points[-1]
-                if abs(first_x - last_x) > 1e-6 or abs(first_y - last_y) > 1e-6:
-                    path.closeSubpath()
-            painter.drawPath(path)
-
-        painter.restore()
+    def _visible_image_bounds(self, event):
+        """Image-space bounds of the repainted area, grown by the handle padding."""
+        rect = event.rect() if event is not None and hasattr(event, "rect") else self.editor.rect()
+        scale = self.editor.scale_factor
+        offset = self.editor.translation
+        pad = DirtyRegionTracker.HANDLE_PADDING_PX
+        return (
+            (rect.left() - pad - offset.x()) / scale,
+            (rect.top() - pad - offset.y()) / scale,
+            (rect.right() + pad - offset.x()) / scale,
+            (rect.bottom() + pad - offset.y()) / scale,
+        )
@@ -0,0 +1,94 @@
+import time
+from collections import Counter
+
+from PyQt6.QtCore import QObject, QRect, QRectF, QTimer
+from PyQt6.QtGui import QRegion
+
+from ..persistence.config import constants
+
+
+class FrameScheduler(QObject):
+    """
+    Collects repaint requests from the editor and its modes and issues at
+    most one widget update per frame interval.
+
+    request() takes an optional region (QRegion, QRect or QRectF; None means
+    the whole widget) and a reason used for the counters. Regions are merged
+    until the frame is issued. When the previous frame is older than the
+    interval the next one goes out on the next event loop iteration, so an
+    isolated change is not delayed.
+    """
+
+    def __init__(self, editor, interval_ms=None):
+        super().__init__(editor)
+        self.editor = editor
+        self._interval_ms = constants.DRAG_UPDATE_INTERVAL_MS if interval_ms is None else interval_ms
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._issue)
+        self._region = None
+        self._full = False
+        self._last_issue = 0.0
+        self.requested_frames = 0
+        self.executed_frames = 0
+        self.reasons = Counter()
+
+    def set_interval(self, interval_ms):
+        self._interval_ms = interval_ms
+
+    def request(self, region=None, reason="update"):
+        """Schedule a repaint of region (None = whole widget)."""
+        self.requested_frames += 1
+        self.reasons[reason] += 1
+        if region is None:
+            self._full = True
+            self._region = None
+        elif not self._full:
+            if isinstance(region, QRectF):
+                region = region.toAlignedRect()
+            if isinstance(region, QRect):
+                region = QRegion(region)
+            self._region = region if self._region is None else self._region.united(region)
+        if not self._timer.isActive():
+            elapsed_ms = (time.perf_counter() - self._last_issue) * 1000.0
+            self._timer.start(max(0, int(self._interval_ms - elapsed_ms)))
+
+    def scrolled(self, dx, dy):
+        """Keep a pending region aligned with pixels moved by QWidget.scroll()."""
+        if self._region is not None:
+            self._region.translate(dx, dy)
+
+    def flush(self):
+        """Issue the pending frame now."""
+        if self.is_pending:
+            self._timer.stop()
+            self._issue()
+
+    @property
+    def is_pending(self):
+        return self._full or self._region is not None
+
+    def stats(self):
+        return {
+            "requested": self.requested_frames,
+            "executed": self.executed_frames,
+            "reasons": dict(self.reasons),
+        }
+
+    def reset_stats(self):
+        self.requested_frames = 0
+        self.executed_frames = 0
+        self.reasons.clear()
+
+    def _issue(self):
+        if not self.is_pending:
+            return
+        full, region = self._full, self._region
+        self._full = False
+        self._region = None
+        self._last_issue = time.perf_counter()
+        self.executed_frames += 1
+        if full:
+            self.editor.update()
+        else:
+            self.editor.update(region)
@@ -0,0 +1,121 @@
+import math
+
+from PyQt6.QtCore import Qt, QRectF
+from PyQt6.QtGui import QPixmap
+
+
+class ImagePyramid:
+    """
+    Lazily built mip pyramid of the background image, split into pixmap tiles.
+
+    Level 0 is the source image and every following level halves its size.
+    Painting picks the smallest level that still has at least one image pixel
+    per screen pixel and draws only the part overlapping the visible rect, so
+    a zoomed-out 20+ MP frame is not resampled in full on every paint. Level 0
+    is drawn straight from the source; reduced levels are cut into pixmap
+    tiles. Levels and tiles are created on first use and dropped when the
+    image changes.
+    """
+
+    TILE_SIZE = 2048  # Level images up to this size are drawn as a single tile
+    MAX_LEVEL = 6
+
+    def __init__(self):
+        self._source = None
+        self._source_key = None
+        self._levels = []
+        self._tiles = {}
+
+    def set_image(self, image):
+        """Replace the source image and drop every cached level and tile."""
+        self._source = image
+        self._source_key = image.cacheKey() if image is not None else None
+        self._levels = [image] if image is not None else []
+        self._tiles = {}
+
+    def invalidate(self):
+        self.set_image(self._source)
+
+    def level_for_scale(self, scale_factor):
+        """Index of the smallest level that keeps >= 1 image pixel per screen pixel."""
+        if scale_factor <= 0:
+            return 0
+        level = int(math.floor(math.log2(1.0 / scale_factor))) if scale_factor < 1.0 else 0
+        return max(0, min(level, self.MAX_LEVEL))
+
+    def level_image(self, level):
+        """
+        Return (level, image) for the requested level. Missing levels are
+        built straight from the source: a fast reduction to twice the target
+        size followed by a smooth 2:1 filter, which is much cheaper than a
+        smooth reduction of the full frame and close in quality.
+        """
+        source = self._source
+        level = min(level, max(0, int(math.log2(max(1, min(source.width(), source.height()))))))
+        self._levels.extend([None] * (level + 1 - len(self._levels)))
+        if self._levels[level] is None:
+            width = max(1, source.width() >> level)
+            height = max(1, source.height() >> level)
+            reduced = source
+            if level > 1:
+                reduced = source.scaled(width * 2, height * 2, Qt.AspectRatioMode.IgnoreAspectRatio,
+                                        Qt.TransformationMode.FastTransformation)
+            self._levels[level] = reduced.scaled(width, height, Qt.AspectRatioMode.IgnoreAspectRatio,
+                                                 Qt.TransformationMode.SmoothTransformation)
+        return level, self._levels[level]
+
+    def draw(self, painter, visible_rect: QRectF, scale_factor):
+        """
+        Draw the image with the painter in image space.
+
+        visible_rect is the image-space area being repainted; tiles outside it
+        are skipped.
+        """
+        source = self._source
+        if source is None or source.isNull():
+            return
+        if source.cacheKey() != self._source_key:
+            # The image was modified in place since the pyramid was built
+            self.set_image(source)
+
+        level = self.level_for_scale(scale_factor)
+        if level == 0:
+            visible = visible_rect.intersected(QRectF(0, 0, source.width(), source.height()))
+            if not visible.isEmpty():
+                painter.drawImage(visible, source, visible)
+            return
+
+        level, level_image = self.level_image(level)
+        sx = source.width() / level_image.width()
+        sy = source.height() / level_image.height()
+        visible = QRectF(visible_rect.x() / sx, visible_rect.y() / sy,
+                         visible_rect.width() / sx, visible_rect.height() / sy)
+        visible = visible.intersected(QRectF(0, 0, level_image.width(), level_image.height()))
+        if visible.isEmpty():
+            return
+
+        tile = self.TILE_SIZE
+        painter.save()
+        painter.scale(sx, sy)
+        for ty in range(int(visible.top()) // tile, int(math.ceil(visible.bottom())) // tile + 1):
+            for tx in range(int(visible.left()) // tile, int(math.ceil(visible.right())) // tile + 1):
+                pixmap = self._tile(level, level_image, tx, ty)
+                if pixmap is not None:
+                    painter.drawPixmap(tx * tile, ty * tile, pixmap)
+        painter.restore()
+
+    def _tile(self, level, level_image, tx, ty):
+        key = (level, tx, ty)
+        pixmap = self._tiles.get(key)
+        if pixmap is None:
+            tile = self.TILE_SIZE
+            x, y = tx * tile, ty * tile
+            if x >= level_image.width() or y >= level_image.height():
+                return None
+            if level_image.width() <= tile and level_image.height() <= tile:
+                pixmap = QPixmap.fromImage(level_image)
+            else:
+                pixmap = QPixmap.fromImage(level_image.copy(
+                    x, y, min(tile, level_image.width() - x), min(tile, level_image.height() - y)))
+            self._tiles[key] = pixmap
+        return pixmap
@@ -0,0 +1,38 @@
+from PyQt6.QtCore import QTimer
+
+from ..persistence.config import constants
+
+
+class InteractionQuality:
+    """
+    Tracks whether the user is in the middle of a zoom, pan or drag.
+
+    Input handlers call begin() on every interaction event. While active the
+    renderer draws a cheaper frame (no antialiasing, proxy image, no labels or
+    unselected handles). Once no event has arrived for INTERACTION_SETTLE_MS a
+    single full-quality frame is requested.
+    """
+
+    def __init__(self, editor):
+        self.editor = editor
+        self.active = False
+        self._settle_timer = QTimer(editor)
+        self._settle_timer.setSingleShot(True)
+        self._settle_timer.setInterval(constants.INTERACTION_SETTLE_MS)
+        self._settle_timer.timeout.connect(self._settle)
+
+    def begin(self):
+        """Enter (or stay in) interaction quality and restart the settle delay."""
+        self.active = True
+        self._settle_timer.start()
+
+    def end(self):
+        """Leave interaction quality immediately and repaint at full quality."""
+        self._settle_timer.stop()
+        self._settle()
+
+    def _settle(self):
+        if not self.active:
+            return
+        self.active = False
+        self.editor.request_repaint(reason="settle")
@@ -0,0 +1,88 @@
+import time
+from itertools import islice
+
+from PyQt6.QtCore import Qt, QPointF
+from PyQt6.QtGui import QPixmap, QPainter
+
+
+class ProgressiveSceneBuffer:
+    """
+    Persistent pixmap that a large scene is painted into a few segments at
+    a time, on top of its background.
+
+    A pass starts whenever the key (view, size, scene signature, selection)
+    changes; paint_chunk() then renders the next items of the pass until the
+    time budget runs out. Items come from a lazily consumed iterable, so
+    ordering work is spread over the chunks as well. Until the pass
+    completes, the buffer holds the segments painted so far (highest
+    priority first).
+    """
+
+    CHECK_EVERY = 32  # Segments painted between deadline checks
+
+    def __init__(self):
+        self._pixmap = None
+        self._key = None
+        self._items = iter(())
+        self._complete = False
+
+    def ensure(self, key, size, ratio, items_factory, draw_base=None):
+        """
+        Start a new pass if key changed; draw_base(painter) paints what lies
+        under the segments (image, overlays). Returns True when a pass was started.
+        """
+        if self._pixmap is not None and key == self._key:
+            return False
+        pixmap = QPixmap(int(size.width() * ratio), int(size.height() * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        # Opaque on purpose: painting onto a transparent pixmap is about twice as slow
+        pixmap.fill(Qt.GlobalColor.white)
+        if draw_base is not None:
+            painter = QPainter(pixmap)
+            try:
+                draw_base(painter)
+            finally:
+                painter.end()
+        self._pixmap = pixmap
+        self._key = key
+        self._items = iter(items_factory())
+        self._complete = False
+        return True
+
+    def paint_chunk(self, setup_painter, paint_item, budget_ms):
+        """
+        Paint pass items with paint_item(painter, item) until budget_ms elapse.
+        setup_painter(painter) applies the view transform and render hints;
+        paint_item must accept None, which items use to yield without painting.
+        """
+        if self.is_complete:
+            return
+        deadline = time.perf_counter() + budget_ms / 1000.0
+        painter = QPainter(self._pixmap)
+        try:
+            setup_painter(painter)
+            while True:
+                count = 0
+                for item in islice(self._items, self.CHECK_EVERY):
+                    paint_item(painter, item)
+                    count += 1
+                if count < self.CHECK_EVERY:
+                    self._complete = True
+                    break
+                if time.perf_counter() >= deadline:
+                    break
+        finally:
+            painter.end()
+
+    def draw(self, painter):
+        painter.drawPixmap(QPointF(0, 0), self._pixmap)
+
+    @property
+    def is_complete(self):
+        return self._pixmap is not None and self._complete
+
+    def invalidate(self):
+        self._pixmap = None
+        self._key = None
+        self._items = iter(())
+        self._complete = False
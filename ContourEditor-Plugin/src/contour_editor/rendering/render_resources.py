@@ -0,0 +1,176 @@
+from collections import OrderedDict
+
+from PyQt6.QtCore import Qt, QPointF
+from PyQt6.QtGui import QBrush, QColor, QFont, QFontMetrics, QPen, QStaticText, QTransform
+
+from ..persistence.config.constants import LAYER_COLORS
+
+
+class TextLabel:
+    """A laid-out label: the shaped text plus the metrics used to place it."""
+
+    __slots__ = ("static_text", "width", "height", "ascent")
+
+    def __init__(self, text, font, metrics):
+        self.static_text = QStaticText(text)
+        self.static_text.setTextFormat(Qt.TextFormat.PlainText)
+        self.static_text.prepare(QTransform(), font)
+        self.width = metrics.horizontalAdvance(text)
+        self.height = metrics.height()
+        self.ascent = metrics.ascent()
+
+    def draw_at_baseline(self, painter, x, baseline_y):
+        """Draw like painter.drawText(x, baseline_y, text)."""
+        painter.drawStaticText(QPointF(x, baseline_y - self.ascent), self.static_text)
+
+
+class LabelCache:
+    """
+    LRU cache of laid-out labels keyed by text and font, so repeated
+    measurement and axis labels skip text shaping. The colour comes from
+    the painter pen at draw time and is not part of the key.
+    """
+
+    def __init__(self, max_size=256):
+        self._labels = OrderedDict()
+        self._max_size = max_size
+
+    def get(self, text, font, metrics):
+        key = (text, font.key())
+        label = self._labels.get(key)
+        if label is not None:
+            self._labels.move_to_end(key)
+            return label
+        label = self._labels[key] = TextLabel(text, font, metrics)
+        while len(self._labels) > self._max_size:
+            self._labels.popitem(last=False)
+        return label
+
+    def clear(self):
+        self._labels.clear()
+
+    def __len__(self):
+        return len(self._labels)
+
+
+class RenderResources:
+    """
+    Cache of pens, brushes, fonts and font metrics shared by the renderers.
+
+    Entries are keyed by what defines them (colour, width, style, layer and
+    active state), so the same objects are reused across frames. Layer pens
+    are dropped when LAYER_COLORS changes and zoom-dependent pens when the
+    scale changes; sync() checks both once per frame.
+    """
+
+    MAX_ENTRIES = 512  # Safety bound for caches keyed by free-form values
+
+    def __init__(self):
+        self._layer_signature = None
+        self._scale = None
+        self._layer_pens = {}
+        self._scaled_pens = {}
+        self._pens = {}
+        self._brushes = {}
+        self._fonts = {}
+        self._metrics = {}
+        self.labels = LabelCache()
+
+    def sync(self, scale_factor):
+        """Invalidate entries that depend on layer colours or on the zoom level."""
+        signature = tuple((name, color.rgba()) for name, color in LAYER_COLORS.items())
+        if signature != self._layer_signature:
+            self._layer_signature = signature
+            self._layer_pens.clear()
+        if scale_factor != self._scale:
+            self._scale = scale_factor
+            self._scaled_pens.clear()
+            self._layer_pens.clear()
+
+    @property
+    def layer_signature(self):
+        """LAYER_COLORS as of the last sync(), as (name, rgba) pairs."""
+        return self._layer_signature
+
+    def segment_pen(self, layer_name, active, width):
+        """Round-capped curve pen in the layer colour, lighter when inactive."""
+        key = (layer_name, active, width)
+        pen = self._layer_pens.get(key)
+        if pen is None:
+            color = LAYER_COLORS.get(layer_name, QColor("black"))
+            pen = QPen(color if active else color.lighter(150), width)
+            pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+            pen.setJoinStyle(Qt.PenJoinStyle.RoundJoin)
+            self._layer_pens[key] = pen
+        return pen
+
+    def scaled_pen(self, color, width, style=Qt.PenStyle.SolidLine):
+        """Pen whose width depends on the zoom level (e.g. tangents in image space)."""
+        key = (QColor(color).rgba(), width, style)
+        pen = self._scaled_pens.get(key)
+        if pen is None:
+            pen = self._scaled_pens[key] = QPen(QColor(color), width, style)
+        return pen
+
+    def point_pen(self, color, radius):
+        """Round-capped pen that draws a point as a filled dot of the given radius."""
+        key = ("point", QColor(color).rgba(), radius)
+        pen = self._pens.get(key)
+        if pen is None:
+            pen = QPen(QColor(color), radius * 2)
+            pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+            pen = self._store(self._pens, key, pen)
+        return pen
+
+    def pen(self, color, width=1, style=Qt.PenStyle.SolidLine):
+        key = (QColor(color).rgba(), width, style)
+        pen = self._pens.get(key)
+        if pen is None:
+            pen = self._store(self._pens, key, QPen(QColor(color), width, style))
+        return pen
+
+    def brush(self, color):
+        key = QColor(color).rgba()
+        brush = self._brushes.get(key)
+        if brush is None:
+            brush = self._store(self._brushes, key, QBrush(QColor(color)))
+        return brush
+
+    def font(self, base_font, point_size, bold=False):
+        """base_font with the given size and weight; base_font is usually painter.font()."""
+        key = (base_font.key(), point_size, bold)
+        font = self._fonts.get(key)
+        if font is None:
+            font = QFont(base_font)
+            font.setPointSize(point_size)
+            font.setBold(bold)
+            font = self._store(self._fonts, key, font)
+        return font
+
+    def metrics(self, font):
+        key = font.key()
+        metrics = self._metrics.get(key)
+        if metrics is None:
+            metrics = self._store(self._metrics, key, QFontMetrics(font))
+        return metrics
+
+    def label(self, text, font):
+        """Cached layout of text in font; see LabelCache."""
+        return self.labels.get(text, font, self.metrics(font))
+
+    def _store(self, cache, key, value):
+        if len(cache) >= self.MAX_ENTRIES:
+            cache.clear()
+        cache[key] = value
+        return value
+
+
+_shared_resources = None
+
+
+def get_render_resources():
+    """Resources shared by the editor renderers and the module-level draw helpers."""
+    global _shared_resources
+    if _shared_resources is None:
+        _shared_resources = RenderResources()
+    return _shared_resources
@@ -1,11 +1,11 @@
 from PyQt6.QtCore import Qt, QRectF, QPointF
-from PyQt6.QtGui import QPen, QColor, QBrush, QPainterPath, QTransform
+from PyQt6.QtGui import QColor, QPainterPath, QPolygonF, QTransform
 import math
 
 from ..persistence.config import constants
-from ..persistence.config.constants import LAYER_COLORS
 from ..persistence.utils.coordinate_utils import calculate_distance
 from ..persistence.utils.point_visibility import get_visible_points
+from .render_resources import get_render_resources
 
 
 def draw_ruler(contour_editor,painter):
@@ -18,7 +18,7 @@ def draw_ruler(contour_editor,painter):
 
         # Draw ruler in widget coordinates
         painter.resetTransform()
-        pen = QPen(QColor(0, 200, 255), 2, Qt.PenStyle.DashLine)
+        pen = get_render_resources().pen(QColor(0, 200, 255), 2, Qt.PenStyle.DashLine)
         painter.setPen(pen)
         painter.drawLine(screen_start.toPoint(), screen_end.toPoint())
 
@@ -41,19 +41,10 @@ def draw_ruler(contour_editor,painter):
         text_y = mid_y + uy * offset_distance
 
         painter.setPen(QColor(0, 0, 0))
-        font = painter.font()
-        font.setPointSize(12)
-        font.setBold(True)
+        font = get_render_resources().font(painter.font(), 12, True)
         painter.setFont(font)
-        text = f"{dist_mm:.1f}mm"
-        metrics = painter.fontMetrics()
-        text_width = metrics.horizontalAdvance(text)
-        text_height = metrics.height()
-        painter.drawText(
-            QRectF(text_x - text_width / 2, text_y - text_height / 2, text_width, text_height),
-            Qt.AlignmentFlag.AlignCenter,
-            text
-        )
+        label = get_render_resources().label(f"{dist_mm:.1f}mm", font)
+        label.draw_at_baseline(painter, text_x - label.width / 2, text_y - label.height / 2 + label.ascent)
 
         painter.restore()  # restore original transform so segments draw correctly
 
@@ -70,23 +61,24 @@ def draw_pickup_point(contour_editor,painter):
         contour_editor.draw_pickup_point(painter, contour_editor.pickup_point)
 
 def draw_selection_status(contour_editor, painter):
-    """Draw selection status indicator in the top-right corner"""
+    """
+    Draw selection status indicator in the top-right corner.
+    Returns the screen rect it covered, or None when nothing was drawn.
+    """
     selected_count = contour_editor.get_selected_points_count()
     if selected_count <= 1:
-        return  # Don't show indicator for single or no selection
+        return None  # Don't show indicator for single or no selection
 
     # Reset painter transformations for UI overlay
     painter.resetTransform()
 
     # Set up text
     status_text = f"{selected_count} points selected"
-    font = painter.font()
-    font.setPointSize(10)
-    font.setBold(True)
+    font = get_render_resources().font(painter.font(), 10, True)
     painter.setFont(font)
 
     # Calculate text size and position
-    text_rect = painter.fontMetrics().boundingRect(status_text)
+    text_rect = get_render_resources().metrics(font).boundingRect(status_text)
     padding = 8
     margin = 10
 
@@ -97,13 +89,14 @@ def draw_selection_status(contour_editor, painter):
     # Draw background
     bg_rect = QRectF(x - padding, y, text_rect.width() + padding * 2, text_rect.height() + padding)
     painter.setPen(Qt.PenStyle.NoPen)
-    painter.setBrush(QBrush(QColor(103, 80, 164, 200)))  # Semi-transparent #6750A4
+    painter.setBrush(get_render_resources().brush(QColor(103, 80, 164, 200)))  # Semi-transparent #6750A4
 
     painter.drawRoundedRect(bg_rect, 4, 4)
 
     # Draw text
-    painter.setPen(QPen(Qt.GlobalColor.white))
-    painter.drawText(int(x), int(y + text_rect.height()), status_text)
+    painter.setPen(get_render_resources().pen(Qt.GlobalColor.white))
+    get_render_resources().label(status_text, font).draw_at_baseline(painter, int(x), int(y + text_rect.height()))
+    return bg_rect
 
 def draw_rectangle_selection(contour_editor, painter):
     """Draw the rectangle selection overlay"""
@@ -113,11 +106,11 @@ def draw_rectangle_selection(contour_editor, painter):
         if rect:
             # Draw in image space (before resetTransform)
             # Rectangle border
-            pen = QPen(QColor(103, 80, 164, 255), 2 / contour_editor.scale_factor, Qt.PenStyle.DashLine)
+            pen = get_render_resources().scaled_pen(QColor(103, 80, 164, 255), 2 / contour_editor.scale_factor, Qt.PenStyle.DashLine)
             painter.setPen(pen)
 
             # Semi-transparent fill
-            brush = QBrush(QColor(103, 80, 164, 50))
+            brush = get_render_resources().brush(QColor(103, 80, 164, 50))
             painter.setBrush(brush)
 
             painter.drawRect(rect)
@@ -125,6 +118,37 @@ def draw_rectangle_selection(contour_editor, painter):
             # Reset brush
             painter.setBrush(Qt.BrushStyle.NoBrush)
 
+def draw_transform_box(contour_editor, painter):
+    """Draw the transform tool's box with its scale and rotate handles"""
+    if not getattr(contour_editor, 'transform_mode_active', False):
+        return
+    transform_mode = contour_editor.transform_mode
+    polygon = transform_mode.box_polygon()
+    if polygon is None:
+        return
+    resources = get_render_resources()
+    color = QColor(103, 80, 164, 255)
+    scale = contour_editor.scale_factor
+    painter.setPen(resources.scaled_pen(color, 1.5 / scale, Qt.PenStyle.DashLine))
+    painter.setBrush(Qt.BrushStyle.NoBrush)
+    painter.drawPolygon(polygon)
+    if transform_mode.active_handle is not None:
+        return
+
+    # Handles are sized in screen pixels
+    half = constants.TRANSFORM_HANDLE_SIZE_PX / 2 / scale
+    rotate_offset = constants.TRANSFORM_ROTATE_HANDLE_OFFSET_PX / scale
+    bounds = transform_mode.bounds
+    top_center = QPointF(bounds.center().x(), bounds.top())
+    rotate_center = top_center - QPointF(0, rotate_offset)
+    painter.setPen(resources.scaled_pen(color, 1.5 / scale))
+    painter.drawLine(top_center, rotate_center)
+    painter.setBrush(resources.brush(Qt.GlobalColor.white))
+    for corner in (bounds.topLeft(), bounds.topRight(), bounds.bottomLeft(), bounds.bottomRight()):
+        painter.drawRect(QRectF(corner.x() - half, corner.y() - half, 2 * half, 2 * half))
+    painter.drawEllipse(rotate_center, half, half)
+    painter.setBrush(Qt.BrushStyle.NoBrush)
+
 def draw_bezier_segment(contour_editor, painter, segment, seg_index=None):
     points = segment.points
     controls = segment.controls
@@ -156,12 +180,8 @@ def draw_bezier_segment(contour_editor, painter, segment, seg_index=None):
             else:
                 path.lineTo(points[i])
 
-        layer_color = LAYER_COLORS.get(segment.layer.name, QColor("black"))
-        pen = QPen(layer_color, thickness / contour_editor.scale_factor)  # scale down by zoom
-        pen.setCapStyle(Qt.PenCapStyle.RoundCap)
-        pen.setJoinStyle(Qt.PenJoinStyle.RoundJoin)
-        if not is_active:
-            pen.setColor(layer_color.lighter(150))
+        # Scaled down by zoom; lighter layer colour when inactive
+        pen = get_render_resources().segment_pen(segment.layer.name, is_active, thickness / contour_editor.scale_factor)
         painter.setPen(pen)
         painter.setBrush(Qt.BrushStyle.NoBrush)
         painter.drawPath(path)
@@ -169,7 +189,7 @@ def draw_bezier_segment(contour_editor, painter, segment, seg_index=None):
     # Draw tangents (image space)
     if is_active or contour_editor.show_handles_only_on_selection:
         tangent_thickness = 1 / contour_editor.scale_factor  # keep thin at any zoom
-        painter.setPen(QPen(Qt.GlobalColor.gray, tangent_thickness, Qt.PenStyle.DashLine))
+        painter.setPen(get_render_resources().scaled_pen(Qt.GlobalColor.gray, tangent_thickness, Qt.PenStyle.DashLine))
         for i in range(1, len(points)):
             if i - 1 < len(controls):
                 ctrl = controls[i - 1]
@@ -215,7 +235,7 @@ def draw_bezier_segment(contour_editor, painter, segment, seg_index=None):
             screen_pt = old_transform.map(pt)
 
             painter.setTransform(QTransform())  # draw in screen space
-            painter.setBrush(QBrush(color))
+            painter.setBrush(get_render_resources().brush(color))
             painter.setPen(Qt.PenStyle.NoPen)
             painter.drawEllipse(screen_pt, handle_px, handle_px)
             painter.setTransform(old_transform)
@@ -236,18 +256,63 @@ def draw_bezier_segment(contour_editor, painter, segment, seg_index=None):
 
             screen_pt = old_transform.map(ctrl)
             painter.setTransform(QTransform())
-            painter.setBrush(QBrush(color))
+            painter.setBrush(get_render_resources().brush(color))
             painter.setPen(Qt.PenStyle.NoPen)
             painter.drawEllipse(screen_pt, size, size)
             painter.setTransform(old_transform)
 
+def draw_snap_indicator(editor, painter):
+    """Draw a marker at the snapped position; its shape tells which kind of target was hit"""
+    snap = getattr(editor, 'snap_indicator', None)
+    if snap is None:
+        return
+    center = snap.point * editor.scale_factor + editor.translation
+    size = constants.SNAP_INDICATOR_SIZE
+    x, y = center.x(), center.y()
+    painter.setPen(get_render_resources().pen(constants.SNAP_INDICATOR_COLOR, 2))
+    painter.setBrush(Qt.BrushStyle.NoBrush)
+    if snap.kind == "anchor":
+        painter.drawRect(QRectF(x - size, y - size, 2 * size, 2 * size))
+    elif snap.kind == "intersection":
+        painter.drawLine(QPointF(x - size, y - size), QPointF(x + size, y + size))
+        painter.drawLine(QPointF(x - size, y + size), QPointF(x + size, y - size))
+    elif snap.kind == "midpoint":
+        painter.drawPolygon(QPolygonF([QPointF(x, y - size), QPointF(x + size, y + size), QPointF(x - size, y + size)]))
+    elif snap.kind == "span":
+        painter.drawEllipse(center, size, size)
+    elif snap.kind == "edge":
+        painter.drawPolygon(QPolygonF([QPointF(x, y - size), QPointF(x + size, y), QPointF(x, y + size), QPointF(x - size, y)]))
+    else:
+        painter.drawLine(QPointF(x - size, y), QPointF(x + size, y))
+        painter.drawLine(QPointF(x, y - size), QPointF(x, y + size))
+
+def draw_hover_highlight(editor, painter):
+    """Outline the point or span under the cursor in screen space"""
+    hover = getattr(editor, 'hover_manager', None)
+    points = hover.highlight_points() if hover is not None else None
+    if not points:
+        return
+    to_screen = lambda p: p * editor.scale_factor + editor.translation
+    painter.setPen(get_render_resources().pen(constants.HOVER_HIGHLIGHT_COLOR, constants.HOVER_HIGHLIGHT_WIDTH))
+    painter.setBrush(Qt.BrushStyle.NoBrush)
+    if len(points) == 1:
+        radius = editor.handle_radius + constants.HOVER_HIGHLIGHT_WIDTH + 2
+        painter.drawEllipse(to_screen(points[0]), radius, radius)
+        return
+    start, control, end = points
+    path = QPainterPath(to_screen(start))
+    if control is None:
+        path.lineTo(to_screen(end))
+    else:
+        path.quadTo(to_screen(control), to_screen(end))
+    painter.drawPath(path)
+
 def draw_drag_crosshair(editor,painter, screen_pos):
     """Draw a crosshair above the cursor when dragging (helps with touchscreen)"""
     # Offset the crosshair above the cursor so it's visible above the finger
     crosshair_x = screen_pos.x()
     crosshair_y = screen_pos.y() + constants.CROSSHAIR_OFFSET_Y
 
-    from PyQt6.QtGui import QPen
 
     # Determine line style (solid or dashed)
     line_style = Qt.PenStyle.DashLine if constants.CROSSHAIR_LINE_STYLE == "dashed" else Qt.PenStyle.SolidLine
@@ -256,13 +321,13 @@ def draw_drag_crosshair(editor,painter, screen_pos):
     if constants.CROSSHAIR_STYLE == "circle":
         # Original style: circle with cross
         # Draw circle at center
-        pen = QPen(constants.CROSSHAIR_COLOR, constants.CROSSHAIR_LINE_THICKNESS, line_style)
+        pen = get_render_resources().pen(constants.CROSSHAIR_COLOR, constants.CROSSHAIR_LINE_THICKNESS, line_style)
         painter.setPen(pen)
         painter.setBrush(Qt.BrushStyle.NoBrush)
         painter.drawEllipse(QPointF(crosshair_x, crosshair_y), constants.CROSSHAIR_CIRCLE_RADIUS, constants.CROSSHAIR_CIRCLE_RADIUS)
 
         # Draw crosshair lines
-        pen = QPen(constants.CROSSHAIR_COLOR, constants.CROSSHAIR_LINE_THICKNESS, line_style)
+        pen = get_render_resources().pen(constants.CROSSHAIR_COLOR, constants.CROSSHAIR_LINE_THICKNESS, line_style)
         painter.setPen(pen)
 
         # Horizontal line
@@ -273,14 +338,14 @@ def draw_drag_crosshair(editor,painter, screen_pos):
                          int(crosshair_x), int(crosshair_y + constants.CROSSHAIR_SIZE))
 
         # Draw connecting line from crosshair to actual cursor
-        pen_connector = QPen(constants.CROSSHAIR_CONNECTOR_COLOR, constants.CROSSHAIR_CONNECTOR_THICKNESS, Qt.PenStyle.DashLine)
+        pen_connector = get_render_resources().pen(constants.CROSSHAIR_CONNECTOR_COLOR, constants.CROSSHAIR_CONNECTOR_THICKNESS, Qt.PenStyle.DashLine)
         painter.setPen(pen_connector)
         painter.drawLine(QPointF(crosshair_x, crosshair_y + constants.CROSSHAIR_CIRCLE_RADIUS),
                          QPointF(screen_pos.x(), screen_pos.y()))
 
     elif constants.CROSSHAIR_STYLE == "simple":
         # Simple style: just a cross
-        pen = QPen(constants.CROSSHAIR_COLOR, constants.CROSSHAIR_LINE_THICKNESS, line_style)
+        pen = get_render_resources().pen(constants.CROSSHAIR_COLOR, constants.CROSSHAIR_LINE_THICKNESS, line_style)
         painter.setPen(pen)
 
         # Horizontal line
@@ -291,7 +356,7 @@ def draw_drag_crosshair(editor,painter, screen_pos):
                          int(crosshair_x), int(crosshair_y + constants.CROSSHAIR_SIZE))
 
         # Draw connecting line from crosshair to actual cursor (dashed)
-        pen_connector = QPen(constants.CROSSHAIR_CONNECTOR_COLOR, constants.CROSSHAIR_CONNECTOR_THICKNESS, Qt.PenStyle.DashLine)
+        pen_connector = get_render_resources().pen(constants.CROSSHAIR_CONNECTOR_COLOR, constants.CROSSHAIR_CONNECTOR_THICKNESS, Qt.PenStyle.DashLine)
         painter.setPen(pen_connector)
         painter.drawLine(QPointF(crosshair_x, crosshair_y),
                         QPointF(screen_pos.x(), screen_pos.y()))
@@ -377,12 +442,12 @@ def draw_segment_length_line(editor,painter, p1, p2, offset, px_per_mm):
     )
 
     # Draw dashed line
-    pen = QPen(constants.SEGMENT_LENGTH_COLOR, constants.SEGMENT_LENGTH_LINE_THICKNESS, Qt.PenStyle.DashLine)
+    pen = get_render_resources().pen(constants.SEGMENT_LENGTH_COLOR, constants.SEGMENT_LENGTH_LINE_THICKNESS, Qt.PenStyle.DashLine)
     painter.setPen(pen)
     painter.drawLine(p1_offset, p2_offset)
 
     # Draw small perpendicular ticks at endpoints
-    painter.setPen(QPen(constants.SEGMENT_LENGTH_COLOR, constants.SEGMENT_LENGTH_LINE_THICKNESS, Qt.PenStyle.SolidLine))
+    painter.setPen(get_render_resources().pen(constants.SEGMENT_LENGTH_COLOR, constants.SEGMENT_LENGTH_LINE_THICKNESS, Qt.PenStyle.SolidLine))
 
     # Tick at p1
     tick1_start = QPointF(p1_offset.x() - perp_y * constants.SEGMENT_LENGTH_TICK_SIZE, p1_offset.y() + perp_x * constants.SEGMENT_LENGTH_TICK_SIZE)
@@ -402,14 +467,12 @@ def draw_segment_length_line(editor,painter, p1, p2, offset, px_per_mm):
 
     # Draw text background for better readability
     text = f"{dist_mm:.1f}mm"
-    font = painter.font()
-    font.setPointSize(constants.SEGMENT_LENGTH_FONT_SIZE)
-    font.setBold(True)
+    font = get_render_resources().font(painter.font(), constants.SEGMENT_LENGTH_FONT_SIZE, True)
     painter.setFont(font)
 
-    metrics = painter.fontMetrics()
-    text_width = metrics.horizontalAdvance(text)
-    text_height = metrics.height()
+    label = get_render_resources().label(text, font)
+    text_width = label.width
+    text_height = label.height
 
     # Background rectangle
     bg_rect = QRectF(
@@ -419,16 +482,12 @@ def draw_segment_length_line(editor,painter, p1, p2, offset, px_per_mm):
         text_height + (constants.AXIS_LABEL_PADDING_Y * 2)
     )
     painter.setPen(Qt.PenStyle.NoPen)
-    painter.setBrush(QBrush(constants.SEGMENT_LENGTH_BG_COLOR))
+    painter.setBrush(get_render_resources().brush(constants.SEGMENT_LENGTH_BG_COLOR))
     painter.drawRoundedRect(bg_rect, constants.AXIS_LABEL_BORDER_RADIUS, constants.AXIS_LABEL_BORDER_RADIUS)
 
     # Draw text
-    painter.setPen(QPen(constants.SEGMENT_LENGTH_COLOR))
-    painter.drawText(
-        int(mid_offset.x() - text_width / 2),
-        int(mid_offset.y() + text_height / 4),
-        text
-    )
+    painter.setPen(get_render_resources().pen(constants.SEGMENT_LENGTH_COLOR))
+    label.draw_at_baseline(painter, int(mid_offset.x() - text_width / 2), int(mid_offset.y() + text_height / 4))
 
 def draw_coordinate_axes_and_angle(editor,painter):
     """Draw X/Y coordinate axes and angle visualization when dragging a point"""
@@ -486,18 +545,18 @@ def draw_coordinate_axes_and_angle(editor,painter):
         if constants.SHOW_AXES_ON_DRAG:
             # Draw horizontal axis line (X projection)
             x_end_point = QPointF(curr_screen.x(), ref_screen.y())
-            pen_x = QPen(constants.AXIS_X_COLOR, constants.AXIS_LINE_THICKNESS, Qt.PenStyle.DashLine)
+            pen_x = get_render_resources().pen(constants.AXIS_X_COLOR, constants.AXIS_LINE_THICKNESS, Qt.PenStyle.DashLine)
             painter.setPen(pen_x)
             painter.drawLine(ref_screen, x_end_point)
 
             # Draw vertical axis line (Y projection)
             y_end_point = QPointF(ref_screen.x(), curr_screen.y())
-            pen_y = QPen(constants.AXIS_Y_COLOR, constants.AXIS_LINE_THICKNESS, Qt.PenStyle.DashLine)
+            pen_y = get_render_resources().pen(constants.AXIS_Y_COLOR, constants.AXIS_LINE_THICKNESS, Qt.PenStyle.DashLine)
             painter.setPen(pen_y)
             painter.drawLine(ref_screen, y_end_point)
 
             # Draw the actual vector line (from reference to current)
-            pen_vector = QPen(constants.AXIS_VECTOR_LINE_COLOR, constants.AXIS_VECTOR_LINE_THICKNESS, Qt.PenStyle.DotLine)
+            pen_vector = get_render_resources().pen(constants.AXIS_VECTOR_LINE_COLOR, constants.AXIS_VECTOR_LINE_THICKNESS, Qt.PenStyle.DotLine)
             painter.setPen(pen_vector)
             painter.drawLine(ref_screen, curr_screen)
 
@@ -522,7 +581,7 @@ def draw_coordinate_axes_and_angle(editor,painter):
                 constants.AXIS_ARC_RADIUS * 2
             )
 
-            pen_arc = QPen(constants.AXIS_ANGLE_ARC_COLOR, constants.AXIS_LINE_THICKNESS, Qt.PenStyle.DashLine)
+            pen_arc = get_render_resources().pen(constants.AXIS_ANGLE_ARC_COLOR, constants.AXIS_LINE_THICKNESS, Qt.PenStyle.DashLine)
             painter.setPen(pen_arc)
             painter.setBrush(Qt.BrushStyle.NoBrush)
 
@@ -546,14 +605,12 @@ def draw_coordinate_axes_and_angle(editor,painter):
 
 def draw_axis_label(painter, text, pos, color):
     """Draw a label with background for axis measurements"""
-    font = painter.font()
-    font.setPointSize(constants.AXIS_LABEL_FONT_SIZE)
-    font.setBold(True)
+    font = get_render_resources().font(painter.font(), constants.AXIS_LABEL_FONT_SIZE, True)
     painter.setFont(font)
 
-    metrics = painter.fontMetrics()
-    text_width = metrics.horizontalAdvance(text)
-    text_height = metrics.height()
+    label = get_render_resources().label(text, font)
+    text_width = label.width
+    text_height = label.height
 
     # Background rectangle
     bg_rect = QRectF(
@@ -563,16 +620,12 @@ def draw_axis_label(painter, text, pos, color):
         text_height + (constants.AXIS_LABEL_PADDING_Y * 2)
     )
     painter.setPen(Qt.PenStyle.NoPen)
-    painter.setBrush(QBrush(constants.AXIS_LABEL_BG_COLOR))
+    painter.setBrush(get_render_resources().brush(constants.AXIS_LABEL_BG_COLOR))
     painter.drawRoundedRect(bg_rect, constants.AXIS_LABEL_BORDER_RADIUS, constants.AXIS_LABEL_BORDER_RADIUS)
 
     # Draw text
-    painter.setPen(QPen(color))
-    painter.drawText(
-        int(pos.x() - text_width / 2),
-        int(pos.y() + text_height / 4),
-        text
-    )
+    painter.setPen(get_render_resources().pen(color))
+    label.draw_at_baseline(painter, int(pos.x() - text_width / 2), int(pos.y() + text_height / 4))
 
 def draw_line_axes_and_angle(editor, painter, p1, p2, px_per_mm):
     """Draw X/Y coordinate axes and angle visualization for a line segment (p1 to p2)"""
@@ -601,18 +654,18 @@ def draw_line_axes_and_angle(editor, painter, p1, p2, px_per_mm):
         if constants.SHOW_AXES_ON_OVERLAY:
             # Draw horizontal axis line (X projection)
             x_end_point = QPointF(curr_screen.x(), ref_screen.y())
-            pen_x = QPen(constants.AXIS_X_COLOR, constants.AXIS_LINE_THICKNESS, Qt.PenStyle.DashLine)
+            pen_x = get_render_resources().pen(constants.AXIS_X_COLOR, constants.AXIS_LINE_THICKNESS, Qt.PenStyle.DashLine)
             painter.setPen(pen_x)
             painter.drawLine(ref_screen, x_end_point)
 
             # Draw vertical axis line (Y projection)
             y_end_point = QPointF(ref_screen.x(), curr_screen.y())
-            pen_y = QPen(constants.AXIS_Y_COLOR, constants.AXIS_LINE_THICKNESS, Qt.PenStyle.DashLine)
+            pen_y = get_render_resources().pen(constants.AXIS_Y_COLOR, constants.AXIS_LINE_THICKNESS, Qt.PenStyle.DashLine)
             painter.setPen(pen_y)
             painter.drawLine(ref_screen, y_end_point)
 
             # Draw the actual vector line (from reference to current)
-            pen_vector = QPen(constants.AXIS_VECTOR_LINE_COLOR, constants.AXIS_VECTOR_LINE_THICKNESS, Qt.PenStyle.DotLine)
+            pen_vector = get_render_resources().pen(constants.AXIS_VECTOR_LINE_COLOR, constants.AXIS_VECTOR_LINE_THICKNESS, Qt.PenStyle.DotLine)
             painter.setPen(pen_vector)
             painter.drawLine(ref_screen, curr_screen)
 
@@ -638,7 +691,7 @@ def draw_line_axes_and_angle(editor, painter, p1, p2, px_per_mm):
                 constants.AXIS_ARC_RADIUS * 2
             )
 
-            pen_arc = QPen(constants.AXIS_ANGLE_ARC_COLOR, constants.AXIS_LINE_THICKNESS, Qt.PenStyle.DashLine)
+            pen_arc = get_render_resources().pen(constants.AXIS_ANGLE_ARC_COLOR, constants.AXIS_LINE_THICKNESS, Qt.PenStyle.DashLine)
             painter.setPen(pen_arc)
             painter.setBrush(Qt.BrushStyle.NoBrush)
 
@@ -680,7 +733,7 @@ def draw_highlighted_line_segment(editor, painter):
         p2 = points[line_index + 1]
 
         # Draw thick highlighted line (in image space, so painter already has transform)
-        pen = QPen(constants.HIGHLIGHTED_LINE_COLOR, constants.HIGHLIGHTED_LINE_THICKNESS)
+        pen = get_render_resources().pen(constants.HIGHLIGHTED_LINE_COLOR, constants.HIGHLIGHTED_LINE_THICKNESS)
         painter.setPen(pen)
         painter.drawLine(p1, p2)
 
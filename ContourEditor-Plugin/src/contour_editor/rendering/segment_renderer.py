@@ -1,95 +1,253 @@
-from PyQt6.QtCore import Qt, QRectF, QPointF
-from PyQt6.QtGui import QPen, QColor, QBrush, QPainterPath, QTransform
+import numpy as np
+from PyQt6.QtCore import Qt, QRectF, QPointF, QLineF
+from PyQt6.QtGui import QColor, QPainterPath, QTransform
 from ..persistence.config import constants
-from ..persistence.config.constants import LAYER_COLORS
-from ..persistence.utils.point_visibility import get_visible_points
+from ..persistence.utils.coordinate_utils import map_points_to_screen, array_to_polygon
+from ..persistence.utils.point_visibility import CurvatureRankCache
+from .render_resources import get_render_resources
+CONTROL_HANDLE_COLOR = QColor(255, 0, 0, 180)
+DRAG_HANDLE_PX = 3  # Handle radius while a point is dragged
 class SegmentRenderer:
-    def __init__(self, context):
+    def __init__(self, context, resources=None):
         self.ctx = context
-    def render_all(self, painter):
+        self._rank_cache = CurvatureRankCache()
+        self.resources = resources or get_render_resources()
+    def render_all(self, painter, visible_bounds=None, draft=False, held_out=None):
+        """
+        Render every visible segment. When visible_bounds (image-space
+        min_x, min_y, max_x, max_y of the repainted area) is given, segments
+        whose cached bounds fall outside it are skipped. In draft mode tangent
+        lines and unselected handles are left out.
+
+        held_out (a drag_snapshot.HeldOut) leaves the spans and handles a drag
+        changes out of the dragged segment, for the static part of a drag frame.
+        """
         segments = self.ctx.segments.all()
+        selected = self._selected_indices_by_segment()
         for idx, segment in enumerate(segments):
-            if segment.visible:
-                self._render_segment(painter, segment, idx)
+            if not segment.visible:
+                continue
+            if visible_bounds is not None and not self._intersects(segment, visible_bounds):
+                continue
+            if held_out is not None and held_out.seg_index == idx:
+                self._render_segment(painter, segment, idx, selected.get(idx), draft, held_out)
+                continue
+            self._render_segment(painter, segment, idx, selected.get(idx), draft)
 
-    def _render_segment(self, painter, segment, seg_index):
-        editor = self.ctx.widget
-        points = segment.points
-        controls = segment.controls
-        is_active = (seg_index == editor.manager.active_segment_index)
+    def render_one(self, painter, seg_index, segment, selected=None, visible_bounds=None):
+        """Render a single full-quality segment, culled like render_all; used by progressive passes."""
+        if not segment.visible:
+            return
+        if visible_bounds is not None and not self._intersects(segment, visible_bounds):
+            return
+        self._render_segment(painter, segment, seg_index, selected)
+
+    def selected_indices_by_segment(self):
+        return self._selected_indices_by_segment()
+
+    def intersects(self, segment, visible_bounds):
+        return self._intersects(segment, visible_bounds)
+
+    def render_spans(self, painter, segment, seg_index, span_start, span_stop, override=None):
+        """
+        Draw only spans [span_start, span_stop) of a segment, e.g. the live
+        part of a drag. override = (role, index, QPointF) draws one point at
+        another position without touching the segment.
+        """
+        points, controls = self._with_override(segment, override)
+        path = QPainterPath()
+        for i in range(max(0, span_start), min(span_stop, len(points) - 1)):
+            path.moveTo(points[i])
+            self._add_span(path, points, controls, i)
+        painter.setPen(self._curve_pen(segment, seg_index))
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawPath(path)
+
+    def render_held_out(self, painter, segment, seg_index, held_out, override=None):
+        """
+        Draw the tangents and the handles of held_out that render_all left out,
+        except the dragged point itself (see render_drag_handle).
+        """
+        points, controls = self._with_override(segment, override)
+        dragged = override[:2] if override is not None else None
+        if self._shows_tangents(seg_index):
+            self._draw_tangents(painter, points, controls, held_out.spans)
+        if not constants.SHOW_CONTROL_POINTS:
+            return
+        screen = [
+            (p.x(), p.y()) for p in (
+                painter.transform().map(controls[i]) for i in held_out.controls
+                if i < len(controls) and controls[i] is not None and dragged != ("control", i)
+            )
+        ]
+        old_transform = painter.transform()
+        painter.setTransform(QTransform())
+        self._draw_handle_batch(painter, self.resources, screen, CONTROL_HANDLE_COLOR, DRAG_HANDLE_PX)
+        painter.setTransform(old_transform)
+
+    def render_drag_handle(self, painter, point, color):
+        """Draw the handle of the dragged point at its drag size."""
+        screen = painter.transform().map(point)
+        old_transform = painter.transform()
+        painter.setTransform(QTransform())
+        self._draw_handle_batch(painter, self.resources, [(screen.x(), screen.y())], color, DRAG_HANDLE_PX)
+        painter.setTransform(old_transform)
+
+    def geometry_for(self, segment):
+        return self._rank_cache.get(segment)
+
+    def cached_geometry_for(self, segment):
+        return self._rank_cache.peek(segment)
+
+    def _intersects(self, segment, visible_bounds):
+        bounds = self._rank_cache.get(segment).bounds
+        if bounds is None:
+            return False
+        min_x, min_y, max_x, max_y = visible_bounds
+        return not (bounds[2] < min_x or bounds[0] > max_x or bounds[3] < min_y or bounds[1] > max_y)
+
+    def _selected_indices_by_segment(self):
+        """Group the current selection as {seg_index: {"anchor": set, "control": set}}."""
+        selected = {}
+        for s in self.ctx.selection._mgr.selected_points_list:
+            roles = selected.setdefault(s["seg_index"], {"anchor": set(), "control": set()})
+            roles.setdefault(s["role"], set()).add(s["point_index"])
+        return selected
+
+    def _curve_pen(self, segment, seg_index):
+        is_active = (seg_index == self.ctx.widget.manager.active_segment_index)
         min_line_thickness = 2
         max_line_thickness = 6
         base_thickness = 2 if is_active else 1
         thickness = max(min_line_thickness, min(max_line_thickness, base_thickness))
-        if len(points) >= 2:
-            path = QPainterPath()
-            path.moveTo(points[0])
-            for i in range(1, len(points)):
-                if i - 1 < len(controls) and controls[i - 1] is not None:
-                    path.quadTo(controls[i - 1], points[i])
-                else:
-                    path.lineTo(points[i])
-            layer_color = LAYER_COLORS.get(segment.layer.name, QColor("black"))
-            pen = QPen(layer_color, thickness / self.ctx.viewport.scale)
-            pen.setCapStyle(Qt.PenCapStyle.RoundCap)
-            pen.setJoinStyle(Qt.PenJoinStyle.RoundJoin)
-            if not is_active:
-                pen.setColor(layer_color.lighter(150))
-            painter.setPen(pen)
-            painter.setBrush(Qt.BrushStyle.NoBrush)
-            painter.drawPath(path)
-        if is_active or editor.show_handles_only_on_selection:
+        return self.resources.segment_pen(segment.layer.name, is_active, thickness / self.ctx.viewport.scale)
+
+    @staticmethod
+    def _with_override(segment, override):
+        """Points and controls of segment with override = (role, index, QPointF) applied, if any."""
+        points, controls = segment.points, segment.controls
+        if override is not None:
+            role, index, position = override
+            if role == "anchor":
+                points = list(points)
+                points[index] = position
+            else:
+                controls = list(controls)
+                controls[index] = position
+        return points, controls
+
+    @staticmethod
+    def _add_span(path, points, controls, i):
+        if i < len(controls) and controls[i] is not None:
+            path.quadTo(controls[i], points[i + 1])
+        else:
+            path.lineTo(points[i + 1])
+
+    def _render_curve(self, painter, segment, seg_index, skip_spans=()):
+        points = segment.points
+        controls = segment.controls
+        if len(points) < 2:
+            return
+        path = QPainterPath()
+        path.moveTo(points[0])
+        for i in range(len(points) - 1):
+            if i in skip_spans:
+                path.moveTo(points[i + 1])
+            else:
+                self._add_span(path, points, controls, i)
+        painter.setPen(self._curve_pen(segment, seg_index))
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawPath(path)
+
+    def _render_segment(self, painter, segment, seg_index, selected=None, draft=False, held_out=None):
+        points = segment.points
+        controls = segment.controls
+        skip_spans = held_out.spans if held_out is not None else ()
+        self._render_curve(painter, segment, seg_index, skip_spans)
+        if draft and not selected:
+            return
+        if not draft and self._shows_tangents(seg_index):
+            self._draw_tangents(painter, points, controls, range(len(points) - 1), skip_spans)
+        self._render_handles(painter, segment, seg_index, points, controls, selected, draft, held_out)
+
+    def _shows_tangents(self, seg_index):
+        editor = self.ctx.widget
+        return seg_index == editor.manager.active_segment_index or editor.show_handles_only_on_selection
+
+    def _draw_tangents(self, painter, points, controls, spans, skip_spans=()):
+        tangents = []
+        for i in spans:
+            if i in skip_spans or not 0 <= i < min(len(points) - 1, len(controls)):
+                continue
+            ctrl = controls[i]
+            if ctrl is not None:
+                tangents.append(QLineF(points[i], ctrl))
+                tangents.append(QLineF(ctrl, points[i + 1]))
+        if tangents:
             tangent_thickness = 1 / self.ctx.viewport.scale
-            painter.setPen(QPen(Qt.GlobalColor.gray, tangent_thickness, Qt.PenStyle.DashLine))
-            for i in range(1, len(points)):
-                if i - 1 < len(controls):
-                    ctrl = controls[i - 1]
-                    if ctrl is not None:
-                        painter.drawLine(points[i - 1], ctrl)
-                        painter.drawLine(ctrl, points[i])
-        self._render_handles(painter, segment, seg_index, points, controls)
-    def _render_handles(self, painter, segment, seg_index, points, controls):
+            painter.setPen(self.resources.scaled_pen(Qt.GlobalColor.gray, tangent_thickness, Qt.PenStyle.DashLine))
+            painter.drawLines(tangents)
+
+    def _render_handles(self, painter, segment, seg_index, points, controls, selected=None, draft=False,
+                        held_out=None):
+        """
+        Draw anchor and control handles in screen space.
+
+        Visibility is decided with index masks sliced from the cached curvature
+        ranking and each color class is drawn with a single drawPoints call
+        using a round-capped pen. Draft frames only draw selected handles.
+        Handles listed in held_out are left out.
+        """
         editor = self.ctx.widget
-        selected_points = {
-            (s["role"], s["seg_index"], s["point_index"])
-            for s in self.ctx.selection._mgr.selected_points_list
-        }
+        selected = selected or {"anchor": set(), "control": set()}
         is_dragging = editor.drag_mode.dragging_point is not None
         if is_dragging:
-            min_px = max_px = handle_px = 3
+            min_px = max_px = handle_px = DRAG_HANDLE_PX
         else:
             min_px = max_px = 20
             handle_px = editor.handle_radius
             handle_px = max(min_px, min(max_px, handle_px))
         old_transform = painter.transform()
-        visible_points = get_visible_points(points, self.ctx.viewport.scale)
-        valid_controls = [c for c in controls if c is not None]
-        visible_controls = get_visible_points(valid_controls, self.ctx.viewport.scale)
-        if constants.SHOW_ANCHOR_POINTS:
-            for idx, pt in enumerate(points):
-                selected = ("anchor", seg_index, idx) in selected_points
-                if not selected and pt not in visible_points:
-                    continue
-                color = editor.handle_selected_color if selected else editor.handle_color
-                screen_pt = old_transform.map(pt)
-                painter.setTransform(QTransform())
-                painter.setBrush(QBrush(color))
-                painter.setPen(Qt.PenStyle.NoPen)
-                painter.drawEllipse(screen_pt, handle_px, handle_px)
-                painter.setTransform(old_transform)
+        scale = self.ctx.viewport.scale
+        geometry = self._rank_cache.get(segment)
+        painter.setTransform(QTransform())
+        held_anchors = held_out.anchors if held_out is not None else ()
+        held_controls = held_out.controls if held_out is not None else ()
+        if constants.SHOW_ANCHOR_POINTS and points:
+            held_mask = self._index_mask(len(points), held_anchors)
+            selected_mask = self._index_mask(len(points), selected["anchor"]) & ~held_mask
+            screen = map_points_to_screen(geometry.anchors, old_transform)
+            if not draft:
+                visible_mask = geometry.anchor_mask(scale) & ~selected_mask & ~held_mask
+                self._draw_handle_batch(painter, self.resources, screen[visible_mask], editor.handle_color, handle_px)
+            self._draw_handle_batch(painter, self.resources, screen[selected_mask], editor.handle_selected_color, handle_px)
         if constants.SHOW_CONTROL_POINTS:
-            for idx, ctrl in enumerate(controls):
-                if ctrl is None:
-                    continue
-                selected = ("control", seg_index, idx) in selected_points
-                if not selected and ctrl not in visible_controls:
-                    continue
-                color = editor.handle_selected_color if selected else QColor(255, 0, 0, 180)
-                size = handle_px * (1.2 if selected else 0.8)
-                size = max(min_px, min(max_px, size))
-                screen_pt = old_transform.map(ctrl)
-                painter.setTransform(QTransform())
-                painter.setBrush(QBrush(color))
-                painter.setPen(Qt.PenStyle.NoPen)
-                painter.drawEllipse(screen_pt, size, size)
-                painter.setTransform(old_transform)
+            ctrl_indices = geometry.control_indices
+            if ctrl_indices.size:
+                held_mask = self._index_mask(len(controls), held_controls)[ctrl_indices]
+                selected_mask = self._index_mask(len(controls), selected["control"])[ctrl_indices] & ~held_mask
+                screen = map_points_to_screen(geometry.controls, old_transform)
+                normal_size = max(min_px, min(max_px, handle_px * 0.8))
+                selected_size = max(min_px, min(max_px, handle_px * 1.2))
+                if not draft:
+                    visible_mask = geometry.control_mask(scale) & ~selected_mask & ~held_mask
+                    self._draw_handle_batch(painter, self.resources, screen[visible_mask], CONTROL_HANDLE_COLOR, normal_size)
+                self._draw_handle_batch(painter, self.resources, screen[selected_mask], editor.handle_selected_color, selected_size)
+        painter.setTransform(old_transform)
+
+    @staticmethod
+    def _index_mask(length, indices):
+        mask = np.zeros(length, dtype=bool)
+        valid = [i for i in indices if 0 <= i < length]
+        if valid:
+            mask[valid] = True
+        return mask
+
+    @staticmethod
+    def _draw_handle_batch(painter, resources, screen_points, color, radius):
+        """Draw all handles of one color class as round points in one call."""
+        if not len(screen_points):
+            return
+        painter.setPen(resources.point_pen(color, radius))
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawPoints(array_to_polygon(screen_points))
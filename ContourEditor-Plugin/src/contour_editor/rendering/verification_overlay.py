@@ -0,0 +1,55 @@
+import numpy as np
+from PyQt6.QtCore import Qt, QRectF
+from PyQt6.QtGui import QColor, QPainterPath, QPen
+
+from ..persistence.utils.coordinate_utils import array_to_polygon
+
+
+class VerificationOverlay:
+    """
+    Prebuilt paths for the verification contours.
+
+    Paths and their image-space bounds are built once when the contours are
+    set; painting only draws the cached paths that overlap the repainted area.
+    """
+
+    def __init__(self):
+        self._source = None
+        self._paths = []  # [(QPainterPath, QRectF bounds)]
+        self._pen = QPen(QColor(0, 180, 255, 220))
+        self._pen.setWidthF(2.0)
+        self._pen.setCosmetic(True)
+
+    def set_contours(self, contours):
+        """Build a path per contour with at least two points."""
+        self._source = contours
+        self._paths = []
+        for contour in contours or []:
+            if contour is None or len(contour) < 2:
+                continue
+            coords = np.asarray(contour, dtype=np.float64).reshape(-1, 2)
+            path = QPainterPath()
+            path.addPolygon(array_to_polygon(coords))
+            if len(coords) > 2 and not np.allclose(coords[0], coords[-1], rtol=0, atol=1e-6):
+                path.closeSubpath()
+            self._paths.append((path, path.controlPointRect()))
+
+    def draw(self, painter, contours, visible_rect: QRectF = None):
+        """Draw the cached paths, rebuilding them if the contour list was replaced."""
+        if contours is not self._source:
+            self.set_contours(contours)
+        if not self._paths:
+            return
+        painter.save()
+        painter.setPen(self._pen)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        for path, bounds in self._paths:
+            if visible_rect is None or _overlaps(visible_rect, bounds):
+                painter.drawPath(path)
+        painter.restore()
+
+
+def _overlaps(rect, bounds):
+    # Inclusive, unlike QRectF.intersects: horizontal and vertical contours have zero-area bounds
+    return (bounds.left() <= rect.right() and bounds.right() >= rect.left() and
+            bounds.top() <= rect.bottom() and bounds.bottom() >= rect.top())
@@ -4,12 +4,14 @@ from .segment_commands import (
     ToggleSegmentVisibilityCommand,
     DeleteSegmentCommand,
     AddSegmentCommand,
-    ChangeSegmentLayerCommand
+    ChangeSegmentLayerCommand,
+    AffineTransformCommand
 )
 
 __all__ = [
     'Command', 'CommandHistory',
     'ToggleSegmentVisibilityCommand', 'DeleteSegmentCommand',
-    'AddSegmentCommand', 'ChangeSegmentLayerCommand'
+    'AddSegmentCommand', 'ChangeSegmentLayerCommand',
+    'AffineTransformCommand'
 ]
 
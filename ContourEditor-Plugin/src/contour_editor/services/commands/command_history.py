@@ -1,13 +1,25 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from .base_command import Command
+from ...core.event_bus import EventBus
+from ...models.edit_sequence import latest_edit_sequence, next_edit_sequence
 
 
 class CommandHistory:
+    """
+    Undo and redo stacks of Commands. Each execute, undo and redo runs in one
+    EventBus transaction, so the changes a command publishes arrive as one
+    ChangeSet.
+
+    Entries carry their edit sequence (see models.edit_sequence) so callers
+    can interleave them with the manager's point-edit snapshots in the order
+    the edits were made.
+    """
+
     _instance = None
 
     def __init__(self, max_history=100):
-        self._undo_stack: List[Command] = []
-        self._redo_stack: List[Command] = []
+        self._undo_stack: List[Tuple[int, Command]] = []
+        self._redo_stack: List[Tuple[int, Command, int]] = []  # Last item: latest edit sequence when undone
         self._max_history = max_history
 
     @classmethod
@@ -21,11 +33,17 @@ class CommandHistory:
         cls._instance = None
 
     def execute(self, command: Command):
-        command.execute()
-        if self._undo_stack and self._undo_stack[-1].can_merge_with(command):
-            self._undo_stack[-1].merge_with(command)
+        with EventBus.get_instance().transaction():
+            command.execute()
+        latest = latest_edit_sequence()
+        sequence = next_edit_sequence()
+        # Merge only into the previous edit; a point edit made in between must stay undoable on its own
+        if self._undo_stack and self._undo_stack[-1][0] == latest and self._undo_stack[-1][1].can_merge_with(command):
+            merged = self._undo_stack[-1][1]
+            merged.merge_with(command)
+            self._undo_stack[-1] = (sequence, merged)
         else:
-            self._undo_stack.append(command)
+            self._undo_stack.append((sequence, command))
             if len(self._undo_stack) > self._max_history:
                 self._undo_stack.pop(0)
         self._redo_stack.clear()
@@ -33,33 +51,49 @@ class CommandHistory:
     def undo(self) -> bool:
         if not self._undo_stack:
             return False
-        command = self._undo_stack.pop()
-        command.undo()
-        self._redo_stack.append(command)
+        sequence, command = self._undo_stack.pop()
+        with EventBus.get_instance().transaction():
+            command.undo()
+        self._redo_stack.append((sequence, command, latest_edit_sequence()))
         return True
 
     def redo(self) -> bool:
-        if not self._redo_stack:
+        if self.redo_sequence() is None:
             return False
-        command = self._redo_stack.pop()
-        command.execute()
-        self._undo_stack.append(command)
+        sequence, command, _ = self._redo_stack.pop()
+        with EventBus.get_instance().transaction():
+            command.execute()
+        self._undo_stack.append((sequence, command))
         return True
 
     def can_undo(self) -> bool:
         return len(self._undo_stack) > 0
 
     def can_redo(self) -> bool:
-        return len(self._redo_stack) > 0
+        return self.redo_sequence() is not None
+
+    def undo_sequence(self) -> Optional[int]:
+        """Edit sequence of the command undo() would revert, or None."""
+        return self._undo_stack[-1][0] if self._undo_stack else None
+
+    def redo_sequence(self) -> Optional[int]:
+        """
+        Edit sequence of the command redo() would re-execute, or None.
+        Commands undone before a newer edit, including a point edit in the
+        manager, are dropped.
+        """
+        if self._redo_stack and self._redo_stack[-1][2] != latest_edit_sequence():
+            self._redo_stack.clear()
+        return self._redo_stack[-1][0] if self._redo_stack else None
 
     def get_undo_description(self) -> Optional[str]:
         if self._undo_stack:
-            return self._undo_stack[-1].get_description()
+            return self._undo_stack[-1][1].get_description()
         return None
 
     def get_redo_description(self) -> Optional[str]:
-        if self._redo_stack:
-            return self._redo_stack[-1].get_description()
+        if self.redo_sequence() is not None:
+            return self._redo_stack[-1][1].get_description()
         return None
 
     def clear(self):
@@ -1,5 +1,8 @@
+import numpy as np
+
 from .base_command import Command
 from ...core.event_bus import EventBus
+from ...models.affine_transform import apply_affine, recentred_controls_of, restore_controls, unlocked_targets
 
 
 class ToggleSegmentVisibilityCommand(Command):
@@ -19,6 +22,7 @@ class ToggleSegmentVisibilityCommand(Command):
             EventBus.get_instance().segment_visibility_changed.emit(
                 self.seg_index, self.new_visible
             )
+            EventBus.get_instance().publish("visibility", self.seg_index)
         self._executed = True
 
     def undo(self):
@@ -28,6 +32,7 @@ class ToggleSegmentVisibilityCommand(Command):
             EventBus.get_instance().segment_visibility_changed.emit(
                 self.seg_index, self.old_visible
             )
+            EventBus.get_instance().publish("visibility", self.seg_index)
 
     def get_description(self):
         return f"Toggle visibility of segment {self.seg_index}"
@@ -45,12 +50,14 @@ class DeleteSegmentCommand(Command):
             self.deleted_segment = self.manager.segments[self.seg_index]
             self.manager.delete_segment(self.seg_index)
             EventBus.get_instance().segment_deleted.emit(self.seg_index)
+            EventBus.get_instance().publish("removed", self.seg_index)
         self._executed = True
 
     def undo(self):
         if self.deleted_segment:
             self.manager.segments.insert(self.seg_index, self.deleted_segment)
             EventBus.get_instance().segment_added.emit(self.seg_index)
+            EventBus.get_instance().publish("added", self.seg_index)
 
     def get_description(self):
         return f"Delete segment {self.seg_index}"
@@ -76,12 +83,14 @@ class AddSegmentCommand(Command):
         if success:
             self.seg_index = len(self.manager.segments) - 1
             EventBus.get_instance().segment_added.emit(self.seg_index)
+            EventBus.get_instance().publish("added", self.seg_index)
         self._executed = True
 
     def undo(self):
         if self.seg_index is not None and self.seg_index < len(self.manager.segments):
             del self.manager.segments[self.seg_index]
             EventBus.get_instance().segment_deleted.emit(self.seg_index)
+            EventBus.get_instance().publish("removed", self.seg_index)
 
     def get_description(self):
         return f"Add segment to {self.layer_name}"
@@ -103,6 +112,7 @@ class ChangeSegmentLayerCommand(Command):
             EventBus.get_instance().segment_layer_changed.emit(
                 self.seg_index, self.new_layer_name
             )
+            EventBus.get_instance().publish("layer", self.seg_index)
         self._executed = True
 
     def undo(self):
@@ -111,6 +121,63 @@ class ChangeSegmentLayerCommand(Command):
             EventBus.get_instance().segment_layer_changed.emit(
                 self.seg_index, self.old_layer_name
             )
+            EventBus.get_instance().publish("layer", self.seg_index)
 
     def get_description(self):
         return f"Change segment {self.seg_index} layer to {self.new_layer_name}"
+
+
+class AffineTransformCommand(Command):
+    """
+    Applies a 3x3 affine matrix to target points. Only the matrix and the
+    (seg_index, anchor_indices, control_indices) targets are stored; undo
+    applies the inverse matrix instead of restoring a snapshot.
+
+    The first execute() skips segments on locked layers and remembers which
+    targets it moved; undo and redo act on exactly those, even if a layer
+    was locked in between, so the scene always matches the history.
+    Controls the transform recentres on their straight span cannot be
+    recovered with the inverse matrix, so their start positions are stored
+    as well and written back on undo.
+    """
+
+    def __init__(self, manager, matrix, targets, description="Transform"):
+        super().__init__()
+        self.manager = manager
+        self.matrix = np.array(matrix, dtype=np.float64)
+        if self.matrix.shape != (3, 3) or abs(np.linalg.det(self.matrix[:2, :2])) < 1e-12:
+            raise ValueError("Affine transform matrix must be an invertible 3x3 matrix")
+        self.inverse = np.linalg.inv(self.matrix)
+        self.targets = tuple(targets)
+        self.description = description
+        self.moved_count = 0
+        self.moved_targets = None  # Set by the first execute()
+        self.recentred_controls = ()  # (seg_index, ((control_index, (x, y)), ...)) start positions
+
+    def execute(self):
+        segments = self.manager.segments
+        if self.moved_targets is None:
+            self.moved_targets = unlocked_targets(segments, self.targets)
+            self.recentred_controls = recentred_controls_of(segments, self.moved_targets, include_locked=True)
+        self.moved_count = apply_affine(segments, self.moved_targets, self.matrix, include_locked=True)
+        self._publish_geometry()
+        self._executed = True
+
+    def undo(self):
+        segments = self.manager.segments
+        apply_affine(segments, self.moved_targets, self.inverse, include_locked=True, recentre=False)
+        restore_controls(segments, self.recentred_controls)
+        self._publish_geometry()
+
+    def _publish_geometry(self):
+        recentred = {seg_index: [i for i, _ in controls] for seg_index, controls in self.recentred_controls}
+        bus = EventBus.get_instance()
+        with bus.transaction():
+            for seg_index, anchor_indices, control_indices in self.moved_targets:
+                if control_indices is not None and seg_index in recentred:
+                    control_indices = tuple(sorted({*control_indices, *recentred[seg_index]}))
+                bus.publish("geometry", seg_index, anchors=anchor_indices, controls=control_indices)
+            bus.points_changed.emit()
+
+    def get_description(self):
+        return f"{self.description} {self.moved_count} points"
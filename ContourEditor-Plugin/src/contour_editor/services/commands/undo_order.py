@@ -0,0 +1,52 @@
+"""
+Undo Order - Undo and redo across CommandHistory and the manager's snapshots
+Segment operations are Commands and point edits are snapshots saved by
+BezierSegmentManager.save_state(). Undo always reverts the most recent edit
+of either and redo replays the most recently undone one, so a Command never
+runs against geometry a later point edit has changed.
+
+Managers without undo_sequence()/redo_sequence() keep the old order: their
+own undo and redo are only used when CommandHistory has nothing left.
+"""
+
+
+def undo_source(history, manager):
+    """Which edit undo would revert: "command", "snapshot" or None if there is nothing to undo."""
+    command = history.undo_sequence()
+    snapshot = manager.undo_sequence() if hasattr(manager, "undo_sequence") else None
+    if command is not None and (snapshot is None or command > snapshot):
+        return "command"
+    if snapshot is None and hasattr(manager, "undo_sequence"):
+        return None
+    return "snapshot"
+
+
+def redo_source(history, manager):
+    """Which edit redo would replay: "command", "snapshot" or None if there is nothing to redo."""
+    command = history.redo_sequence()
+    snapshot = manager.redo_sequence() if hasattr(manager, "redo_sequence") else None
+    if command is not None and (snapshot is None or command < snapshot):
+        return "command"
+    if snapshot is None and hasattr(manager, "redo_sequence"):
+        return None
+    return "snapshot"
+
+
+
+def publish_snapshot_changes(bus, before, after):
+    """
+    Publish what a snapshot undo or redo changed, given the segment lists
+    before and after it, as one transaction. Snapshots restore whole
+    segments, so a changed segment is a geometry change of any of its points.
+    Equal non-zero geometry versions mean the segment was not touched.
+    """
+    with bus.transaction():
+        for seg_index, segment in enumerate(after):
+            if seg_index >= len(before):
+                bus.publish("added", seg_index)
+                continue
+            version = getattr(segment, "geometry_version", 0)
+            if not version or version != getattr(before[seg_index], "geometry_version", 0):
+                bus.publish("geometry", seg_index)
+        for seg_index in range(len(before) - 1, len(after) - 1, -1):
+            bus.publish("removed", seg_index)
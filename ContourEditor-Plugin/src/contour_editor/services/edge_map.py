@@ -0,0 +1,143 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+import numpy as np
+from PyQt6.QtCore import QObject, Qt, pyqtSignal
+from PyQt6.QtGui import QImage
+
+# Gradient magnitude (Sobel, L2) an edge must exceed; keeps flat or noisy frames free of edges
+EDGE_MIN_GRADIENT = 60.0
+# Canny's high threshold is this percentile of the frame's gradient magnitude
+EDGE_STRENGTH_PERCENTILE = 90
+
+
+def image_to_gray(image):
+    """Grayscale copy of a QImage as a 2D uint8 array."""
+    gray = image.convertToFormat(QImage.Format.Format_Grayscale8)
+    width, height = gray.width(), gray.height()
+    buffer = np.frombuffer(gray.constBits().asstring(gray.sizeInBytes()), dtype=np.uint8)
+    return buffer.reshape(height, gray.bytesPerLine())[:, :width].copy()
+
+
+class EdgeMap:
+    """
+    Strong edges of a background image with their distance transform.
+
+    distances holds, for every pixel, the distance to the nearest edge pixel
+    and labels which edge pixel that is, so nearest() is a constant-time
+    lookup instead of a search around the cursor.
+    """
+
+    def __init__(self, distances=None, labels=None, edge_points=None, edge_count=0):
+        self.distances = distances
+        self.labels = labels
+        self.edge_points = edge_points  # Indexed by label
+        self.edge_count = edge_count
+
+    def nearest(self, x, y, radius):
+        """Image-space (x, y) of the edge pixel nearest to (x, y) if within radius, else None."""
+        if not self.edge_count:
+            return None
+        height, width = self.distances.shape
+        col, row = int(round(x)), int(round(y))
+        if not (0 <= col < width and 0 <= row < height):
+            return None
+        # The transform is measured from the pixel centre; allow for the rounding above
+        if self.distances[row, col] > radius + 1.0:
+            return None
+        point = self.edge_points[self.labels[row, col]]
+        if np.hypot(point[0] - x, point[1] - y) > radius:
+            return None
+        return point
+
+
+def compute_edge_map(gray):
+    """
+    Build the EdgeMap of a grayscale frame: Canny edges whose thresholds follow
+    the frame's own gradient strength, then a labelled distance transform.
+    """
+    blurred = cv2.GaussianBlur(gray, (5, 5), 0)
+    magnitude = cv2.magnitude(cv2.Sobel(blurred, cv2.CV_32F, 1, 0), cv2.Sobel(blurred, cv2.CV_32F, 0, 1))
+    high = max(float(np.percentile(magnitude, EDGE_STRENGTH_PERCENTILE)), EDGE_MIN_GRADIENT)
+    edges = cv2.Canny(blurred, high / 2, high, L2gradient=True)
+    rows, cols = np.nonzero(edges)
+    if not len(rows):
+        return EdgeMap()
+    # Edge pixels are the zeros the transform measures from
+    distances, labels = cv2.distanceTransformWithLabels(
+        np.where(edges > 0, 0, 255).astype(np.uint8), cv2.DIST_L2, 5, labelType=cv2.DIST_LABEL_PIXEL
+    )
+    edge_points = np.zeros((labels.max() + 1, 2))
+    edge_points[labels[rows, cols]] = np.column_stack((cols, rows))
+    return EdgeMap(distances, labels, edge_points, len(rows))
+
+
+class EdgeMapBuilder(QObject):
+    """
+    Computes the EdgeMap of the background image on a worker thread.
+
+    At most one build runs at a time. Requests that arrive meanwhile only
+    replace the pending image, so a live feed is rebuilt for its latest
+    frame once the running build finishes instead of queueing every frame.
+    edge_map keeps the last finished map until a newer one replaces it and
+    is None only before the first map or after the image was cleared.
+    """
+
+    _built = pyqtSignal(int, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="edge-map")
+        self._generation = 0
+        self._image_key = None
+        self._building = False
+        self._pending = None  # (image, keep_alive) waiting for the running build
+        self.edge_map = None
+        self._built.connect(self._on_built, Qt.ConnectionType.QueuedConnection)
+
+    def request(self, image, keep_alive=None):
+        """
+        Build the map for image unless it is already built or pending.
+        keep_alive is held until the worker is done, for images that wrap
+        memory they do not own (see ViewportController.set_image).
+        """
+        key = image.cacheKey() if image is not None and not image.isNull() else None
+        if key == self._image_key:
+            return
+        self._image_key = key
+        if key is None:
+            # Drop the running build's result along with the map
+            self._generation += 1
+            self._pending = None
+            self.edge_map = None
+        elif self._building:
+            self._pending = (image, keep_alive)
+        else:
+            self._start(image, keep_alive)
+
+    def _start(self, image, keep_alive):
+        self._building = True
+        self._executor.submit(self._build, self._generation, image, keep_alive)
+
+    def _build(self, generation, image, keep_alive):
+        # Runs on the worker thread; always reports back so the next build can start
+        edge_map = None
+        try:
+            if generation == self._generation:
+                edge_map = compute_edge_map(image_to_gray(image))
+        finally:
+            self._built.emit(generation, edge_map)
+
+    def _on_built(self, generation, edge_map):
+        self._building = False
+        if edge_map is not None and generation == self._generation:
+            self.edge_map = edge_map
+        if self._pending is not None:
+            image, keep_alive = self._pending
+            self._pending = None
+            self._start(image, keep_alive)
+
+    def shutdown(self):
+        self._generation += 1
+        self._pending = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -2,8 +2,10 @@ from .commands.segment_commands import (
     AddSegmentCommand,
     DeleteSegmentCommand,
     ToggleSegmentVisibilityCommand,
-    ChangeSegmentLayerCommand
+    ChangeSegmentLayerCommand,
+    AffineTransformCommand
 )
+from ..core.scene_changes import changed_indices
 
 
 class SegmentService:
@@ -31,11 +33,28 @@ class SegmentService:
         cmd = ChangeSegmentLayerCommand(self.manager, seg_index, new_layer_name)
         self.command_history.execute(cmd)
 
+    def transform(self, targets, matrix, description="Transform"):
+        cmd = AffineTransformCommand(self.manager, matrix, targets, description)
+        self.command_history.execute(cmd)
+        return cmd.moved_count
+
     def add_control_point(self, seg_index, pos):
-        return self.manager.add_control_point(seg_index, pos)
+        before = self._segment_points(seg_index)
+        with self.event_bus.transaction():
+            result = self.manager.add_control_point(seg_index, pos)
+            if result:
+                self._publish_point_changes(seg_index, before)
+                self.event_bus.points_changed.emit()
+        return result
 
     def add_anchor_point(self, seg_index, pos):
-        return self.manager.insert_anchor_point(seg_index, pos)
+        before = self._segment_points(seg_index)
+        with self.event_bus.transaction():
+            result = self.manager.insert_anchor_point(seg_index, pos)
+            if result:
+                self._publish_point_changes(seg_index, before)
+                self.event_bus.points_changed.emit()
+        return result
 
     def disconnect_line(self, pos, seg_index):
         segment_info = self.manager.find_segment_at(pos)
@@ -47,7 +66,16 @@ class SegmentService:
         if found_seg_index != seg_index:
             seg_index = found_seg_index
 
-        result = self.manager.disconnect_line_segment(seg_index, line_index)
+        segment_count = len(self.manager.get_segments())
+        with self.event_bus.transaction():
+            result = self.manager.disconnect_line_segment(seg_index, line_index)
+            if result:
+                # The segment is replaced by the pieces it was split into
+                self.event_bus.publish("removed", seg_index)
+                pieces = len(self.manager.get_segments()) - segment_count + 1
+                for piece_index in range(seg_index, seg_index + pieces):
+                    self.event_bus.publish("added", piece_index)
+                self.event_bus.points_changed.emit()
         return result
 
     def set_active_segment(self, seg_index):
@@ -62,12 +90,33 @@ class SegmentService:
 
         layer.visible = visible
 
-        for idx, segment in enumerate(self.manager.get_segments()):
-            if hasattr(segment, 'layer') and segment.layer and segment.layer.name == layer_name:
-                self.manager.set_segment_visibility(idx, visible)
-
-        self.event_bus.points_changed.emit()
+        with self.event_bus.transaction():
+            for idx, segment in enumerate(self.manager.get_segments()):
+                if hasattr(segment, 'layer') and segment.layer and segment.layer.name == layer_name:
+                    self.manager.set_segment_visibility(idx, visible)
+                    self.event_bus.publish("visibility", idx)
+            self.event_bus.points_changed.emit()
 
     def set_layer_locked(self, layer_name, locked):
         self.manager.set_layer_locked(layer_name, locked)
         self.event_bus.points_changed.emit()
+
+    def _segment_points(self, seg_index):
+        """Copies of the anchor and control lists of a segment, or None if there is no such segment."""
+        segments = self.manager.get_segments()
+        if not 0 <= seg_index < len(segments):
+            return None
+        segment = segments[seg_index]
+        return list(segment.points), list(segment.controls)
+
+    def _publish_point_changes(self, seg_index, before):
+        """Publish a geometry change with the anchor and control indices that differ from before."""
+        after = self._segment_points(seg_index)
+        if before is None or after is None:
+            self.event_bus.publish("geometry", seg_index)
+            return
+        self.event_bus.publish(
+            "geometry", seg_index,
+            anchors=changed_indices(before[0], after[0]),
+            controls=changed_indices(before[1], after[1]),
+        )
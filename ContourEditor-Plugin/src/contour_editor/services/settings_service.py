@@ -1,5 +1,6 @@
 import json
 import os
+from ..core.event_bus import EventBus
 from ..models.settings_config import SettingsConfig
 
 
@@ -74,6 +75,9 @@ class SettingsService:
                     self.default_settings[key] = str(value)
 
     def apply_to_all_segments(self, manager, settings: dict):
-        for segment in manager.get_segments():
-            segment.set_settings(settings)
+        event_bus = EventBus.get_instance()
+        with event_bus.transaction():
+            for seg_index, segment in enumerate(manager.get_segments()):
+                segment.set_settings(settings)
+                event_bus.publish("settings", seg_index)
 
@@ -0,0 +1,206 @@
+import numpy as np
+from PyQt6.QtCore import QPointF
+
+from ..models.spatial_index import SpatialIndex, closest_on_pieces
+from .edge_map import EdgeMapBuilder
+from ..persistence.config import constants
+
+# Intersections are only computed between the spans closest to the cursor
+MAX_INTERSECTION_SPANS = 32
+# Most spans a snap considers; denser geometry narrows the radius (SpanGrid.spans_near)
+MAX_SNAP_SPANS = 4096
+
+
+class SnapResult:
+    """Snapped image-space position and the kind of target it came from."""
+
+    def __init__(self, point, kind):
+        self.point = point
+        self.kind = kind
+
+    def __repr__(self):
+        return f"SnapResult({self.point.x():.2f}, {self.point.y():.2f}, {self.kind!r})"
+
+
+class SnappingService:
+    """
+    Snaps image-space positions to nearby anchors, span intersections, span
+    midpoints, the nearest point on a span, a strong edge of the background
+    image or a mm grid.
+
+    Candidates come from the spatial index's SpanGrid, so a query only looks
+    at spans under the snap radius. While a point is dragged, begin() freezes
+    the grid: the scene is indexed once at the press and the spans that move
+    with the dragged point are left out, instead of re-indexing on every move.
+
+    Edge snapping reads an EdgeMap that is built on a worker thread whenever
+    the background image changes; until the first map is ready edges are
+    simply not offered as targets, and while a newer frame's map is built the
+    last finished one keeps being used.
+    """
+
+    # Earlier kinds win over later ones when both are within the radius
+    KINDS = ("anchor", "intersection", "midpoint", "span", "edge", "grid")
+    _KIND_FLAGS = {
+        "anchor": "SNAP_TO_ANCHORS",
+        "intersection": "SNAP_TO_INTERSECTIONS",
+        "midpoint": "SNAP_TO_MIDPOINTS",
+        "span": "SNAP_TO_SPANS",
+        "edge": "SNAP_TO_EDGES",
+        "grid": "SNAP_TO_GRID",
+    }
+
+    def __init__(self, spatial_index=None):
+        self.spatial_index = spatial_index or SpatialIndex()
+        self._frozen_grid = None
+        self._excluded_spans = ()
+        self._excluded_anchor = None
+        self._background = (None, None)  # (QImage, buffer it wraps)
+        self._edge_builder = None  # Created on first use
+        self._candidate_finders = {
+            "anchor": self._anchor_candidates,
+            "intersection": self._intersection_candidates,
+            "midpoint": self._midpoint_candidates,
+            "span": self._span_candidates,
+        }
+
+    @property
+    def enabled(self):
+        return constants.SNAP_ENABLED and any(self.is_kind_enabled(kind) for kind in self.KINDS)
+
+    def is_kind_enabled(self, kind):
+        return bool(getattr(constants, self._KIND_FLAGS[kind]))
+
+    def set_background(self, image, keep_alive=None):
+        """Start building the edge map of a new background image when edge snapping is on."""
+        self._background = (image, keep_alive)
+        if self.enabled and self.is_kind_enabled("edge"):
+            self._get_edge_builder().request(image, keep_alive)
+
+    def begin(self, segments, dragged_point=None):
+        """Freeze the scene for a drag; dragged_point is the (role, seg_index, idx) being moved."""
+        self._frozen_grid = self.spatial_index.grid_for(segments) if self.enabled else None
+        self._excluded_spans = ()
+        self._excluded_anchor = None
+        if dragged_point is not None:
+            role, seg_index, idx = dragged_point
+            if role == "anchor":
+                self._excluded_spans = ((seg_index, idx - 1), (seg_index, idx))
+                self._excluded_anchor = (seg_index, idx)
+            else:
+                self._excluded_spans = ((seg_index, idx),)
+
+    def end(self):
+        self._frozen_grid = None
+        self._excluded_spans = ()
+        self._excluded_anchor = None
+
+    def snap(self, pos, scale, segments=None):
+        """
+        Best snap target for the image-space pos within SNAP_RADIUS_PX screen
+        pixels, or None. Uses the frozen grid during a drag, otherwise the
+        spatial index's grid for segments.
+        """
+        if not self.enabled:
+            return None
+        radius = constants.SNAP_RADIUS_PX / scale
+        x, y = pos.x(), pos.y()
+        grid = self._frozen_grid
+        if grid is None and segments is not None:
+            grid = self.spatial_index.grid_for(segments)
+        spans = np.empty(0, dtype=np.intp)
+        if grid is not None:
+            spans, radius = grid.spans_near(x, y, radius, MAX_SNAP_SPANS)
+            spans = self._without_excluded(grid, spans)
+        cursor = np.array((x, y))
+
+        for kind in self.KINDS:
+            if not self.is_kind_enabled(kind):
+                continue
+            if kind == "grid":
+                candidates = self._grid_point(cursor)
+            elif kind == "edge":
+                candidates = self._edge_point(cursor, radius)
+            elif not len(spans):
+                continue
+            else:
+                candidates = self._candidate_finders[kind](grid, spans, cursor)
+            if not len(candidates):
+                continue
+            distances = np.hypot(candidates[:, 0] - x, candidates[:, 1] - y)
+            best = int(np.argmin(distances))
+            if distances[best] <= radius:
+                return SnapResult(QPointF(*candidates[best].tolist()), kind)
+        return None
+
+    def _without_excluded(self, grid, spans):
+        if self._excluded_spans and len(spans):
+            keep = np.ones(len(spans), dtype=bool)
+            for seg_index, span_index in self._excluded_spans:
+                keep &= ~((grid.seg_ids[spans] == seg_index) & (grid.span_ids[spans] == span_index))
+            spans = spans[keep]
+        return spans
+
+    def _anchor_candidates(self, grid, spans, cursor):
+        points = np.vstack((grid.starts[spans], grid.ends[spans]))
+        if self._excluded_anchor is not None:
+            seg_index, idx = self._excluded_anchor
+            seg_ids = np.concatenate((grid.seg_ids[spans], grid.seg_ids[spans]))
+            anchor_ids = np.concatenate((grid.span_ids[spans], grid.span_ids[spans] + 1))
+            points = points[~((seg_ids == seg_index) & (anchor_ids == idx))]
+        return points
+
+    def _midpoint_candidates(self, grid, spans, cursor):
+        starts, ends, controls = grid.starts[spans], grid.ends[spans], grid.controls[spans]
+        straight = (starts + ends) / 2
+        # Quadratic Bezier at t = 0.5
+        curved = 0.25 * starts + 0.5 * controls + 0.25 * ends
+        return np.where(np.isnan(controls), straight, curved)
+
+    def _span_candidates(self, grid, spans, cursor):
+        a, b, _ = grid.pieces(spans)
+        return closest_on_pieces(a, b, cursor)
+
+    def _intersection_candidates(self, grid, spans, cursor):
+        if len(spans) > MAX_INTERSECTION_SPANS:
+            centers = (grid.span_min[spans] + grid.span_max[spans]) / 2
+            order = np.argsort(np.hypot(*(centers - cursor).T))
+            spans = spans[order[:MAX_INTERSECTION_SPANS]]
+        a, b, owner = grid.pieces(spans)
+        seg_ids, span_ids = grid.seg_ids[spans][owner], grid.span_ids[spans][owner]
+        i, j = np.triu_indices(len(a), k=1)
+        # Pieces of the same or neighbouring spans of a segment only meet at their shared anchor
+        distinct = (seg_ids[i] != seg_ids[j]) | (np.abs(span_ids[i] - span_ids[j]) > 1)
+        i, j = i[distinct], j[distinct]
+        d1, d2 = b[i] - a[i], b[j] - a[j]
+        denominator = d1[:, 0] * d2[:, 1] - d1[:, 1] * d2[:, 0]
+        offset = a[j] - a[i]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = (offset[:, 0] * d2[:, 1] - offset[:, 1] * d2[:, 0]) / denominator
+            u = (offset[:, 0] * d1[:, 1] - offset[:, 1] * d1[:, 0]) / denominator
+        hit = (np.abs(denominator) > 1e-12) & (t >= 0) & (t <= 1) & (u >= 0) & (u <= 1)
+        return a[i[hit]] + t[hit, None] * d1[hit]
+
+    def _edge_point(self, cursor, radius):
+        builder = self._get_edge_builder()
+        # Catches up when edge snapping was switched on after the image was set
+        builder.request(*self._background)
+        point = builder.edge_map.nearest(*cursor.tolist(), radius) if builder.edge_map is not None else None
+        return np.empty((0, 2)) if point is None else point[None, :]
+
+    def shutdown(self):
+        """Stop the edge map worker thread."""
+        if self._edge_builder is not None:
+            self._edge_builder.shutdown()
+            self._edge_builder = None
+
+    def _get_edge_builder(self):
+        if self._edge_builder is None:
+            self._edge_builder = EdgeMapBuilder()
+        return self._edge_builder
+
+    def _grid_point(self, cursor):
+        step = constants.SNAP_GRID_MM * constants.PIXELS_PER_MM
+        if step <= 0:
+            return np.empty((0, 2))
+        return (np.round(cursor / step) * step)[None, :]
@@ -495,6 +495,12 @@ class ConstantsSettingsDialog(QDialog):
         self._add_spinbox(drag_layout, row, "POINT_HIT_RADIUS_PX", "Point Hit Radius (px)", 1, 50, False)
         row += 1
         self._add_spinbox(drag_layout, row, "CLUSTER_DISTANCE_PX", "Cluster Distance (px)", 1, 50, False)
+        row += 1
+        self._add_checkbox(drag_layout, row, "HOVER_HIGHLIGHT_ENABLED", "Highlight Under Cursor")
+        row += 1
+        self._add_color(drag_layout, row, "HOVER_HIGHLIGHT_COLOR", "Highlight Color")
+        row += 1
+        self._add_spinbox(drag_layout, row, "HOVER_HIGHLIGHT_WIDTH", "Highlight Width (px)", 1, 10, False)
 
         drag_group.setLayout(drag_layout)
         layout.addWidget(drag_group)
@@ -514,6 +520,33 @@ class ConstantsSettingsDialog(QDialog):
         timing_group.setLayout(timing_layout)
         layout.addWidget(timing_group)
 
+        # Snapping group
+        snap_group = QGroupBox("Snapping")
+        snap_layout = QGridLayout()
+        snap_layout.setSpacing(16)
+
+        row = 0
+        self._add_checkbox(snap_layout, row, "SNAP_ENABLED", "Enable Snapping")
+        row += 1
+        self._add_spinbox(snap_layout, row, "SNAP_RADIUS_PX", "Snap Radius (px)", 1, 50, False)
+        row += 1
+        self._add_checkbox(snap_layout, row, "SNAP_TO_ANCHORS", "Snap to Anchors")
+        row += 1
+        self._add_checkbox(snap_layout, row, "SNAP_TO_INTERSECTIONS", "Snap to Intersections")
+        row += 1
+        self._add_checkbox(snap_layout, row, "SNAP_TO_MIDPOINTS", "Snap to Midpoints")
+        row += 1
+        self._add_checkbox(snap_layout, row, "SNAP_TO_SPANS", "Snap to Lines")
+        row += 1
+        self._add_checkbox(snap_layout, row, "SNAP_TO_EDGES", "Snap to Image Edges")
+        row += 1
+        self._add_checkbox(snap_layout, row, "SNAP_TO_GRID", "Snap to Grid")
+        row += 1
+        self._add_spinbox(snap_layout, row, "SNAP_GRID_MM", "Grid Spacing (mm)", 0.1, 100.0, True)
+
+        snap_group.setLayout(snap_layout)
+        layout.addWidget(snap_group)
+
         layout.addStretch()
 
     # ------------------------------------------------------------------
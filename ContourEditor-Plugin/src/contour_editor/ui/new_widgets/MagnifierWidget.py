@@ -2,11 +2,14 @@
 Magnifier widget that shows a zoomed-in view of the cursor position
 for precise point placement.
 """
-from PyQt6.QtCore import Qt, QPointF, QPoint, QTimer
+import numpy as np
+from PyQt6.QtCore import Qt, QPointF, QPoint, QRectF, QTimer
 from PyQt6.QtWidgets import QWidget
 from PyQt6.QtGui import QPainter, QPen, QColor, QBrush
 
+from ...models.spatial_index import SpatialIndex
 from ...persistence.config.constants import LAYER_COLORS
+from ...persistence.utils.coordinate_utils import array_to_polygon
 from ...rendering.renderer import draw_ruler, draw_pickup_point
 from PyQt6.QtGui import QPainterPath
 from .styles import PRIMARY, BORDER
@@ -23,6 +26,7 @@ class MagnifierWidget(QWidget):
         self.size = 150  # Size of the magnifier window
         self.offset = QPoint(20, 20)  # Offset from cursor
         self.cursor_pos = QPointF(0, 0)  # Current cursor position in image space
+        self._spatial_index = SpatialIndex()  # Fallback when the editor has no shared index
 
         # Setup widget as a frameless, always-on-top tool window
         self.setFixedSize(self.size, self.size)
@@ -74,8 +78,11 @@ class MagnifierWidget(QWidget):
         except:
             pass
 
-    def _draw_magnified_view(self, painter, manager):
-        """Draw bezier curves and points at normal screen size (compensating for magnification)"""
+    def _draw_magnified_view(self, painter, manager, view_rect):
+        """
+        Draw bezier curves and points at normal screen size (compensating for magnification).
+        Only the spans the spatial index reports under view_rect are drawn.
+        """
 
         segments = manager.get_segments()
         if not segments:
@@ -86,29 +93,27 @@ class MagnifierWidget(QWidget):
         line_width = 2.0 / self.magnification  # Normal line width
         point_radius = 3.0 / self.magnification  # Normal point size (3px on screen)
 
-        for seg in segments:
+        spatial_index = getattr(self.editor, 'spatial_index', None) or self._spatial_index
+        for seg_index, seg, spans, span_indices in spatial_index.query_rect(segments, view_rect):
             # Skip invisible segments
             if hasattr(seg, 'layer') and seg.layer and not seg.layer.visible:
                 continue
             if hasattr(seg, 'visible') and not seg.visible:
                 continue
 
-            points = seg.points
-            controls = seg.controls
-            if len(points) < 2:
-                continue
-
-            # Draw the bezier curve
+            # Draw the bezier curve, one subpath per run of consecutive spans
+            anchors = spans.anchors
             path = QPainterPath()
-            path.moveTo(points[0].x(), points[0].y())
-
-            for i in range(len(points) - 1):
-                p2 = points[i + 1]
-                if i < len(controls) and controls[i] is not None:
-                    ctrl = controls[i]
-                    path.quadTo(ctrl.x(), ctrl.y(), p2.x(), p2.y())
+            previous = None
+            for i in span_indices.tolist():
+                if previous != i - 1:
+                    path.moveTo(anchors[i, 0], anchors[i, 1])
+                ctrl = spans.controls[i]
+                if np.isnan(ctrl[0]):
+                    path.lineTo(anchors[i + 1, 0], anchors[i + 1, 1])
                 else:
-                    path.lineTo(p2.x(), p2.y())
+                    path.quadTo(ctrl[0], ctrl[1], anchors[i + 1, 0], anchors[i + 1, 1])
+                previous = i
 
             # Draw path with compensated line width
             layer_color = LAYER_COLORS.get(seg.layer.name, QColor("black"))
@@ -119,18 +124,25 @@ class MagnifierWidget(QWidget):
             painter.setBrush(Qt.BrushStyle.NoBrush)
             painter.drawPath(path)
 
-            # Draw anchor points with compensated size
-            for pt in points:
-                painter.setBrush(QBrush(QColor(0, 150, 255, 180)))  # Blue
-                painter.setPen(Qt.PenStyle.NoPen)
-                painter.drawEllipse(pt, point_radius, point_radius)
-
-            # Draw control points with compensated size
-            for ctrl in controls:
-                if ctrl is not None:
-                    painter.setBrush(QBrush(QColor(255, 0, 0, 180)))  # Red
-                    painter.setPen(Qt.PenStyle.NoPen)
-                    painter.drawEllipse(ctrl, point_radius * 0.8, point_radius * 0.8)
+            # Draw anchor and control points with compensated size
+            anchor_indices = np.union1d(span_indices, span_indices + 1)
+            self._draw_points(painter, anchors[anchor_indices], view_rect, QColor(0, 150, 255, 180), point_radius)
+            controls = spans.controls[span_indices]
+            self._draw_points(painter, controls[~np.isnan(controls[:, 0])], view_rect,
+                              QColor(255, 0, 0, 180), point_radius * 0.8)
+
+    @staticmethod
+    def _draw_points(painter, coords, view_rect, color, radius):
+        """Draw the points inside view_rect as round dots in one call."""
+        inside = ((coords[:, 0] >= view_rect.left()) & (coords[:, 0] <= view_rect.right()) &
+                  (coords[:, 1] >= view_rect.top()) & (coords[:, 1] <= view_rect.bottom()))
+        if not inside.any():
+            return
+        pen = QPen(color, radius * 2)
+        pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+        painter.setPen(pen)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawPoints(array_to_polygon(coords[inside]))
 
     def _draw_curves_only(self, painter, manager):
         """Draw only the bezier curves without control points or anchor points"""
@@ -239,20 +251,27 @@ class MagnifierWidget(QWidget):
                     # 3. Translate to center on cursor position in image space
                     painter.translate(-view_center_x, -view_center_y)
 
+                    # Image-space area visible in the magnifier
+                    half_w = target_rect.width() / 2 / self.magnification
+                    half_h = target_rect.height() / 2 / self.magnification
+                    view_rect = QRectF(view_center_x - half_w, view_center_y - half_h, half_w * 2, half_h * 2)
+
                     # Now draw the scene with the editor's current scale and translation
                     # First, fill with white background
-                    from PyQt6.QtCore import QRectF
                     img_width = self.editor.image.width() if self.editor.image else 1280
                     img_height = self.editor.image.height() if self.editor.image else 720
-                    painter.fillRect(QRectF(0, 0, img_width, img_height), Qt.GlobalColor.white)
+                    image_rect = QRectF(0, 0, img_width, img_height)
+                    painter.fillRect(image_rect.intersected(view_rect), Qt.GlobalColor.white)
 
-                    # Draw the background image
+                    # Draw only the part of the background image under the magnifier
                     if self.editor.image and not self.editor.image.isNull():
-                        painter.drawImage(0, 0, self.editor.image)
+                        source_rect = image_rect.intersected(view_rect)
+                        if not source_rect.isEmpty():
+                            painter.drawImage(source_rect, self.editor.image, source_rect)
 
                     # Draw bezier curves and small points
                     if hasattr(self.editor, 'manager') and self.editor.manager:
-                        self._draw_magnified_view(painter, self.editor.manager)
+                        self._draw_magnified_view(painter, self.editor.manager, view_rect)
 
                     # Draw ruler if active
                     if hasattr(self.editor, 'ruler_mode_active') and self.editor.ruler_mode_active:
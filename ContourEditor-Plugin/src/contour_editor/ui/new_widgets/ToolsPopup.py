@@ -75,10 +75,20 @@ class ToolsPopup(QDialog):
             "Rectangle Select", self.icons["rectangle_select"], "▭",
             is_active=self.active_states.get("rectangle_select", False)
         )
+        self._transform_icon = self._create_tool_icon(
+            "Transform", None, "⤧",
+            is_active=self.active_states.get("transform", False)
+        )
+        self._snap_icon = self._create_tool_icon(
+            "Snap", None, "🧲",
+            is_active=self.active_states.get("snap", False)
+        )
 
         tools_layout.addWidget(self._ruler_icon, 0, 0)
         tools_layout.addWidget(self._magnifier_icon, 0, 1)
         tools_layout.addWidget(self._rectangle_select_icon, 0, 2)
+        tools_layout.addWidget(self._transform_icon, 0, 3)
+        tools_layout.addWidget(self._snap_icon, 1, 0)
 
         main_layout.addLayout(tools_layout)
 
@@ -122,7 +132,14 @@ class ToolsPopup(QDialog):
             selected_tool = self._magnifier_icon
         elif tool_name == "Rectangle Select":
             self._ruler_icon.set_active(active=False)
+            self._transform_icon.set_active(active=False)
             selected_tool = self._rectangle_select_icon
+        elif tool_name == "Transform":
+            self._ruler_icon.set_active(active=False)
+            self._rectangle_select_icon.set_active(active=False)
+            selected_tool = self._transform_icon
+        elif tool_name == "Snap":
+            selected_tool = self._snap_icon
         else:
             raise ValueError(f"Unknown tool selected: {tool_name}")
 
@@ -0,0 +1,113 @@
+"""
+Dialog for numeric move / rotate / scale / mirror of the transform selection
+"""
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, QPushButton, QCheckBox
+)
+from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtGui import QFont
+import qtawesome as qta
+
+from ...persistence.config import constants
+from .styles import (
+    PRIMARY_DARK, ICON_COLOR, BG_COLOR,
+    DIALOG_BUTTON_STYLE
+)
+from .touch_widgets import TouchSpinBox
+
+
+class TransformDialog(QDialog):
+    """Dialog for entering a transform; rotation, scale and mirror act around the selection center"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Transform")
+        self.setModal(True)
+
+        self.setStyleSheet(f"""
+            QDialog {{
+                background-color: {BG_COLOR};
+            }}
+        """)
+
+        layout = QVBoxLayout(self)
+        layout.setSpacing(20)
+        layout.setContentsMargins(24, 24, 24, 24)
+
+        grid = QGridLayout()
+        grid.setHorizontalSpacing(16)
+        grid.setVerticalSpacing(12)
+
+        self.move_x_input = self._add_stepper(grid, 0, 0, "Move X (mm):", -10000.0, 10000.0, 0.0, " mm", [0.1, 1, 10])
+        self.move_y_input = self._add_stepper(grid, 0, 1, "Move Y (mm):", -10000.0, 10000.0, 0.0, " mm", [0.1, 1, 10])
+        self.scale_x_input = self._add_stepper(grid, 2, 0, "Scale X (%):", 1.0, 1000.0, 100.0, " %", [0.1, 1, 10])
+        self.scale_y_input = self._add_stepper(grid, 2, 1, "Scale Y (%):", 1.0, 1000.0, 100.0, " %", [0.1, 1, 10])
+        self.angle_input = self._add_stepper(grid, 4, 0, "Rotate (degrees):", -360.0, 360.0, 0.0, "°", [0.1, 1, 5, 15])
+        layout.addLayout(grid)
+
+        mirror_layout = QHBoxLayout()
+        self.mirror_horizontal_check = QCheckBox("Mirror left-right", self)
+        self.mirror_vertical_check = QCheckBox("Mirror top-bottom", self)
+        for check in (self.mirror_horizontal_check, self.mirror_vertical_check):
+            check.setFont(QFont("Arial", 11))
+            check.setStyleSheet(f"color: {PRIMARY_DARK};")
+            mirror_layout.addWidget(check)
+        mirror_layout.addStretch()
+        layout.addLayout(mirror_layout)
+
+        # OK / Cancel buttons
+        button_layout = QHBoxLayout()
+        button_layout.setSpacing(12)
+
+        self.ok_button = self._make_button("fa5s.check", "  OK")
+        self.ok_button.clicked.connect(self.accept)
+        self.cancel_button = self._make_button("fa5s.times", "  Cancel")
+        self.cancel_button.clicked.connect(self.reject)
+
+        button_layout.addStretch()
+        button_layout.addWidget(self.ok_button)
+        button_layout.addWidget(self.cancel_button)
+        layout.addLayout(button_layout)
+
+        self.setMinimumWidth(640)
+
+    def _add_stepper(self, grid, row, column, text, min_val, max_val, initial, suffix, step_options):
+        label = QLabel(text, self)
+        label.setFont(QFont("Arial", 11, QFont.Weight.Bold))
+        label.setStyleSheet(f"color: {PRIMARY_DARK};")
+        grid.addWidget(label, row, column)
+        stepper = TouchSpinBox(
+            min_val=min_val,
+            max_val=max_val,
+            initial=initial,
+            step=1.0,
+            decimals=2,
+            suffix=suffix,
+            step_options=step_options,
+            parent=self,
+        )
+        grid.addWidget(stepper, row + 1, column)
+        return stepper
+
+    def _make_button(self, icon_name, text):
+        button = QPushButton(self)
+        button.setIcon(qta.icon(icon_name, color=ICON_COLOR))
+        button.setIconSize(QSize(18, 18))
+        button.setText(text)
+        button.setFont(QFont("Arial", 12))
+        button.setMinimumHeight(52)
+        button.setCursor(Qt.CursorShape.PointingHandCursor)
+        button.setStyleSheet(DIALOG_BUTTON_STYLE)
+        return button
+
+    def get_transform(self):
+        """Entered values as keyword arguments for TransformMode.apply_numeric (moves in image pixels)"""
+        return {
+            "dx": self.move_x_input.value() * constants.PIXELS_PER_MM,
+            "dy": self.move_y_input.value() * constants.PIXELS_PER_MM,
+            "angle": self.angle_input.value(),
+            "sx": self.scale_x_input.value() / 100.0,
+            "sy": self.scale_y_input.value() / 100.0,
+            "mirror_horizontal": self.mirror_horizontal_check.isChecked(),
+            "mirror_vertical": self.mirror_vertical_check.isChecked(),
+        }
@@ -1,15 +1,17 @@
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QListWidget
+from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtWidgets import QWidget, QVBoxLayout
 
 from .segment_actions import SegmentActions
 from .settings_dialog_handler import SettingsDialogHandler
-from .models import ListItemData
+from .point_tree_model import PointTreeModel
+from .point_tree_view import PointTreeView
+from .row_widgets import RowWidgets
 
 
 class PointManagerCoordinator(QWidget):
     """
     Coordinates the point manager widgets and provides a unified interface.
-    This orchestrator manages the single QListWidget and delegates to focused components.
+    This orchestrator owns the PointTreeModel and its PointTreeView and delegates to focused components.
     """
     point_selected_signal = pyqtSignal(dict)
 
@@ -28,88 +30,74 @@ class PointManagerCoordinator(QWidget):
         self.event_bus = EventBus.get_instance()
         self.command_history = CommandHistory.get_instance()
 
-        # Single list widget for all items
-        self.list = QListWidget()
-        self.list.setAlternatingRowColors(True)
-        self.list.itemClicked.connect(self._on_item_clicked)
-        self.layout().addWidget(self.list)
-
-        # Shared state
-        self.expanded_layers = set()
-        self.expanded_segments = set()
+        # Tree model of layers, segments and points; refresh_points() updates it incrementally
+        self.model = PointTreeModel(contour_editor.manager if contour_editor else None, self)
 
         # Create delegates
         segment_service = getattr(contour_editor, 'segment_service', None)
         self._segment_actions = SegmentActions(
-            contour_editor, self.event_bus, self.command_history, self.list, segment_service
+            contour_editor, self.event_bus, self.command_history, self.model, segment_service
         )
         self._settings_handler = SettingsDialogHandler(
             contour_editor, self.parent_widget, self.refresh_points
         )
-
-        # Import list builder for now (can be refactored further)
-        from .list_builder import ListBuilder
-        self._list_builder = ListBuilder(
-            self.list, contour_editor, self._segment_actions, self._settings_handler,
-            self.expanded_layers, self.expanded_segments,
+        self._row_widgets = RowWidgets(
+            contour_editor, self._segment_actions, self._settings_handler,
             self._on_layer_expand_toggle, self._on_segment_expand_toggle
         )
 
+        self.view = PointTreeView(self._row_widgets)
+        self.view.setModel(self.model)
+        self.view.clicked.connect(self._on_index_clicked)
+        # Layers start expanded
+        self.model.rowsInserted.connect(self._on_rows_inserted)
+        self.layout().addWidget(self.view)
+
         # Connect EventBus events
-        self.event_bus.segment_visibility_changed.connect(lambda *_: self.refresh_points())
-        self.event_bus.segment_deleted.connect(lambda *_: self.refresh_points())
-        self.event_bus.segment_added.connect(lambda *_: self.refresh_points())
-        self.event_bus.segment_layer_changed.connect(lambda *_: self.refresh_points())
+        self.event_bus.scene_changed.connect(self._on_scene_changed)
 
         if self.contour_editor:
             self.contour_editor.pointsUpdated.connect(self.refresh_points)
 
-        self._list_builder.initialize_list_structure()
+        self.refresh_points()
 
     def refresh_points(self):
-        """Refresh the points display in the list"""
+        """Apply scene changes to the tree as row insertions, removals and updates"""
         if not self.contour_editor:
             return
+        self.model.sync()
 
-        # Save current state
-        selected_item_data = None
-        current_item = self.list.currentItem()
-        if current_item:
-            selected_item_data = current_item.data(Qt.ItemDataRole.UserRole)
-
-        active_segment_index = getattr(self.contour_editor.manager, "active_segment_index", None)
-
-        self._list_builder.rebuild_list()
-
-        self._restore_selection(selected_item_data)
-
-        if active_segment_index is not None:
-            self._segment_actions.set_active_segment_ui(active_segment_index)
+    def _on_scene_changed(self, changes):
+        """Point edits update their rows directly; anything else re-syncs the tree"""
+        if not self.contour_editor:
+            return
+        if changes.kinds <= {"geometry", "settings"}:
+            self.model.update_points(changes)
+        else:
+            self.refresh_points()
 
     def update_all_segments_settings(self, settings):
         """Apply settings to all segments (called by GlobalSettingsDialog)"""
         self._settings_handler.update_all_segments_settings(settings)
 
+    def _on_rows_inserted(self, parent, first, last):
+        if parent.isValid():
+            return
+        for row in range(first, last + 1):
+            self.view.setExpanded(self.model.index(row, 0), True)
+
     def _on_layer_expand_toggle(self, layer_name, is_expanded):
-        if is_expanded:
-            self.expanded_layers.add(layer_name)
-        else:
-            self.expanded_layers.discard(layer_name)
-        self.refresh_points()
+        self.view.setExpanded(self.model.layer_index(layer_name), is_expanded)
 
     def _on_segment_expand_toggle(self, seg_index, is_expanded):
-        if is_expanded:
-            self.expanded_segments.add(seg_index)
-        else:
-            self.expanded_segments.discard(seg_index)
-        self.refresh_points()
+        self.view.setExpanded(self.model.segment_index(seg_index), is_expanded)
 
-    def _on_item_clicked(self, item):
+    def _on_index_clicked(self, index):
         """Handle point selection and highlighting"""
-        if not item or not self.contour_editor:
+        if not index.isValid() or not self.contour_editor:
             return
 
-        item_data = item.data(Qt.ItemDataRole.UserRole)
+        item_data = index.data(PointTreeModel.ItemDataRole)
         if not item_data:
             return
 
@@ -132,41 +120,11 @@ class PointManagerCoordinator(QWidget):
                 'point_index': point_index
             })
 
-    def _restore_selection(self, selected_item_data):
-        """Restore the selected item based on saved data"""
-        if not selected_item_data:
-            return
-
-        for i in range(self.list.count()):
-            item = self.list.item(i)
-            item_data = item.data(Qt.ItemDataRole.UserRole)
-
-            if self._items_match(item_data, selected_item_data):
-                self.list.setCurrentItem(item)
-                break
-
-    @staticmethod
-    def _items_match(item_data1, item_data2):
-        """Check if two item data objects represent the same item"""
-        if not item_data1 or not item_data2:
-            return False
-        if item_data1.item_type != item_data2.item_type:
-            return False
-        if item_data1.item_type == 'layer':
-            return item_data1.layer_name == item_data2.layer_name
-        elif item_data1.item_type == 'segment':
-            return item_data1.seg_index == item_data2.seg_index
-        elif item_data1.item_type == 'point':
-            return (item_data1.seg_index == item_data2.seg_index and
-                    item_data1.point_index == item_data2.point_index and
-                    item_data1.point_type == item_data2.point_type)
-        return False
-
     def get_current_selected_layer(self):
         """Get the currently selected layer name"""
-        current_item = self.list.currentItem()
-        if current_item:
-            item_data = current_item.data(Qt.ItemDataRole.UserRole)
+        current = self.view.currentIndex()
+        if current.isValid():
+            item_data = current.data(PointTreeModel.ItemDataRole)
             if item_data and item_data.item_type == 'layer':
                 return item_data.layer_name
         if hasattr(self.contour_editor.manager, "layer_config"):
@@ -55,24 +55,22 @@ class PointManagerWidget(QWidget):
                 selection-background-color: rgba(122,90,248,0.15);
                 selection-color: {PRIMARY_DARK};
             }}
-            QListWidget {{
+            QTreeView {{
                 outline: none;
                 border: 1px solid {BORDER};
                 background-color: white;
                 border-radius: 8px;
             }}
-            QListWidget::item {{
+            QTreeView::item {{
                 border: none;
-                padding: 8px;
-                margin: 2px;
                 border-radius: 6px;
             }}
-            QListWidget::item:selected {{
+            QTreeView::item:selected {{
                 background-color: rgba(122,90,248,0.15);
                 border: 1px solid {PRIMARY};
                 color: {PRIMARY_DARK};
             }}
-            QListWidget::item:hover {{
+            QTreeView::item:hover {{
                 background-color: rgba(122,90,248,0.05);
             }}
         """)
@@ -0,0 +1,430 @@
+import itertools
+from difflib import SequenceMatcher
+
+from PyQt6.QtCore import QAbstractItemModel, QModelIndex, QPointF, Qt
+
+from .models import ListItemData
+
+_ROOT = 0
+# Point rows a segment exposes at a time; the view fetches more as it scrolls (PointTreeView)
+POINT_PAGE_SIZE = 256
+_ITEM_FLAGS = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+
+class PointTreeModel(QAbstractItemModel):
+    """
+    Layers -> segments -> points tree of the point manager.
+
+    Rows are never materialised: point rows read the live segment when the
+    view asks for them, and a segment exposes its points a page at a time
+    (load_more), so a long segment costs only the rows scrolled to. sync()
+    compares the scene with the tree it last reported and emits row
+    insert/remove and dataChanged notifications for the difference instead
+    of resetting the model.
+
+    Every layer and segment row is a node with a stable id, and an index's
+    internalId is the id of its parent node (0 for layers). Segment nodes
+    follow their Segment object, so rows keep their expansion and selection
+    when segments are added, deleted or moved to another layer.
+    """
+
+    ItemDataRole = Qt.ItemDataRole.UserRole  # ListItemData of the row
+    LabelRole = Qt.ItemDataRole.UserRole + 1  # "P3" / "C3" on point rows, None elsewhere
+    CoordinatesRole = Qt.ItemDataRole.UserRole + 2  # "(x, y)" on point rows
+    ActiveRole = Qt.ItemDataRole.UserRole + 3  # True on the active segment's row
+    # What moving a point changes; its row keeps its size
+    _POINT_ROLES = (Qt.ItemDataRole.DisplayRole, CoordinatesRole)
+
+    def __init__(self, manager=None, parent=None):
+        super().__init__(parent)
+        self.manager = manager
+        self.active_segment_index = None
+        self._ids = itertools.count(1)
+        self._layers = []  # Layer names, in row order
+        self._layer_ids = {}  # Layer name -> node id
+        self._layer_names = {}  # Layer node id -> name
+        self._children = {}  # Layer node id -> segment node ids, in row order
+        self._segments = {}  # Segment node id -> Segment
+        self._segment_ids = {}  # id(Segment) -> node id
+        self._segment_rows = {}  # Segment node id -> (layer node id, row)
+        self._seg_indexes = {}  # Segment node id -> index in the manager's segment list
+        self._seg_nodes = {}  # Index in the manager's segment list -> segment node id
+        self._counts = {}  # Segment node id -> (anchor count, control count)
+        self._loaded = {}  # Segment node id -> point rows exposed so far (see load_more)
+        self._row_states = {}  # Segment node id -> _row_state() last reported
+        self._versions = {}  # Segment node id -> geometry_version last reported
+
+    # --- QAbstractItemModel ---
+
+    # The view calls these for every row it lays out, so they stay cheap and avoid hasIndex()
+
+    def index(self, row, column=0, parent=QModelIndex()):
+        if column != 0 or row < 0:
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, 0, _ROOT) if row < len(self._layers) else QModelIndex()
+        parent_node = parent.internalId()
+        if parent_node == _ROOT:
+            node = self._layer_ids[self._layers[parent.row()]]
+            count = len(self._children[node])
+        elif parent_node in self._children:
+            node = self._children[parent_node][parent.row()]
+            count = self._loaded[node]
+        else:
+            return QModelIndex()
+        return self.createIndex(row, 0, node) if row < count else QModelIndex()
+
+    def parent(self, index=QModelIndex()):
+        if not index.isValid():
+            return QModelIndex()
+        node = index.internalId()
+        if node == _ROOT:
+            return QModelIndex()
+        if node in self._layer_names:
+            return self.createIndex(self._layers.index(self._layer_names[node]), 0, _ROOT)
+        layer_node, row = self._segment_rows[node]
+        return self.createIndex(row, 0, layer_node)
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self._layers)
+        parent_node = parent.internalId()
+        if parent_node == _ROOT:
+            return len(self._children[self._layer_ids[self._layers[parent.row()]]])
+        if parent_node in self._children and parent.column() == 0:
+            return self._loaded[self._children[parent_node][parent.row()]]
+        return 0
+
+    def hasChildren(self, parent=QModelIndex()):
+        if parent.isValid() and parent.internalId() not in self._children and parent.internalId() != _ROOT:
+            return False
+        return self.rowCount(parent) > 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def flags(self, index):
+        return _ITEM_FLAGS if index.isValid() else Qt.ItemFlag.NoItemFlags
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        kind = self.item_kind(index)
+        if kind == "point":
+            node = index.internalId()
+            segment = self._segments[node]
+            anchors = self._counts[node][0]
+            if index.row() < anchors:
+                point_type, point_index, prefix = "anchor", index.row(), "P"
+                points = segment.points
+            else:
+                point_type, point_index, prefix = "control", index.row() - anchors, "C"
+                points = segment.controls
+            if role == self.LabelRole:
+                return f"{prefix}{point_index}"
+            if role in (self.CoordinatesRole, Qt.ItemDataRole.DisplayRole):
+                point = points[point_index] if point_index < len(points) else None
+                coordinates = f"({point.x():.1f}, {point.y():.1f})" if isinstance(point, QPointF) else "Invalid"
+                return coordinates if role == self.CoordinatesRole else f"{prefix}{point_index} {coordinates}"
+            if role == self.ItemDataRole:
+                return ListItemData('point', seg_index=self._seg_indexes[node],
+                                    point_index=point_index, point_type=point_type)
+            return None
+        if kind == "segment":
+            node = self._children[index.internalId()][index.row()]
+            seg_index = self._seg_indexes[node]
+            if role == Qt.ItemDataRole.DisplayRole:
+                return f"S{seg_index}"
+            if role == self.ActiveRole:
+                return seg_index == self.active_segment_index
+            if role == self.ItemDataRole:
+                return ListItemData('segment', layer_name=self._layer_names[index.internalId()], seg_index=seg_index)
+            return None
+        name = self._layers[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return name
+        if role == self.ItemDataRole:
+            return ListItemData('layer', layer_name=name)
+        return None
+
+    # --- Lookups ---
+
+    def item_kind(self, index):
+        """'layer', 'segment' or 'point' for a valid index."""
+        node = index.internalId()
+        if node == _ROOT:
+            return "layer"
+        return "segment" if node in self._children else "point"
+
+    def segment_at(self, index):
+        """Segment object of a segment row."""
+        return self._segments[self._children[index.internalId()][index.row()]]
+
+    def layer_index(self, layer_name):
+        if layer_name not in self._layer_ids:
+            return QModelIndex()
+        return self.createIndex(self._layers.index(layer_name), 0, _ROOT)
+
+    def segment_index(self, seg_index):
+        """Index of the row of the segment at seg_index in the manager's list."""
+        node = self._seg_nodes.get(seg_index)
+        return QModelIndex() if node is None else self._segment_parent(node)
+
+    def set_active_segment(self, seg_index):
+        """Mark seg_index as active, repainting only the old and new active rows."""
+        previous, self.active_segment_index = self.active_segment_index, seg_index
+        for index in (self.segment_index(previous), self.segment_index(seg_index)):
+            if index.isValid():
+                node = self._children[index.internalId()][index.row()]
+                self._row_states[node] = self._row_state(node)
+                self.dataChanged.emit(index, index, [self.ActiveRole])
+
+    # --- Incremental updates ---
+
+    def sync(self):
+        """Bring the tree in line with the manager, notifying views of each change."""
+        if self.manager is None:
+            return
+        self.active_segment_index = getattr(self.manager, "active_segment_index", None)
+        names = list(self.manager.get_available_layer_names())
+        segments = list(self.manager.get_segments())
+        by_layer = {name: [] for name in names}
+        for seg_index, segment in enumerate(segments):
+            layer = getattr(segment, "layer", None)
+            if layer is not None and layer.name in by_layer:
+                by_layer[layer.name].append(seg_index)
+
+        self._sync_layers(names)
+        self._sync_segments(names, by_layer, segments)
+        self._sync_points()
+
+    def _sync_layers(self, names):
+        if names == self._layers:
+            return
+        opcodes = SequenceMatcher(None, self._layers, names, autojunk=False).get_opcodes()
+        for tag, i1, i2, j1, j2 in reversed(opcodes):
+            if tag in ("delete", "replace"):
+                self.beginRemoveRows(QModelIndex(), i1, i2 - 1)
+                for name in self._layers[i1:i2]:
+                    node = self._layer_ids.pop(name)
+                    del self._layer_names[node]
+                    self._children.pop(node)
+                del self._layers[i1:i2]
+                self.endRemoveRows()
+        for tag, i1, i2, j1, j2 in opcodes:
+            if tag in ("insert", "replace"):
+                self.beginInsertRows(QModelIndex(), j1, j2 - 1)
+                for name in names[j1:j2]:
+                    node = next(self._ids)
+                    self._layer_ids[name] = node
+                    self._layer_names[node] = name
+                    self._children[node] = []
+                self._layers[j1:j1] = names[j1:j2]
+                self.endInsertRows()
+
+    def _sync_segments(self, names, by_layer, segments):
+        # Unknown segments get placeholders until the diff says whether they take over a row
+        wanted = {}
+        for name in names:
+            wanted[name] = [self._segment_ids.get(id(segments[seg_index]), ("new", seg_index))
+                            for seg_index in by_layer[name]]
+        opcodes = {name: SequenceMatcher(None, self._children[self._layer_ids[name]], wanted[name],
+                                         autojunk=False).get_opcodes()
+                   for name in names if self._children[self._layer_ids[name]] != wanted[name]}
+
+        # Same-length replacements (e.g. the deep copies an undo restores) keep their rows
+        alive = {id(segment) for segment in segments}
+        for name, layer_opcodes in opcodes.items():
+            old = self._children[self._layer_ids[name]]
+            for tag, i1, i2, j1, j2 in layer_opcodes:
+                if tag == "replace" and i2 - i1 == j2 - j1:
+                    for node, j in zip(old[i1:i2], range(j1, j2)):
+                        if not isinstance(wanted[name][j], tuple) or id(self._segments[node]) in alive:
+                            continue
+                        self._rebind(node, segments[by_layer[name][j]])
+                        wanted[name][j] = node
+
+        # All removals before any insertion, so a segment that changed layer is never in two places
+        for name in list(opcodes):
+            layer_node = self._layer_ids[name]
+            opcodes[name] = SequenceMatcher(None, self._children[layer_node], wanted[name],
+                                            autojunk=False).get_opcodes()
+            parent = self.layer_index(name)
+            children = self._children[layer_node]
+            for tag, i1, i2, j1, j2 in reversed(opcodes[name]):
+                if tag in ("delete", "replace"):
+                    self.beginRemoveRows(parent, i1, i2 - 1)
+                    del children[i1:i2]
+                    self._renumber(layer_node)
+                    self.endRemoveRows()
+        for name, layer_opcodes in opcodes.items():
+            layer_node = self._layer_ids[name]
+            parent = self.layer_index(name)
+            children = self._children[layer_node]
+            for tag, i1, i2, j1, j2 in layer_opcodes:
+                if tag in ("insert", "replace"):
+                    nodes = [self._node_for(segments[seg_index]) for seg_index in by_layer[name][j1:j2]]
+                    self.beginInsertRows(parent, j1, j2 - 1)
+                    children[j1:j1] = nodes
+                    self._renumber(layer_node)
+                    self.endInsertRows()
+
+        self._seg_indexes = {}
+        for name in names:
+            for node, seg_index in zip(self._children[self._layer_ids[name]], by_layer[name]):
+                self._seg_indexes[node] = seg_index
+        self._seg_nodes = {seg_index: node for node, seg_index in self._seg_indexes.items()}
+        for node in [node for node in self._segments if node not in self._seg_indexes]:
+            self._forget(node)
+        for name in names:
+            layer_node = self._layer_ids[name]
+            changed = []
+            for row, node in enumerate(self._children[layer_node]):
+                state = self._row_state(node)
+                if state != self._row_states.get(node):
+                    if node in self._row_states:
+                        changed.append(row)
+                    self._row_states[node] = state
+            self._emit_rows_changed(self.layer_index(name), changed)
+
+    def _sync_points(self):
+        for node in self._segments:
+            self._sync_segment_points(node)
+
+    def _sync_segment_points(self, node):
+        segment = self._segments[node]
+        anchors, controls = self._counts[node]
+        new_anchors, new_controls = len(segment.points), len(segment.controls)
+        version = getattr(segment, "geometry_version", None)
+        if (new_anchors, new_controls) == (anchors, controls) and version == self._versions[node]:
+            return
+        parent = self._segment_parent(node)
+        # Anchors come first, then controls; each block grows or shrinks at its own end
+        self._resize_block(node, parent, 0, anchors, new_anchors, (new_anchors, controls))
+        self._resize_block(node, parent, new_anchors, controls, new_controls, (new_anchors, new_controls))
+        self._versions[node] = version
+        self._emit_rows_changed(parent, range(self._loaded[node]), self._POINT_ROLES)
+
+    def update_points(self, changes):
+        """
+        Apply the geometry changes of a ChangeSet (EventBus.scene_changed)
+        without re-reading the scene: changes that name their point indices
+        update just those rows.
+        """
+        for change in changes:
+            node = self._seg_nodes.get(change.seg_index) if change.kind == "geometry" else None
+            if node is None:
+                continue
+            segment = self._segments[node]
+            anchors, controls = self._counts[node]
+            if (change.anchors is None or change.controls is None
+                    or (len(segment.points), len(segment.controls)) != (anchors, controls)):
+                self._sync_segment_points(node)
+                continue
+            loaded = self._loaded[node]
+            rows = set()
+            for indices, offset in ((change.anchors, 0), (change.controls, anchors)):
+                for span in indices:
+                    rows.update(range(span.start + offset, min(span.stop + offset, loaded)))
+            self._emit_rows_changed(self._segment_parent(node), sorted(rows), self._POINT_ROLES)
+            self._versions[node] = getattr(segment, "geometry_version", None)
+
+    def _resize_block(self, node, parent, start, old_size, new_size, counts):
+        """
+        Grow or shrink the point block starting at start to new_size rows,
+        notifying only the part that lies in the loaded rows.
+        """
+        loaded = self._loaded[node]
+        fully_loaded = loaded == sum(self._counts[node])
+        edge = start + min(old_size, new_size)
+        if new_size > old_size and (edge < loaded or fully_loaded):
+            self.beginInsertRows(parent, edge, edge + new_size - old_size - 1)
+            self._counts[node] = counts
+            self._loaded[node] = loaded + new_size - old_size
+            self.endInsertRows()
+        elif new_size < old_size and edge < loaded:
+            removed = min(start + old_size, loaded) - edge
+            self.beginRemoveRows(parent, edge, edge + removed - 1)
+            self._counts[node] = counts
+            self._loaded[node] = loaded - removed
+            self.endRemoveRows()
+        else:
+            self._counts[node] = counts
+
+    # Not canFetchMore()/fetchMore(): QTreeView calls those on every layout of an
+    # expanded row, which would load a page per layout until everything is loaded
+
+    def can_load_more(self, parent):
+        """Whether the segment row parent has point rows that are not exposed yet."""
+        if not parent.isValid() or parent.internalId() not in self._children:
+            return False
+        node = self._children[parent.internalId()][parent.row()]
+        return self._loaded[node] < sum(self._counts[node])
+
+    def load_more(self, parent):
+        """Expose the next POINT_PAGE_SIZE point rows of the segment row parent."""
+        if not self.can_load_more(parent):
+            return
+        node = self._children[parent.internalId()][parent.row()]
+        loaded = self._loaded[node]
+        count = min(POINT_PAGE_SIZE, sum(self._counts[node]) - loaded)
+        self.beginInsertRows(parent, loaded, loaded + count - 1)
+        self._loaded[node] = loaded + count
+        self.endInsertRows()
+
+    def _row_state(self, node):
+        """What a segment row shows besides its widgets' own state."""
+        seg_index = self._seg_indexes[node]
+        return seg_index, getattr(self._segments[node], "visible", True), seg_index == self.active_segment_index
+
+    def _emit_rows_changed(self, parent, rows, roles=()):
+        """One dataChanged per run of consecutive rows; the view re-measures every row it is told about."""
+        run_start = previous = None
+        for row in rows:
+            if previous is not None and row == previous + 1:
+                previous = row
+                continue
+            if run_start is not None:
+                self.dataChanged.emit(self.index(run_start, 0, parent), self.index(previous, 0, parent), list(roles))
+            run_start = previous = row
+        if run_start is not None:
+            self.dataChanged.emit(self.index(run_start, 0, parent), self.index(previous, 0, parent), list(roles))
+
+    # --- Node bookkeeping ---
+
+    def _segment_parent(self, node):
+        """Index of a segment node's row, the parent of its point rows."""
+        layer_node, row = self._segment_rows[node]
+        return self.createIndex(row, 0, layer_node)
+
+    def _node_for(self, segment):
+        node = self._segment_ids.get(id(segment))
+        if node is None:
+            node = next(self._ids)
+            self._segment_ids[id(segment)] = node
+            self._segments[node] = segment
+            # A new row arrives with its first page of point rows, not followed by an insert per block
+            self._counts[node] = (len(segment.points), len(segment.controls))
+            self._loaded[node] = min(sum(self._counts[node]), POINT_PAGE_SIZE)
+            self._versions[node] = getattr(segment, "geometry_version", None)
+        return node
+
+    def _rebind(self, node, segment):
+        """Let an existing row show a different Segment object."""
+        del self._segment_ids[id(self._segments[node])]
+        self._segment_ids[id(segment)] = node
+        self._segments[node] = segment
+        self._versions[node] = None
+
+    def _forget(self, node):
+        segment = self._segments.pop(node)
+        del self._segment_ids[id(segment)]
+        del self._counts[node]
+        del self._loaded[node]
+        del self._versions[node]
+        self._row_states.pop(node, None)
+        self._segment_rows.pop(node, None)
+
+    def _renumber(self, layer_node):
+        for row, node in enumerate(self._children[layer_node]):
+            self._segment_rows[node] = (layer_node, row)
@@ -0,0 +1,158 @@
+from PyQt6.QtCore import QPersistentModelIndex, QPoint, QRect, QSize, Qt, QTimer
+from PyQt6.QtGui import QColor, QFont
+from PyQt6.QtWidgets import (
+    QAbstractItemView, QApplication, QStyle, QStyledItemDelegate, QStyleOptionViewItem, QTreeView
+)
+
+from .point_tree_model import PointTreeModel
+from ..styles import PRIMARY, PRIMARY_DARK
+
+# Rows before the end of a segment's loaded points at which the next page is loaded
+FETCH_MARGIN_ROWS = 32
+
+
+class PointItemDelegate(QStyledItemDelegate):
+    """
+    Paints point rows directly: the label ("P3" / "C3") and coordinates that
+    used to be a PointWidget per point. Layer and segment rows only get their
+    background; their row widget covers the rest.
+    """
+
+    ROW_HEIGHTS = {"layer": 72, "segment": 68, "point": 44}
+    LABEL_WIDTH = 45
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._label_font = QFont("Arial", 11, QFont.Weight.Bold)
+        self._coordinates_font = QFont("Arial", 11)
+        self._anchor_color = QColor(PRIMARY)
+        self._control_color = QColor(PRIMARY_DARK)
+
+    def sizeHint(self, option, index):
+        return QSize(0, self.ROW_HEIGHTS[index.model().item_kind(index)])
+
+    def paint(self, painter, option, index):
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, opt, painter, widget)
+
+        label = index.data(PointTreeModel.LabelRole)
+        if label is None:
+            return
+        rect = option.rect.adjusted(8, 0, -8, 0)
+        align = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+        painter.save()
+        painter.setFont(self._label_font)
+        painter.setPen(self._anchor_color if label.startswith("P") else self._control_color)
+        painter.drawText(QRect(rect.left(), rect.top(), self.LABEL_WIDTH, rect.height()), align, label)
+        painter.setFont(self._coordinates_font)
+        painter.setPen(self._control_color)
+        painter.drawText(rect.adjusted(self.LABEL_WIDTH + 12, 0, 0, 0), align,
+                         index.data(PointTreeModel.CoordinatesRole))
+        painter.restore()
+
+
+class PointTreeView(QTreeView):
+    """
+    Tree view of a PointTreeModel.
+
+    Point rows are painted by PointItemDelegate. Layer and segment rows carry
+    interactive widgets, but only while they are on screen: after a scroll,
+    resize or model change sync_row_widgets() creates widgets for rows that
+    came into view, replaces those whose signature changed and drops the
+    rest. Layer rows are few and always keep theirs.
+    """
+
+    def __init__(self, row_widgets, parent=None):
+        super().__init__(parent)
+        self.row_widgets = row_widgets
+        self._shown = {}  # (kind, key) -> (QPersistentModelIndex, signature)
+
+        self.setHeaderHidden(True)
+        self.setRootIsDecorated(False)
+        self.setItemsExpandable(False)
+        self.setExpandsOnDoubleClick(False)
+        self.setIndentation(20)
+        self.setUniformRowHeights(False)
+        self.setAlternatingRowColors(True)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.setItemDelegate(PointItemDelegate(self))
+
+        # Batches the many notifications of one sync into a single pass
+        self._widget_timer = QTimer(self)
+        self._widget_timer.setSingleShot(True)
+        self._widget_timer.setInterval(0)
+        self._widget_timer.timeout.connect(self.sync_row_widgets)
+        self.verticalScrollBar().valueChanged.connect(self.schedule_row_widgets)
+        self.expanded.connect(lambda index: self._on_expansion_changed(index, True))
+        self.collapsed.connect(lambda index: self._on_expansion_changed(index, False))
+
+    def setModel(self, model):
+        super().setModel(model)
+        for signal in (model.rowsInserted, model.rowsRemoved, model.dataChanged,
+                       model.layoutChanged, model.modelReset):
+            signal.connect(self.schedule_row_widgets)
+        self.schedule_row_widgets()
+
+    def drawBranches(self, painter, rect, index):
+        # Rows expand through the chevron of their row widget
+        pass
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.schedule_row_widgets()
+
+    def schedule_row_widgets(self, *args):
+        self._widget_timer.start()
+
+    def visible_indexes(self):
+        """Indexes of the rows intersecting the viewport, top to bottom."""
+        bottom = self.viewport().height()
+        index = self.indexAt(QPoint(0, 0))
+        while index.isValid() and self.visualRect(index).top() < bottom:
+            yield index
+            index = self.indexBelow(index)
+
+    def sync_row_widgets(self):
+        model = self.model()
+        if model is None:
+            return
+        wanted = {}
+        for row in range(model.rowCount()):
+            index = model.index(row, 0)
+            wanted[("layer", index.data())] = index
+        fetch = []
+        for index in self.visible_indexes():
+            kind = model.item_kind(index)
+            if kind == "segment":
+                wanted[("segment", id(model.segment_at(index)))] = index
+            elif kind == "point" and model.rowCount(index.parent()) - index.row() <= FETCH_MARGIN_ROWS:
+                fetch.append(index.parent())
+        # Point rows come a page at a time; load the next page before the loaded ones run out
+        for parent in fetch:
+            if model.can_load_more(parent):
+                model.load_more(parent)
+
+        for key, (persistent, signature) in list(self._shown.items()):
+            # Rows the model removed took their widget with them
+            if not persistent.isValid():
+                del self._shown[key]
+            elif key not in wanted or QPersistentModelIndex(wanted[key]) != persistent:
+                self.setIndexWidget(model.index(persistent.row(), 0, persistent.parent()), None)
+                del self._shown[key]
+
+        for key, index in wanted.items():
+            signature = self.row_widgets.signature(index)
+            if key in self._shown and self._shown[key][1] == signature:
+                continue
+            self.setIndexWidget(index, self.row_widgets.create(index, self.isExpanded(index)))
+            self._shown[key] = (QPersistentModelIndex(index), signature)
+
+    def _on_expansion_changed(self, index, expanded):
+        widget = self.indexWidget(index)
+        if widget is not None and hasattr(widget, "set_expanded"):
+            widget.set_expanded(expanded)
+        self.schedule_row_widgets()
@@ -0,0 +1,147 @@
+from contour_editor.ui.new_widgets.LayerButtonsWidget import LayerButtonsWidget
+from contour_editor.ui.new_widgets.SegmentButtonsAndComboWidget import SegmentButtonsAndComboWidget
+
+from .list_item_widgets import (
+    ExpandableLayerWidget,
+    ExpandableSegmentWidget,
+)
+
+ACTIVE_INDEX_STYLE = """
+    QPushButton {
+        background-color: #7E6DAD;
+        color: white;
+        border-radius: 15px;
+        font-weight: bold;
+        text-align: center;
+        padding: 0px;
+        min-width: 50px;
+        min-height: 50px;
+        max-width: 50px;
+        max-height: 50px;
+    }
+"""
+
+INACTIVE_INDEX_STYLE = """
+    QPushButton {
+        background-color: #f0f0f0;
+        color: #666;
+        border-radius: 15px;
+        font-weight: normal;
+        text-align: center;
+        padding: 0px;
+        border: 1px solid #ddd;
+        min-width: 50px;
+        min-height: 50px;
+        max-width: 50px;
+        max-height: 50px;
+    }
+"""
+
+
+class RowWidgets:
+    """
+    Creates the interactive widgets shown on layer and segment rows of the
+    point tree. The view asks for them only for rows on screen (see
+    PointTreeView.sync_row_widgets) and compares signature() to decide
+    whether a widget it already shows is still current.
+    """
+
+    def __init__(self, contour_editor, segment_actions, settings_handler,
+                 on_layer_expand_toggle, on_segment_expand_toggle):
+        self.contour_editor = contour_editor
+        self.segment_actions = segment_actions
+        self.settings_handler = settings_handler
+        self._on_layer_expand_toggle = on_layer_expand_toggle
+        self._on_segment_expand_toggle = on_segment_expand_toggle
+
+    def signature(self, index):
+        """Everything a row widget shows; a different signature means the widget is stale."""
+        model = index.model()
+        item_data = index.data(model.ItemDataRole)
+        manager = self.contour_editor.manager
+        if item_data.item_type == 'layer':
+            return 'layer', item_data.layer_name, manager.isLayerLocked(item_data.layer_name)
+        segment = model.segment_at(index)
+        return ('segment', item_data.seg_index, id(segment), item_data.layer_name, segment.visible,
+                bool(index.data(model.ActiveRole)), tuple(manager.get_available_layer_names()))
+
+    def create(self, index, expanded):
+        model = index.model()
+        item_data = index.data(model.ItemDataRole)
+        if item_data.item_type == 'layer':
+            return self._create_layer_widget(item_data.layer_name, expanded)
+        return self._create_segment_widget(item_data.seg_index, model.segment_at(index), item_data.layer_name,
+                                           expanded, bool(index.data(model.ActiveRole)))
+
+    def _create_layer_widget(self, name, expanded):
+        is_locked = self.contour_editor.manager.isLayerLocked(name) if self.contour_editor else False
+        layer_buttons = LayerButtonsWidget(
+            layer_name=name,
+            layer_item=None,
+            on_visibility_toggle=lambda visible, n=name: self.segment_actions.set_layer_visibility(n, visible),
+            on_add_segment=self.segment_actions.make_add_segment(
+                name, lambda n=name: self._on_layer_expand_toggle(n, True)
+            ),
+            on_lock_toggle=self.segment_actions.make_layer_lock_toggle(name),
+            is_locked=is_locked
+        )
+
+        expandable_widget = ExpandableLayerWidget(
+            name,
+            layer_buttons,
+            self._on_layer_expand_toggle
+        )
+        expandable_widget.set_expanded(expanded)
+        return expandable_widget
+
+    def _create_segment_widget(self, seg_index, segment, layer_name, expanded, active):
+        seg_container = self._create_segment_container(seg_index, segment, layer_name)
+        seg_container.index_label.setStyleSheet(ACTIVE_INDEX_STYLE if active else INACTIVE_INDEX_STYLE)
+
+        expandable_widget = ExpandableSegmentWidget(
+            seg_index,
+            seg_container,
+            self._on_segment_expand_toggle
+        )
+        expandable_widget.set_expanded(expanded)
+        return expandable_widget
+
+    def _create_segment_container(self, seg_index, segment, layer_name):
+        def on_visibility(btn):
+            if self.segment_actions.segment_service:
+                self.segment_actions.segment_service.toggle_visibility(seg_index)
+            else:
+                from contour_editor.services.commands import ToggleSegmentVisibilityCommand
+                cmd = ToggleSegmentVisibilityCommand(
+                    self.contour_editor.manager,
+                    seg_index
+                )
+                self.segment_actions.command_history.execute(cmd)
+
+        def on_activate():
+            self.segment_actions.set_active_segment_ui(seg_index)
+
+        def on_delete():
+            self.segment_actions.delete_segment(seg_index)
+
+        def on_settings():
+            self.settings_handler.on_settings_button_clicked(seg_index)
+
+        def on_layer_change(new_layer_name):
+            self.segment_actions.assign_segment_layer(seg_index, new_layer_name)
+
+        def on_long_press(seg_index):
+            print(f"Long press detected on segment {seg_index}!")
+
+        return SegmentButtonsAndComboWidget(
+            seg_index=seg_index,
+            segment=segment,
+            layer_name=layer_name,
+            on_visibility=on_visibility,
+            on_activate=on_activate,
+            on_delete=on_delete,
+            on_settings=on_settings,
+            on_layer_change=on_layer_change,
+            on_long_press=on_long_press,
+            layer_options=self.contour_editor.manager.get_available_layer_names(),
+        )
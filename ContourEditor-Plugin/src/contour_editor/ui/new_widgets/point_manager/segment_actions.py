@@ -1,15 +1,11 @@
-from PyQt6.QtGui import QIcon
-from ....persistence.providers.icon_provider import IconProvider
-
-
 class SegmentActions:
     """Command-based actions for segments: delete, add, visibility, layer, active state."""
 
-    def __init__(self, contour_editor, event_bus, command_history, list_widget, segment_service=None):
+    def __init__(self, contour_editor, event_bus, command_history, model, segment_service=None):
         self.contour_editor = contour_editor
         self.event_bus = event_bus
         self.command_history = command_history
-        self.list_widget = list_widget
+        self.model = model  # PointTreeModel
         self.segment_service = segment_service
 
     def delete_segment(self, seg_index):
@@ -47,8 +43,8 @@ class SegmentActions:
         elif self.contour_editor:
             self.contour_editor.set_layer_visibility(layer_name, visible)
 
-    def make_add_segment(self, layer_name, expanded_layers):
-        """Create an add segment callback for a layer"""
+    def make_add_segment(self, layer_name, expand_layer):
+        """Create an add segment callback for a layer; expand_layer() reveals the new segment"""
 
         def add_segment():
             if self.segment_service:
@@ -62,7 +58,7 @@ class SegmentActions:
                 )
                 self.command_history.execute(cmd)
 
-            expanded_layers.add(layer_name)
+            expand_layer()
 
         return add_segment
 
@@ -87,65 +83,7 @@ class SegmentActions:
             self.contour_editor.manager.set_active_segment(seg_index)
             self.event_bus.active_segment_changed.emit(seg_index)
 
-        # Update all segment active buttons
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            item_data = item.data(256)  # Qt.ItemDataRole.UserRole
-
-            if item_data and item_data.item_type == 'segment':
-                is_active = item_data.seg_index == seg_index
-
-                # Get the item widget (IndentedWidget)
-                indented_widget = self.list_widget.itemWidget(item)
-                if indented_widget:
-                    # Navigate: IndentedWidget -> ExpandableSegmentWidget -> SegmentButtonsAndComboWidget
-                    expandable_segment = indented_widget.layout().itemAt(0).widget()
-                    if expandable_segment and hasattr(expandable_segment, 'layout'):
-                        # Get the SegmentButtonsAndComboWidget (second item in layout, after expand button)
-                        segment_buttons_widget = expandable_segment.layout().itemAt(1).widget()
-                        if segment_buttons_widget:
-                            # Find the active button specifically
-                            active_btn = getattr(segment_buttons_widget, 'active_btn', None)
-                            if active_btn:
-                                print(
-                                    f"Updating active button for segment {item_data.seg_index}, is_active: {is_active}")
-                                active_btn.setIcon(QIcon(ACTIVE_ICON if is_active else INACTIVE_ICON))
-                            index_label = getattr(segment_buttons_widget, 'index_label', None)
-
-                            if index_label:
-                                if is_active:
-                                    index_label.setText(f"S{item_data.seg_index}")
-                                    index_label.setStyleSheet("""
-                                        QPushButton {
-                                            background-color: #7E6DAD;
-                                            color: white;
-                                            border-radius: 15px;
-                                            font-weight: bold;
-                                            text-align: center;
-                                            padding: 0px;
-                                            min-width: 50px;
-                                            min-height: 50px;
-                                            max-width: 50px;
-                                            max-height: 50px;
-                                        }
-                                    """)
-                                else:
-                                    index_label.setText(f"S{item_data.seg_index}")
-                                    index_label.setStyleSheet("""
-                                        QPushButton {
-                                            background-color: #f0f0f0;
-                                            color: #666;
-                                            border-radius: 15px;
-                                            font-weight: normal;
-                                            text-align: center;
-                                            padding: 0px;
-                                            border: 1px solid #ddd;
-                                            min-width: 50px;
-                                            min-height: 50px;
-                                            max-width: 50px;
-                                            max-height: 50px;
-                                        }
-                                    """)
-        self.list_widget.viewport().update()
+        # Only the previous and the new active row are repainted
+        self.model.set_active_segment(seg_index)
         if self.contour_editor:
             self.contour_editor.update()
@@ -0,0 +1,120 @@
+"""
+Tests for the camera frame pipeline.
+This module tests:
+- Latest-frame-wins slot and stale frame dropping
+- Duplicate detection by frame id and by content fingerprint
+- Borrowed frame buffers are copied, owned ones are not
+- Polling resumes on show after repeated hides
+- Zero-copy BGR frames on the viewport controller
+- Submitting None clears the shown frame, its pyramid and edge map
+"""
+import threading
+import numpy as np
+def test_slot_keeps_latest_frame():
+    """Test a newer frame replaces an untaken one."""
+    from contour_editor.controllers.managers.camera_feed_manager import LatestFrameSlot
+    slot = LatestFrameSlot()
+    first = np.zeros((10, 10, 3), dtype=np.uint8)
+    second = np.full((10, 10, 3), 7, dtype=np.uint8)
+    assert slot.put(first)
+    assert slot.put(second)
+    frame, bgr = slot.take()
+    assert frame is second
+    assert bgr is False
+    assert slot.dropped_frames == 1
+    assert slot.take() is None
+def test_slot_skips_repeated_frames():
+    """Test identical content or a repeated frame id is not accepted twice."""
+    from contour_editor.controllers.managers.camera_feed_manager import LatestFrameSlot
+    slot = LatestFrameSlot()
+    frame = np.random.default_rng(0).integers(0, 255, (120, 160, 3), dtype=np.uint8)
+    assert slot.put(frame)
+    assert not slot.put(frame.copy())
+    assert slot.put(frame, frame_id=1)
+    assert not slot.put(frame + 1, frame_id=1)
+    assert slot.skipped_frames == 2
+def test_fingerprint_sees_single_pixel_changes():
+    """Test a change between any sampling grid points still makes a new frame."""
+    from contour_editor.controllers.managers.camera_feed_manager import frame_fingerprint
+    frame = np.zeros((480, 640), dtype=np.uint8)
+    changed = frame.copy()
+    changed[241, 333] = 1
+    assert frame_fingerprint(frame) != frame_fingerprint(changed)
+    assert frame_fingerprint(frame) == frame_fingerprint(frame.copy())
+def test_submit_copies_borrowed_buffers(qapp):
+    """Test frames wrapping a producer's buffer are copied and owned frames are shown in place."""
+    from unittest.mock import Mock
+    from contour_editor.controllers.managers.camera_feed_manager import CameraFeedManager
+    editor = Mock()
+    manager = CameraFeedManager(None)
+    manager.editor = editor
+    buffer = bytearray(12)
+    borrowed = np.frombuffer(buffer, dtype=np.uint8).reshape(3, 4)
+    manager.submit(borrowed, frame_id=1)
+    shown = editor.viewport_controller.set_image.call_args[0][0]
+    assert shown is not borrowed and not np.shares_memory(shown, borrowed)
+    owned = np.ones((3, 4), dtype=np.uint8)
+    manager.submit(owned, frame_id=2)
+    assert editor.viewport_controller.set_image.call_args[0][0] is owned
+def test_repeated_hide_keeps_resume(qapp):
+    """Test a second hide while paused does not cancel resuming on show."""
+    from unittest.mock import Mock
+    from PyQt6.QtCore import QTimer
+    from contour_editor.controllers.managers.camera_feed_manager import CameraFeedManager
+    manager = CameraFeedManager(None)
+    manager.editor = Mock()
+    timer = QTimer()
+    timer.setInterval(1000)
+    timer.start()
+    manager.editor.camera_feed_update_timer = timer
+    manager.pause_for_hide()
+    manager.pause_for_hide()
+    assert not timer.isActive()
+    manager.resume_after_show()
+    assert timer.isActive()
+    timer.stop()
+def test_slot_accepts_frames_from_threads():
+    """Test concurrent producers leave exactly one pending frame."""
+    from contour_editor.controllers.managers.camera_feed_manager import LatestFrameSlot
+    slot = LatestFrameSlot()
+    def produce(offset):
+        for i in range(50):
+            slot.put(np.zeros((4, 4), dtype=np.uint8), frame_id=offset + i)
+    threads = [threading.Thread(target=produce, args=(n * 100,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert slot.take() is not None
+    assert slot.take() is None
+    assert slot.dropped_frames == 199
+def test_set_image_bgr_zero_copy(qapp):
+    """Test BGR frames are wrapped without copying and keep their buffer alive."""
+    from unittest.mock import Mock
+    from PyQt6.QtGui import QColor, QImage
+    from contour_editor.controllers.viewport_controller import ViewportController
+    controller = ViewportController(Mock())
+    frame = np.zeros((20, 30, 3), dtype=np.uint8)
+    frame[..., 0] = 255  # Blue in OpenCV order
+    controller.set_image(frame, bgr=True)
+    assert controller.image.format() == QImage.Format.Format_BGR888
+    assert QColor(controller.image.pixel(5, 5)) == QColor(0, 0, 255)
+    assert controller._image_buffer is frame
+def test_submit_none_clears_frame(qapp):
+    """Test None removes the background and the next frame is shown even if it repeats the last one."""
+    from unittest.mock import Mock
+    from contour_editor.controllers.managers.camera_feed_manager import CameraFeedManager
+    from contour_editor.controllers.viewport_controller import ViewportController
+    editor = Mock()
+    editor.viewport_controller = ViewportController(editor)
+    manager = CameraFeedManager(None)
+    manager.editor = editor
+    frame = np.zeros((20, 30), dtype=np.uint8)
+    manager.submit(frame, frame_id=1)
+    assert editor.viewport_controller.image is not None
+    manager.submit(None)
+    assert editor.viewport_controller.image is None
+    assert editor.viewport_controller.image_pyramid._levels == []
+    editor.snapping.set_background.assert_called_with(None, None)
+    manager.submit(frame, frame_id=1)
+    assert editor.viewport_controller.image is not None
@@ -0,0 +1,84 @@
+"""
+Tests for the hover highlight.
+This module tests:
+- Points win over spans within the hit radius, hidden segments are ignored
+- Only the old and new highlight areas are repainted
+- The scene grid is reused and updated in place when geometry changes
+- Hovering after an edit or a snapshot undo only re-reads the changed segments
+"""
+from types import SimpleNamespace
+from unittest.mock import Mock
+from PyQt6.QtCore import QPointF
+def _segment(points, controls=None):
+    from contour_editor.models.segment import Segment
+    segment = Segment()
+    for point in points:
+        segment.add_point(QPointF(*point))
+    for index, control in (controls or {}).items():
+        segment.controls[index] = QPointF(*control)
+    return segment
+def _hover(segments, scale=1.0):
+    from contour_editor.controllers.managers.hover_manager import HoverManager
+    from contour_editor.models.spatial_index import SpatialIndex
+    from contour_editor.rendering.dirty_regions import DirtyRegionTracker
+    editor = SimpleNamespace(manager=Mock(), spatial_index=SpatialIndex(), scale_factor=scale,
+                             translation=QPointF(0, 0), request_repaint=Mock(), handle_radius=6)
+    editor.manager.get_segments.return_value = segments
+    editor.dirty_regions = DirtyRegionTracker(editor)
+    return HoverManager(editor), editor
+def test_points_before_spans():
+    """Test the nearest anchor or control is hovered before the span under the cursor."""
+    segments = [_segment([(0, 0), (100, 0), (200, 0)], {1: (150, 40)})]
+    hover, _ = _hover(segments)
+    assert hover.find_target(QPointF(97, 4), 1.0) == ("anchor", 0, 1)
+    assert hover.find_target(QPointF(152, 37), 1.0) == ("control", 0, 1)
+    assert hover.find_target(QPointF(50, 6), 1.0) == ("span", 0, 0)
+    assert hover.find_target(QPointF(150, 20), 1.0) == ("span", 0, 1)
+    assert hover.find_target(QPointF(50, 30), 1.0) is None
+    assert hover.find_target(QPointF(50, 6), 2.0) is None
+def test_hidden_segments_are_skipped():
+    """Test a hidden segment does not take the hover from a visible one below it."""
+    hidden = _segment([(0, 0), (100, 0)])
+    hidden.visible = False
+    hover, _ = _hover([hidden, _segment([(0, 5), (100, 5)])])
+    assert hover.find_target(QPointF(50, 1), 1.0) == ("span", 1, 0)
+def test_repaints_only_highlight_regions():
+    """Test a new target repaints the old and new highlight area and an unchanged one nothing."""
+    hover, editor = _hover([_segment([(0, 0), (100, 0)]), _segment([(400, 300), (500, 300)])])
+    hover.update(QPointF(2, 2))
+    assert hover.hovered == ("anchor", 0, 0)
+    region = editor.request_repaint.call_args[0][0]
+    assert region.boundingRect().width() < 80
+    editor.request_repaint.reset_mock()
+    hover.update(QPointF(1, 1))
+    editor.request_repaint.assert_not_called()
+    hover.update(QPointF(450, 302))
+    bounds = editor.request_repaint.call_args[0][0].boundingRect()
+    assert bounds.contains(0, 0) and bounds.contains(450, 300)
+    hover.clear()
+    assert hover.hovered is None and hover.highlight_points() is None
+def test_grid_reused_until_geometry_changes():
+    """Test hover queries share one scene grid that geometry changes update."""
+    segments = [_segment([(0, 0), (100, 0)])]
+    hover, editor = _hover(segments)
+    grid = editor.spatial_index.grid_for(segments)
+    hover.find_target(QPointF(50, 0), 1.0)
+    assert editor.spatial_index.grid_for(segments) is grid
+    segments[0].add_point(QPointF(100, 100))
+    assert editor.spatial_index.grid_for(segments) is grid and len(grid) == 2
+    assert hover.find_target(QPointF(100, 50), 1.0) == ("span", 0, 1)
+def test_hover_after_edit_rereads_only_changed_segments():
+    """Test the first hover after a point edit, and after undoing it from a snapshot, indexes one segment."""
+    import copy
+    from unittest.mock import patch
+    from contour_editor.models import spatial_index
+    segments = [_segment([(x * 10, y) for x in range(10)]) for y in range(0, 200, 20)]
+    hover, editor = _hover(segments)
+    hover.find_target(QPointF(0, 0), 1.0)
+    snapshot = copy.deepcopy(segments)
+    segments[4].add_point(QPointF(90, 150))
+    with patch.object(spatial_index, "SegmentSpans", wraps=spatial_index.SegmentSpans) as built:
+        assert hover.find_target(QPointF(91, 110), 1.0) == ("span", 4, 9)
+        segments[:] = snapshot
+        assert hover.find_target(QPointF(91, 110), 1.0) is None
+    assert built.call_count == 2
@@ -0,0 +1,32 @@
+"""
+Tests for deleting points from the point info overlay.
+This module tests:
+- Deleting a selection publishes the changed points of each segment in one change set
+"""
+from unittest.mock import Mock
+from PyQt6.QtCore import QPointF
+def _segment():
+    from contour_editor.models.segment import Layer, Segment
+    segment = Segment(layer=Layer("Main"))
+    for x in (0, 10, 20, 30):
+        segment.add_point(QPointF(x, 0))
+    segment.controls[2] = QPointF(25, 5)
+    return segment
+def test_delete_selection_publishes_one_change_set(qapp, mock_event_bus, monkeypatch):
+    """Test deleting an anchor and a control publishes the shifted anchors and the cleared control."""
+    from PyQt6.QtWidgets import QMessageBox
+    from contour_editor.controllers.managers.point_info_overlay_manager import remove_selected_points
+    monkeypatch.setattr(QMessageBox, "question", Mock(return_value=QMessageBox.StandardButton.Yes))
+    segments = [_segment(), _segment()]
+    editor = Mock(point_manager_widget=None)
+    editor.manager.get_segments.return_value = segments
+    editor.selection_manager.selected_points_list = [
+        {'role': 'anchor', 'seg_index': 0, 'point_index': 1},
+        {'role': 'control', 'seg_index': 1, 'point_index': 2},
+    ]
+    published = []
+    mock_event_bus.scene_changed.connect(published.append)
+    remove_selected_points(editor)
+    assert len(published) == 1
+    changes = {change.seg_index: (change.anchors, change.controls) for change in published[0]}
+    assert changes == {0: ((range(1, 3),), (range(1, 2),)), 1: ((), (range(2, 3),))}
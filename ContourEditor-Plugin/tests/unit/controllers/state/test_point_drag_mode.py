@@ -0,0 +1,53 @@
+"""
+Tests for dragging points.
+This module tests:
+- Releasing a drag publishes the moved points in one transaction
+- A press without a drag publishes nothing
+"""
+from unittest.mock import Mock
+from PyQt6.QtCore import QPointF
+def _drag_mode(segments):
+    from contour_editor.controllers.state.mode_handlers.point_drag_mode import PointDragMode
+    editor = Mock()
+    editor.manager.get_segments.return_value = segments
+    return PointDragMode(editor)
+def _segment():
+    from contour_editor.models.segment import Layer, Segment
+    segment = Segment(layer=Layer("Main"))
+    for x in (0, 10, 20, 30):
+        segment.add_point(QPointF(x, 0))
+    return segment
+def test_release_publishes_dragged_anchor(qapp, mock_event_bus):
+    """Test an anchor drag publishes the anchor and the controls of its two spans."""
+    mode = _drag_mode([_segment()])
+    published = []
+    mock_event_bus.scene_changed.connect(published.append)
+    mode.dragging_point, mode.is_actually_dragging = ("anchor", 0, 2), True
+    mode.mouseRelease()
+    [change] = published[0]
+    assert (change.kind, change.seg_index, change.anchors, change.controls) == ("geometry", 0, (range(2, 3),), (range(1, 3),))
+    assert mode.dragging_point is None
+def test_release_publishes_group_move(qapp, mock_event_bus):
+    """Test a group drag publishes one geometry change per moved segment in one change set."""
+    from contour_editor.models.group_move import GroupMove
+    segments = [_segment(), _segment()]
+    mode = _drag_mode(segments)
+    selection = [{'role': 'anchor', 'seg_index': 0, 'point_index': 1}, {'role': 'control', 'seg_index': 1, 'point_index': 0}]
+    segments[1].controls[0] = QPointF(5, 5)
+    mode.group_move = GroupMove(segments, selection)
+    published = []
+    mock_event_bus.scene_changed.connect(published.append)
+    mode.dragging_point, mode.is_actually_dragging = ("anchor", 0, 1), True
+    mode.mouseRelease()
+    assert len(published) == 1
+    assert [(change.seg_index, change.anchors, change.controls) for change in published[0]] == [
+        (0, (range(1, 2),), ()), (1, (), (range(0, 1),))
+    ]
+def test_release_without_drag_publishes_nothing(qapp, mock_event_bus):
+    """Test releasing a pressed point that never moved publishes no change."""
+    mode = _drag_mode([_segment()])
+    published = []
+    mock_event_bus.scene_changed.connect(published.append)
+    mode.dragging_point = ("anchor", 0, 2)
+    mode.mouseRelease()
+    assert published == []
@@ -45,6 +45,7 @@ def mock_editor():
     editor.width = Mock(return_value=800)
     editor.height = Mock(return_value=600)
     editor.update = Mock()
+    editor.request_repaint = Mock()
     editor.grabGesture = Mock()
     editor.ungrabGesture = Mock()
     return editor
@@ -340,7 +341,7 @@ class TestViewportController:
         controller.zoom_in()
 
         assert controller.scale_factor > initial_scale
-        mock_editor.update.assert_called()
+        mock_editor.request_repaint.assert_called()
 
     def test_zoom_out(self, mock_editor):
         """Test zoom out functionality"""
@@ -353,7 +354,7 @@ class TestViewportController:
         controller.zoom_out()
 
         assert controller.scale_factor < initial_scale
-        mock_editor.update.assert_called()
+        mock_editor.request_repaint.assert_called()
 
     def test_zoom_in_multiple_times(self, mock_editor):
         """Test multiple zoom in operations"""
@@ -396,7 +397,7 @@ class TestViewportController:
 
         assert controller.scale_factor == 1.0
         assert controller.translation == QPointF(0, 0)
-        mock_editor.update.assert_called()
+        mock_editor.request_repaint.assert_called()
 
     def test_reset_zoom_with_image(self, mock_editor):
         """Test reset zoom with image"""
@@ -553,7 +554,7 @@ class TestViewportController:
         controller.update_image(image)
 
         assert controller.image is image
-        mock_editor.update.assert_called()
+        mock_editor.request_repaint.assert_called()
 
     def test_update_image_from_path(self, mock_editor):
         """Test updating image from file path"""
@@ -569,7 +570,7 @@ class TestViewportController:
             controller.update_image("/path/to/image.png")
 
             assert controller.image is mock_image
-            mock_editor.update.assert_called()
+            mock_editor.request_repaint.assert_called()
 
     def test_update_image_invalid_path(self, mock_editor):
         """Test updating image with invalid path"""
@@ -0,0 +1,82 @@
+"""
+Tests for background image loading.
+This module tests:
+- Decoding on the worker thread and delivery on the GUI thread
+- Superseded loads are discarded
+- LRU reuse of decoded images
+- Editor teardown stops the worker threads
+"""
+import time
+from PyQt6.QtGui import QImage, QColor
+def _write_image(path, color):
+    image = QImage(40, 30, QImage.Format.Format_RGB32)
+    image.fill(QColor(color))
+    assert image.save(str(path))
+    return str(path)
+def _collect(loader):
+    delivered = []
+    loader.image_loaded.connect(lambda path, image: delivered.append((path, image)))
+    return delivered
+def _wait_until(qapp, condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        qapp.processEvents()
+        time.sleep(0.005)
+    return condition()
+def test_load_delivers_decoded_image(qapp, tmp_path):
+    """Test a loaded image arrives through image_loaded."""
+    from contour_editor.controllers.image_loader import AsyncImageLoader
+    loader = AsyncImageLoader()
+    delivered = _collect(loader)
+    path = _write_image(tmp_path / "a.png", "red")
+    assert loader.load(path) is None
+    assert _wait_until(qapp, lambda: delivered)
+    assert delivered[0][0] == path
+    assert QColor(delivered[0][1].pixel(0, 0)) == QColor("red")
+    loader.shutdown()
+def test_superseded_load_is_discarded(qapp, tmp_path):
+    """Test only the newest request is delivered."""
+    from contour_editor.controllers.image_loader import AsyncImageLoader
+    loader = AsyncImageLoader()
+    delivered = _collect(loader)
+    first = _write_image(tmp_path / "first.png", "red")
+    second = _write_image(tmp_path / "second.png", "blue")
+    loader.load(first)
+    loader.load(second)
+    assert _wait_until(qapp, lambda: delivered)
+    _wait_until(qapp, lambda: False, timeout=0.05)
+    assert [path for path, _ in delivered] == [second]
+    loader.shutdown()
+def test_reopened_image_comes_from_cache(qapp, tmp_path):
+    """Test a second load of the same file is served synchronously."""
+    from contour_editor.controllers.image_loader import AsyncImageLoader
+    loader = AsyncImageLoader(cache_size=1)
+    delivered = _collect(loader)
+    path = _write_image(tmp_path / "a.png", "green")
+    other = _write_image(tmp_path / "b.png", "blue")
+    loader.load(path)
+    assert _wait_until(qapp, lambda: len(delivered) == 1)
+    assert loader.load(path) is not None
+    loader.load(other)
+    assert _wait_until(qapp, lambda: len(delivered) == 3)
+    assert loader.load(path) is None  # Evicted by the newer image
+    loader.shutdown()
+def test_editor_teardown_stops_workers(qapp, tmp_path):
+    """Test closing or destroying the editor shuts down the image and edge map executors."""
+    from PyQt6.QtCore import QCoreApplication, QEvent
+    from contour_editor.core.editor import ContourEditor
+    from contour_editor.models.bezier_segment_manager import BezierSegmentManager
+    from contour_editor.persistence.data.segment_provider import SegmentManagerProvider
+    SegmentManagerProvider.get_instance().set_manager_class(BezierSegmentManager)
+    try:
+        for teardown in ("close", "deleteLater"):
+            editor = ContourEditor(visionSystem=None, parent=None, image_path=None, data=None)
+            editor.load_image_async(_write_image(tmp_path / f"{teardown}.png", "red"))
+            loader = editor.viewport_controller._image_loader
+            edge_builder = editor.snapping._get_edge_builder()
+            getattr(editor, teardown)()
+            if teardown == "deleteLater":
+                QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+            assert loader._executor._shutdown and edge_builder._executor._shutdown
+    finally:
+        SegmentManagerProvider._instance = None
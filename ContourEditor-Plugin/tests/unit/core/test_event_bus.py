@@ -5,6 +5,7 @@ This module tests:
 - Signal emissions
 - Multiple subscribers
 - Signal cleanup
+- Structured scene changes and transactions
 """
 import pytest
 def test_event_bus_singleton(mock_event_bus):
@@ -110,3 +111,30 @@ def test_signal_disconnect(mock_event_bus, qtbot):
     mock_event_bus.segment_deleted.emit(2)
     # Should still be 1, not 2
     assert len(received_signals) == 1
+def test_publish_outside_transaction(mock_event_bus, qtbot):
+    """Test a change published on its own is emitted at once as a one-change ChangeSet."""
+    received = []
+    mock_event_bus.scene_changed.connect(received.append)
+    mock_event_bus.publish("geometry", 2, anchors=[5, 3, 4, 9], controls=[])
+    assert len(received) == 1 and len(received[0]) == 1
+    change = next(iter(received[0]))
+    assert (change.kind, change.seg_index) == ("geometry", 2)
+    assert change.anchors == (range(3, 6), range(9, 10)) and change.controls == ()
+def test_transactions_batch_and_nest(mock_event_bus, qtbot):
+    """Test nested transactions deliver every change once, when the outermost one ends."""
+    received = []
+    mock_event_bus.scene_changed.connect(received.append)
+    with mock_event_bus.transaction():
+        mock_event_bus.publish("visibility", 0)
+        with mock_event_bus.transaction():
+            mock_event_bus.publish("removed", 1)
+        assert received == []
+    assert len(received) == 1
+    changes = received[0]
+    assert changes.kinds == {"visibility", "removed"} and changes.structural
+    assert changes.seg_indexes("visibility") == {0} and changes.seg_indexes() == {0, 1}
+    with mock_event_bus.transaction():
+        pass
+    assert len(received) == 1
+    with pytest.raises(ValueError):
+        mock_event_bus.publish("moved", 0)
@@ -0,0 +1,58 @@
+"""
+Tests for input event coalescing.
+This module tests:
+- The first event of a burst is dispatched immediately
+- Later moves collapse to the latest one and wheel deltas are summed
+- flush() dispatches pending input at once
+"""
+import time
+from PyQt6.QtCore import QPointF
+class _Wheel:
+    def __init__(self, delta, pos):
+        self._delta, self._pos = delta, pos
+    def angleDelta(self):
+        delta = self._delta
+        class Delta:
+            def y(self):
+                return delta
+        return Delta()
+    def position(self):
+        return self._pos
+class _Move:
+    def __init__(self, x):
+        self.x = x
+def _coalescer(moves, wheels):
+    from contour_editor.input.event_coalescer import InputCoalescer
+    return InputCoalescer(moves.append, lambda angle, pos: wheels.append((angle, pos)), interval_ms=20)
+def test_move_burst_collapses_to_latest(qapp):
+    """Test moves inside one frame are dispatched once with the latest event."""
+    moves, wheels = [], []
+    coalescer = _coalescer(moves, wheels)
+    for x in range(5):
+        coalescer.move(_Move(x))
+    assert [m.x for m in moves] == [0]
+    deadline = time.monotonic() + 1.0
+    while len(moves) < 2 and time.monotonic() < deadline:
+        qapp.processEvents()
+        time.sleep(0.002)
+    assert [m.x for m in moves] == [0, 4]
+    assert coalescer.received_events == 5
+    assert coalescer.dispatched_events == 2
+def test_wheel_deltas_are_summed(qapp):
+    """Test wheel notches after the first are summed into one zoom step."""
+    moves, wheels = [], []
+    coalescer = _coalescer(moves, wheels)
+    coalescer.wheel(_Wheel(120, QPointF(1, 1)))
+    coalescer.wheel(_Wheel(0, QPointF(2, 2)))
+    coalescer.wheel(_Wheel(30, QPointF(3, 3)))
+    coalescer.wheel(_Wheel(90, QPointF(4, 4)))
+    coalescer.flush()
+    assert wheels == [(120, QPointF(1, 1)), (120, QPointF(4, 4))]
+def test_wheel_zoom_is_proportional_to_delta(qapp):
+    """Test a half notch zooms by the square root of a full notch."""
+    from unittest.mock import Mock
+    from contour_editor.input.zoom_handler import ZoomHandler
+    ctx = Mock()
+    ZoomHandler(ctx).zoom_by_wheel(60, QPointF(0, 0))
+    factor = ctx.viewport.zoom_at_point.call_args[0][1]
+    assert abs(factor - 1.25 ** 0.5) < 1e-9
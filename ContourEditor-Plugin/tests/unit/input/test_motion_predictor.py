@@ -0,0 +1,50 @@
+"""
+Tests for drag input prediction.
+This module tests:
+- Constant-velocity extrapolation
+- Lead clamping and stale sample expiry
+- Drag samples are timed by the input event, not by their dispatch
+"""
+import pytest
+from PyQt6.QtCore import QPointF
+def test_predicts_along_velocity():
+    """Test a steady 1000 px/s motion is extrapolated 16 px ahead for 16 ms."""
+    from contour_editor.input.motion_predictor import MotionPredictor
+    predictor = MotionPredictor(window_ms=100, max_lead_px=100)
+    for i in range(4):
+        predictor.add_sample(QPointF(100 + i * 8, 50), t=i * 0.008)
+    predicted = predictor.predict(16)
+    assert predicted.x() == pytest.approx(124 + 16)
+    assert predicted.y() == pytest.approx(50)
+def test_lead_is_clamped_and_old_samples_dropped():
+    """Test the lead never exceeds max_lead_px and samples outside the window are ignored."""
+    from contour_editor.input.motion_predictor import MotionPredictor
+    predictor = MotionPredictor(window_ms=50, max_lead_px=10)
+    predictor.add_sample(QPointF(0, 0), t=0.0)
+    predictor.add_sample(QPointF(0, 100), t=0.01)
+    assert predictor.predict(16).y() == pytest.approx(110)
+    predictor.add_sample(QPointF(0, 100), t=1.0)
+    assert predictor.velocity() is None
+    assert predictor.predict(16) == QPointF(0, 100)
+def test_drag_samples_use_event_time(qapp, monkeypatch):
+    """Test moves dispatched together by the frame timer keep their own input times."""
+    from unittest.mock import Mock
+    from contour_editor.controllers.state.mode_handlers.point_drag_mode import PointDragMode
+    from contour_editor.input.motion_predictor import MotionPredictor
+    from contour_editor.persistence.config import constants
+    monkeypatch.setattr(constants, "DRAG_PREDICTION_MS", 16)
+    class _Move:
+        def __init__(self, x, timestamp_ms):
+            self._pos, self._timestamp = QPointF(x, 0), timestamp_ms
+        def position(self):
+            return self._pos
+        def timestamp(self):
+            return self._timestamp
+    editor = Mock(snap_indicator=None, translation=QPointF(0, 0), scale_factor=1.0)
+    mode = PointDragMode(editor)
+    # A frozen clock would give every sample the same time if the event time were ignored
+    mode.predictor = MotionPredictor(window_ms=100, max_lead_px=100, clock=lambda: 0.0)
+    for i in range(4):
+        mode._update_prediction(editor, _Move(100 + i * 8, 1000 + i * 8), 0)
+    assert mode.predictor.velocity()[0] == pytest.approx(1000)
+    assert mode.predicted_cursor_pos.x() == pytest.approx(124 + 16)
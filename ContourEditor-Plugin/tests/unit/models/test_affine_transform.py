@@ -0,0 +1,70 @@
+"""
+Tests for affine transforms of segments and selections.
+This module tests:
+- Rotation, scale and mirror matrices around a center
+- Selection targets including spans between selected anchors
+- Live preview writing from start positions and restoring them
+- Straight spans next to a transformed anchor stay straight, as in a group drag
+"""
+import pytest
+from PyQt6.QtCore import QPointF
+def _segment():
+    from contour_editor.models.segment import Segment
+    segment = Segment()
+    for point in [(0, 0), (10, 0), (20, 0)]:
+        segment.add_point(QPointF(*point))
+    segment.controls[0] = QPointF(5, 5)
+    segment.controls[1] = QPointF(15, 5)
+    return segment
+def test_matrices_act_around_center():
+    """Test rotation, scale and mirror keep their center fixed."""
+    from contour_editor.models.affine_transform import apply_affine, rotation_matrix, scale_matrix, mirror_matrix
+    segment = _segment()
+    apply_affine([segment], ((0, (2,), ()),), rotation_matrix(90, QPointF(10, 0)))
+    assert segment.points[2].x() == pytest.approx(10) and segment.points[2].y() == pytest.approx(10)
+    apply_affine([segment], ((0, (0,), ()),), scale_matrix(2, 3, QPointF(10, 0)))
+    assert segment.points[0] == QPointF(-10, 0)
+    apply_affine([segment], ((0, (0,), ()),), mirror_matrix(True, False, QPointF(0, 0)))
+    assert segment.points[0] == QPointF(10, 0)
+def test_selection_targets_include_inner_controls():
+    """Test the control between two selected anchors is transformed with them."""
+    from contour_editor.models.affine_transform import targets_from_selection
+    selection = [{'role': 'anchor', 'seg_index': 0, 'point_index': i} for i in (0, 1)]
+    assert targets_from_selection(selection, [_segment()]) == ((0, (0, 1), (0,)),)
+def test_preview_restores_start_positions():
+    """Test previews do not accumulate and restore() puts the points back."""
+    from contour_editor.models.affine_transform import AffinePreview, targets_for_segments, translation_matrix
+    segment = _segment()
+    preview = AffinePreview([segment], targets_for_segments([0]))
+    preview.show(translation_matrix(5, 0))
+    preview.show(translation_matrix(7, 1))
+    assert segment.points[0] == QPointF(7, 1)
+    assert segment.controls[1] == QPointF(22, 6)
+    preview.restore()
+    assert segment.points[0] == QPointF(0, 0)
+def _straight_segment():
+    from contour_editor.models.segment import Segment
+    segment = Segment()
+    for point in [(0, 0), (10, 0), (20, 0)]:
+        segment.add_point(QPointF(*point))
+    segment.controls[0] = QPointF(3, 0)
+    return segment
+def test_on_line_controls_follow_like_group_move():
+    """Test moving one anchor recentres the on-line control exactly as GroupMove does."""
+    from contour_editor.models.affine_transform import apply_affine, targets_from_selection, translation_matrix
+    from contour_editor.models.group_move import GroupMove
+    selection = [{'role': 'anchor', 'seg_index': 0, 'point_index': 1}]
+    dragged, transformed = _straight_segment(), _straight_segment()
+    GroupMove([dragged], selection).apply(QPointF(0, 10))
+    apply_affine([transformed], targets_from_selection(selection, [transformed]), translation_matrix(0, 10))
+    assert transformed.controls[0] == dragged.controls[0] == QPointF(5, 5)
+    assert transformed.controls[1] is None
+def test_preview_restores_recentred_controls():
+    """Test restore() puts a recentred control back where it was, not at the midpoint."""
+    from contour_editor.models.affine_transform import AffinePreview, translation_matrix
+    segment = _straight_segment()
+    preview = AffinePreview([segment], ((0, (1,), ()),))
+    preview.show(translation_matrix(0, 10))
+    assert segment.controls[0] == QPointF(5, 5)
+    preview.restore()
+    assert segment.controls[0] == QPointF(3, 0) and segment.points[1] == QPointF(10, 0)
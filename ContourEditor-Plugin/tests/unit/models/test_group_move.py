@@ -0,0 +1,59 @@
+"""
+Tests for moving a multi-point selection.
+This module tests:
+- Selected anchors and controls move by one offset
+- Unselected on-line controls stay at the midpoint of moved anchors
+- The whole move is one undo entry and locked layers are skipped
+- The moved point indices include recentred controls
+"""
+from PyQt6.QtCore import QPointF
+def _selection(*items):
+    return [{'role': role, 'seg_index': seg, 'point_index': idx} for role, seg, idx in items]
+def _manager():
+    from contour_editor.models.bezier_segment_manager import BezierSegmentManager
+    manager = BezierSegmentManager()
+    segment = manager.segments[0]
+    for point in [(0, 0), (10, 0), (20, 0), (30, 0)]:
+        segment.add_point(QPointF(*point))
+    segment.controls[0] = QPointF(5, 0)
+    segment.controls[1] = QPointF(15, 40)
+    return manager, segment
+def test_selected_points_move_by_offset():
+    """Test anchors and controls of the selection move together and the rest stay."""
+    manager, segment = _manager()
+    version = segment.geometry_version
+    manager.move_points(_selection(('anchor', 0, 1), ('anchor', 0, 2), ('control', 0, 1)), QPointF(3, 4))
+    assert segment.points == [QPointF(0, 0), QPointF(13, 4), QPointF(23, 4), QPointF(30, 0)]
+    assert segment.controls[1] == QPointF(18, 44)
+    assert segment.geometry_version > version
+def test_on_line_control_follows_midpoint():
+    """Test a straight-span control is recentred while a curved one is left alone."""
+    manager, segment = _manager()
+    manager.move_points(_selection(('anchor', 0, 1), ('anchor', 0, 3)), QPointF(0, 10))
+    assert segment.controls[0] == QPointF(5, 5)
+    assert segment.controls[1] == QPointF(15, 40)
+    assert segment.controls[2] is None
+def test_group_drag_is_one_undo_entry():
+    """Test repeated drag updates place points from their start positions and undo restores them at once."""
+    from contour_editor.models.group_move import GroupMove
+    manager, segment = _manager()
+    manager.save_state()
+    move = GroupMove(manager.segments, _selection(('anchor', 0, 0), ('anchor', 0, 1)))
+    for step in range(1, 6):
+        move.apply(QPointF(step, 0))
+    assert segment.points[:2] == [QPointF(5, 0), QPointF(15, 0)]
+    assert len(manager.undo_stack) == 1
+    manager.undo()
+    assert manager.segments[0].points[:2] == [QPointF(0, 0), QPointF(10, 0)]
+def test_locked_layer_is_skipped():
+    """Test points on a locked layer do not move."""
+    manager, segment = _manager()
+    segment.layer.locked = True
+    manager.move_points(_selection(('anchor', 0, 1), ('anchor', 0, 2)), QPointF(5, 5))
+    assert segment.points[1] == QPointF(10, 0)
+def test_changed_points_include_recentred_controls():
+    """Test changed_points names the moved anchors, selected controls and recentred controls per segment."""
+    from contour_editor.models.group_move import GroupMove
+    manager, segment = _manager()
+    move = GroupMove(manager.segments, _selection(('anchor', 0, 1), ('anchor', 0, 3)))
+    assert move.changed_points() == [(0, [1, 3], [0])]
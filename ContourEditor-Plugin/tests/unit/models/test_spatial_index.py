@@ -0,0 +1,92 @@
+"""
+Tests for the segment spatial index.
+This module tests:
+- Span bounds including control points
+- Rect queries returning only overlapping spans
+- Rect queries going through the shared scene grid
+- Cache reuse and invalidation on geometry changes
+- Scene grid updated in place for edited, added and removed segments
+- Undo copies of segments keep their grid rows
+"""
+from PyQt6.QtCore import QPointF, QRectF
+def _segment(points, controls=None):
+    from contour_editor.models.segment import Segment
+    segment = Segment()
+    for point in points:
+        segment.add_point(QPointF(*point))
+    for index, control in (controls or {}).items():
+        segment.add_control_point(index, QPointF(*control))
+    return segment
+def test_span_bounds_include_controls():
+    """Test a curved span's bounds reach its control point."""
+    from contour_editor.models.spatial_index import SegmentSpans
+    spans = SegmentSpans(_segment([(0, 0), (10, 0)], {0: (5, 30)}))
+    assert spans.span_max[0].tolist() == [10.0, 30.0]
+    assert spans.bounds == (0.0, 0.0, 10.0, 30.0)
+def test_query_rect_returns_overlapping_spans():
+    """Test only segments and spans under the rect are reported."""
+    from contour_editor.models.spatial_index import SpatialIndex
+    line = _segment([(x * 10, 0) for x in range(100)])
+    far = _segment([(5000, 5000), (5010, 5000)])
+    hits = SpatialIndex().query_rect([line, far], QRectF(205, -5, 20, 10))
+    assert len(hits) == 1
+    seg_index, segment, spans, span_indices = hits[0]
+    assert seg_index == 0 and segment is line
+    assert span_indices.tolist() == [20, 21, 22]
+def test_query_rect_uses_scene_grid():
+    """Test rect queries group the scene grid's hits by segment and follow geometry edits."""
+    from contour_editor.models.spatial_index import SpatialIndex
+    index = SpatialIndex()
+    segments = [_segment([(x * 10, y) for x in range(50)]) for y in range(0, 500, 5)]
+    hits = index.query_rect(segments, QRectF(95, 8, 20, 4))
+    assert [(seg_index, span_indices.tolist()) for seg_index, _, _, span_indices in hits] == [(2, [9, 10, 11])]
+    assert index.query_rect(segments, QRectF(95, 8, 20, 4)) and index._grid is index.grid_for(segments)
+    segments[40].points[3] = QPointF(100, 10)
+    segments[40].mark_geometry_changed()
+    hits = index.query_rect(segments, QRectF(95, 8, 20, 4))
+    assert [(seg_index, span_indices.tolist()) for seg_index, _, _, span_indices in hits] == [(2, [9, 10, 11]), (40, [2, 3])]
+    assert hits[1][1] is segments[40] and hits[1][2].anchors[3].tolist() == [100.0, 10.0]
+def test_entries_revalidate_on_geometry_change():
+    """Test cached spans are reused until the segment geometry changes."""
+    from contour_editor.models.spatial_index import SpatialIndex
+    index = SpatialIndex()
+    segment = _segment([(0, 0), (10, 0)])
+    spans = index.spans_for(segment)
+    assert index.spans_for(segment) is spans
+    segment.add_point(QPointF(20, 0))
+    assert index.spans_for(segment) is not spans
+    assert len(index.spans_for(segment).anchors) == 3
+def _grid_spans(grid, rect):
+    found = grid.spans_in(rect.left(), rect.top(), rect.right(), rect.bottom())
+    return sorted(zip(grid.seg_ids[found].tolist(), grid.span_ids[found].tolist()))
+def test_grid_updates_edited_segments_in_place():
+    """Test edits, inserted and removed segments reach the existing grid and match a rebuilt one."""
+    from contour_editor.models.spatial_index import SpanGrid, SpatialIndex
+    index = SpatialIndex()
+    segments = [_segment([(x * 10, y) for x in range(20)]) for y in range(0, 100, 10)]
+    grid = index.grid_for(segments)
+    segments[3].points[5] = QPointF(500, 500)
+    segments[3].mark_geometry_changed()
+    segments.insert(0, _segment([(480, 480), (520, 520)]))
+    del segments[7]
+    segments[-1].add_point(QPointF(490, 510))
+    assert index.grid_for(segments) is grid and len(grid) == sum(len(s.points) - 1 for s in segments)
+    rebuilt = SpanGrid((seg_index, index.spans_for(segment)) for seg_index, segment in enumerate(segments))
+    for rect in (QRectF(450, 450, 100, 100), QRectF(0, 0, 60, 45), QRectF(-50, -50, 1000, 1000)):
+        assert _grid_spans(grid, rect) == _grid_spans(rebuilt, rect)
+    assert (0, 0) in _grid_spans(grid, QRectF(495, 495, 1, 1)) and (4, 4) in _grid_spans(grid, QRectF(495, 495, 1, 1))
+def test_undo_copies_keep_grid_rows():
+    """Test segments replaced by deep copies, as a snapshot undo does, are not re-read."""
+    import copy
+    from unittest.mock import patch
+    from contour_editor.models import spatial_index
+    index = spatial_index.SpatialIndex()
+    segments = [_segment([(x, y) for x in range(10)]) for y in range(5)]
+    snapshot = copy.deepcopy(segments)
+    grid = index.grid_for(segments)
+    segments[2].add_point(QPointF(50, 50))
+    index.grid_for(segments)
+    with patch.object(spatial_index, "SegmentSpans", wraps=spatial_index.SegmentSpans) as built:
+        assert index.grid_for(snapshot) is grid
+    assert built.call_count == 1 and len(grid) == 45
+    assert _grid_spans(grid, QRectF(20, 20, 40, 40)) == []
@@ -0,0 +1,97 @@
+"""
+Tests for handle visibility helpers.
+This module tests:
+- Index masks agree with get_visible_points
+- Short segments keep every point
+- Curvature ranking cache reuse and invalidation
+- Vectorized screen-space decluttering and clustering
+"""
+import math
+import numpy as np
+from PyQt6.QtCore import QPointF
+def _wavy_points(count):
+    return [QPointF(i * 3.0, 20 * math.sin(i * 0.7)) for i in range(count)]
+def test_visible_mask_matches_visible_points():
+    """Test the mask selects exactly the points get_visible_points returns."""
+    from contour_editor.persistence.utils.point_visibility import get_visible_points, get_visible_point_mask
+    points = _wavy_points(200)
+    for scale in (0.2, 1.0, 2.5):
+        mask = get_visible_point_mask(points, scale)
+        expected = get_visible_points(points, scale)
+        assert mask.sum() == len(expected)
+        assert [p for p, keep in zip(points, mask) if keep] == [p for p in points if p in expected]
+def test_visible_mask_keeps_all_points_when_zoomed_in():
+    """Test every handle is visible at high zoom."""
+    from contour_editor.persistence.utils.point_visibility import get_visible_point_mask
+    mask = get_visible_point_mask(_wavy_points(50), 10.0)
+    assert mask.all()
+def test_visible_mask_short_segment():
+    """Test segments with two points or fewer are never decluttered."""
+    from contour_editor.persistence.utils.point_visibility import get_visible_point_mask
+    assert get_visible_point_mask(_wavy_points(2), 0.01).tolist() == [True, True]
+    assert get_visible_point_mask([], 1.0).shape == (0,)
+def test_points_to_array():
+    """Test QPointF lists convert to (N, 2) arrays."""
+    from contour_editor.persistence.utils.point_visibility import points_to_array
+    arr = points_to_array([QPointF(1, 2), QPointF(3, 4)])
+    assert np.array_equal(arr, np.array([[1.0, 2.0], [3.0, 4.0]]))
+    assert points_to_array([]).shape == (0, 2)
+def test_segment_to_arrays():
+    """Test span controls come back NaN-filled and controls past the last span are left out."""
+    from contour_editor.models.segment import Segment
+    from contour_editor.persistence.utils.point_visibility import segment_to_arrays
+    segment = Segment()
+    for x in (0, 10, 20):
+        segment.add_point(QPointF(x, 0))
+    segment.controls[1] = QPointF(15, 5)
+    segment.controls.append(QPointF(99, 99))
+    anchors, controls = segment_to_arrays(segment)
+    assert anchors.shape == (3, 2) and controls.shape == (2, 2)
+    assert np.isnan(controls[0]).all() and controls[1].tolist() == [15.0, 5.0]
+    assert [a.shape for a in segment_to_arrays(Segment())] == [(0, 2), (0, 2)]
+def test_rank_cache_reuses_geometry_until_segment_changes():
+    """Test cached handle geometry is reused and rebuilt after an edit."""
+    from contour_editor.models.segment import Segment
+    from contour_editor.persistence.utils.point_visibility import CurvatureRankCache, get_visible_point_mask
+    segment = Segment()
+    for pt in _wavy_points(100):
+        segment.add_point(pt)
+    cache = CurvatureRankCache()
+    first = cache.get(segment)
+    assert cache.get(segment) is first
+    assert first.anchor_mask(0.5).tolist() == get_visible_point_mask(segment.points, 0.5).tolist()
+    segment.add_point(QPointF(400, 0))
+    rebuilt = cache.get(segment)
+    assert rebuilt is not first
+    assert len(rebuilt.anchors) == 101
+def test_rank_cache_tracks_valid_controls():
+    """Test control handles are indexed by their position in segment.controls."""
+    from contour_editor.models.segment import Segment
+    from contour_editor.persistence.utils.point_visibility import CurvatureRankCache
+    segment = Segment()
+    for pt in _wavy_points(4):
+        segment.add_point(pt)
+    segment.add_control_point(1, QPointF(5, 5))
+    geometry = CurvatureRankCache().get(segment)
+    assert geometry.control_indices.tolist() == [1]
+    assert geometry.controls.tolist() == [[5.0, 5.0]]
+def test_declutter_keeps_first_point_per_cell():
+    """Test decluttering keeps one point per 20px screen cell in input order."""
+    from unittest.mock import Mock
+    from PyQt6.QtGui import QTransform
+    from contour_editor.persistence.utils.point_visibility import _declutter_points_screen_space
+    painter = Mock()
+    painter.transform.return_value = QTransform().scale(2, 2)
+    points = [QPointF(1, 1), QPointF(2, 2), QPointF(30, 1), QPointF(3, 3)]
+    visible = _declutter_points_screen_space(painter, points, 200, 200)
+    assert visible == [QPointF(2, 2), QPointF(60, 2)]
+def test_cluster_screen_points_returns_centroids():
+    """Test clustering merges points sharing a grid cell into their centroid."""
+    from unittest.mock import Mock
+    from PyQt6.QtGui import QTransform
+    from contour_editor.persistence.utils.point_visibility import _cluster_screen_points
+    painter = Mock()
+    painter.transform.return_value = QTransform()
+    points = [QPointF(1, 1), QPointF(50, 50), QPointF(3, 5)]
+    clustered = _cluster_screen_points(painter, points, 10)
+    assert clustered == [QPointF(2, 3), QPointF(50, 50)]
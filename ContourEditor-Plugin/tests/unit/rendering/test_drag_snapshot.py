@@ -0,0 +1,63 @@
+"""
+Tests for the drag scene snapshot.
+This module tests:
+- Span ranges affected by dragging anchors and controls
+- Snapshot reuse while the key is unchanged and rebuild when it changes
+- Only the dragged point's spans and handles are held out of the snapshot
+"""
+from PyQt6.QtCore import QSize
+def test_affected_span_range():
+    """Test anchors affect their two spans and controls their own span."""
+    from contour_editor.rendering.drag_snapshot import affected_span_range
+    assert affected_span_range("anchor", 0, 5) == (0, 1)
+    assert affected_span_range("anchor", 2, 5) == (1, 3)
+    assert affected_span_range("anchor", 4, 5) == (3, 4)
+    assert affected_span_range("control", 2, 5) == (2, 3)
+    assert affected_span_range("anchor", 0, 1) == (0, 0)
+def test_held_out_for():
+    """Test an anchor drag holds out its spans and their controls, a control drag only its own."""
+    from contour_editor.rendering.drag_snapshot import held_out_for
+    held = held_out_for("anchor", 3, 2, 5)
+    assert (held.seg_index, held.spans, held.anchors, held.controls) == (3, range(1, 3), (2,), (1, 2))
+    held = held_out_for("control", 0, 2, 5)
+    assert (held.spans, held.anchors, held.controls) == (range(2, 3), (), (2,))
+def test_snapshot_keeps_other_handles_of_dragged_segment(qapp):
+    """Test the static scene draws every handle of the dragged segment except the held-out ones."""
+    from unittest.mock import Mock
+    from PyQt6.QtCore import QPointF
+    from PyQt6.QtGui import QColor, QImage, QPainter
+    from contour_editor.models.segment import Layer, Segment
+    from contour_editor.rendering.drag_snapshot import held_out_for
+    from contour_editor.rendering.segment_renderer import SegmentRenderer
+    segment = Segment(layer=Layer("Main"))
+    for x in (10, 40, 70, 100):
+        segment.add_point(QPointF(x, 30))
+    segment.controls[2] = QPointF(85, 50)
+    editor = Mock(handle_color=QColor("blue"), handle_selected_color=QColor("green"),
+                  show_handles_only_on_selection=False)
+    editor.manager.active_segment_index = None
+    ctx = Mock()
+    ctx.widget = editor
+    ctx.viewport.scale = 1.0
+    ctx.segments.all.return_value = [segment]
+    ctx.selection._mgr.selected_points_list = [{"seg_index": 0, "role": "anchor", "point_index": 1}]
+    image = QImage(120, 60, QImage.Format.Format_RGB32)
+    image.fill(QColor("white"))
+    painter = QPainter(image)
+    SegmentRenderer(ctx).render_all(painter, held_out=held_out_for("anchor", 0, 1, 4))
+    painter.end()
+    assert QColor(image.pixel(70, 30)) == QColor("blue")  # Neighbouring anchor stays
+    assert QColor(image.pixel(85, 50)).red() > 200  # Control of an untouched span stays
+    assert QColor(image.pixel(40, 30)) == QColor("white")  # Dragged anchor and its spans are held out
+def test_snapshot_is_rendered_once_per_key(qapp):
+    """Test the scene is only redrawn when the snapshot key changes."""
+    from contour_editor.rendering.drag_snapshot import DragSceneSnapshot
+    snapshot = DragSceneSnapshot()
+    calls = []
+    first = snapshot.pixmap_for("a", QSize(20, 10), 1.0, calls.append)
+    assert snapshot.pixmap_for("a", QSize(20, 10), 1.0, calls.append) is first
+    assert len(calls) == 1
+    snapshot.pixmap_for("b", QSize(20, 10), 1.0, calls.append)
+    assert len(calls) == 2
+    snapshot.invalidate()
+    assert not snapshot.is_valid
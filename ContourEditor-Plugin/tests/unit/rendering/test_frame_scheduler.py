@@ -0,0 +1,47 @@
+"""
+Tests for the frame scheduler.
+This module tests:
+- Requests in one frame are merged into a single update
+- Full-widget requests override regions
+- Requested vs executed counters
+"""
+import time
+from PyQt6.QtCore import QRect
+from PyQt6.QtWidgets import QWidget
+class _RecordingWidget(QWidget):
+    def __init__(self):
+        super().__init__()
+        self.updates = []
+    def update(self, *args):
+        self.updates.append(args[0] if args else None)
+def _wait_until(qapp, condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        qapp.processEvents()
+        time.sleep(0.002)
+    return condition()
+def test_requests_are_merged_into_one_update(qapp):
+    """Test several region requests produce one update covering all of them."""
+    from contour_editor.rendering.frame_scheduler import FrameScheduler
+    widget = _RecordingWidget()
+    scheduler = FrameScheduler(widget, interval_ms=16)
+    scheduler.request(QRect(0, 0, 10, 10), "drag")
+    scheduler.request(QRect(50, 50, 10, 10), "drag")
+    assert _wait_until(qapp, lambda: widget.updates)
+    assert len(widget.updates) == 1
+    region = widget.updates[0]
+    assert region.contains(QRect(0, 0, 10, 10)) and region.contains(QRect(50, 50, 10, 10))
+    assert scheduler.stats()["requested"] == 2
+    assert scheduler.stats()["executed"] == 1
+def test_full_request_overrides_regions(qapp):
+    """Test a whole-widget request wins over pending regions."""
+    from contour_editor.rendering.frame_scheduler import FrameScheduler
+    widget = _RecordingWidget()
+    scheduler = FrameScheduler(widget, interval_ms=16)
+    scheduler.request(QRect(0, 0, 10, 10), "drag")
+    scheduler.request(None, "zoom")
+    scheduler.request(QRect(5, 5, 10, 10), "drag")
+    scheduler.flush()
+    assert widget.updates == [None]
+    assert scheduler.stats()["reasons"] == {"drag": 2, "zoom": 1}
+    assert not scheduler.is_pending
@@ -0,0 +1,55 @@
+"""
+Tests for the background image pyramid.
+This module tests:
+- Level selection for the zoom factor
+- Lazy level building and invalidation on image change
+- Drawing reduced levels into the visible area
+"""
+from PyQt6.QtCore import QRectF
+from PyQt6.QtGui import QImage, QColor, QPainter
+def _image(width, height, color="red"):
+    image = QImage(width, height, QImage.Format.Format_RGB32)
+    image.fill(QColor(color))
+    return image
+def test_level_for_scale():
+    """Test each level keeps at least one image pixel per screen pixel."""
+    from contour_editor.rendering.image_pyramid import ImagePyramid
+    pyramid = ImagePyramid()
+    assert pyramid.level_for_scale(2.0) == 0
+    assert pyramid.level_for_scale(1.0) == 0
+    assert pyramid.level_for_scale(0.6) == 0
+    assert pyramid.level_for_scale(0.5) == 1
+    assert pyramid.level_for_scale(0.2) == 2
+    assert pyramid.level_for_scale(0.0001) == ImagePyramid.MAX_LEVEL
+def test_levels_built_lazily_and_invalidated(qapp):
+    """Test levels are cached per image and dropped when the image changes."""
+    from contour_editor.rendering.image_pyramid import ImagePyramid
+    pyramid = ImagePyramid()
+    pyramid.set_image(_image(400, 200))
+    level, image = pyramid.level_image(2)
+    assert level == 2
+    assert (image.width(), image.height()) == (100, 50)
+    assert pyramid.level_image(2)[1] is image
+    pyramid.set_image(_image(400, 200, "blue"))
+    assert pyramid.level_image(2)[1] is not image
+def test_viewport_image_setter_resets_pyramid(qapp):
+    """Test assigning the viewport image replaces the pyramid source."""
+    from unittest.mock import Mock
+    from contour_editor.controllers.viewport_controller import ViewportController
+    controller = ViewportController(Mock())
+    controller.image = _image(64, 64)
+    cached = controller.image_pyramid.level_image(1)[1]
+    controller.image = _image(64, 64, "blue")
+    assert controller.image_pyramid.level_image(1)[1] is not cached
+def test_draw_reduced_level(qapp):
+    """Test a zoomed-out draw covers the image area with its colour."""
+    from contour_editor.rendering.image_pyramid import ImagePyramid
+    pyramid = ImagePyramid()
+    pyramid.set_image(_image(800, 400, "red"))
+    target = _image(100, 100, "white")
+    painter = QPainter(target)
+    painter.scale(0.1, 0.1)
+    pyramid.draw(painter, QRectF(0, 0, 1000, 1000), 0.1)
+    painter.end()
+    assert QColor(target.pixel(40, 20)) == QColor("red")
+    assert QColor(target.pixel(40, 60)) == QColor("white")
@@ -0,0 +1,35 @@
+"""
+Tests for progressive scene painting.
+This module tests:
+- Work is split into budgeted chunks and resumed until complete
+- A changed key restarts the pass
+"""
+from PyQt6.QtCore import QSize
+def test_pass_resumes_until_complete(qapp):
+    """Test a pass that exceeds the budget continues in later chunks."""
+    import time
+    from contour_editor.rendering.progressive_buffer import ProgressiveSceneBuffer
+    buffer = ProgressiveSceneBuffer()
+    painted = []
+    def paint_item(painter, item):
+        time.sleep(0.001)
+        painted.append(item)
+    assert buffer.ensure("scene", QSize(10, 10), 1.0, lambda: range(200))
+    buffer.paint_chunk(lambda painter: None, paint_item, budget_ms=5)
+    assert 0 < len(painted) < 200
+    assert not buffer.is_complete
+    while not buffer.is_complete:
+        buffer.paint_chunk(lambda painter: None, paint_item, budget_ms=5)
+    assert painted == list(range(200))
+def test_changed_key_restarts_pass(qapp):
+    """Test ensure() only starts a new pass when the key changes."""
+    from contour_editor.rendering.progressive_buffer import ProgressiveSceneBuffer
+    buffer = ProgressiveSceneBuffer()
+    bases = []
+    assert buffer.ensure("a", QSize(10, 10), 1.0, lambda: [1], bases.append)
+    assert not buffer.ensure("a", QSize(10, 10), 1.0, lambda: [1], bases.append)
+    buffer.paint_chunk(lambda painter: None, lambda painter, item: None, budget_ms=5)
+    assert buffer.is_complete
+    assert buffer.ensure("b", QSize(10, 10), 1.0, lambda: [1], bases.append)
+    assert not buffer.is_complete
+    assert len(bases) == 2
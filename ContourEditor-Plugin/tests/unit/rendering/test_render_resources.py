@@ -0,0 +1,63 @@
+"""
+Tests for the renderer pen/brush/font cache.
+This module tests:
+- Reuse of cached pens across frames
+- Invalidation on scale and layer colour changes
+- Inactive segment pens use the lighter layer colour
+- LRU label layout cache
+"""
+from PyQt6.QtGui import QColor
+def test_pens_are_reused_between_frames(qapp):
+    """Test the same pen object is returned while nothing changed."""
+    from contour_editor.rendering.render_resources import RenderResources
+    resources = RenderResources()
+    resources.sync(1.0)
+    pen = resources.pen(QColor("red"), 2)
+    assert resources.pen(QColor("red"), 2) is pen
+    assert resources.brush(QColor("red")) is resources.brush(QColor("red"))
+    font = resources.font(qapp.font(), 10, True)
+    assert resources.font(qapp.font(), 10, True) is font
+    assert resources.metrics(font) is resources.metrics(font)
+def test_scale_and_layer_changes_invalidate(qapp):
+    """Test zoom-dependent and layer pens are rebuilt when their inputs change."""
+    from contour_editor.rendering.render_resources import RenderResources
+    from contour_editor.persistence.config.constants import LAYER_COLORS
+    resources = RenderResources()
+    resources.sync(1.0)
+    layer = next(iter(LAYER_COLORS))
+    layer_pen = resources.segment_pen(layer, True, 2.0)
+    scaled = resources.scaled_pen(QColor("gray"), 1.0)
+    resources.sync(2.0)
+    assert resources.scaled_pen(QColor("gray"), 1.0) is not scaled
+    layer_pen = resources.segment_pen(layer, True, 2.0)
+    original = LAYER_COLORS[layer]
+    try:
+        LAYER_COLORS[layer] = QColor(1, 2, 3)
+        resources.sync(2.0)
+        rebuilt = resources.segment_pen(layer, True, 2.0)
+        assert rebuilt is not layer_pen
+        assert rebuilt.color() == QColor(1, 2, 3)
+    finally:
+        LAYER_COLORS[layer] = original
+def test_inactive_segment_pen_is_lighter(qapp):
+    """Test inactive segments are drawn with the lighter layer colour."""
+    from contour_editor.rendering.render_resources import RenderResources
+    from contour_editor.persistence.config.constants import LAYER_COLORS
+    resources = RenderResources()
+    resources.sync(1.0)
+    layer = next(iter(LAYER_COLORS))
+    assert resources.segment_pen(layer, False, 1.0).color() == LAYER_COLORS[layer].lighter(150)
+def test_label_cache_reuses_and_evicts(qapp):
+    """Test labels are reused per text and font and evicted least recently used first."""
+    from contour_editor.rendering.render_resources import LabelCache, RenderResources
+    resources = RenderResources()
+    resources.labels = LabelCache(max_size=2)
+    font = resources.font(qapp.font(), 10, True)
+    first = resources.label("1.0mm", font)
+    assert resources.label("1.0mm", font) is first
+    assert first.width == resources.metrics(font).horizontalAdvance("1.0mm")
+    resources.label("2.0mm", font)
+    resources.label("1.0mm", font)
+    resources.label("3.0mm", font)
+    assert len(resources.labels) == 2
+    assert resources.label("1.0mm", font) is first
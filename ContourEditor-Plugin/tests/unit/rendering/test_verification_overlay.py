@@ -0,0 +1,50 @@
+"""
+Tests for prebuilt verification contour paths.
+This module tests:
+- Array to QPolygonF conversion
+- Path building from (N, 2) and OpenCV (N, 1, 2) contours
+- Culling against the repainted area
+- Horizontal and vertical contours are not culled
+"""
+from unittest.mock import Mock
+import numpy as np
+from PyQt6.QtCore import QRectF
+def test_array_to_polygon():
+    """Test polygon points match the array rows."""
+    from contour_editor.persistence.utils.coordinate_utils import array_to_polygon
+    polygon = array_to_polygon(np.array([[1, 2], [3.5, 4], [5, 6]]))
+    assert [(p.x(), p.y()) for p in polygon] == [(1.0, 2.0), (3.5, 4.0), (5.0, 6.0)]
+    assert array_to_polygon(np.empty((0, 2))).isEmpty()
+def test_paths_built_once_with_bounds(qapp):
+    """Test contours become closed paths with cached bounds."""
+    from contour_editor.rendering.verification_overlay import VerificationOverlay
+    overlay = VerificationOverlay()
+    square = np.array([[[10, 10]], [[50, 10]], [[50, 40]], [[10, 40]]], dtype=np.int32)
+    contours = [square, [(0, 0)], None]
+    overlay.set_contours(contours)
+    assert len(overlay._paths) == 1
+    path, bounds = overlay._paths[0]
+    assert bounds == QRectF(10, 10, 40, 30)
+    assert path.elementCount() == 5  # Four points plus the closing element
+    cached = overlay._paths
+    overlay.draw(Mock(), contours)
+    assert overlay._paths is cached
+def test_draw_culls_offscreen_paths(qapp):
+    """Test only contours overlapping the visible rect are drawn."""
+    from contour_editor.rendering.verification_overlay import VerificationOverlay
+    overlay = VerificationOverlay()
+    contours = [np.array([[2, 2], [18, 2], [18, 18]]), np.array([[200, 200], [220, 200]])]
+    painter = Mock()
+    overlay.draw(painter, contours, QRectF(0, 0, 20, 20))
+    assert painter.drawPath.call_count == 1
+    painter = Mock()
+    overlay.draw(painter, contours)
+    assert painter.drawPath.call_count == 2
+def test_axis_aligned_contours_are_drawn(qapp):
+    """Test contours with zero-width or zero-height bounds survive culling."""
+    from contour_editor.rendering.verification_overlay import VerificationOverlay
+    overlay = VerificationOverlay()
+    contours = [np.array([[10, 10], [50, 10]]), np.array([[30, 5], [30, 60]]), np.array([[150, 10], [190, 10]])]
+    painter = Mock()
+    overlay.draw(painter, contours, QRectF(0, 0, 100, 100))
+    assert painter.drawPath.call_count == 2
@@ -6,6 +6,7 @@ This module tests:
 - Undo/redo functionality  
 - Stack management
 - Error handling
+- One scene_changed batch per execute, undo and redo
 """
 import pytest
 from unittest.mock import Mock
@@ -142,3 +143,25 @@ def test_command_execution_failure(mock_command_history):
         mock_command_history.execute(mock_command)
     # Command should not be in history (execute failed before adding)
     assert not mock_command_history.can_undo()
+def test_command_changes_arrive_as_one_batch(mock_command_history, mock_event_bus):
+    """Test the changes a command publishes are delivered as a single ChangeSet."""
+    from PyQt6.QtCore import QPointF
+    from contour_editor.models.affine_transform import translation_matrix
+    from contour_editor.models.segment import Segment
+    from contour_editor.services.commands.segment_commands import AffineTransformCommand
+    segments = []
+    for _ in range(2):
+        segment = Segment()
+        segment.add_point(QPointF(0, 0))
+        segment.add_point(QPointF(10, 0))
+        segments.append(segment)
+    received = []
+    mock_event_bus.scene_changed.connect(received.append)
+    targets = ((0, (1,), ()), (1, None, None))
+    mock_command_history.execute(AffineTransformCommand(Mock(segments=segments), translation_matrix(5, 0), targets))
+    assert len(received) == 1
+    first, second = received[0]
+    assert (first.kind, first.seg_index, first.anchors, first.controls) == ("geometry", 0, (range(1, 2),), ())
+    assert second.anchors is None and not received[0].structural
+    mock_command_history.undo()
+    assert len(received) == 2 and received[1].seg_indexes("geometry") == {0, 1}
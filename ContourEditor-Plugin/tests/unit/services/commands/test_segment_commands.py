@@ -5,6 +5,7 @@ This module tests:
 - DeleteSegmentCommand
 - ToggleSegmentVisibilityCommand
 - ChangeSegmentLayerCommand
+- AffineTransformCommand
 - Command execution, undo, redo
 """
 import pytest
@@ -152,3 +153,64 @@ def test_change_layer_undo(mock_manager, mock_event_bus, mock_segment_with_layer
     # Second call should restore original layer
     second_call_args = mock_manager.assign_segment_layer.call_args_list[1]
     assert second_call_args[0] == (0, "Contour")
+# ===== AffineTransformCommand Tests =====
+def test_affine_transform_execute_and_undo(mock_manager, mock_event_bus):
+    """Test AffineTransformCommand moves whole segments and undo applies the inverse."""
+    from contour_editor.models.segment import Segment
+    from contour_editor.models.affine_transform import rotation_matrix, targets_for_segments
+    from contour_editor.services.commands.segment_commands import AffineTransformCommand
+    segment = Segment()
+    for point in [(0, 0), (10, 0)]:
+        segment.add_point(QPointF(*point))
+    segment.controls[0] = QPointF(5, 5)
+    mock_manager.segments = [segment]
+    cmd = AffineTransformCommand(mock_manager, rotation_matrix(90), targets_for_segments([0]))
+    with patch('contour_editor.services.commands.segment_commands.EventBus.get_instance', return_value=mock_event_bus):
+        cmd.execute()
+        assert cmd.moved_count == 3
+        assert segment.points[1].x() == pytest.approx(0) and segment.points[1].y() == pytest.approx(10)
+        cmd.undo()
+    assert segment.points[1].x() == pytest.approx(10) and segment.points[1].y() == pytest.approx(0, abs=1e-9)
+    assert segment.controls[0].x() == pytest.approx(5) and segment.controls[0].y() == pytest.approx(5)
+def test_affine_transform_rejects_singular_matrix(mock_manager):
+    """Test a matrix without an inverse cannot be recorded."""
+    from contour_editor.models.affine_transform import scale_matrix
+    from contour_editor.services.commands.segment_commands import AffineTransformCommand
+    with pytest.raises(ValueError):
+        AffineTransformCommand(mock_manager, scale_matrix(0, 1), ())
+def test_affine_transform_undo_ignores_later_lock(mock_manager, mock_event_bus):
+    """Test undo and redo act on the segments execute moved, even after their layer was locked."""
+    from contour_editor.models.segment import Segment
+    from contour_editor.models.affine_transform import targets_for_segments, translation_matrix
+    from contour_editor.services.commands.segment_commands import AffineTransformCommand
+    moved, locked = Segment(), Segment()
+    for segment, locked_layer in ((moved, False), (locked, True)):
+        segment.add_point(QPointF(0, 0))
+        segment.layer = Mock(locked=locked_layer)
+    mock_manager.segments = [moved, locked]
+    cmd = AffineTransformCommand(mock_manager, translation_matrix(5, 0), targets_for_segments([0, 1]))
+    with patch('contour_editor.services.commands.segment_commands.EventBus.get_instance', return_value=mock_event_bus):
+        cmd.execute()
+        moved.layer.locked = True
+        cmd.undo()
+        assert moved.points[0].x() == 0
+        cmd.execute()
+    assert moved.points[0].x() == 5 and locked.points[0].x() == 0
+def test_affine_transform_undo_restores_recentred_controls(mock_manager, mock_event_bus):
+    """Test undo puts an on-line control back at its start position, which the inverse matrix cannot recover."""
+    from contour_editor.models.segment import Segment
+    from contour_editor.services.commands.segment_commands import AffineTransformCommand
+    from contour_editor.models.affine_transform import translation_matrix
+    segment = Segment()
+    for x in (0, 10, 20):
+        segment.add_point(QPointF(x, 0))
+    segment.controls[0] = QPointF(3, 0)
+    mock_manager.segments = [segment]
+    cmd = AffineTransformCommand(mock_manager, translation_matrix(0, 10), ((0, (1,), ()),))
+    with patch('contour_editor.services.commands.segment_commands.EventBus.get_instance', return_value=mock_event_bus):
+        cmd.execute()
+        assert segment.controls[0] == QPointF(5, 5)
+        cmd.undo()
+        assert segment.controls[0] == QPointF(3, 0) and segment.points[1] == QPointF(10, 0)
+        cmd.execute()
+    assert segment.controls[0] == QPointF(5, 5)
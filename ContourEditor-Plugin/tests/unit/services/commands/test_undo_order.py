@@ -0,0 +1,107 @@
+"""
+Tests for undo and redo across CommandHistory and the manager's snapshots.
+This module tests:
+- A point edit made after a transform is undone before the transform
+- Redo replays edits in the order they were undone
+- Redo entries undone before a newer edit are dropped
+- Picking the next edit leaves both stacks untouched
+- Transform undo skips point indices that no longer exist
+- Snapshot undo publishes the segments it restored
+"""
+from PyQt6.QtCore import QPointF
+def _manager():
+    from contour_editor.models.bezier_segment_manager import BezierSegmentManager
+    manager = BezierSegmentManager()
+    for x in (0, 10, 20, 30):
+        manager.segments[0].add_point(QPointF(x, 0))
+    return manager
+def _points(manager):
+    return [(p.x(), p.y()) for p in manager.segments[0].points]
+def test_point_edit_after_transform_is_undone_first(mock_command_history):
+    """Test transform, then deleting a point, then undo restores the point before reverting the transform."""
+    from contour_editor.models.affine_transform import translation_matrix
+    from contour_editor.services.commands.segment_commands import AffineTransformCommand
+    from contour_editor.services.commands.undo_order import undo_source
+    manager = _manager()
+    mock_command_history.execute(AffineTransformCommand(manager, translation_matrix(0, 5), ((0, (0, 1, 2), ()),)))
+    manager.remove_point('anchor', 0, 2)
+    assert undo_source(mock_command_history, manager) == "snapshot"
+    manager.undo()
+    assert _points(manager) == [(0, 5), (10, 5), (20, 5), (30, 0)]
+    assert undo_source(mock_command_history, manager) == "command"
+    mock_command_history.undo()
+    assert _points(manager) == [(0, 0), (10, 0), (20, 0), (30, 0)]
+    assert undo_source(mock_command_history, manager) is None
+def test_redo_follows_undo_order(mock_command_history):
+    """Test redo replays the transform before the point edit that followed it."""
+    from contour_editor.models.affine_transform import translation_matrix
+    from contour_editor.services.commands.segment_commands import AffineTransformCommand
+    from contour_editor.services.commands.undo_order import redo_source, undo_source
+    manager = _manager()
+    manager.move_point('anchor', 0, 3, QPointF(30, 9))
+    mock_command_history.execute(AffineTransformCommand(manager, translation_matrix(1, 0), ((0, None, None),)))
+    manager.remove_point('anchor', 0, 0)
+    edited = _points(manager)
+    replay = {"command": (mock_command_history.undo, mock_command_history.redo), "snapshot": (manager.undo, manager.redo)}
+    undone = []
+    for _ in range(3):
+        undone.append(undo_source(mock_command_history, manager))
+        replay[undone[-1]][0]()
+    assert undone == ["snapshot", "command", "snapshot"]
+    redone = []
+    for _ in range(3):
+        redone.append(redo_source(mock_command_history, manager))
+        replay[redone[-1]][1]()
+    assert redone == ["snapshot", "command", "snapshot"]
+    assert _points(manager) == edited and redo_source(mock_command_history, manager) is None
+def test_new_edit_drops_stale_redo(mock_command_history):
+    """Test an undone transform cannot be redone once a point edit followed the undo."""
+    from contour_editor.models.affine_transform import translation_matrix
+    from contour_editor.services.commands.segment_commands import AffineTransformCommand
+    from contour_editor.services.commands.undo_order import redo_source, undo_source
+    manager = _manager()
+    mock_command_history.execute(AffineTransformCommand(manager, translation_matrix(0, 5), ((0, None, None),)))
+    assert undo_source(mock_command_history, manager) == "command"
+    mock_command_history.undo()
+    assert mock_command_history.can_redo()
+    manager.remove_point('anchor', 0, 3)
+    assert not mock_command_history.can_redo() and redo_source(mock_command_history, manager) is None
+def test_source_lookup_does_not_replay(mock_command_history):
+    """Test undo_source and redo_source only report which edit is next."""
+    from contour_editor.models.affine_transform import translation_matrix
+    from contour_editor.services.commands.segment_commands import AffineTransformCommand
+    from contour_editor.services.commands.undo_order import redo_source, undo_source
+    manager = _manager()
+    mock_command_history.execute(AffineTransformCommand(manager, translation_matrix(0, 5), ((0, None, None),)))
+    moved = _points(manager)
+    assert undo_source(mock_command_history, manager) == "command"
+    assert redo_source(mock_command_history, manager) is None
+    assert _points(manager) == moved and mock_command_history.can_undo()
+def test_transform_undo_skips_missing_points(mock_command_history):
+    """Test undoing a transform after its points were removed out of order does not index past the segment."""
+    from contour_editor.models.affine_transform import translation_matrix
+    from contour_editor.services.commands.segment_commands import AffineTransformCommand
+    manager = _manager()
+    mock_command_history.execute(AffineTransformCommand(manager, translation_matrix(0, 5), ((0, (0, 1, 3), (2,)),)))
+    del manager.segments[0].points[2:]
+    mock_command_history.undo()
+    assert _points(manager) == [(0, 0), (10, 0)]
+def test_snapshot_undo_publishes_restored_segments(mock_event_bus):
+    """Test a snapshot undo publishes a whole-segment geometry change for each restored segment only."""
+    from contour_editor.models.segment import Segment
+    from contour_editor.services.commands.undo_order import publish_snapshot_changes
+    manager = _manager()
+    manager.segments.append(Segment())
+    manager.segments[1].add_point(QPointF(0, 0))
+    manager.move_point('anchor', 0, 1, QPointF(10, 9))
+    published = []
+    mock_event_bus.scene_changed.connect(published.append)
+    before = list(manager.get_segments())
+    manager.undo()
+    publish_snapshot_changes(mock_event_bus, before, manager.get_segments())
+    [change] = published[0]
+    assert (change.kind, change.seg_index, change.anchors, change.controls) == ("geometry", 0, None, None)
+    before = list(manager.get_segments())
+    manager.segments.pop()
+    publish_snapshot_changes(mock_event_bus, before, manager.get_segments())
+    assert [(change.kind, change.seg_index) for change in published[1]] == [("removed", 1)]
@@ -0,0 +1,84 @@
+"""
+Tests for edge snapping to the background image.
+This module tests:
+- Strong edges are found and flat frames have none
+- Nearest-edge lookups respect the radius
+- The map is built off the GUI thread and used by the snapping service
+"""
+import time
+import numpy as np
+from PyQt6.QtCore import QPointF
+from PyQt6.QtGui import QImage
+def _frame():
+    gray = np.full((120, 160), 255, dtype=np.uint8)
+    gray[40:80, 60:100] = 0
+    return gray
+def _wait_for(predicate, qapp, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        qapp.processEvents()
+        time.sleep(0.01)
+    return predicate()
+def test_nearest_edge_within_radius():
+    """Test a point near the square's side snaps onto it and distant points do not."""
+    from contour_editor.services.edge_map import compute_edge_map
+    edge_map = compute_edge_map(_frame())
+    assert edge_map.edge_count > 0
+    point = edge_map.nearest(62.0, 60.0, 5.0)
+    assert point is not None and abs(point[0] - 60) <= 1 and point[1] == 60
+    assert edge_map.nearest(80.0, 60.0, 5.0) is None
+    assert edge_map.nearest(500.0, 60.0, 5.0) is None
+def test_flat_frame_has_no_edges():
+    """Test a uniform or slightly noisy frame yields no edges."""
+    from contour_editor.services.edge_map import compute_edge_map
+    noise = (np.random.default_rng(0).integers(0, 10, (120, 160)) + 120).astype(np.uint8)
+    assert compute_edge_map(noise).edge_count == 0
+    assert compute_edge_map(np.zeros((50, 50), dtype=np.uint8)).nearest(10, 10, 5) is None
+def test_builder_supersedes_older_images(qapp):
+    """Test the builder keeps only the map of the latest image."""
+    from contour_editor.services.edge_map import EdgeMapBuilder
+    frame = _frame()
+    image = QImage(frame.data, 160, 120, 160, QImage.Format.Format_Grayscale8)
+    builder = EdgeMapBuilder()
+    builder.request(QImage(160, 120, QImage.Format.Format_Grayscale8))
+    builder.request(image, keep_alive=frame)
+    assert _wait_for(lambda: builder.edge_map is not None and builder.edge_map.edge_count > 0, qapp)
+    builder.shutdown()
+def test_builder_keeps_map_during_live_feed(qapp, monkeypatch):
+    """Test a stream of frames never clears the map and only the latest waiting frame is built."""
+    from contour_editor.services import edge_map as edge_map_module
+    from contour_editor.services.edge_map import EdgeMapBuilder
+    builds = []
+    compute = edge_map_module.compute_edge_map
+    def counting_compute(gray):
+        builds.append(gray)
+        return compute(gray)
+    monkeypatch.setattr(edge_map_module, "compute_edge_map", counting_compute)
+    frame = _frame()
+    builder = EdgeMapBuilder()
+    builder.request(QImage(frame.data, 160, 120, 160, QImage.Format.Format_Grayscale8), keep_alive=frame)
+    assert _wait_for(lambda: builder.edge_map is not None, qapp)
+    frames = 30
+    for _ in range(frames):
+        builder.request(QImage(frame.data, 160, 120, 160, QImage.Format.Format_Grayscale8).copy())
+        qapp.processEvents()
+        assert builder.edge_map is not None
+    assert _wait_for(lambda: not builder._building, qapp)
+    assert builder.edge_map.edge_count > 0
+    assert len(builds) < frames + 1
+    builder.shutdown()
+def test_snapping_service_snaps_to_edges(qapp, monkeypatch):
+    """Test the snapping service offers image edges once the map is ready."""
+    from contour_editor.persistence.config import constants
+    from contour_editor.services.snapping_service import SnappingService
+    for name in ("SNAP_TO_ANCHORS", "SNAP_TO_INTERSECTIONS", "SNAP_TO_MIDPOINTS", "SNAP_TO_SPANS", "SNAP_TO_GRID"):
+        monkeypatch.setattr(constants, name, False)
+    monkeypatch.setattr(constants, "SNAP_ENABLED", True)
+    monkeypatch.setattr(constants, "SNAP_TO_EDGES", True)
+    monkeypatch.setattr(constants, "SNAP_RADIUS_PX", 5)
+    frame = _frame()
+    service = SnappingService()
+    service.set_background(QImage(frame.data, 160, 120, 160, QImage.Format.Format_Grayscale8), frame)
+    assert _wait_for(lambda: service.snap(QPointF(62, 60), 1.0) is not None, qapp)
+    result = service.snap(QPointF(62, 60), 1.0)
+    assert result.kind == "edge" and abs(result.point.x() - 60) <= 1
@@ -3,6 +3,7 @@ Tests for SegmentService.
 This module tests:
 - Command-based operations (add, delete, toggle, change layer)
 - Direct operations (add points, disconnect, set active)
+- Scene changes published by direct operations
 - Layer operations (visibility, locking)
 """
 import pytest
@@ -105,6 +106,52 @@ def test_disconnect_line_wrong_segment(segment_service, mock_manager):
     result = segment_service.disconnect_line(pos, 2)
     mock_manager.disconnect_line_segment.assert_called_once_with(3, 0)
     assert result is True
+def test_add_anchor_point_publishes_shifted_anchors(segment_service, mock_manager, mock_event_bus):
+    """Test add_anchor_point publishes the inserted and shifted anchors with points_changed."""
+    from contour_editor.models.segment import Segment
+    segment = Segment()
+    for x in (0, 10, 20):
+        segment.add_point(QPointF(x, 0))
+    mock_manager.get_segments = Mock(return_value=[segment])
+    mock_manager.insert_anchor_point = Mock(side_effect=lambda *_: (segment.points.insert(1, QPointF(5, 0)), segment.controls.insert(1, None), True)[-1])
+    published, legacy = [], []
+    mock_event_bus.scene_changed.connect(published.append)
+    mock_event_bus.points_changed.connect(lambda: legacy.append(mock_event_bus.has_pending_changes()))
+    assert segment_service.add_anchor_point(0, QPointF(5, 0)) is True
+    [change] = published[0]
+    assert (change.kind, change.seg_index, change.anchors, change.controls) == ("geometry", 0, (range(1, 4),), (range(2, 3),))
+    assert legacy == [True]
+def test_add_control_point_publishes_changed_control(segment_service, mock_manager, mock_event_bus):
+    """Test add_control_point publishes only the replaced control."""
+    from contour_editor.models.segment import Segment
+    segment = Segment()
+    for x in (0, 10, 20):
+        segment.add_point(QPointF(x, 0))
+    mock_manager.get_segments = Mock(return_value=[segment])
+    mock_manager.add_control_point = Mock(side_effect=lambda *_: (segment.controls.__setitem__(1, QPointF(15, 0)), True)[-1])
+    published = []
+    mock_event_bus.scene_changed.connect(published.append)
+    segment_service.add_control_point(0, QPointF(15, 0))
+    [change] = published[0]
+    assert (change.anchors, change.controls) == ((), (range(1, 2),))
+def test_failed_point_edit_publishes_nothing(segment_service, mock_manager, mock_event_bus):
+    """Test a rejected point edit publishes no scene change."""
+    published = []
+    mock_event_bus.scene_changed.connect(published.append)
+    mock_manager.add_control_point = Mock(return_value=False)
+    assert segment_service.add_control_point(0, QPointF(1, 1)) is False
+    assert published == []
+def test_disconnect_line_publishes_pieces(segment_service, mock_manager, mock_event_bus):
+    """Test disconnect_line publishes the split segment as removed and its pieces as added."""
+    segments = [Mock(), Mock()]
+    mock_manager.get_segments = Mock(return_value=segments)
+    mock_manager.find_segment_at = Mock(return_value=(1, 2))
+    mock_manager.disconnect_line_segment = Mock(side_effect=lambda *_: (segments.__setitem__(slice(1, 2), [Mock(), Mock(), Mock()]), True)[-1])
+    published = []
+    mock_event_bus.scene_changed.connect(published.append)
+    assert segment_service.disconnect_line(QPointF(50, 50), 1) is True
+    assert len(published) == 1
+    assert [(change.kind, change.seg_index) for change in published[0]] == [("removed", 1), ("added", 1), ("added", 2), ("added", 3)]
 def test_set_active_segment(segment_service, mock_manager):
     """Test set_active_segment updates manager and emits event."""
     mock_manager.set_active_segment = Mock()
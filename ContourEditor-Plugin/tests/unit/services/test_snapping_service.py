@@ -0,0 +1,65 @@
+"""
+Tests for the snapping service.
+This module tests:
+- Snap target priority and the screen-space radius
+- Intersections, midpoints and the mm grid
+- Frozen drags leaving out the dragged point and its spans
+"""
+import pytest
+from PyQt6.QtCore import QPointF
+@pytest.fixture
+def snap_constants(monkeypatch):
+    from contour_editor.persistence.config import constants
+    for name, value in {"SNAP_ENABLED": True, "SNAP_RADIUS_PX": 10, "SNAP_TO_ANCHORS": True,
+                        "SNAP_TO_INTERSECTIONS": True, "SNAP_TO_MIDPOINTS": True,
+                        "SNAP_TO_SPANS": False, "SNAP_TO_GRID": False}.items():
+        monkeypatch.setattr(constants, name, value)
+    return constants
+def _segment(points):
+    from contour_editor.models.segment import Segment
+    segment = Segment()
+    for point in points:
+        segment.add_point(QPointF(*point))
+    return segment
+def test_anchor_wins_within_radius(snap_constants):
+    """Test the nearest anchor is chosen and the radius is in screen pixels."""
+    from contour_editor.services.snapping_service import SnappingService
+    segments = [_segment([(0, 0), (100, 0)])]
+    service = SnappingService()
+    result = service.snap(QPointF(96, 3), 1.0, segments)
+    assert result.kind == "anchor" and result.point == QPointF(100, 0)
+    assert service.snap(QPointF(96, 3), 4.0, segments) is None
+    assert service.snap(QPointF(50, 20), 1.0, segments) is None
+def test_intersection_and_midpoint(snap_constants):
+    """Test crossing spans snap to their intersection, straight spans to their middle."""
+    from contour_editor.services.snapping_service import SnappingService
+    segments = [_segment([(0, 0), (100, 100)]), _segment([(0, 100), (100, 0)]), _segment([(200, 0), (300, 0)])]
+    service = SnappingService()
+    crossing = service.snap(QPointF(53, 49), 1.0, segments)
+    assert crossing.kind == "intersection"
+    assert crossing.point.x() == pytest.approx(50) and crossing.point.y() == pytest.approx(50)
+    middle = service.snap(QPointF(252, 4), 1.0, segments)
+    assert middle.kind == "midpoint" and middle.point == QPointF(250, 0)
+def test_grid_snap(snap_constants, monkeypatch):
+    """Test grid nodes are spaced SNAP_GRID_MM apart in image pixels."""
+    from contour_editor.services.snapping_service import SnappingService
+    monkeypatch.setattr(snap_constants, "SNAP_TO_GRID", True)
+    monkeypatch.setattr(snap_constants, "SNAP_GRID_MM", 10.0)
+    monkeypatch.setattr(snap_constants, "PIXELS_PER_MM", 2.0)
+    result = SnappingService().snap(QPointF(37, 61), 1.0, [])
+    assert result.kind == "grid" and result.point == QPointF(40, 60)
+def test_drag_excludes_dragged_point(snap_constants):
+    """Test a dragged anchor does not snap to itself or the spans that move with it."""
+    from contour_editor.services.snapping_service import SnappingService
+    segments = [_segment([(0, 0), (100, 0), (200, 0)]), _segment([(100, 5), (100, 300)])]
+    service = SnappingService()
+    service.begin(segments, ("anchor", 0, 1))
+    result = service.snap(QPointF(101, 1), 1.0)
+    assert result.kind == "anchor" and result.point == QPointF(100, 5)
+    service.end()
+    assert service.snap(QPointF(101, 1), 1.0) is None
+def test_disabled_returns_none(snap_constants, monkeypatch):
+    """Test nothing snaps while snapping is switched off."""
+    from contour_editor.services.snapping_service import SnappingService
+    monkeypatch.setattr(snap_constants, "SNAP_ENABLED", False)
+    assert SnappingService().snap(QPointF(0, 0), 1.0, [_segment([(0, 0), (10, 0)])]) is None
@@ -0,0 +1,127 @@
+"""
+Tests for the point manager's tree model and view.
+This module tests:
+- Adding, deleting and re-layering segments notify single row changes
+- Point rows are exposed a page at a time and follow point edits incrementally
+- Undo's copies of segments keep their rows
+- Geometry changes from the EventBus update only the named point rows
+- Only on-screen segment rows get a widget
+"""
+from types import SimpleNamespace
+from PyQt6.QtCore import QPersistentModelIndex, QPointF
+def _segment(layer, count=2):
+    from contour_editor.models.segment import Segment
+    segment = Segment(layer=layer)
+    for i in range(count):
+        segment.add_point(QPointF(i, i))
+    return segment
+def _scene(*layer_names):
+    from contour_editor.models.segment import Layer
+    layers = {name: Layer(name, False, True) for name in layer_names}
+    manager = SimpleNamespace(segments=[], active_segment_index=None, layers=layers)
+    manager.get_available_layer_names = lambda: list(layers)
+    manager.get_segments = lambda: manager.segments
+    return manager
+def _model(manager):
+    from PyQt6.QtTest import QAbstractItemModelTester
+    from contour_editor.ui.new_widgets.point_manager.point_tree_model import PointTreeModel
+    model = PointTreeModel(manager)
+    model.tester = QAbstractItemModelTester(model, QAbstractItemModelTester.FailureReportingMode.Fatal)
+    events = []
+    model.rowsInserted.connect(lambda parent, first, last: events.append(("insert", model.item_kind(parent) if parent.isValid() else None, first, last)))
+    model.rowsRemoved.connect(lambda parent, first, last: events.append(("remove", model.item_kind(parent) if parent.isValid() else None, first, last)))
+    model.modelReset.connect(lambda: events.append(("reset",)))
+    model.sync()
+    events.clear()
+    return model, events
+def test_segment_changes_are_single_row_notifications(qapp):
+    """Test adding, deleting and re-layering a segment touch only its row."""
+    manager = _scene("Main", "Fill")
+    main, fill = manager.layers["Main"], manager.layers["Fill"]
+    manager.segments = [_segment(main), _segment(main), _segment(fill)]
+    model, events = _model(manager)
+    assert [model.rowCount(model.index(row, 0)) for row in range(2)] == [2, 1]
+    kept = QPersistentModelIndex(model.segment_index(1))
+    manager.segments.insert(0, _segment(main))
+    model.sync()
+    assert events == [("insert", "layer", 0, 0)]
+    assert kept.row() == 2 and model.segment_at(model.segment_index(2)) is manager.segments[2]
+    events.clear()
+    del manager.segments[1]
+    model.sync()
+    assert events == [("remove", "layer", 1, 1)]
+    events.clear()
+    manager.segments[2].layer = main
+    model.sync()
+    assert events == [("remove", "layer", 0, 0), ("insert", "layer", 2, 2)]
+    assert model.segment_index(2).data(model.ItemDataRole).layer_name == "Main"
+def test_point_rows_are_paged_and_incremental(qapp):
+    """Test long segments expose a page of points and edits only insert the new rows."""
+    from contour_editor.ui.new_widgets.point_manager.point_tree_model import POINT_PAGE_SIZE
+    manager = _scene("Main")
+    manager.segments = [_segment(manager.layers["Main"], 3), _segment(manager.layers["Main"], POINT_PAGE_SIZE)]
+    model, events = _model(manager)
+    short, long = model.segment_index(0), model.segment_index(1)
+    assert [model.index(row, 0, short).data(model.LabelRole) for row in range(5)] == ["P0", "P1", "P2", "C0", "C1"]
+    assert model.rowCount(long) == POINT_PAGE_SIZE and model.can_load_more(long)
+    model.load_more(long)
+    assert model.rowCount(long) == 2 * POINT_PAGE_SIZE - 1 and not model.can_load_more(long)
+    events.clear()
+    manager.segments[0].add_point(QPointF(5, 6))
+    model.sync()
+    assert events == [("insert", "segment", 3, 3), ("insert", "segment", 6, 6)]
+    assert model.index(3, 0, short).data(model.CoordinatesRole) == "(5.0, 6.0)"
+    assert model.index(3, 0, short).data(model.ItemDataRole).point_type == "anchor"
+def test_undo_copies_keep_their_rows(qapp):
+    """Test replacing segments by copies, as undo does, updates rows in place."""
+    import copy
+    manager = _scene("Main")
+    manager.segments = [_segment(manager.layers["Main"]) for _ in range(3)]
+    model, events = _model(manager)
+    changed = []
+    model.dataChanged.connect(lambda first, last, roles: changed.append((first.row(), last.row())))
+    manager.segments = copy.deepcopy(manager.segments)
+    manager.segments[1].visible = False
+    model.sync()
+    assert events == []
+    assert model.segment_at(model.segment_index(1)) is manager.segments[1]
+    assert (1, 1) in changed
+def test_geometry_changes_update_named_rows(qapp):
+    """Test a ChangeSet naming point indices repaints just those rows."""
+    from contour_editor.core.scene_changes import ChangeSet, SceneChange
+    manager = _scene("Main")
+    manager.segments = [_segment(manager.layers["Main"], 10)]
+    model, events = _model(manager)
+    changed = []
+    model.dataChanged.connect(lambda first, last, roles: changed.append((first.row(), last.row())))
+    manager.segments[0].points[4] = QPointF(40, 41)
+    model.update_points(ChangeSet([SceneChange("geometry", 0, anchors=[4], controls=[2, 3])]))
+    assert changed == [(4, 4), (12, 13)] and events == []
+    assert model.index(4, 0, model.segment_index(0)).data(model.CoordinatesRole) == "(40.0, 41.0)"
+    changed.clear()
+    model.sync()
+    assert changed == []
+    manager.segments[0].add_point(QPointF(1, 2))
+    model.update_points(ChangeSet([SceneChange("geometry", 0)]))
+    assert events == [("insert", "segment", 10, 10), ("insert", "segment", 20, 20)]
+def test_row_widgets_only_for_visible_rows(qapp):
+    """Test the view builds widgets for the segment rows on screen, not for every segment."""
+    from PyQt6.QtWidgets import QLabel
+    from contour_editor.ui.new_widgets.point_manager.point_tree_view import PointTreeView
+    manager = _scene("Main")
+    manager.segments = [_segment(manager.layers["Main"]) for _ in range(500)]
+    model, _ = _model(manager)
+    created = []
+    row_widgets = SimpleNamespace(signature=lambda index: index.data(), create=lambda index, expanded: created.append(index.data()) or QLabel(index.data()))
+    view = PointTreeView(row_widgets)
+    view.setModel(model)
+    view.resize(300, 600)
+    view.show()
+    view.setExpanded(model.layer_index("Main"), True)
+    view.sync_row_widgets()
+    assert "Main" in created and "S0" in created and len(created) < 20
+    created.clear()
+    view.scrollToBottom()
+    view.sync_row_widgets()
+    assert "S499" in created and "S0" not in created and len(created) < 20
+    view.close()